@@ -7,7 +7,8 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.storage.db import get_db
+from src.storage.db import INDEX_MIGRATIONS, get_db, run_index_migrations
+from src.storage.maintenance import backfill_symbol_keys
 from sqlalchemy import text
 
 def create_indexes():
@@ -41,6 +42,17 @@ def create_indexes():
                 print(f"✓ Created index: {idx_sql.split('idx_')[1].split(' ')[0] if 'idx_' in idx_sql else idx_sql.split('uq_')[1].split(' ')[0]}")
             except Exception as e:
                 print(f"✗ Error creating index: {e}")
+
+    # symbol_key / covering indexes (CONCURRENTLY except on partitioned parents)
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ALTER TABLE trades ADD COLUMN IF NOT EXISTS symbol_key VARCHAR"))
+    applied = run_index_migrations(db.engine)
+    for idx_sql in INDEX_MIGRATIONS:
+        name = idx_sql.split('EXISTS ')[1].split(' ')[0]
+        ok = any(name in stmt for stmt in applied)
+        print(f"{'✓ Created' if ok else '✗ Error creating'} index: {name}")
+
+    print(f"✓ Backfilled symbol_key on {backfill_symbol_keys(db.engine)} trades")
     
     print("\n✅ Index creation complete!")
 
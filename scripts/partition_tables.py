@@ -0,0 +1,109 @@
+"""
+Convert system_events and/or candles to native Postgres partitioning.
+
+One-off, operator-run migration (see src/storage/partitioning.py for the
+layout). Each table is converted in a single transaction: the table is
+unavailable to writers while rows are copied, so stop the worker first.
+Rows already past retention (decision traces, 15m/1h/4h candles) are not
+copied. Afterwards DatabasePruner drops expired partitions and creates
+upcoming ones during its daily run.
+
+Usage:
+    python scripts/partition_tables.py --dry-run
+    python scripts/partition_tables.py --table system_events
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import AddConstraint, CreateIndex
+
+from src.storage.db import get_db
+from src.storage.maintenance import CANDLE_RETENTION_DAYS
+from src.storage.partitioning import (
+    CANDLE_GROUPS,
+    EVENT_GROUPS,
+    TRACE_GROUP,
+    conversion_statements,
+    is_partitioned,
+)
+from src.storage.repository import CandleModel, SystemEventModel
+
+TRACE_DAYS_TO_KEEP = 3  # DatabasePruner.prune_old_traces default
+
+
+def _ddl(element) -> str:
+    return str(element.compile(dialect=postgresql.dialect()))
+
+
+def _min_ts(conn, table, key, value):
+    return conn.execute(
+        text(f"SELECT MIN(timestamp) FROM {table} WHERE {key} = :v"), {"v": value}
+    ).scalar()
+
+
+def _event_plan(conn, now):
+    trace_cutoff = now - timedelta(days=TRACE_DAYS_TO_KEEP + 1)
+    starts = {}
+    for group in EVENT_GROUPS:
+        first = _min_ts(conn, "system_events", "event_type", group.list_values[0]) or now
+        if group is TRACE_GROUP:
+            first = max(first, trace_cutoff)
+        starts[group.parent] = first
+    indexes = [_ddl(CreateIndex(ix)) for ix in SystemEventModel.__table__.indexes]
+    copy_filter = f"NOT (event_type = 'DECISION_TRACE' AND timestamp < '{trace_cutoff:%Y-%m-%d}')"
+    return conversion_statements("system_events", EVENT_GROUPS, starts, now, indexes, copy_filter)
+
+
+def _candle_plan(conn, now):
+    starts = {}
+    clauses = []
+    for tf, group in CANDLE_GROUPS.items():
+        cutoff = now - timedelta(days=CANDLE_RETENTION_DAYS[tf])
+        starts[group.parent] = max(_min_ts(conn, "candles", "timeframe", tf) or now, cutoff)
+        clauses.append(f"(timeframe = '{tf}' AND timestamp < '{cutoff:%Y-%m-%d}')")
+    table = CandleModel.__table__
+    ddl = [_ddl(CreateIndex(ix)) for ix in table.indexes]
+    ddl += [_ddl(AddConstraint(c)) for c in table.constraints if c.name == "uq_candle_key"]
+    copy_filter = "NOT (" + " OR ".join(clauses) + ")"
+    return conversion_statements("candles", tuple(CANDLE_GROUPS.values()), starts, now, ddl, copy_filter)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--table", choices=["system_events", "candles", "all"], default="all")
+    parser.add_argument("--dry-run", action="store_true", help="Print the DDL without executing it")
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    tables = ["system_events", "candles"] if args.table == "all" else [args.table]
+    db = get_db()
+    for table in tables:
+        with db.engine.connect() as conn:
+            if is_partitioned(conn, table):
+                print(f"✓ {table} is already partitioned")
+                continue
+            plan = _event_plan(conn, now) if table == "system_events" else _candle_plan(conn, now)
+            if args.dry_run:
+                print(f"-- {table}")
+                print(";\n".join(plan) + ";\n")
+                continue
+            print(f"Converting {table} ({len(plan)} statements)...")
+            try:
+                for stmt in plan:
+                    conn.execute(text(stmt))
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                print(f"✗ {table} conversion failed, rolled back: {e}")
+                continue
+            print(f"✓ {table} partitioned")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from decimal import Decimal
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
 from src.config.config import Config
+from src.config.runtime_params import compile_runtime_params
 from src.data.kraken_client import KrakenClient
 from src.strategy.smc_engine import SMCEngine
 from src.risk.risk_manager import RiskManager
@@ -225,6 +226,7 @@ class BacktestEngine:
             starting_equity: Starting capital. If None, uses config value.
         """
         self.config = config
+        self.runtime_params = compile_runtime_params(config)
         
         # V2: Multi-asset support - use specified symbol or default to first spot market
         self.symbol = symbol if symbol else config.exchange.spot_markets[0]
@@ -251,7 +253,9 @@ class BacktestEngine:
         
         # Strategy and risk components
         self.smc_engine = SMCEngine(config.strategy)
-        self.risk_manager = RiskManager(config.risk, liquidity_filters=config.liquidity_filters)
+        self.risk_manager = RiskManager(
+            config.risk, liquidity_filters=config.liquidity_filters, params=self.runtime_params.risk
+        )
         self.basis_guard = BasisGuard(config.risk)
         self.execution = ExecutionEngine(config)
         
@@ -401,29 +405,25 @@ class BacktestEngine:
                          # Progressive trailing: compute R-multiple and apply tighter ATR mult if applicable
                          effective_atr_mult = None  # None = use default from config
                          risk_per_unit = getattr(self.position, '_initial_risk_per_unit', None)
-                         mtp = getattr(self.config, 'multi_tp', None)
-                         prog_enabled = mtp and getattr(mtp, 'progressive_trail_enabled', False)
+                         exit_params = self.runtime_params.exits
                          
-                         if prog_enabled and risk_per_unit and risk_per_unit > 0:
+                         if exit_params.progressive_trail_enabled and risk_per_unit and risk_per_unit > 0:
                              if self.position.side == Side.LONG:
                                  current_r = (spot_price - self.position.entry_price) / risk_per_unit
                              else:
                                  current_r = (self.position.entry_price - spot_price) / risk_per_unit
                              
-                             prog_levels = getattr(mtp, 'progressive_trail_levels', [])
-                             sorted_levels = sorted(prog_levels, key=lambda x: x.get("r_threshold", 0))
+                             levels = exit_params.progressive_trail_levels
                              highest_level = getattr(self.position, '_prog_trail_level', -1)
                              
-                             for idx, level in enumerate(sorted_levels):
-                                 r_thresh = Decimal(str(level.get("r_threshold", 999)))
-                                 if current_r >= r_thresh and idx > highest_level:
+                             for idx, level in enumerate(levels):
+                                 if current_r >= level.r_threshold and idx > highest_level:
                                      self.position._prog_trail_level = idx
-                                     effective_atr_mult = Decimal(str(level.get("atr_mult", 2.0)))
+                                     effective_atr_mult = level.atr_mult
                              
                              # Use the highest applicable ATR mult
                              if hasattr(self.position, '_prog_trail_level') and self.position._prog_trail_level >= 0:
-                                 best_level = sorted_levels[self.position._prog_trail_level]
-                                 effective_atr_mult = Decimal(str(best_level.get("atr_mult", 2.0)))
+                                 effective_atr_mult = levels[self.position._prog_trail_level].atr_mult
                          
                          # Temporarily override execution engine's trailing ATR mult if progressive
                          original_mult = self.execution.config.trailing_atr_mult
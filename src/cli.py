@@ -42,6 +42,10 @@ def _setup_logging_from_config(config, *, log_file: Optional[Path] = None) -> No
         config.monitoring.log_level,
         config.monitoring.log_format,
         log_file=str(log_file) if log_file else None,
+        async_mode=config.monitoring.log_async,
+        queue_size=config.monitoring.log_queue_size,
+        rate_limit_per_key=config.monitoring.log_rate_limit_per_key,
+        rate_limit_window_seconds=config.monitoring.log_rate_limit_window_seconds,
     )
 
 
@@ -369,7 +373,7 @@ def live(
     async def run_live():
         try:
             logger.info("Initializing LiveTrading engine...")
-            engine = LiveTrading(config)
+            engine = LiveTrading(config, config_path=str(config_path))
             logger.info("LiveTrading engine initialized successfully")
             logger.info("Starting main trading loop...")
             await engine.run()
@@ -570,6 +574,50 @@ def report(
     generate_activity_report(hours=hours, format_type=format)
 
 
+@app.command(name="diagnose-startup")
+def diagnose_startup(
+    module: str = typer.Option("src.live.live_trading", "--module", help="Module to import-profile"),
+    top: int = typer.Option(25, "--top", help="Number of modules to list"),
+    config_path: Path = typer.Option("src/config/config.yaml", "--config", help="Path to config file"),
+):
+    """
+    Measure cold-start cost: per-module import time (-X importtime) and config load.
+
+    Runtime phase timings (per-phase wall-clock, time-to-READY) are reported by
+    the running worker in its STARTUP_COMPLETE log line.
+
+    Example:
+        python run.py diagnose-startup --top 30
+    """
+    import time
+    from src.runtime.startup_diagnostics import measure_imports
+
+    try:
+        report = measure_imports(module)
+    except (RuntimeError, OSError) as e:
+        typer.secho(f"Import profiling failed: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    typer.echo(f"Import profile: {module}")
+    typer.echo("=" * 72)
+    typer.echo(f"Total import time: {report.total_us / 1e6:.3f}s "
+               f"(child process wall {report.wall_seconds:.3f}s, {len(report.timings)} modules)")
+    typer.echo(f"\nTop {top} by cumulative time")
+    typer.echo(f"{'cumulative':>12} {'self':>10}  module")
+    for t in report.top_cumulative(top):
+        typer.echo(f"{t.cumulative_us / 1000:>10.1f}ms {t.self_us / 1000:>8.1f}ms  {'  ' * t.depth}{t.module}")
+    typer.echo(f"\nTop {top} by self time")
+    for t in report.top_self(top):
+        typer.echo(f"{t.self_us / 1000:>10.1f}ms  {t.module}")
+
+    started = time.perf_counter()
+    try:
+        _load_config(config_path)
+        typer.echo(f"\nConfig load: {time.perf_counter() - started:.3f}s ({config_path})")
+    except (OSError, ValueError) as e:
+        typer.echo(f"\nConfig load failed: {e}")
+
+
 
 @app.callback()
 def main(
@@ -48,6 +48,13 @@ class ExchangeConfig(BaseSettings):
     circuit_breaker_failure_threshold: int = Field(default=5, ge=2, le=20, description="Consecutive failures before opening breaker")
     circuit_breaker_rate_limit_threshold: int = Field(default=2, ge=1, le=10, description="Rate limit errors before opening breaker")
     circuit_breaker_cooldown_seconds: float = Field(default=60.0, ge=10.0, le=300.0, description="Seconds before half-open probe")
+
+    # Bulk spot ticker fetch (chunks run concurrently; failing chunks are bisected)
+    spot_ticker_chunk_size: int = Field(default=50, ge=1, le=200)
+    spot_ticker_concurrency: int = Field(default=4, ge=1, le=16, description="Chunk requests in flight at once")
+    spot_ticker_request_timeout_seconds: float = Field(default=3.0, gt=0.0, le=30.0)
+    spot_ticker_deadline_seconds: float = Field(default=10.0, gt=0.0, le=120.0, description="Upper bound on one bulk fetch; partial results after that")
+    bad_symbol_ttl_minutes: int = Field(default=60, ge=1, le=1440, description="How long a symbol the exchange rejected is skipped")
     
     # Position size format (for exchange compatibility)
     # If True: exchange returns position size as notional USD (don't multiply by price)
@@ -125,6 +132,11 @@ class RiskConfig(BaseSettings):
     auction_entry_cost: float = Field(default=2.0, ge=0.0, le=10.0)
     auction_exit_cost: float = Field(default=2.0, ge=0.0, le=10.0)
     auction_direction_concentration_penalty: float = Field(default=10.0, ge=0.0, le=50.0, description="Score penalty at max directional imbalance (all positions same side)")
+    auction_solver: Literal["greedy", "exact"] = Field(
+        default="greedy",
+        description="Winner selection: greedy pass, or exact branch-and-bound for small contender sets",
+    )
+    auction_exact_max_contenders: int = Field(default=40, ge=1, le=200, description="Above this many contenders the exact solver falls back to greedy")
     auction_no_signal_persistence_enabled: bool = Field(
         default=False,
         description="When enabled, suppress strategic auction closes until no-signal streak reaches threshold",
@@ -776,6 +788,29 @@ class DataConfig(BaseSettings):
     min_healthy_coins: int = Field(default=30, ge=1, le=500, description="Min coins with sufficient candles to allow new entries")
     min_health_ratio: float = Field(default=0.25, ge=0.05, le=1.0, description="Min ratio sufficient/total to allow new entries")
     
+    # L2 order book cache (entry-time liquidity checks read it instead of REST)
+    orderbook_cache_enabled: bool = Field(default=True, description="Keep L2 snapshots warm for signal symbols")
+    orderbook_refresh_seconds: int = Field(default=15, ge=2, le=300, description="Snapshot interval for watched symbols")
+    orderbook_max_age_seconds: int = Field(default=30, ge=1, le=600, description="Older snapshots fall back to REST")
+    orderbook_depth_levels: int = Field(default=50, ge=5, le=500)
+    orderbook_watch_ttl_seconds: int = Field(default=900, ge=60, le=86400, description="How long a signal symbol stays warm")
+
+    # Bar-close-aligned loop scheduling
+    bar_aligned_scheduler_enabled: bool = Field(default=True, description="Wake the loop on bar closes instead of a fixed 60s sleep")
+    bar_scheduler_timeframes: List[str] = Field(default_factory=lambda: ["15m", "1h", "4h"], description="Timeframes whose closes trigger full analysis")
+    bar_close_settle_seconds: float = Field(default=5.0, ge=0.0, le=120.0, description="Delay after a boundary before analysing (exchange bar finalisation)")
+    management_tick_seconds: int = Field(default=60, ge=15, le=900, description="Cadence of management-only ticks between bar closes")
+
+    # Incremental analysis: reuse NO_SIGNAL results while a symbol's inputs are unchanged
+    incremental_analysis_enabled: bool = Field(default=True, description="Skip generate_signal for symbols whose input fingerprint is unchanged")
+    analysis_price_bucket_bps: float = Field(default=10.0, gt=0.0, le=500.0, description="Price bucket width for the input fingerprint")
+    analysis_cache_max_age_seconds: int = Field(default=3600, ge=60, le=14400, description="Force a full re-analysis at least this often")
+
+    # Process-local trade ledger: answers cooldown / stop-out / churn windows without per-tick SQL
+    trade_ledger_enabled: bool = Field(default=True, description="Serve recent-trade window queries from the in-memory ledger")
+    trade_ledger_retention_hours: int = Field(default=72, ge=6, le=720, description="Closed trades kept in the ledger; longer windows fall back to the DB")
+    trade_ledger_resync_seconds: int = Field(default=900, ge=60, le=86400, description="Incremental DB resync (picks up trades written by other processes)")
+    
     # Data sanity gate
     data_sanity: DataSanityConfig = Field(default_factory=DataSanityConfig)
     
@@ -807,7 +842,22 @@ class MonitoringConfig(BaseSettings):
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     log_format: Literal["json", "text"] = "json"
-    
+    log_async: bool = Field(default=True, description="Write logs from a background thread via a bounded queue")
+    log_queue_size: int = Field(default=10000, ge=100, le=1000000, description="Async log queue capacity (overflow is dropped and counted)")
+    log_rate_limit_per_key: int = Field(default=20, ge=0, le=10000, description="Max events per (logger, level, event, symbol) per window; 0 disables")
+    log_rate_limit_window_seconds: float = Field(default=60.0, gt=0.0, le=3600.0)
+
+    # Memory introspection (registry sizes, tracemalloc diffs, RSS dumps)
+    memory_monitor_enabled: bool = True
+    memory_sample_interval_seconds: int = Field(default=300, ge=30, le=3600)
+    memory_tracemalloc_frames: int = Field(default=0, ge=0, le=25, description="0 disables tracemalloc (it roughly doubles allocation cost)")
+    memory_rss_dump_threshold_mb: float = Field(default=1500.0, ge=0.0, description="Write a memory dump when RSS crosses this; 0 disables")
+    memory_dump_dir: str = "logs"
+
+    # Read models (status / performance / decision projections for the health API and Telegram bot)
+    read_model_performance_window_days: int = Field(default=30, ge=1, le=365)
+    read_model_persist_path: str = Field(default="", description="JSON snapshot written from the heartbeat for out-of-process readers; empty disables")
+
     # Alerts
     alert_margin_usage_threshold_pct: float = Field(default=0.70, ge=0.50, le=0.90)
     alert_liquidation_buffer_threshold_pct: float = Field(default=0.35, ge=0.30, le=0.50)
@@ -865,6 +915,8 @@ class SystemConfig(BaseSettings):
     name: str = "Trading System"
     version: str = "3.0.0"
     dry_run: bool = False  # If True, no real orders are placed
+    # Re-read config.yaml / safety.yaml between ticks and swap hot-reloadable sections in place
+    config_hot_reload_enabled: bool = True
 
 
 class SpotDCAConfig(BaseSettings):
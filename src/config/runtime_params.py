@@ -0,0 +1,335 @@
+"""
+Precompiled, read-only views of the config for hot paths.
+
+The pydantic models in ``src.config.config`` are convenient to load and
+validate but slow to read in loops: every access goes through ``getattr``
+with a default, numeric settings are re-converted with ``Decimal(str(...))``
+and list settings are re-sorted or re-normalized on each call. The frozen
+dataclasses here do that work once, when the config is loaded (or swapped),
+and the per-bar / per-signal code reads plain attributes.
+
+Each ``from_*`` constructor reproduces the defaults and conversions the
+inline code used, so behaviour is unchanged. Components that hold a params
+object recompile it when their config object is replaced (identity check),
+so a config swap never leaves them reading stale values.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from src.data.symbol_utils import spot_symbol_key
+
+
+# ---------------------------------------------------------------------------
+# Exits (multi_tp): progressive trailing and trailing activation
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class TrailLevel:
+    """One progressive-trail step: tighten to ``atr_mult`` once ``r_threshold`` R is reached."""
+    r_threshold: Decimal
+    atr_mult: Decimal
+
+
+@dataclass(frozen=True)
+class ExitParams:
+    """Exit-management settings from ``MultiTPConfig``; levels sorted by R threshold."""
+    progressive_trail_enabled: bool = False
+    progressive_trail_levels: Tuple[TrailLevel, ...] = ()
+    trailing_activation_atr_min: Decimal = Decimal("0")
+
+    @classmethod
+    def from_multi_tp(cls, multi_tp_config: Any) -> "ExitParams":
+        if not multi_tp_config:
+            return cls()
+        raw_levels = getattr(multi_tp_config, "progressive_trail_levels", []) or []
+        levels = tuple(
+            TrailLevel(
+                r_threshold=Decimal(str(level.get("r_threshold", 999))),
+                atr_mult=Decimal(str(level.get("atr_mult", 2.0))),
+            )
+            for level in sorted(raw_levels, key=lambda x: x.get("r_threshold", 0))
+        )
+        return cls(
+            progressive_trail_enabled=bool(getattr(multi_tp_config, "progressive_trail_enabled", False)),
+            progressive_trail_levels=levels,
+            trailing_activation_atr_min=Decimal(
+                str(getattr(multi_tp_config, "trailing_activation_atr_min", 0))
+            ),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Risk: config-only inputs of RiskManager's per-snapshot terms
+# ---------------------------------------------------------------------------
+
+_FUNDING_INTERVAL_HOURS = Decimal("8")  # Funding every 8 hours
+_FEE_EDGE_REGIMES = ("tight_smc", "wide_structure")
+
+
+def fee_edge_costs(config: Any, regime: str) -> dict:
+    """
+    Cost side of the fee-edge gate in bps: conservative fee + slippage + funding
+    with a configurable cost buffer multiplier, and the required edge.
+    """
+    taker_fee_bps = Decimal(str(config.taker_fee_bps))
+    maker_fee_bps = Decimal(str(config.maker_fee_bps))
+    conservative_taker = bool(getattr(config, "fee_edge_use_conservative_taker", True))
+    fees_bps_rt = (
+        taker_fee_bps * Decimal("2")
+        if conservative_taker
+        else (maker_fee_bps + taker_fee_bps)
+    )
+    slippage_bps_rt = Decimal(str(getattr(config, "fee_edge_slippage_bps_est", 4.0)))
+    avg_hold_hours = Decimal(
+        str(
+            config.tight_smc_avg_hold_hours
+            if regime == "tight_smc"
+            else config.wide_structure_avg_hold_hours
+        )
+    )
+    funding_bps_from_hold = Decimal(str(config.funding_rate_daily_bps)) * (
+        avg_hold_hours / Decimal("24")
+    )
+    funding_floor_bps = Decimal(str(getattr(config, "fee_edge_funding_floor_bps", 2.0)))
+    funding_bps_est = max(funding_bps_from_hold, funding_floor_bps)
+
+    buffer_mult = Decimal(str(getattr(config, "fee_edge_cost_buffer_multiplier", 1.2)))
+    fee_bps_rt = (fees_bps_rt + slippage_bps_rt + funding_bps_est) * buffer_mult
+    edge_multiple_k = Decimal(str(getattr(config, "fee_edge_multiple_k", 5.0)))
+    required_bps = fee_bps_rt * edge_multiple_k
+
+    return {
+        "fee_bps_rt": fee_bps_rt,
+        "required_bps": required_bps,
+        "fees_bps_rt": fees_bps_rt,
+        "slippage_bps_rt": slippage_bps_rt,
+        "funding_bps_est": funding_bps_est,
+        "edge_multiple_k": edge_multiple_k,
+    }
+
+
+@dataclass(frozen=True)
+class RiskParams:
+    """
+    ``RiskConfig`` values used by every trade validation, pre-converted.
+
+    Account-level terms (equity, open positions, daily P&L) are combined with
+    these per snapshot in ``RiskManager._risk_terms``.
+    """
+    sizing_method: str
+    risk_per_trade_pct: Decimal
+    kelly_fraction: Optional[Decimal]
+    kelly_abs_risk_cap_pct: Decimal
+    vol_thresholds: Optional[Tuple[float, float, float, float]]  # high, low, high-vol penalty, low-vol boost
+    target_leverage: Decimal
+    max_usd: Decimal
+    max_single_margin_pct: Decimal
+    max_aggregate_margin_pct: Decimal
+    max_loss_per_trade_usd: Decimal
+    min_liquidation_buffer_pct: Decimal
+    basis_max: Decimal
+    position_limit: int
+    daily_loss_limit_pct: Decimal
+    taker_fee_rate: Decimal
+    daily_funding_rate: Decimal
+    tight_funding_probability: Decimal
+    wide_funding_intervals: Decimal
+    tight_cost_cap_decimal: Decimal
+    tight_min_rr: Decimal
+    wide_max_distortion: Decimal
+    wide_projected_funding_bps: Decimal
+    wide_funding_cap_bps: Decimal
+    tight_stop_threshold: Decimal
+    fee_edge_guard_enabled: bool
+    fee_edge_costs: Dict[str, dict] = field(default_factory=dict)  # regime -> cost side; treat as read-only
+
+    @classmethod
+    def from_risk_config(cls, config: Any) -> "RiskParams":
+        sizing_method = getattr(config, "sizing_method", "fixed")
+
+        kelly_fraction = None
+        if sizing_method in ["kelly", "kelly_volatility"]:
+            win_prob = Decimal(str(config.kelly_win_prob))
+            win_loss_ratio = Decimal(str(config.kelly_win_loss_ratio))
+            # Kelly % = W - (1-W)/R, capped (Quarter Kelly defaults to 0.25)
+            kelly_pct = win_prob - ((Decimal("1") - win_prob) / win_loss_ratio)
+            kelly_fraction = min(kelly_pct, Decimal(str(config.kelly_max_fraction)))
+
+        vol_thresholds = None
+        if sizing_method in ["volatility", "kelly_volatility"]:
+            vol_thresholds = (
+                float(getattr(config, "vol_sizing_atr_threshold_high", 1.5)),
+                float(getattr(config, "vol_sizing_atr_threshold_low", 0.8)),
+                float(getattr(config, "vol_sizing_high_vol_penalty", 0.6)),
+                float(getattr(config, "vol_sizing_low_vol_boost", 1.2)),
+            )
+
+        daily_funding_bps = Decimal(str(config.funding_rate_daily_bps))
+        wide_hold_hours = Decimal(str(config.wide_structure_avg_hold_hours))
+        fee_edge_guard_enabled = bool(getattr(config, "fee_edge_guard_enabled", False))
+        return cls(
+            sizing_method=sizing_method,
+            risk_per_trade_pct=Decimal(str(config.risk_per_trade_pct)),
+            kelly_fraction=kelly_fraction,
+            kelly_abs_risk_cap_pct=Decimal(str(config.max_risk_per_trade_entry_pct)),
+            vol_thresholds=vol_thresholds,
+            target_leverage=Decimal(str(getattr(config, "target_leverage", config.max_leverage))),
+            max_usd=Decimal(str(config.max_position_size_usd)),
+            max_single_margin_pct=Decimal(str(getattr(config, "max_single_position_margin_pct_equity", 0.25))),
+            max_aggregate_margin_pct=Decimal(str(getattr(config, "max_aggregate_margin_pct_equity", 2.0))),
+            max_loss_per_trade_usd=Decimal(str(getattr(config, "max_loss_per_trade_usd", 500.0))),
+            min_liquidation_buffer_pct=Decimal(str(config.min_liquidation_buffer_pct)),
+            basis_max=Decimal(str(getattr(config, "basis_max_pct", "0.0075"))),
+            # If auction mode is enabled, ignore max_concurrent_positions and use auction_max_positions instead
+            position_limit=(
+                config.auction_max_positions if config.auction_mode_enabled else config.max_concurrent_positions
+            ),
+            daily_loss_limit_pct=Decimal(str(config.daily_loss_limit_pct)),
+            taker_fee_rate=Decimal(str(config.taker_fee_bps)) / Decimal("10000"),
+            daily_funding_rate=daily_funding_bps / Decimal("10000"),
+            # Probability of paying funding = min(avg_hold / 8, 1.0)
+            tight_funding_probability=min(
+                Decimal(str(config.tight_smc_avg_hold_hours)) / _FUNDING_INTERVAL_HOURS, Decimal("1.0")
+            ),
+            wide_funding_intervals=wide_hold_hours / _FUNDING_INTERVAL_HOURS,
+            tight_cost_cap_decimal=Decimal(str(config.tight_smc_cost_cap_bps / 10000)),  # bps to decimal
+            tight_min_rr=Decimal(str(config.tight_smc_min_rr_multiple)),
+            wide_max_distortion=Decimal(str(config.wide_structure_max_distortion_pct)),
+            wide_projected_funding_bps=daily_funding_bps * (wide_hold_hours / Decimal("24")),
+            wide_funding_cap_bps=Decimal(str(getattr(config, "wide_structure_funding_hard_cap_bps", 0.0))),
+            tight_stop_threshold=Decimal(str(config.tight_stop_threshold_pct)),
+            fee_edge_guard_enabled=fee_edge_guard_enabled,
+            fee_edge_costs={regime: fee_edge_costs(config, regime) for regime in _FEE_EDGE_REGIMES},
+        )
+
+
+# ---------------------------------------------------------------------------
+# Auction: chop detection, per-symbol loss cooldown, entry blocklist
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SymbolCooldownParams:
+    """Loss-cooldown window for one symbol (base values or canary overrides)."""
+    lookback_hours: int
+    loss_threshold: int
+    cooldown_hours: int
+    min_pnl_pct: float
+    canary_applied: bool = False
+
+
+@dataclass(frozen=True)
+class SymbolCooldownPolicy:
+    """Per-symbol loss-cooldown settings with the canary symbol set pre-normalized."""
+    enabled: bool
+    base: SymbolCooldownParams
+    canary: Optional[SymbolCooldownParams] = None  # None when canary overrides are disabled
+    canary_symbols: FrozenSet[str] = frozenset()  # empty = canary applies to every symbol
+
+    @classmethod
+    def from_strategy(cls, strategy_config: Any) -> "SymbolCooldownPolicy":
+        base = SymbolCooldownParams(
+            lookback_hours=int(getattr(strategy_config, "symbol_loss_lookback_hours", 24)),
+            loss_threshold=int(getattr(strategy_config, "symbol_loss_threshold", 3)),
+            cooldown_hours=int(getattr(strategy_config, "symbol_loss_cooldown_hours", 12)),
+            min_pnl_pct=float(getattr(strategy_config, "symbol_loss_min_pnl_pct", -0.5)),
+        )
+        enabled = bool(getattr(strategy_config, "symbol_loss_cooldown_enabled", True))
+        if not bool(getattr(strategy_config, "symbol_loss_cooldown_canary_enabled", False)):
+            return cls(enabled=enabled, base=base)
+
+        def _override(field_name: str, default):
+            value = getattr(strategy_config, field_name, None)
+            return default if value is None else type(default)(value)
+
+        canary = SymbolCooldownParams(
+            lookback_hours=_override("symbol_loss_cooldown_canary_lookback_hours", base.lookback_hours),
+            loss_threshold=_override("symbol_loss_cooldown_canary_threshold", base.loss_threshold),
+            cooldown_hours=_override("symbol_loss_cooldown_canary_hours", base.cooldown_hours),
+            min_pnl_pct=_override("symbol_loss_cooldown_canary_min_pnl_pct", base.min_pnl_pct),
+            canary_applied=True,
+        )
+        canary_symbols = frozenset(
+            spot_symbol_key(s)
+            for s in (getattr(strategy_config, "symbol_loss_cooldown_canary_symbols", []) or [])
+        )
+        return cls(enabled=enabled, base=base, canary=canary, canary_symbols=canary_symbols)
+
+    def resolve(self, symbol: str) -> SymbolCooldownParams:
+        """Cooldown window for ``symbol``: canary overrides when it is in the canary set."""
+        if self.canary is None:
+            return self.base
+        if self.canary_symbols and spot_symbol_key(symbol) not in self.canary_symbols:
+            return self.base
+        return self.canary
+
+
+@dataclass(frozen=True)
+class EntryBlocklist:
+    """Hard entry blocklist (``ExecutionConfig.entry_blocklist_*``), normalized once."""
+    spot_symbols: FrozenSet[str] = frozenset()
+    bases: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_execution(cls, execution_config: Any) -> "EntryBlocklist":
+        return cls(
+            spot_symbols=frozenset(
+                s.strip().upper().split(":")[0]
+                for s in getattr(execution_config, "entry_blocklist_spot_symbols", []) or []
+            ),
+            bases=frozenset(
+                b.strip().upper()
+                for b in getattr(execution_config, "entry_blocklist_bases", []) or []
+            ),
+        )
+
+    def block_reason(self, symbol: str) -> Optional[str]:
+        """"blocked_spot_symbol" / "blocked_base" if a new entry on ``symbol`` is blocked, else None."""
+        spot_key = (symbol or "").strip().upper().split(":")[0]
+        if spot_key and spot_key in self.spot_symbols:
+            return "blocked_spot_symbol"
+        base = spot_key.split("/")[0].strip() if "/" in spot_key else spot_key
+        if base and base in self.bases:
+            return "blocked_base"
+        return None
+
+
+@dataclass(frozen=True)
+class AuctionParams:
+    """Per-signal settings read by the auction candidate loop."""
+    chop_adx_threshold: float
+    chop_score_std_threshold: float
+    symbol_cooldown: SymbolCooldownPolicy
+    entry_blocklist: EntryBlocklist
+
+    @classmethod
+    def from_config(cls, config: Any) -> "AuctionParams":
+        return cls(
+            chop_adx_threshold=float(getattr(config.risk, "auction_chop_adx_threshold", 18.0) or 18.0),
+            chop_score_std_threshold=float(getattr(config.risk, "auction_chop_score_std_threshold", 6.0) or 6.0),
+            symbol_cooldown=SymbolCooldownPolicy.from_strategy(config.strategy),
+            entry_blocklist=EntryBlocklist.from_execution(config.execution),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Aggregate
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class RuntimeParams:
+    """All precompiled views of one ``Config``; rebuilt whenever the config is (re)loaded."""
+    risk: RiskParams
+    exits: ExitParams
+    auction: AuctionParams
+
+
+def compile_runtime_params(config: Any) -> RuntimeParams:
+    """Build the hot-path views of ``config`` (a full ``Config``)."""
+    return RuntimeParams(
+        risk=RiskParams.from_risk_config(config.risk),
+        exits=ExitParams.from_multi_tp(getattr(config, "multi_tp", None)),
+        auction=AuctionParams.from_config(config),
+    )
@@ -124,6 +124,8 @@ def get_cycle_guard_config(config: Optional[dict] = None) -> dict:
         "max_cycle_duration_seconds": cg_config.get("max_cycle_duration_seconds", 300),
         "max_candle_age_seconds": cg_config.get("max_candle_age_seconds", 120),
         "max_clock_skew_seconds": cg_config.get("max_clock_skew_seconds", 30),
+        "profile_slow_cycle_seconds": cg_config.get("profile_slow_cycle_seconds", 0.0),
+        "profile_sample_every": cg_config.get("profile_sample_every", 0),
     }
 
 
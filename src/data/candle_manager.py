@@ -4,6 +4,7 @@ from typing import Callable, Dict, List, Optional, Any
 from collections import defaultdict
 
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics import tick_stage_histogram, timed
 from src.domain.models import Candle
 from src.data.kraken_client import KrakenClient
 from src.storage.repository import load_candles_map, save_candles_bulk, get_latest_candle_timestamp
@@ -72,26 +73,18 @@ class CandleManager:
                 sample={s: len(self.candles["15m"].get(s, [])) for s in sorted(markets)[:3]},
             )
 
-        res_15m = await asyncio.to_thread(load_candles_map, markets, "15m", days=14)
-        for s, cands in res_15m.items():
-            if s not in self.candles["15m"]: self.candles["15m"][s] = cands
-            else: self._merge_candles(s, "15m", cands)
+        # The four timeframe loads are independent queries; run them on
+        # separate threads (separate pooled sessions) and merge afterwards.
+        windows = (("15m", 14), ("1h", 60), ("4h", 180), ("1d", 365))
+        results = await asyncio.gather(*(
+            asyncio.to_thread(load_candles_map, markets, tf, days=days)
+            for tf, days in windows
+        ))
+        for (tf, _), res in zip(windows, results):
+            for s, cands in res.items():
+                if s not in self.candles[tf]: self.candles[tf][s] = cands
+                else: self._merge_candles(s, tf, cands)
 
-        res_1h = await asyncio.to_thread(load_candles_map, markets, "1h", days=60)
-        for s, cands in res_1h.items():
-            if s not in self.candles["1h"]: self.candles["1h"][s] = cands
-            else: self._merge_candles(s, "1h", cands)
-        
-        res_4h = await asyncio.to_thread(load_candles_map, markets, "4h", days=180)
-        for s, cands in res_4h.items():
-            if s not in self.candles["4h"]: self.candles["4h"][s] = cands
-            else: self._merge_candles(s, "4h", cands)
-        
-        res_1d = await asyncio.to_thread(load_candles_map, markets, "1d", days=365)
-        for s, cands in res_1d.items():
-            if s not in self.candles["1d"]: self.candles["1d"][s] = cands
-            else: self._merge_candles(s, "1d", cands)
-        
         # Initialize update trackers
         now = datetime.now(timezone.utc)
         for symbol in markets:
@@ -206,6 +199,7 @@ class CandleManager:
         self._futures_fallback_symbols.clear()
         return n
 
+    @timed(tick_stage_histogram(), stage="update_candles")
     async def update_candles(self, symbol: str):
         """Update candles for a symbol (Incremental). Uses spot OHLCV; if unavailable and use_futures_fallback, uses futures OHLCV."""
         now = datetime.now(timezone.utc)
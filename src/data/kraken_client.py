@@ -27,8 +27,10 @@ from decimal import Decimal
 from collections import deque
 from dataclasses import dataclass
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics import get_metrics_registry, timed
 from src.domain.models import Candle
 from src.data.fiat_currencies import has_disallowed_base, is_disallowed_trading_base
+from src.data.ticker_batch import BadSymbolCache, TickerBatch, fetch_tickers_batched
 from src.constants import (
     PUBLIC_API_CAPACITY,
     PUBLIC_API_REFILL_RATE,
@@ -50,6 +52,22 @@ from src.utils.retry import retry_on_transient_errors
 
 logger = get_logger(__name__)
 
+_API_LATENCY = get_metrics_registry().histogram(
+    "trading_kraken_api_latency_ms",
+    "KrakenClient public call latency (includes retries and rate-limit waits)",
+    ("endpoint", "outcome"),
+)
+
+
+def _api_timed(fn):
+    """
+    Observe a KrakenClient method into ``_API_LATENCY`` labelled by method name.
+
+    Not applied to thin aliases (``get_ticker``, ``create_order``, ...) that
+    just await another timed method; that call would be counted twice.
+    """
+    return timed(_API_LATENCY, endpoint=fn.__name__)(fn)
+
 
 def _extract_venue_error(exc: Exception) -> tuple:
     """Extract venue error code and message from Kraken/ccxt exception. Returns (code, message)."""
@@ -154,6 +172,11 @@ class KrakenClient:
         breaker_failure_threshold: int = 5,
         breaker_rate_limit_threshold: int = 2,
         breaker_cooldown_seconds: float = 60.0,
+        spot_ticker_chunk_size: int = 50,
+        spot_ticker_concurrency: int = 4,
+        spot_ticker_request_timeout_seconds: float = 3.0,
+        spot_ticker_deadline_seconds: float = 10.0,
+        bad_symbol_ttl_seconds: float = 3600.0,
     ):
         """
         Initialize Kraken client.
@@ -165,6 +188,8 @@ class KrakenClient:
             futures_api_secret: Kraken Futures API secret (optional)
             use_testnet: Use testnet
             market_cache_minutes: TTL for get_spot_markets/get_futures_markets cache (default 60)
+            spot_ticker_*: chunking, parallelism and time bounds of fetch_spot_tickers
+            bad_symbol_ttl_seconds: how long a symbol the exchange rejected is skipped
         """
         self.api_key = api_key
         self.api_secret = api_secret
@@ -205,6 +230,13 @@ class KrakenClient:
         # Reusable SSL context
         self._ssl_context = None
         
+        # Bulk spot ticker fetch (see src/data/ticker_batch.py)
+        self._spot_ticker_chunk_size = max(1, spot_ticker_chunk_size)
+        self._spot_ticker_concurrency = max(1, spot_ticker_concurrency)
+        self._spot_ticker_request_timeout = spot_ticker_request_timeout_seconds
+        self._spot_ticker_deadline = spot_ticker_deadline_seconds
+        self._bad_spot_symbols = BadSymbolCache(ttl_seconds=bad_symbol_ttl_seconds)
+
         # Persistent HTTP session for connection reuse (created lazily)
         self._http_session: Optional[aiohttp.ClientSession] = None
 
@@ -369,6 +401,7 @@ class KrakenClient:
         """Check if futures API keys are present."""
         return bool(self.futures_api_key and self.futures_api_secret and not self.futures_api_key.startswith("${"))
 
+    @_api_timed
     async def initialize(self):
         """
         Lazy initialization of CCXT exchanges.
@@ -406,6 +439,7 @@ class KrakenClient:
         
         logger.info("Kraken client initialized")
 
+    @_api_timed
     async def get_spot_markets(self) -> Dict[str, dict]:
         """
         Fetch Kraken spot markets (USD-quoted, active). Cached for market_cache_minutes.
@@ -442,6 +476,7 @@ class KrakenClient:
                 logger.error("Failed to fetch spot markets", error=str(e))
                 raise
 
+    @_api_timed
     async def get_futures_markets(self) -> Dict[str, dict]:
         """
         Fetch Kraken futures perpetuals (swap, active). Cached for market_cache_minutes.
@@ -497,6 +532,7 @@ class KrakenClient:
                 logger.error("Failed to fetch futures markets", error=str(e))
                 raise
 
+    @_api_timed
     async def get_spot_balance(self) -> Dict[str, Any]:
         """
         Get spot account balance using CCXT.
@@ -520,6 +556,7 @@ class KrakenClient:
             logger.error("Failed to fetch spot balance", error=str(e))
             raise classified from e
 
+    @_api_timed
     async def get_spot_ticker(self, symbol: str) -> Dict:
         """Get current spot ticker information."""
         await self.public_limiter.wait_for_token()
@@ -548,53 +585,40 @@ class KrakenClient:
         """
         return await self.get_spot_ticker(symbol)
 
+    @_api_timed
     async def get_spot_tickers_bulk(self, symbols: List[str]) -> Dict[str, Dict]:
         """
-        Get spot tickers for multiple symbols in one call.
-        Returns dict: {symbol: ticker_data}
-        Handles invalid symbols gracefully by skipping them.
-        """
-        await self.public_limiter.wait_for_token()
-        results = {}
-        chunk_size = 50 
-        
-        for i in range(0, len(symbols), chunk_size):
-            chunk = symbols[i:i + chunk_size]
-            try:
-                # Wrap bulk fetch in timeout
-                tickers = await asyncio.wait_for(
-                    self.exchange.fetch_tickers(chunk),
-                    timeout=3.0
-                )
-                results.update(tickers)
-            except asyncio.TimeoutError:
-                 logger.debug(f"Bulk fetch timed out for chunk {i//chunk_size}, falling back to individual")
-                 pass 
-            except Exception as e:
-                # If bulk fetch fails, it might be due to ONE bad symbol in the chunk
-                logger.debug(f"Bulk fetch failed for chunk {i//chunk_size}, falling back to individual", error=str(e))
-                pass
-
-            # Fallback logic: check which symbols are missing from results and fetch individually
-            # This handles both timeouts and partial failures (invalid symbols)
-            missing = [s for s in chunk if s not in results]
-            if missing:
-                for symbol in missing:
-                    try:
-                        # Wrap individual fetch in short timeout
-                        ticker = await asyncio.wait_for(
-                            self.get_spot_ticker(symbol),
-                            timeout=0.5
-                        )
-                        results[symbol] = ticker
-                    except Exception as e:
-                        # Log as debug to avoid spamming warnings for unsupported coins
-                        logger.debug(f"Individual fetch failed for {symbol}", error=str(e))
-                        pass
-                    await asyncio.sleep(0) # Yield
-        
-        return results
+        Get spot tickers for multiple symbols.
+        Returns dict: {symbol: ticker_data}; symbols that could not be
+        fetched are left out (``fetch_spot_tickers`` reports why).
+        """
+        return (await self.fetch_spot_tickers(symbols)).tickers
+
+    async def fetch_spot_tickers(
+        self, symbols: List[str], deadline_seconds: Optional[float] = None
+    ) -> TickerBatch:
+        """
+        Concurrent bulk spot ticker fetch with partial results.
+
+        Chunks go out in parallel under the public rate limiter; chunks the
+        exchange rejects are bisected to isolate bad symbols, which are then
+        skipped for ``bad_symbol_ttl_seconds``. Returns within
+        ``deadline_seconds`` (default: the client's configured deadline) with
+        whatever arrived plus an error code for every symbol that didn't.
+        """
+        return await fetch_tickers_batched(
+            self.exchange.fetch_tickers,
+            symbols,
+            classify=self._classify_exception,
+            acquire=self.public_limiter.wait_for_token,
+            bad_symbols=self._bad_spot_symbols,
+            chunk_size=self._spot_ticker_chunk_size,
+            concurrency=self._spot_ticker_concurrency,
+            request_timeout=self._spot_ticker_request_timeout,
+            deadline_seconds=deadline_seconds if deadline_seconds is not None else self._spot_ticker_deadline,
+        )
 
+    @_api_timed
     async def get_spot_ohlcv(
         self,
         symbol: str,
@@ -669,6 +693,7 @@ class KrakenClient:
             )
             raise classified from e
     
+    @_api_timed
     async def get_futures_ohlcv(
         self,
         futures_symbol: str,
@@ -748,6 +773,7 @@ class KrakenClient:
                 return pos
         return None
 
+    @_api_timed
     @retry_on_transient_errors(max_retries=3, base_delay=1.0)
     async def get_all_futures_positions(self) -> List[Dict]:
         """
@@ -796,6 +822,7 @@ class KrakenClient:
             logger.error("Failed to fetch all futures positions", error=str(e))
             raise classified from e
     
+    @_api_timed
     async def get_futures_instruments(self) -> List[Dict]:
         """
         Fetch all futures instruments and their specifications.
@@ -814,6 +841,7 @@ class KrakenClient:
             logger.error("Failed to fetch futures instruments", error=str(e))
             raise
 
+    @_api_timed
     async def get_futures_mark_price(self, symbol: str) -> Decimal:
         """
         Get current mark price from Kraken Futures official feed.
@@ -873,6 +901,24 @@ class KrakenClient:
             logger.error("Failed to fetch futures mark price", symbol=symbol, error=str(e))
             raise
 
+    @_api_timed
+    async def get_futures_orderbook(self, symbol: str, limit: int = 50) -> Optional[Dict[str, Any]]:
+        """
+        Fetch an L2 order book snapshot for a futures symbol (public endpoint).
+
+        Returns CCXT-shaped dict with ``bids``/``asks`` ([[price, size], ...])
+        and ``timestamp`` (ms), or None when futures are not configured.
+        Used to feed OrderBookDepthCache for entry-time liquidity checks.
+        """
+        if not self.futures_exchange:
+            return None
+        await self.public_limiter.wait_for_token()
+        return await self._guarded_call(
+            self.futures_exchange.fetch_order_book(symbol, limit),
+            label="get_futures_orderbook",
+        )
+
+    @_api_timed
     async def get_futures_tickers_bulk(self) -> Dict[str, Decimal]:
         """
         Get ALL futures mark prices in one call.
@@ -969,6 +1015,7 @@ class KrakenClient:
             logger.error("Failed to fetch bulk futures tickers", error=str(e))
             raise classified from e
 
+    @_api_timed
     async def get_futures_tickers_bulk_full(self) -> Dict[str, FuturesTicker]:
         """
         Get ALL futures tickers with full data for market discovery filtering.
@@ -1084,6 +1131,7 @@ class KrakenClient:
             logger.error("Failed to fetch bulk full futures tickers", error=str(e))
             raise classified from e
     
+    @_api_timed
     async def get_account_balance(self) -> Dict[str, Decimal]:
         """
         Get account balance (spot).
@@ -1110,6 +1158,7 @@ class KrakenClient:
             logger.error("Failed to fetch account balance", error=str(e))
             raise classified from e
     
+    @_api_timed
     async def get_futures_fills(
         self,
         symbol: Optional[str] = None,
@@ -1149,6 +1198,7 @@ class KrakenClient:
             logger.error("Failed to fetch futures fills", error=str(e), symbol=symbol)
             raise classified from e
 
+    @_api_timed
     async def place_spot_order(
         self,
         symbol: str,
@@ -1212,6 +1262,7 @@ class KrakenClient:
             logger.error("Failed to place spot order", error=str(e), symbol=symbol, side=side)
             raise classified from e
 
+    @_api_timed
     async def place_futures_order(
         self,
         symbol: str,
@@ -1461,6 +1512,7 @@ class KrakenClient:
             client_order_id=client_order_id,
         )
 
+    @_api_timed
     @retry_on_transient_errors(max_retries=3, base_delay=1.0)
     async def get_futures_balance(self) -> Dict[str, Any]:
         """
@@ -1485,6 +1537,7 @@ class KrakenClient:
             logger.error("Failed to fetch futures balance", error=str(e))
             raise classified from e
 
+    @_api_timed
     @retry_on_transient_errors(max_retries=3, base_delay=1.0)
     async def get_futures_account_info(self) -> Dict[str, Any]:
         """
@@ -1511,6 +1564,7 @@ class KrakenClient:
             "balance": balance,
         }
 
+    @_api_timed
     async def get_futures_open_orders(self) -> List[Dict[str, Any]]:
         """
         Get all open futures orders using CCXT.
@@ -1564,6 +1618,7 @@ class KrakenClient:
             logger.error("Failed to fetch futures open orders", error=str(e))
             raise classified from e
 
+    @_api_timed
     async def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Fetch a single order by id (open or closed).
@@ -1597,6 +1652,7 @@ class KrakenClient:
             logger.debug("fetch_order failed", order_id=order_id, symbol=symbol, error=str(e))
             return None
 
+    @_api_timed
     async def cancel_futures_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """
         Cancel a futures order using CCXT.
@@ -1633,6 +1689,7 @@ class KrakenClient:
             logger.error("Failed to cancel futures order", order_id=order_id, error=str(e))
             raise classified from e
 
+    @_api_timed
     async def edit_futures_order(
         self,
         *,
@@ -1741,6 +1798,7 @@ class KrakenClient:
         """CCXT-style cancel_order for ExecutionGateway. Delegates to cancel_futures_order."""
         return await self.cancel_futures_order(order_id, symbol)
 
+    @_api_timed
     async def cancel_all_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Cancel all open futures orders.
@@ -1776,6 +1834,7 @@ class KrakenClient:
             logger.error("Failed to cancel all orders", error=str(e))
             raise
 
+    @_api_timed
     async def close_position(self, symbol: str) -> Dict[str, Any]:
         """
         Close an entire position at market price.
@@ -4,7 +4,8 @@ Market Discovery Service.
 Thin wrapper over MarketRegistry—single source of truth for discoverable markets.
 Returns spot -> futures symbol mapping for live trading.
 """
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Set
 from datetime import datetime, timezone
 import json
 from pathlib import Path
@@ -19,6 +20,35 @@ logger = get_logger(__name__)
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 MARKETS_FILE = DATA_DIR / "discovered_markets.json"
 DISCOVERY_GAP_FILE = DATA_DIR / "discovery_gap_report.json"
+MARKET_METADATA_CACHE_FILE = DATA_DIR / "market_metadata_cache.json"
+
+
+@dataclass
+class UniverseDelta:
+    """Change between two spot -> futures universes."""
+    added: Dict[str, str] = field(default_factory=dict)
+    removed: Set[str] = field(default_factory=set)
+    remapped: Dict[str, str] = field(default_factory=dict)  # spot -> new futures symbol
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.remapped)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "added": dict(self.added),
+            "removed": sorted(self.removed),
+            "remapped": dict(self.remapped),
+        }
+
+
+def universe_delta(old: Mapping[str, str], new: Mapping[str, str]) -> UniverseDelta:
+    """Symbols added, removed or mapped to a different futures contract going from ``old`` to ``new``."""
+    return UniverseDelta(
+        added={s: f for s, f in new.items() if s not in old},
+        removed={s for s in old if s not in new},
+        remapped={s: f for s, f in new.items() if s in old and old[s] != f},
+    )
 
 
 class MarketDiscoveryService:
@@ -30,8 +60,10 @@ class MarketDiscoveryService:
     def __init__(self, client: KrakenClient, config: object):
         self.client = client
         self.config = config
-        self._registry = MarketRegistry(client, config)
+        self._registry = MarketRegistry(client, config, cache_path=MARKET_METADATA_CACHE_FILE)
         self._cache_valid_seconds = 3600 * 24  # 24 hours
+        self._last_mapping: Dict[str, str] = {}
+        self.last_delta: Optional[UniverseDelta] = None
 
     async def discover_markets(self, filter_volume: bool = True) -> Dict[str, str]:
         """
@@ -46,11 +78,17 @@ class MarketDiscoveryService:
             mapping = {spot: pair.futures_symbol for spot, pair in pairs.items()}
             sorted_spots = sorted(mapping.keys())
             discovery_report = self._registry.get_last_discovery_report()
+            self.last_delta = universe_delta(self._last_mapping, mapping)
+            self._last_mapping = dict(mapping)
 
             logger.info(
                 "Market discovery complete",
                 eligible_pairs=len(mapping),
                 sample=sorted_spots[:5],
+                added=len(self.last_delta.added),
+                removed=len(self.last_delta.removed),
+                remapped=len(self.last_delta.remapped),
+                **self._registry.last_discovery_stats,
             )
 
             self._save_to_disk(sorted_spots, mapping, discovery_report)
@@ -63,6 +101,7 @@ class MarketDiscoveryService:
                         "count": len(sorted_spots),
                         "markets": sorted_spots,
                         "mapping": mapping,
+                        "delta": self.last_delta.to_dict(),
                         "gap_summary": (discovery_report or {}).get("totals", {}),
                         "gap_status_counts": (discovery_report or {}).get("status_counts", {}),
                         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -3,11 +3,24 @@ Market Registry for automatic discovery and validation of tradable pairs.
 
 Discovers spot markets and futures perpetuals, builds validated mappings,
 and applies liquidity filters to determine eligible trading pairs.
+
+Discovery runs as a pipeline: the spot market list, the futures market list
+and the futures tickers are fetched concurrently; spot tickers follow once
+the candidate pairs are known. Candidate pairs are cached under a hash of
+the two market lists (optionally on disk, see ``cache_path``), so an
+unchanged listing is not re-mapped; per-symbol filter verdicts are memoized
+on their liquidity inputs, so a refresh only re-filters symbols whose
+tickers changed.
 """
 import asyncio
+import hashlib
+import json
+import os
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime, timezone
 
 from src.data.kraken_client import KrakenClient, FuturesTicker
@@ -52,13 +65,20 @@ class MarketRegistry:
     - Return only eligible pairs
     """
     
-    def __init__(self, client: KrakenClient, config):
+    def __init__(self, client: KrakenClient, config, cache_path: Optional[Union[str, Path]] = None):
         self.client = client
         self.config = config
         self.discovered_pairs: Dict[str, MarketPair] = {}
         self.last_discovery: Optional[datetime] = None
         self.last_discovery_report: Dict[str, Any] = {}
         self._last_seen_futures_symbols: Set[str] = set()
+        # Market-list hash -> candidate pairs as {spot: [futures_symbol, source]}
+        self._cache_path = Path(cache_path) if cache_path else None
+        self._candidates_hash: Optional[str] = None
+        self._candidates: Dict[str, List[str]] = {}
+        # spot symbol -> (liquidity-input key, filtered pair, rejection reason or None)
+        self._filter_memo: Dict[str, Tuple[tuple, MarketPair, Optional[str]]] = {}
+        self.last_discovery_stats: Dict[str, Any] = {}
 
     # Permanent Tier-A universe - major coins that always bypass liquidity filters.
     # These get the same treatment: pinned Tier A, bypass volume/spread gates.
@@ -66,6 +86,11 @@ class MarketRegistry:
     _SYMBOL_PREFIXES_TO_STRIP: Tuple[str, ...] = ("PF_", "PI_", "FI_")
     _SYMBOL_SUFFIXES_TO_STRIP: Tuple[str, ...] = ("-PERP", "USD")
     _BASE_ALIASES: Dict[str, str] = {"XBT": "BTC"}
+    # Dynamic tiers for _classify_tier, best first: (tier, min futures volume, max futures spread).
+    _TIER_RULES: Tuple[Tuple[str, Decimal, Decimal], ...] = (
+        ("A", Decimal("5000000"), Decimal("0.0010")),
+        ("B", Decimal("500000"), Decimal("0.0025")),
+    )
 
     @classmethod
     def _normalize_base_symbol(cls, symbol: Optional[str]) -> str:
@@ -170,11 +195,17 @@ class MarketRegistry:
         """
         logger.info("Starting market discovery...")
 
-        # 1. Fetch via KrakenClient interface (no spot_exchange / futures_exchange)
-        spot_markets = await self._fetch_spot_markets()
+        # 1. Independent fetches run concurrently (KrakenClient interface, no
+        # spot_exchange / futures_exchange); spot tickers need the candidates.
+        futures_tickers_task = asyncio.create_task(self._fetch_futures_tickers())
+        try:
+            spot_markets, futures_markets = await asyncio.gather(
+                self._fetch_spot_markets(), self._fetch_futures_markets()
+            )
+        except BaseException:
+            futures_tickers_task.cancel()
+            raise
         logger.info("Found %s spot markets", len(spot_markets))
-
-        futures_markets = await self._fetch_futures_markets()
         logger.info("Found %s futures perpetuals", len(futures_markets))
 
         # 2. Build mappings (spot×futures and, optionally, futures-only pairs)
@@ -186,22 +217,19 @@ class MarketRegistry:
             getattr(exchange_cfg, "allow_futures_only_pairs", False)
         )
         previous_futures_symbols = set(self._last_seen_futures_symbols)
-        if spot_markets and futures_markets:
-            pairs = self._build_mappings(
-                spot_markets,
-                futures_markets,
-                include_futures_only=allow_futures_only_pairs,
-            )
-        elif not spot_markets and futures_markets and allow_futures_only_universe:
-            pairs = self._build_futures_only_mappings(futures_markets)
-        else:
-            pairs = self._build_mappings(spot_markets, futures_markets)
-
+        pairs, candidates_reused = self._candidate_pairs(
+            spot_markets, futures_markets, allow_futures_only_pairs, allow_futures_only_universe
+        )
         logger.info("Built %s spot→futures mappings", len(pairs))
 
         # 3. Apply filters
-        eligible_pairs, rejected_reasons = await self._apply_filters(pairs)
+        spot_tickers = await self._fetch_spot_tickers(list(pairs)) if pairs else {}
+        futures_tickers = await futures_tickers_task
+        eligible_pairs, rejected_reasons = await self._apply_filters(
+            pairs, spot_tickers=spot_tickers, futures_tickers=futures_tickers
+        )
         logger.info("%s pairs passed filters", len(eligible_pairs))
+        self.last_discovery_stats["candidates_reused"] = candidates_reused
 
         self.discovered_pairs = eligible_pairs
         self.last_discovery = datetime.now(timezone.utc)
@@ -240,6 +268,114 @@ class MarketRegistry:
             logger.error("Failed to fetch futures markets", error=str(e))
             return {}
 
+    async def _fetch_spot_tickers(self, symbols: List[str]) -> Dict[str, dict]:
+        """Spot tickers for filtering (spot filters and price reference)."""
+        if not hasattr(self.client, "get_spot_tickers_bulk"):
+            return {}
+        try:
+            spot_tickers = await self.client.get_spot_tickers_bulk(symbols)
+            logger.info(
+                "Fetched spot tickers for discovery filters",
+                requested=len(symbols),
+                received=len(spot_tickers),
+            )
+            return spot_tickers
+        except Exception as e:
+            logger.error("Bulk spot ticker fetch failed during discovery filters", error=str(e))
+            return {}
+
+    async def _fetch_futures_tickers(self) -> Dict[str, FuturesTicker]:
+        """Futures tickers for filtering (futures filters - primary for perp trading)."""
+        if not hasattr(self.client, "get_futures_tickers_bulk_full"):
+            return {}
+        try:
+            futures_tickers = await self.client.get_futures_tickers_bulk_full()
+            logger.info(
+                "Fetched futures tickers for discovery filters",
+                count=len(futures_tickers),
+            )
+            return futures_tickers
+        except Exception as e:
+            logger.error("Bulk futures ticker fetch failed during discovery filters", error=str(e))
+            return {}
+
+    # ---------- candidate cache ----------
+
+    @staticmethod
+    def markets_hash(
+        spot_markets: Dict[str, dict],
+        futures_markets: Dict[str, dict],
+        *flags: bool,
+    ) -> str:
+        """Content hash of the market lists (stands in for an exchange ETag)."""
+        payload = json.dumps([spot_markets, futures_markets, list(flags)], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _candidate_pairs(
+        self,
+        spot_markets: Dict[str, dict],
+        futures_markets: Dict[str, dict],
+        allow_futures_only_pairs: bool,
+        allow_futures_only_universe: bool,
+    ) -> Tuple[Dict[str, MarketPair], bool]:
+        """Candidate pairs for these market lists; (pairs, served from cache)."""
+        digest = self.markets_hash(
+            spot_markets, futures_markets, allow_futures_only_pairs, allow_futures_only_universe
+        )
+        if self._candidates_hash is None:
+            self._load_candidate_cache()
+        if digest == self._candidates_hash:
+            pairs = {
+                spot: self._new_pair(spot_symbol=spot, futures_symbol=fut, source=source)
+                for spot, (fut, source) in self._candidates.items()
+            }
+            return pairs, True
+
+        if spot_markets and futures_markets:
+            pairs = self._build_mappings(
+                spot_markets,
+                futures_markets,
+                include_futures_only=allow_futures_only_pairs,
+            )
+        elif not spot_markets and futures_markets and allow_futures_only_universe:
+            pairs = self._build_futures_only_mappings(futures_markets)
+        else:
+            pairs = self._build_mappings(spot_markets, futures_markets)
+
+        # An empty result is usually a failed fetch: don't cache it.
+        if pairs:
+            self._candidates_hash = digest
+            self._candidates = {spot: [p.futures_symbol, p.source] for spot, p in pairs.items()}
+            self._save_candidate_cache()
+        return pairs, False
+
+    def _load_candidate_cache(self) -> None:
+        if self._cache_path is None or not self._cache_path.exists():
+            return
+        try:
+            data = json.loads(self._cache_path.read_text())
+            candidates = data["candidates"]
+            if isinstance(candidates, dict):
+                self._candidates = {k: list(v) for k, v in candidates.items()}
+                self._candidates_hash = str(data["hash"])
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.debug("Market metadata cache unreadable", path=str(self._cache_path), error=str(e))
+
+    def _save_candidate_cache(self) -> None:
+        if self._cache_path is None:
+            return
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache_path.with_suffix(self._cache_path.suffix + ".tmp")
+            tmp.write_text(json.dumps({
+                "hash": self._candidates_hash,
+                "saved_at": datetime.now(timezone.utc).isoformat(),
+                "candidates": self._candidates,
+            }))
+            os.replace(tmp, self._cache_path)
+        except OSError as e:
+            logger.debug("Failed to write market metadata cache", path=str(self._cache_path), error=str(e))
+
     def _build_futures_only_mappings(self, futures_markets: Dict[str, dict]) -> Dict[str, MarketPair]:
         """Build spot_symbol -> MarketPair when only futures available (base_quote used as spot_symbol)."""
         pairs = {}
@@ -298,13 +434,24 @@ class MarketRegistry:
         
         return pairs
     
-    async def _apply_filters(self, pairs: Dict[str, MarketPair]) -> Tuple[Dict[str, MarketPair], Dict[str, str]]:
+    async def _apply_filters(
+        self,
+        pairs: Dict[str, MarketPair],
+        spot_tickers: Optional[Dict[str, dict]] = None,
+        futures_tickers: Optional[Dict[str, FuturesTicker]] = None,
+    ) -> Tuple[Dict[str, MarketPair], Dict[str, str]]:
         """
         Apply liquidity and spread filters using both spot and futures data.
         
         Filter modes:
         - "futures_primary": Futures filters required, spot filters optional (recommended for perp trading)
         - "spot_and_futures": Both spot and futures filters must pass
+
+        Tickers not passed in are fetched. Each symbol's liquidity inputs are
+        quantised to the threshold bands they are compared against (tier and
+        filter limits, data-quality cut-offs); a symbol whose bands, mapping
+        and filter settings are unchanged since the previous run keeps its
+        verdict and tier, and only its ticker fields are refreshed.
         """
         eligible = {}
         rejected: Dict[str, str] = {}
@@ -315,213 +462,297 @@ class MarketRegistry:
         if not symbols:
             return eligible, rejected
 
-        # Fetch spot tickers (for spot filters and price reference)
-        spot_tickers: Dict[str, dict] = {}
-        if hasattr(self.client, "get_spot_tickers_bulk"):
-            try:
-                spot_tickers = await self.client.get_spot_tickers_bulk(symbols)
-                logger.info(
-                    "Fetched spot tickers for discovery filters",
-                    requested=len(symbols),
-                    received=len(spot_tickers),
-                )
-            except Exception as e:
-                logger.error("Bulk spot ticker fetch failed during discovery filters", error=str(e))
-                spot_tickers = {}
-        
-        # Fetch futures tickers (for futures filters - primary for perp trading)
-        futures_tickers: Dict[str, FuturesTicker] = {}
-        if hasattr(self.client, "get_futures_tickers_bulk_full"):
-            try:
-                futures_tickers = await self.client.get_futures_tickers_bulk_full()
-                logger.info(
-                    "Fetched futures tickers for discovery filters",
-                    count=len(futures_tickers),
-                )
-            except Exception as e:
-                logger.error("Bulk futures ticker fetch failed during discovery filters", error=str(e))
-                futures_tickers = {}
+        if spot_tickers is None:
+            spot_tickers = await self._fetch_spot_tickers(symbols)
+        if futures_tickers is None:
+            futures_tickers = await self._fetch_futures_tickers()
 
+        settings = self._filter_settings_key(filters, filter_mode)
+        volume_bands, spread_bands = self._volume_bands(), self._spread_bands()
+        spot_limits = self._spot_limits(filters)
+        memo: Dict[str, Tuple[tuple, MarketPair, Optional[str]]] = {}
+        reused = 0
         for symbol, pair in pairs.items():
-            try:
-                # --- FUTURES FILTERS (primary gate for futures_primary mode) ---
-                # Look up futures ticker by multiple formats
-                fticker = (
-                    futures_tickers.get(pair.futures_symbol) or
-                    futures_tickers.get(symbol) or
-                    futures_tickers.get(f"{symbol}:USD")
-                )
-                
-                if not fticker:
+            # Look up futures ticker by multiple formats
+            fticker = (
+                futures_tickers.get(pair.futures_symbol) or
+                futures_tickers.get(symbol) or
+                futures_tickers.get(f"{symbol}:USD")
+            )
+            spot_ticker = spot_tickers.get(symbol)
+            key = (
+                settings,
+                pair.futures_symbol,
+                pair.source,
+                self._futures_inputs(fticker, volume_bands, spread_bands),
+                self._spot_inputs(spot_ticker, spot_limits),
+            )
+            previous = self._filter_memo.get(symbol)
+            if previous is not None and previous[0] == key:
+                _, pair, reason = previous
+                if fticker is not None:
+                    self._populate_liquidity_fields(pair, fticker, spot_ticker)
+                reused += 1
+            else:
+                try:
+                    reason = self._filter_pair(symbol, pair, fticker, spot_ticker, filters, filter_mode)
+                except Exception as e:
+                    logger.warning(f"Failed to filter {symbol}", error=str(e))
                     pair.is_eligible = False
-                    pair.rejection_reason = f"No futures ticker data for {pair.futures_symbol}"
+                    pair.rejection_reason = f"Filter error: {str(e)}"
                     rejected[symbol] = pair.rejection_reason
                     continue
-                
-                # Populate futures fields
-                pair.futures_open_interest = fticker.open_interest
-                pair.futures_volume_24h = fticker.volume_24h
-                pair.futures_spread_pct = fticker.spread_pct
-                pair.funding_rate = fticker.funding_rate
-                
-                # ============================================================
-                # DATA QUALITY ASSESSMENT (V3 - for observability, NOT gating)
-                # ============================================================
-                # Assess OI quality - Kraken reports $0 for known-liquid coins
-                if fticker.open_interest is None or fticker.open_interest == 0:
-                    pair.oi_quality = "SUSPECT"
-                elif fticker.open_interest < Decimal("10000"):
-                    pair.oi_quality = "SUSPECT"
-                else:
-                    pair.oi_quality = "OK"
-                
-                # Assess funding quality - extreme values are suspect
-                if fticker.funding_rate is None:
-                    pair.funding_quality = "UNKNOWN"
-                elif abs(fticker.funding_rate) > Decimal("0.10"):  # > 10% is suspect
-                    pair.funding_quality = "SUSPECT"
-                else:
-                    pair.funding_quality = "OK"
-                
-                # ============================================================
-                # TIER-AWARE FILTERING (V3 - Single Source of Truth)
-                # ============================================================
-                # Key principle: MarketRegistry is the ONLY tier authority.
-                # - Config tiers: For UNIVERSE SELECTION only, not filtering
-                # - OI: Logged only (Kraken misreports)
-                # - Funding: Logged only (Kraken misreports)
-                # - Volume + Spread: PRIMARY gates (Tier C thresholds for all)
-                # - Tier classification: AFTER passing filters, based on metrics
-                # ============================================================
-                
-                # Only pinned Tier A (BTC, ETH, SOL, DOGE, BNB) bypasses filters
-                is_pinned_tier_a = self.is_pinned_tier_a_symbol(pair.spot_symbol, pair.futures_symbol)
-                
-                # --- OI: LOG ONLY (removed as gate - Kraken misreports) ---
-                min_oi = getattr(filters, "min_futures_open_interest", Decimal("0")) or Decimal("0")
-                if fticker.open_interest < min_oi:
-                    logger.debug(
-                        "OI below threshold (logged only, not a gate)",
-                        symbol=symbol,
-                        oi_quality=pair.oi_quality,
-                        reported_oi=f"${fticker.open_interest:,.0f}",
-                        threshold=f"${min_oi:,.0f}",
-                    )
-                
-                # --- FUNDING: LOG ONLY (removed as gate - Kraken misreports) ---
-                max_funding = getattr(filters, "max_funding_rate_abs", None)
-                if max_funding and fticker.funding_rate is not None:
-                    if abs(fticker.funding_rate) > max_funding:
-                        logger.debug(
-                            "Funding rate above threshold (logged only, not a gate)",
-                            symbol=symbol,
-                            funding_quality=pair.funding_quality,
-                            reported_funding=f"{fticker.funding_rate:.4%}",
-                            threshold=f"{max_funding:.4%}",
-                        )
-                
-                # --- VOLUME: PRIMARY GATE (Tier C threshold for all non-pinned) ---
-                # Pinned Tier A (BTC, ETH, SOL, DOGE, BNB) bypasses all filters
-                if not is_pinned_tier_a:
-                    min_vol = self._get_tier_volume_threshold('C')  # Use most permissive threshold
-                    if fticker.volume_24h < min_vol:
-                        pair.is_eligible = False
-                        pair.rejection_reason = f"Futures vol ${fticker.volume_24h:,.0f} < ${min_vol:,.0f}"
-                        rejected[symbol] = pair.rejection_reason
-                        continue
-                
-                # --- SPREAD: PRIMARY GATE (Tier C threshold for all non-pinned) ---
-                # Pinned Tier A (BTC, ETH, SOL, DOGE, BNB) bypasses all filters
-                if not is_pinned_tier_a:
-                    max_spread = self._get_tier_spread_threshold('C')  # Use most permissive threshold
-                    if fticker.spread_pct > max_spread:
-                        pair.is_eligible = False
-                        pair.rejection_reason = f"Futures spread {fticker.spread_pct:.2%} > {max_spread:.2%}"
-                        rejected[symbol] = pair.rejection_reason
-                        continue
-                
-                # Log Pinned Tier A bypasses for visibility
-                if is_pinned_tier_a:
-                    issues = []
-                    if fticker.open_interest < min_oi:
-                        issues.append(f"OI=${fticker.open_interest:,.0f}")
-                    if fticker.spread_pct > Decimal("0.003"):
-                        issues.append(f"spread={fticker.spread_pct:.2%}")
-                    if max_funding and fticker.funding_rate and abs(fticker.funding_rate) > max_funding:
-                        issues.append(f"funding={fticker.funding_rate:.4%}")
-                    if fticker.volume_24h < Decimal("500000"):
-                        issues.append(f"vol=${fticker.volume_24h:,.0f}")
-                    if issues:
-                        logger.warning(
-                            "Tier A coin bypassing filters (trusted major)",
-                            symbol=symbol,
-                            issues=", ".join(issues),
-                        )
-                
-                # --- SPOT FILTERS (optional in futures_primary mode) ---
-                spot_ticker = spot_tickers.get(symbol)
-                spot_filters_passed = True
-                spot_rejection_reason = None
-                
-                if spot_ticker:
-                    # Populate spot fields
-                    pair.spot_volume_24h = Decimal(str(spot_ticker.get('quoteVolume', 0)))
-                    
-                    bid = Decimal(str(spot_ticker.get('bid', 0)))
-                    ask = Decimal(str(spot_ticker.get('ask', 0)))
-                    if bid > 0 and ask > 0:
-                        pair.spot_spread_pct = (ask - bid) / bid
-                    
-                    # Check spot volume
-                    min_spot_vol = getattr(filters, "min_spot_volume_usd_24h", Decimal("0")) or Decimal("0")
-                    if pair.spot_volume_24h < min_spot_vol:
-                        spot_filters_passed = False
-                        spot_rejection_reason = f"Spot vol ${pair.spot_volume_24h:,.0f} < ${min_spot_vol:,.0f}"
-                    
-                    # Check spot spread
-                    max_spot_spread = getattr(filters, "max_spread_pct", Decimal("0.002")) or Decimal("0.002")
-                    if spot_filters_passed and pair.spot_spread_pct > max_spot_spread:
-                        spot_filters_passed = False
-                        spot_rejection_reason = f"Spot spread {pair.spot_spread_pct:.2%} > {max_spot_spread:.2%}"
-                    
-                    # Check minimum price
-                    min_price = getattr(filters, "min_price_usd", Decimal("0.01")) or Decimal("0.01")
-                    last_price = Decimal(str(spot_ticker.get('last', 0)))
-                    if spot_filters_passed and last_price < min_price:
-                        spot_filters_passed = False
-                        spot_rejection_reason = f"Price ${last_price} < ${min_price}"
-                else:
-                    # No spot ticker - only fail if mode requires spot
-                    if filter_mode == "spot_and_futures":
-                        spot_filters_passed = False
-                        spot_rejection_reason = "No spot ticker data"
-                
-                # Apply filter mode logic
-                if filter_mode == "spot_and_futures" and not spot_filters_passed:
-                    pair.is_eligible = False
-                    pair.rejection_reason = spot_rejection_reason
-                    rejected[symbol] = pair.rejection_reason or "Spot filters failed"
-                    continue
-                
-                # Passed all required filters - classify tier and mark eligible
-                pair.liquidity_tier = self._classify_tier(pair)
-                pair.is_eligible = True
+            memo[symbol] = (key, pair, reason)
+            if reason is None:
                 eligible[symbol] = pair
-                
-            except Exception as e:
-                logger.warning(f"Failed to filter {symbol}", error=str(e))
-                pair.is_eligible = False
-                pair.rejection_reason = f"Filter error: {str(e)}"
-                rejected[symbol] = pair.rejection_reason
+            else:
+                rejected[symbol] = reason
+        self._filter_memo = memo
+        self.last_discovery_stats = {"refiltered": len(pairs) - reused, "filter_unchanged": reused}
         
         # Log tier distribution
         tier_counts = {"A": 0, "B": 0, "C": 0}
         for p in eligible.values():
             tier_counts[p.liquidity_tier] = tier_counts.get(p.liquidity_tier, 0) + 1
-        logger.info("Filtering complete", eligible=len(eligible), tier_distribution=tier_counts)
+        logger.info(
+            "Filtering complete",
+            eligible=len(eligible),
+            tier_distribution=tier_counts,
+            refiltered=len(pairs) - reused,
+            unchanged=reused,
+        )
         
         return eligible, rejected
 
+    def _filter_settings_key(self, filters: Any, filter_mode: str) -> tuple:
+        names = (
+            "min_futures_open_interest",
+            "max_funding_rate_abs",
+            "min_spot_volume_usd_24h",
+            "max_spread_pct",
+            "min_price_usd",
+        )
+        return (
+            (filter_mode,)
+            + tuple(str(getattr(filters, n, None)) for n in names)
+            + (self._volume_bands(), self._spread_bands())
+        )
+
+    def _volume_bands(self) -> Tuple[Decimal, ...]:
+        """Every futures-volume threshold a verdict or tier depends on, ascending."""
+        limits = {self._get_tier_volume_threshold("C")} | {r[1] for r in self._TIER_RULES}
+        return tuple(sorted(limits))
+
+    def _spread_bands(self) -> Tuple[Decimal, ...]:
+        """Every futures-spread threshold a verdict or tier depends on, ascending."""
+        limits = {self._get_tier_spread_threshold("C")} | {r[2] for r in self._TIER_RULES}
+        return tuple(sorted(limits))
+
+    @staticmethod
+    def _spot_limits(filters: Any) -> Tuple[Decimal, Decimal, Decimal]:
+        """(min spot volume, max spot spread, min price) with the filter defaults."""
+        return (
+            getattr(filters, "min_spot_volume_usd_24h", Decimal("0")) or Decimal("0"),
+            getattr(filters, "max_spread_pct", Decimal("0.002")) or Decimal("0.002"),
+            getattr(filters, "min_price_usd", Decimal("0.01")) or Decimal("0.01"),
+        )
+
+    @staticmethod
+    def _oi_quality(open_interest: Optional[Decimal]) -> str:
+        if open_interest is None or open_interest < Decimal("10000"):
+            return "SUSPECT"
+        return "OK"
+
+    @staticmethod
+    def _funding_quality(funding_rate: Optional[Decimal]) -> str:
+        if funding_rate is None:
+            return "UNKNOWN"
+        return "SUSPECT" if abs(funding_rate) > Decimal("0.10") else "OK"
+
+    def _futures_inputs(
+        self,
+        fticker: Optional[FuturesTicker],
+        volume_bands: Tuple[Decimal, ...],
+        spread_bands: Tuple[Decimal, ...],
+    ) -> Optional[tuple]:
+        if fticker is None:
+            return None
+        return (
+            bisect_right(volume_bands, fticker.volume_24h),  # number of `vol >= limit` that hold
+            bisect_left(spread_bands, fticker.spread_pct),  # number of `spread <= limit` that fail
+            self._oi_quality(fticker.open_interest),
+            self._funding_quality(fticker.funding_rate),
+        )
+
+    @staticmethod
+    def _spot_inputs(spot_ticker: Optional[dict], limits: Tuple[Decimal, Decimal, Decimal]) -> Optional[tuple]:
+        if not spot_ticker:
+            return None
+        min_volume, max_spread, min_price = limits
+        bid = Decimal(str(spot_ticker.get("bid", 0)))
+        ask = Decimal(str(spot_ticker.get("ask", 0)))
+        spread = (ask - bid) / bid if bid > 0 and ask > 0 else None
+        return (
+            Decimal(str(spot_ticker.get("quoteVolume", 0))) < min_volume,
+            None if spread is None else spread > max_spread,
+            Decimal(str(spot_ticker.get("last", 0))) < min_price,
+        )
+
+    @staticmethod
+    def _populate_liquidity_fields(
+        pair: MarketPair, fticker: FuturesTicker, spot_ticker: Optional[dict]
+    ) -> None:
+        """Copy the current ticker figures onto ``pair`` (no filtering)."""
+        pair.futures_open_interest = fticker.open_interest
+        pair.futures_volume_24h = fticker.volume_24h
+        pair.futures_spread_pct = fticker.spread_pct
+        pair.funding_rate = fticker.funding_rate
+        if spot_ticker:
+            pair.spot_volume_24h = Decimal(str(spot_ticker.get('quoteVolume', 0)))
+            bid = Decimal(str(spot_ticker.get('bid', 0)))
+            ask = Decimal(str(spot_ticker.get('ask', 0)))
+            if bid > 0 and ask > 0:
+                pair.spot_spread_pct = (ask - bid) / bid
+
+    def _filter_pair(
+        self,
+        symbol: str,
+        pair: MarketPair,
+        fticker: Optional[FuturesTicker],
+        spot_ticker: Optional[dict],
+        filters: Any,
+        filter_mode: str,
+    ) -> Optional[str]:
+        """Filter one candidate in place; returns the rejection reason, or None if eligible."""
+        # --- FUTURES FILTERS (primary gate for futures_primary mode) ---
+        if not fticker:
+            pair.is_eligible = False
+            pair.rejection_reason = f"No futures ticker data for {pair.futures_symbol}"
+            return pair.rejection_reason
+
+        # Populate futures (and spot) fields
+        self._populate_liquidity_fields(pair, fticker, spot_ticker)
+
+        # ============================================================
+        # DATA QUALITY ASSESSMENT (V3 - for observability, NOT gating)
+        # ============================================================
+        # Assess OI quality - Kraken reports $0 for known-liquid coins
+        pair.oi_quality = self._oi_quality(fticker.open_interest)
+        # Assess funding quality - extreme values (> 10%) are suspect
+        pair.funding_quality = self._funding_quality(fticker.funding_rate)
+
+        # ============================================================
+        # TIER-AWARE FILTERING (V3 - Single Source of Truth)
+        # ============================================================
+        # Key principle: MarketRegistry is the ONLY tier authority.
+        # - Config tiers: For UNIVERSE SELECTION only, not filtering
+        # - OI: Logged only (Kraken misreports)
+        # - Funding: Logged only (Kraken misreports)
+        # - Volume + Spread: PRIMARY gates (Tier C thresholds for all)
+        # - Tier classification: AFTER passing filters, based on metrics
+        # ============================================================
+
+        # Only pinned Tier A (BTC, ETH, SOL, DOGE, BNB) bypasses filters
+        is_pinned_tier_a = self.is_pinned_tier_a_symbol(pair.spot_symbol, pair.futures_symbol)
+
+        # --- OI: LOG ONLY (removed as gate - Kraken misreports) ---
+        min_oi = getattr(filters, "min_futures_open_interest", Decimal("0")) or Decimal("0")
+        if fticker.open_interest < min_oi:
+            logger.debug(
+                "OI below threshold (logged only, not a gate)",
+                symbol=symbol,
+                oi_quality=pair.oi_quality,
+                reported_oi=f"${fticker.open_interest:,.0f}",
+                threshold=f"${min_oi:,.0f}",
+            )
+
+        # --- FUNDING: LOG ONLY (removed as gate - Kraken misreports) ---
+        max_funding = getattr(filters, "max_funding_rate_abs", None)
+        if max_funding and fticker.funding_rate is not None:
+            if abs(fticker.funding_rate) > max_funding:
+                logger.debug(
+                    "Funding rate above threshold (logged only, not a gate)",
+                    symbol=symbol,
+                    funding_quality=pair.funding_quality,
+                    reported_funding=f"{fticker.funding_rate:.4%}",
+                    threshold=f"{max_funding:.4%}",
+                )
+
+        # --- VOLUME: PRIMARY GATE (Tier C threshold for all non-pinned) ---
+        # Pinned Tier A (BTC, ETH, SOL, DOGE, BNB) bypasses all filters
+        if not is_pinned_tier_a:
+            min_vol = self._get_tier_volume_threshold('C')  # Use most permissive threshold
+            if fticker.volume_24h < min_vol:
+                pair.is_eligible = False
+                pair.rejection_reason = f"Futures vol ${fticker.volume_24h:,.0f} < ${min_vol:,.0f}"
+                return pair.rejection_reason
+
+        # --- SPREAD: PRIMARY GATE (Tier C threshold for all non-pinned) ---
+        # Pinned Tier A (BTC, ETH, SOL, DOGE, BNB) bypasses all filters
+        if not is_pinned_tier_a:
+            max_spread = self._get_tier_spread_threshold('C')  # Use most permissive threshold
+            if fticker.spread_pct > max_spread:
+                pair.is_eligible = False
+                pair.rejection_reason = f"Futures spread {fticker.spread_pct:.2%} > {max_spread:.2%}"
+                return pair.rejection_reason
+
+        # Log Pinned Tier A bypasses for visibility
+        if is_pinned_tier_a:
+            issues = []
+            if fticker.open_interest < min_oi:
+                issues.append(f"OI=${fticker.open_interest:,.0f}")
+            if fticker.spread_pct > Decimal("0.003"):
+                issues.append(f"spread={fticker.spread_pct:.2%}")
+            if max_funding and fticker.funding_rate and abs(fticker.funding_rate) > max_funding:
+                issues.append(f"funding={fticker.funding_rate:.4%}")
+            if fticker.volume_24h < Decimal("500000"):
+                issues.append(f"vol=${fticker.volume_24h:,.0f}")
+            if issues:
+                logger.warning(
+                    "Tier A coin bypassing filters (trusted major)",
+                    symbol=symbol,
+                    issues=", ".join(issues),
+                )
+
+        # --- SPOT FILTERS (optional in futures_primary mode) ---
+        spot_filters_passed = True
+        spot_rejection_reason = None
+
+        if spot_ticker:
+            min_spot_vol, max_spot_spread, min_price = self._spot_limits(filters)
+
+            # Check spot volume
+            if pair.spot_volume_24h < min_spot_vol:
+                spot_filters_passed = False
+                spot_rejection_reason = f"Spot vol ${pair.spot_volume_24h:,.0f} < ${min_spot_vol:,.0f}"
+
+            # Check spot spread
+            if spot_filters_passed and pair.spot_spread_pct > max_spot_spread:
+                spot_filters_passed = False
+                spot_rejection_reason = f"Spot spread {pair.spot_spread_pct:.2%} > {max_spot_spread:.2%}"
+
+            # Check minimum price
+            last_price = Decimal(str(spot_ticker.get('last', 0)))
+            if spot_filters_passed and last_price < min_price:
+                spot_filters_passed = False
+                spot_rejection_reason = f"Price ${last_price} < ${min_price}"
+        else:
+            # No spot ticker - only fail if mode requires spot
+            if filter_mode == "spot_and_futures":
+                spot_filters_passed = False
+                spot_rejection_reason = "No spot ticker data"
+
+        # Apply filter mode logic
+        if filter_mode == "spot_and_futures" and not spot_filters_passed:
+            pair.is_eligible = False
+            pair.rejection_reason = spot_rejection_reason
+            return pair.rejection_reason or "Spot filters failed"
+
+        # Passed all required filters - classify tier and mark eligible
+        pair.liquidity_tier = self._classify_tier(pair)
+        pair.is_eligible = True
+        return None
+
     def _new_pair(self, spot_symbol: str, futures_symbol: str, source: str) -> MarketPair:
         """Create a default MarketPair placeholder before filters populate metrics."""
         return MarketPair(
@@ -724,15 +955,12 @@ class MarketRegistry:
         vol = pair.futures_volume_24h or Decimal("0")
         spread = pair.futures_spread_pct or Decimal("1")
         
-        # Tier A: High liquidity - vol >= $5M AND spread <= 0.10%
-        if vol >= Decimal("5000000") and spread <= Decimal("0.0010"):
-            return "A"
-        # Tier B: Medium liquidity - vol >= $500k AND spread <= 0.25%
-        elif vol >= Decimal("500000") and spread <= Decimal("0.0025"):
-            return "B"
+        # Tier A: vol >= $5M AND spread <= 0.10%; Tier B: vol >= $500k AND spread <= 0.25%
+        for tier, min_vol, max_spread in self._TIER_RULES:
+            if vol >= min_vol and spread <= max_spread:
+                return tier
         # Tier C: Lower liquidity (eligible but restricted)
-        else:
-            return "C"
+        return "C"
     
     def tier_for(self, symbol: str) -> str:
         """
@@ -1,13 +1,20 @@
 """
-Futures mark price and best bid/ask tracking.
+Futures mark price and best bid/ask tracking, plus an L2 depth cache.
 
 CRITICAL: Mark price MUST be sourced from Kraken Futures mark/index feed,
 not computed from bid/ask. This module tracks but does NOT compute mark price.
+
+``OrderBookDepthCache`` keeps per-symbol L2 snapshots (periodic REST snapshots
+or any feed calling ``update``) so entry-time liquidity checks can read
+spread / depth-within-bps without a network round-trip.
 """
+import asyncio
+import bisect
+import time
 from decimal import Decimal
 from datetime import datetime, timezone
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 from src.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
@@ -134,3 +141,222 @@ class OrderBook:
     def get_snapshot(self) -> Optional[OrderBookSnapshot]:
         """Get current order book snapshot."""
         return self.current
+
+
+# ============ L2 DEPTH CACHE ============
+
+_BPS = Decimal("10000")
+
+Level = Tuple[Decimal, Decimal]  # (price, size)
+
+
+class L2Book:
+    """
+    Immutable L2 snapshot with prefix-summed sizes.
+
+    Bids are stored descending, asks ascending. ``depth_within_bps`` is a
+    bisect over the price ladder plus a prefix-sum read: O(log n).
+    """
+
+    __slots__ = (
+        "symbol", "received_at", "timestamp",
+        "_bid_prices", "_bid_cum", "_ask_prices", "_ask_cum",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        bids: Sequence[Sequence[Any]],
+        asks: Sequence[Sequence[Any]],
+        timestamp: Optional[datetime] = None,
+        received_at: Optional[float] = None,
+    ):
+        self.symbol = symbol
+        self.timestamp = timestamp or datetime.now(timezone.utc)
+        self.received_at = received_at if received_at is not None else time.monotonic()
+        bid_levels = sorted(_parse_levels(bids), key=lambda lv: lv[0], reverse=True)
+        ask_levels = sorted(_parse_levels(asks), key=lambda lv: lv[0])
+        # Bids: bisect needs ascending keys, so store negated prices.
+        self._bid_prices = [-p for p, _ in bid_levels]
+        self._bid_cum = _prefix_sums(q for _, q in bid_levels)
+        self._ask_prices = [p for p, _ in ask_levels]
+        self._ask_cum = _prefix_sums(q for _, q in ask_levels)
+
+    @property
+    def best_bid(self) -> Optional[Decimal]:
+        return -self._bid_prices[0] if self._bid_prices else None
+
+    @property
+    def best_ask(self) -> Optional[Decimal]:
+        return self._ask_prices[0] if self._ask_prices else None
+
+    def mid(self) -> Optional[Decimal]:
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid + self.best_ask) / 2
+
+    def spread_pct(self) -> Optional[Decimal]:
+        """(ask - bid) / mid, or None if either side is empty."""
+        mid = self.mid()
+        if mid is None or mid <= 0:
+            return None
+        return (self.best_ask - self.best_bid) / mid
+
+    def depth_within_bps(self, side: str, bps: Decimal) -> Decimal:
+        """
+        Resting size within ``bps`` of the touch on one side.
+
+        side="ask" is what a buy consumes, side="bid" what a sell consumes.
+        """
+        band = Decimal(str(bps)) / _BPS
+        if side == "ask":
+            if not self._ask_prices:
+                return Decimal("0")
+            limit = self._ask_prices[0] * (1 + band)
+            idx = bisect.bisect_right(self._ask_prices, limit)
+            return self._ask_cum[idx - 1] if idx else Decimal("0")
+        if not self._bid_prices:
+            return Decimal("0")
+        limit = -self._bid_prices[0] * (1 - band)
+        idx = bisect.bisect_right(self._bid_prices, -limit)
+        return self._bid_cum[idx - 1] if idx else Decimal("0")
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.monotonic()) - self.received_at
+
+
+def _parse_levels(levels: Sequence[Sequence[Any]]) -> List[Level]:
+    out: List[Level] = []
+    for lv in levels or ():
+        try:
+            price = Decimal(str(lv[0]))
+            size = Decimal(str(lv[1]))
+        except (IndexError, TypeError, ArithmeticError, ValueError):
+            continue
+        if price > 0 and size > 0:
+            out.append((price, size))
+    return out
+
+
+def _prefix_sums(sizes) -> List[Decimal]:
+    total = Decimal("0")
+    out: List[Decimal] = []
+    for q in sizes:
+        total += q
+        out.append(total)
+    return out
+
+
+SnapshotFetcher = Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class OrderBookDepthCache:
+    """
+    Per-symbol L2 snapshot cache for entry-time liquidity checks.
+
+    - ``get_fresh`` is a pure in-memory read (no network I/O).
+    - ``refresh_symbol`` pulls one REST snapshot (used as the stale fallback).
+    - ``run`` keeps "watched" symbols (recent signal / auction candidates)
+      warm with periodic snapshots, so the entry path normally hits cache.
+    """
+
+    def __init__(
+        self,
+        fetch_snapshot: Optional[SnapshotFetcher] = None,
+        max_age_seconds: float = 30.0,
+        watch_ttl_seconds: float = 900.0,
+        max_concurrency: int = 4,
+    ):
+        self._fetch_snapshot = fetch_snapshot
+        self.max_age_seconds = max_age_seconds
+        self.watch_ttl_seconds = watch_ttl_seconds
+        self._books: Dict[str, L2Book] = {}
+        self._watched: Dict[str, float] = {}  # symbol -> monotonic deadline
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._running = False
+        self.stats = {"hits": 0, "stale": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0}
+
+    # ---------- writes ----------
+
+    def update(
+        self,
+        symbol: str,
+        bids: Sequence[Sequence[Any]],
+        asks: Sequence[Sequence[Any]],
+        timestamp: Optional[datetime] = None,
+    ) -> L2Book:
+        """Replace the snapshot for ``symbol`` (feed or REST)."""
+        book = L2Book(symbol, bids, asks, timestamp=timestamp)
+        self._books[symbol] = book
+        return book
+
+    def watch(self, symbol: str) -> None:
+        """Keep ``symbol`` warm for the next ``watch_ttl_seconds``."""
+        self._watched[symbol] = time.monotonic() + self.watch_ttl_seconds
+
+    # ---------- reads ----------
+
+    def get_fresh(self, symbol: str, max_age_seconds: Optional[float] = None) -> Optional[L2Book]:
+        """Cached book if younger than ``max_age_seconds``; never touches the network."""
+        book = self._books.get(symbol)
+        if book is None:
+            self.stats["misses"] += 1
+            return None
+        limit = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        if book.age_seconds() > limit:
+            self.stats["stale"] += 1
+            return None
+        self.stats["hits"] += 1
+        return book
+
+    def watched_symbols(self) -> List[str]:
+        now = time.monotonic()
+        expired = [s for s, deadline in self._watched.items() if deadline < now]
+        for s in expired:
+            del self._watched[s]
+            self._books.pop(s, None)
+        return list(self._watched)
+
+    # ---------- REST snapshots ----------
+
+    async def refresh_symbol(self, symbol: str) -> Optional[L2Book]:
+        """Fetch one REST snapshot into the cache. Returns None on failure."""
+        if self._fetch_snapshot is None:
+            return None
+        async with self._semaphore:
+            try:
+                raw = await self._fetch_snapshot(symbol)
+            except Exception as e:  # fail open: callers fall back to ticker data
+                self.stats["refresh_errors"] += 1
+                logger.debug("Order book snapshot failed", symbol=symbol, error=str(e))
+                return None
+        if not raw:
+            return None
+        self.stats["refreshes"] += 1
+        ts = raw.get("timestamp")
+        timestamp = (
+            datetime.fromtimestamp(ts / 1000, tz=timezone.utc) if isinstance(ts, (int, float)) else None
+        )
+        return self.update(symbol, raw.get("bids") or [], raw.get("asks") or [], timestamp=timestamp)
+
+    async def refresh_watched(self) -> int:
+        symbols = self.watched_symbols()
+        if not symbols:
+            return 0
+        books = await asyncio.gather(*(self.refresh_symbol(s) for s in symbols))
+        return sum(1 for b in books if b is not None)
+
+    async def run(self, interval_seconds: float = 15.0) -> None:
+        """Periodic snapshot loop for watched symbols."""
+        self._running = True
+        while self._running:
+            try:
+                await self.refresh_watched()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning("Order book refresh loop error", error=str(e), error_type=type(e).__name__)
+            await asyncio.sleep(interval_seconds)
+
+    def stop(self) -> None:
+        self._running = False
@@ -6,6 +6,8 @@ Shared symbol helpers for Kraken Futures.
 - futures_candidate_symbols: single source of truth for Kraken BTC/XBT and variants
 - normalize_to_base: extract base asset name from any symbol format
 - exchange_position_side: determine position side from exchange data dict
+- spot_symbol_key: spot-style key (PF_SOLUSD, SOL/USD:USD -> SOL/USD) for canary / allowlist matching
+- symbol_key / normalize_to_base / spot_symbol_key are memoized (see ``clear_symbol_cache``)
 
 This module is the **single source of truth** for symbol normalization. If you
 need to compare symbols across formats anywhere in the codebase, import from
@@ -14,9 +16,15 @@ here rather than writing ad-hoc normalization logic.
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, List
 
+# Upper bound on distinct symbol spellings we memoize. The tradable universe is
+# a few hundred markets × ~4 formats, so this never evicts in practice.
+_SYMBOL_CACHE_SIZE = 8192
 
+
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
 def normalize_symbol_for_position_match(symbol: str) -> str:
     """
     Canonical form for "same asset" comparison across formats.
@@ -41,6 +49,36 @@ def normalize_symbol_for_position_match(symbol: str) -> str:
     return s
 
 
+def symbol_key(symbol: str) -> str:
+    """
+    Memoized canonical key for a symbol (alias of
+    ``normalize_symbol_for_position_match``).
+
+    Hot paths (registry lookups, auctions, reconciliation) call this many
+    times per tick for the same handful of strings; the result is cached.
+    """
+    return normalize_symbol_for_position_match(symbol)
+
+
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
+def spot_symbol_key(symbol: str) -> str:
+    """
+    Spot-style key used to match symbols against configured symbol lists.
+
+    SOL/USD, sol/usd:USD -> SOL/USD.  PF_SOLUSD -> SOL/USD.  Unlike
+    ``normalize_symbol_for_position_match`` the slash is kept and no XBT
+    alias is applied, matching how canary lists are written in config.
+    """
+    key = (symbol or "").strip().upper()
+    key = key.split(":")[0]
+    if key.startswith("PF_"):
+        base = key.replace("PF_", "").replace("USD", "")
+        if base:
+            return f"{base}/USD"
+    return key
+
+
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
 def normalize_to_base(symbol: str) -> str:
     """
     Extract the base asset name from any symbol format.
@@ -62,6 +100,13 @@ def normalize_to_base(symbol: str) -> str:
     return s
 
 
+def clear_symbol_cache() -> None:
+    """Drop memoized normalization results (tests / long-running hygiene)."""
+    normalize_symbol_for_position_match.cache_clear()
+    normalize_to_base.cache_clear()
+    spot_symbol_key.cache_clear()
+
+
 def exchange_position_side(pos_data: Dict[str, Any]) -> str:
     """
     Determine position side from an exchange position dict.
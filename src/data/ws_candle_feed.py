@@ -12,7 +12,7 @@ import asyncio
 import json
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
 
 import websockets
 
@@ -38,6 +38,7 @@ class KrakenCandleFeed:
         interval: int = 15,
         max_retries: int = 10,
         backoff_base: int = 5,
+        on_bar_close: Optional[Callable[[str, str, datetime], None]] = None,
     ):
         self._cm = candle_manager
         self._symbols = list(symbols)
@@ -49,6 +50,9 @@ class KrakenCandleFeed:
         self._retry_count = 0
         self._received_count = 0
         self._subscribed_symbols: Set[str] = set()
+        # Bar-close detection: a newer interval_begin means the previous bar closed.
+        self._on_bar_close = on_bar_close
+        self._last_interval_begin: Dict[str, datetime] = {}
         logger.info(
             "KrakenCandleFeed initialized",
             symbol_count=len(self._symbols),
@@ -196,6 +200,15 @@ class KrakenCandleFeed:
         self._cm.receive_ws_candle(symbol, tf, candle)
         self._received_count += 1
 
+        prev = self._last_interval_begin.get(symbol)
+        if prev is None or ts > prev:
+            self._last_interval_begin[symbol] = ts
+            if prev is not None and not is_snapshot and self._on_bar_close is not None:
+                try:
+                    self._on_bar_close(symbol, tf, prev)
+                except Exception as e:  # callback must never kill the feed
+                    logger.warning("WS_BAR_CLOSE_CALLBACK_FAILED", symbol=symbol, error=str(e))
+
     @staticmethod
     def _interval_to_timeframe(interval: int) -> Optional[str]:
         return {1: "1m", 5: "5m", 15: "15m", 30: "30m", 60: "1h", 240: "4h", 1440: "1d"}.get(interval)
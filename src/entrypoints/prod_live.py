@@ -126,7 +126,14 @@ def main() -> None:
         raise SystemExit(1)
 
     try:
-        setup_logging(config.monitoring.log_level, config.monitoring.log_format)
+        setup_logging(
+            config.monitoring.log_level,
+            config.monitoring.log_format,
+            async_mode=config.monitoring.log_async,
+            queue_size=config.monitoring.log_queue_size,
+            rate_limit_per_key=config.monitoring.log_rate_limit_per_key,
+            rate_limit_window_seconds=config.monitoring.log_rate_limit_window_seconds,
+        )
     except (ImportError, OSError, ValueError, TypeError) as e:
         print(f"FATAL: failed to setup logging: {type(e).__name__}: {e}", file=sys.stderr)
         raise SystemExit(1)
@@ -284,7 +291,7 @@ def main() -> None:
 
         async def _run() -> None:
             install_asyncio_exception_handler(asyncio.get_running_loop())
-            engine = LiveTrading(config)
+            engine = LiveTrading(config, config_path=_config_path())
             await engine.run()
 
         asyncio.run(_run())
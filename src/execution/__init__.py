@@ -26,6 +26,7 @@ from src.execution.position_state_machine import (
     ManagedPosition,
     PositionState,
     PositionRegistry,
+    RegistrySnapshot,
     ExitReason,
     OrderEvent,
     OrderEventType,
@@ -37,6 +38,9 @@ from src.execution.position_state_machine import (
     set_position_registry
 )
 
+# Event dedup (shared by ManagedPosition + EventOrderingEnforcer)
+from src.execution.event_dedup import EventDedupWindow
+
 # Position Manager V2
 from src.execution.position_manager_v2 import (
     PositionManagerV2,
@@ -80,6 +84,7 @@ __all__ = [
     "ManagedPosition",
     "PositionState",
     "PositionRegistry",
+    "RegistrySnapshot",
     "ExitReason",
     "OrderEvent",
     "OrderEventType",
@@ -89,6 +94,7 @@ __all__ = [
     "get_position_registry",
     "reset_position_registry",
     "set_position_registry",
+    "EventDedupWindow",
     
     # Manager V2
     "PositionManagerV2",
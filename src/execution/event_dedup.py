@@ -0,0 +1,184 @@
+"""
+Bounded order-event deduplication.
+
+Shared by ``ManagedPosition`` (per-position event idempotency) and
+``EventOrderingEnforcer`` (gateway fill-id dedup) so neither grows without
+bound on long-lived positions.
+
+Design:
+- Keys are fixed-size 64-bit ints (the 16-hex ``OrderEvent.event_hash`` parses
+  directly; other strings such as fill ids are hashed with blake2b-64).
+- Live keys sit in an insertion-ordered ring capped at ``max_keys``.
+- When an order is fully FILLED its per-event keys are evicted and replaced
+  by a single tombstone (order id) that keeps rejecting *fill* events for
+  that order. Non-fill late events (e.g. an ACK arriving after the FILL)
+  still pass, exactly as before. Cancelled/rejected/expired orders are not
+  tombstoned: a late partial fill with a new fill id can race the cancel and
+  must still be applied, so they keep exact per-key dedup only.
+- Serialization is cached per ``version`` so unchanged windows are not
+  re-encoded on every save.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+EventKey = Union[int, str]
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def event_key_to_int(key: EventKey) -> int:
+    """Map an event hash / fill id to a stable unsigned 64-bit int."""
+    if isinstance(key, int):
+        return key & 0xFFFFFFFFFFFFFFFF
+    s = str(key)
+    if len(s) == 16 and _HEX_DIGITS.issuperset(s):
+        # OrderEvent.event_hash(): already a truncated SHA-256 (64 bits)
+        return int(s, 16)
+    return int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big")
+
+
+class EventDedupWindow:
+    """Fixed-capacity dedup set grouped by order id with filled-order tombstones."""
+
+    DEFAULT_MAX_KEYS = 256
+    DEFAULT_MAX_CLOSED_ORDERS = 128
+
+    def __init__(
+        self,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        max_closed_orders: int = DEFAULT_MAX_CLOSED_ORDERS,
+    ):
+        self.max_keys = max_keys
+        self.max_closed_orders = max_closed_orders
+        # key -> order_id, insertion ordered (oldest first) = the ring
+        self._keys: Dict[int, str] = {}
+        # order_id -> keys still live for that order
+        self._by_order: Dict[str, List[int]] = {}
+        # ordered set of terminal order ids (tombstones)
+        self._closed: Dict[str, None] = {}
+        self._version = 0
+        self._json_cache: Optional[Tuple[int, str]] = None
+
+    # ---------- queries ----------
+
+    @property
+    def version(self) -> int:
+        """Monotonic mutation counter (cheap change detection for persistence)."""
+        return self._version
+
+    def seen(self, order_id: Optional[str], key: EventKey, *, is_fill: bool = False) -> bool:
+        """True if this event was already processed (or is a fill for a fully filled order)."""
+        if event_key_to_int(key) in self._keys:
+            return True
+        return bool(is_fill and order_id and order_id in self._closed)
+
+    def is_closed(self, order_id: str) -> bool:
+        return order_id in self._closed
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (int, str)):
+            return False
+        return event_key_to_int(key) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate live keys as 16-hex strings (legacy ``processed_event_hashes`` shape)."""
+        return (f"{k:016x}" for k in self._keys)
+
+    # ---------- mutation ----------
+
+    def add(self, order_id: Optional[str], key: EventKey) -> None:
+        """Record a processed event, evicting the oldest key when full."""
+        k = event_key_to_int(key)
+        if k in self._keys:
+            return
+        oid = order_id or ""
+        self._keys[k] = oid
+        self._by_order.setdefault(oid, []).append(k)
+        while len(self._keys) > self.max_keys:
+            old_key = next(iter(self._keys))
+            old_oid = self._keys.pop(old_key)
+            bucket = self._by_order.get(old_oid)
+            if bucket is not None:
+                try:
+                    bucket.remove(old_key)
+                except ValueError:
+                    pass
+                if not bucket:
+                    del self._by_order[old_oid]
+        self._bump()
+
+    def close_order(self, order_id: Optional[str], keep_key: Optional[EventKey] = None) -> None:
+        """
+        Order fully filled: drop its per-event keys, keep a tombstone.
+
+        ``keep_key`` (usually the terminal event itself) stays exact so a
+        redelivered copy of that event is still recognised as a duplicate.
+        """
+        if not order_id:
+            return
+        keep = event_key_to_int(keep_key) if keep_key is not None else None
+        for k in self._by_order.pop(order_id, []):
+            if k != keep:
+                self._keys.pop(k, None)
+        if keep is not None and keep in self._keys:
+            self._by_order[order_id] = [keep]
+        self._closed.pop(order_id, None)
+        self._closed[order_id] = None
+        while len(self._closed) > self.max_closed_orders:
+            del self._closed[next(iter(self._closed))]
+        self._bump()
+
+    def _bump(self) -> None:
+        self._version += 1
+
+    # ---------- persistence ----------
+
+    def to_state(self) -> Dict:
+        """Compact JSON-able state: keys grouped by order, plus tombstones."""
+        return {
+            "orders": {oid: list(keys) for oid, keys in self._by_order.items()},
+            "closed": list(self._closed),
+        }
+
+    def to_json(self) -> str:
+        """JSON of ``to_state()``, re-encoded only when the window changed."""
+        cache = self._json_cache
+        if cache is not None and cache[0] == self._version:
+            return cache[1]
+        encoded = json.dumps(self.to_state(), separators=(",", ":"))
+        self._json_cache = (self._version, encoded)
+        return encoded
+
+    @classmethod
+    def from_state(cls, data: Union[None, Dict, Iterable[str]], **kwargs) -> "EventDedupWindow":
+        """
+        Restore from ``to_state()`` output.
+
+        Also accepts the legacy format (flat list of 16-hex event hashes) so
+        positions persisted before the bounded window load unchanged.
+        """
+        window = cls(**kwargs)
+        if not data:
+            return window
+        if isinstance(data, dict):
+            for oid, keys in (data.get("orders") or {}).items():
+                for k in keys:
+                    window.add(oid, int(k))
+            for oid in data.get("closed") or []:
+                window._closed[oid] = None
+            while len(window._closed) > window.max_closed_orders:
+                del window._closed[next(iter(window._closed))]
+        else:
+            for k in data:
+                window.add(None, k)
+        return window
+
+    @classmethod
+    def from_json(cls, raw: Optional[str], **kwargs) -> "EventDedupWindow":
+        return cls.from_state(json.loads(raw) if raw else None, **kwargs)
@@ -43,6 +43,7 @@ from src.execution.production_safety import (
 )
 from src.domain.models import Side, OrderType
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics import get_metrics_registry
 from src.exceptions import (
     OperationalError,
     DataError,
@@ -52,6 +53,12 @@ from src.exceptions import (
 
 logger = get_logger(__name__)
 
+_ACTION_LATENCY = get_metrics_registry().histogram(
+    "trading_execution_action_latency_ms",
+    "ExecutionGateway.execute_action latency by action type",
+    ("action", "outcome"),
+)
+
 
 class OrderPurpose(str, Enum):
     """Purpose of an order for tracking."""
@@ -195,6 +202,7 @@ class ExecutionGateway:
         maker_fee_bps: float = 2.0,
         taker_fee_bps: float = 5.0,
         funding_rate_daily_bps: float = 10.0,
+        orderbook_cache=None,
     ):
         """
         Initialize the execution gateway.
@@ -208,6 +216,7 @@ class ExecutionGateway:
             use_safety: If True, wire AtomicStopReplacer, WAL, EventOrderingEnforcer
             instrument_spec_registry: Optional registry for venue min_size; used to guard partial closes
             on_trade_recorded: Optional async callback(position, trade) called after trade recording
+            orderbook_cache: Optional OrderBookDepthCache read by the entry liquidity check
         """
         self.client = exchange_client
         self.registry = registry or get_position_registry()
@@ -220,6 +229,7 @@ class ExecutionGateway:
         self._on_partial_close = on_partial_close
         self._on_trade_recorded = on_trade_recorded
         self._startup_machine = startup_machine  # Optional P2.3 startup state machine
+        self._orderbook_cache = orderbook_cache  # Optional L2 cache (src.data.orderbook)
         self._stop_replacer: Optional[AtomicStopReplacer] = None
         self._wal: Optional[WriteAheadIntentLog] = None
         self._event_enforcer: Optional[EventOrderingEnforcer] = None
@@ -296,6 +306,7 @@ class ExecutionGateway:
     # Configurable thresholds for entry-time liquidity check
     ENTRY_MAX_SPREAD_PCT = Decimal("0.005")  # 0.5% max spread at entry time
     ENTRY_MIN_DEPTH_RATIO = Decimal("2.0")  # Order book depth must be 2x order size
+    ENTRY_DEPTH_BAND_BPS = Decimal("50")  # L2 depth counted within 50 bps of the touch
     PRICE_DRIFT_ALERT_PCT = Decimal("0.001")  # 0.1% threshold for SQLite vs Postgres entry price drift
     
     async def _check_entry_liquidity(
@@ -319,8 +330,20 @@ class ExecutionGateway:
         2. Depth check: Order book depth must support the order size
         
         Note: We fail OPEN on errors to be safe. Reduce-only exits always proceed.
+        
+        With an orderbook cache the check is an in-memory read; a stale/missing
+        snapshot is refreshed via one REST book call, and only if that fails
+        do we fall back to the ticker path below.
         """
         try:
+            if self._orderbook_cache is not None:
+                self._orderbook_cache.watch(symbol)
+                book = self._orderbook_cache.get_fresh(symbol)
+                if book is None:
+                    book = await self._orderbook_cache.refresh_symbol(symbol)
+                if book is not None and book.spread_pct() is not None:
+                    return self._check_book_liquidity(symbol, side, size, book)
+            
             # Get real-time orderbook or ticker
             fetch_ticker = getattr(self.client, "fetch_ticker", None)
             if not fetch_ticker:
@@ -401,6 +424,39 @@ class ExecutionGateway:
             )
             return (True, None)
     
+    def _check_book_liquidity(
+        self, symbol: str, side: Side, size: Decimal, book
+    ) -> tuple[bool, Optional[str]]:
+        """Spread + depth-within-band check against a cached L2 snapshot (no I/O)."""
+        spread_pct = book.spread_pct()
+        if spread_pct > self.ENTRY_MAX_SPREAD_PCT:
+            return (
+                False,
+                f"Spread {spread_pct:.4%} exceeds max {self.ENTRY_MAX_SPREAD_PCT:.2%}"
+            )
+        
+        # For longs, we hit the ask; for shorts, we hit the bid
+        relevant_depth = book.depth_within_bps(
+            "ask" if side == Side.LONG else "bid", self.ENTRY_DEPTH_BAND_BPS
+        )
+        if relevant_depth > 0 and size > 0:
+            depth_ratio = relevant_depth / size
+            if depth_ratio < self.ENTRY_MIN_DEPTH_RATIO:
+                return (
+                    False,
+                    f"Depth ratio {depth_ratio:.2f}x < min {self.ENTRY_MIN_DEPTH_RATIO}x "
+                    f"(within {self.ENTRY_DEPTH_BAND_BPS} bps)"
+                )
+        
+        logger.debug(
+            "Entry liquidity check passed (cached book)",
+            symbol=symbol,
+            spread=f"{spread_pct:.4%}",
+            depth=str(relevant_depth),
+            book_age_s=round(book.age_seconds(), 2),
+        )
+        return (True, None)
+    
     # ========== ORDER SUBMISSION ==========
     
     async def execute_action(
@@ -432,6 +488,21 @@ class ExecutionGateway:
                 )
         # P0.2: Global order rate limit
         self._order_rate_limiter.check_and_record()
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await self._dispatch_action(action, order_symbol)
+            outcome = "ok" if result.success else "failed"
+            return result
+        finally:
+            _ACTION_LATENCY.labels(action=action.type.value, outcome=outcome).observe(
+                (time.perf_counter() - started) * 1000
+            )
+    
+    async def _dispatch_action(
+        self, action: ManagementAction, order_symbol: Optional[str] = None
+    ) -> ExecutionResult:
+        """Route an action to its executor; operational/data errors become failed results."""
         try:
             if action.type == ActionType.OPEN_POSITION:
                 return await self._execute_entry(action, order_symbol=order_symbol)
@@ -1617,6 +1688,8 @@ class ExecutionGateway:
         
         if self._event_enforcer:
             self._event_enforcer.mark_processed(exchange_order_id, next_seq, fill_id)
+            if event_type == OrderEventType.FILLED:
+                self._event_enforcer.mark_order_filled(exchange_order_id)
         pending.last_event_seq = next_seq
         
         if event_type == OrderEventType.FILLED:
@@ -2146,7 +2219,6 @@ class ExecutionGateway:
         Also handles stale positions (remaining_qty=0) by replacing them.
         """
         from src.execution.position_state_machine import ManagedPosition, PositionState, FillRecord, Side
-        from src.data.symbol_utils import normalize_symbol_for_position_match
         from datetime import datetime, timezone
         
         try:
@@ -2167,21 +2239,20 @@ class ExecutionGateway:
                 continue
             
             # Check if already in registry - use normalized matching
-            normalized_key = normalize_symbol_for_position_match(symbol)
             existing = self.registry.get_position(symbol)
             stale_symbols_to_remove = []
             
             # Also check for normalized matches across all registry positions
-            for reg_symbol in list(self.registry._positions.keys()):
-                if normalize_symbol_for_position_match(reg_symbol) == normalized_key:
-                    reg_pos = self.registry._positions.get(reg_symbol)
-                    if reg_pos and reg_pos.remaining_qty > 0:
-                        # Found a valid existing position, skip import
-                        existing = reg_pos
-                        break
-                    elif reg_pos and reg_pos.remaining_qty <= 0:
-                        # Stale position, mark for removal
-                        stale_symbols_to_remove.append(reg_symbol)
+            # (registry-maintained index: no scan over every stored key)
+            for reg_symbol in self.registry.get_symbols_by_normalized(symbol):
+                reg_pos = self.registry._positions.get(reg_symbol)
+                if reg_pos and reg_pos.remaining_qty > 0:
+                    # Found a valid existing position, skip import
+                    existing = reg_pos
+                    break
+                elif reg_pos and reg_pos.remaining_qty <= 0:
+                    # Stale position, mark for removal
+                    stale_symbols_to_remove.append(reg_symbol)
             
             if existing and existing.remaining_qty > 0:
                 continue
@@ -2327,7 +2398,7 @@ class ExecutionGateway:
         return {
             **self.metrics,
             "pending_orders": len(self._pending_orders),
-            "active_positions": len(self.registry.get_all_active()),
+            "active_positions": len(self.registry.snapshot().active()),
             "manager_metrics": self.position_manager.metrics,
             "orders_blocked_by_rate_limit_total": self._order_rate_limiter.orders_blocked_total,
             "orders_per_minute_current": self._order_rate_limiter.orders_last_minute,
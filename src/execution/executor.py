@@ -71,6 +71,11 @@ class Executor:
         )
         
         logger.info("Executor initialized", config=config.model_dump())
+
+    def apply_config(self, config: ExecutionConfig) -> None:
+        """Swap in a hot-reloaded execution config; tracked orders and intents are kept."""
+        self.config = config
+        self.order_monitor.default_timeout_seconds = config.order_timeout_seconds
         
 
         
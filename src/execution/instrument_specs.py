@@ -407,10 +407,74 @@ def ensure_size_step_aligned(
     return (rounded, None)
 
 
+# Fields whose change between refreshes is reported (sizing / leverage inputs)
+_DIFF_FIELDS = ("contract_size", "min_size", "size_step", "price_tick", "max_leverage", "leverage_mode")
+_ALIAS_MEMO_MAX = 4096  # cap on memoized ad-hoc lookups (incl. misses)
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class SpecDiff:
+    """What a refresh changed relative to the previous index."""
+
+    added: Tuple[str, ...] = ()
+    removed: Tuple[str, ...] = ()
+    changed: Dict[str, Dict[str, Tuple[str, str]]] = field(default_factory=dict)  # symbol -> field -> (old, new)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "added": list(self.added),
+            "removed": list(self.removed),
+            "changed": {sym: {k: list(v) for k, v in f.items()} for sym, f in self.changed.items()},
+        }
+
+
+def diff_specs(old: Dict[str, InstrumentSpec], new: Dict[str, InstrumentSpec]) -> SpecDiff:
+    """Compare two symbol_raw -> spec maps."""
+    added = tuple(sorted(set(new) - set(old)))
+    removed = tuple(sorted(set(old) - set(new)))
+    changed: Dict[str, Dict[str, Tuple[str, str]]] = {}
+    for sym in set(old) & set(new):
+        a, b = old[sym], new[sym]
+        fields = {
+            name: (str(getattr(a, name)), str(getattr(b, name)))
+            for name in _DIFF_FIELDS
+            if getattr(a, name) != getattr(b, name)
+        }
+        if fields:
+            changed[sym] = fields
+    return SpecDiff(added=added, removed=removed, changed=changed)
+
+
+def _alias_variants(spec: InstrumentSpec) -> List[str]:
+    """Common spellings of a contract: PF_/PI_ prefixes, BASE/USD, BASE/USD:USD, BASEUSD, XBT<->BTC."""
+    bases = [spec.base.upper()]
+    if bases[0] == "XBT":
+        bases.append("BTC")
+    elif bases[0] == "BTC":
+        bases.append("XBT")
+    out = []
+    for b in bases:
+        out += [
+            f"{b}USD", f"PF_{b}USD", f"PI_{b}USD",
+            f"{b}/USD", f"{b}/USD:USD", f"{b}-USD", f"{b}_USD", f"{b}",
+        ]
+    return out
+
+
 class InstrumentSpecRegistry:
     """
     Single source of truth for futures instrument specs.
     Loads from Kraken instruments API, caches to disk with TTL.
+
+    Lookups go through an alias index (every common spelling of each
+    contract -> spec) built once per index rebuild; spellings not in it are
+    resolved by normalization once and memoized. The disk snapshot is only
+    re-parsed when the file changes (mtime/size).
     """
 
     def __init__(
@@ -429,6 +493,12 @@ class InstrumentSpecRegistry:
         self._by_ccxt: Dict[str, InstrumentSpec] = {}
         self._loaded_at: float = 0
         self._log_unknown_leverage: Dict[str, bool] = {}  # symbol -> already logged
+        self._aliases: Dict[str, InstrumentSpec] = {}
+        self._memo: Dict[str, Optional[InstrumentSpec]] = {}  # ad-hoc spellings (incl. misses)
+        self._aliases_for: Optional[Dict[str, InstrumentSpec]] = None  # _by_raw the aliases were built from
+        self._disk_stat: Optional[Tuple[int, int]] = None  # (mtime_ns, size) of the last parsed snapshot
+        self._disk_result: bool = False
+        self.last_diff: Optional[SpecDiff] = None
 
     def _is_stale(self) -> bool:
         """True if never loaded, empty, or past TTL. Treat never-loaded as stale."""
@@ -437,8 +507,21 @@ class InstrumentSpecRegistry:
         return (time.time() - self._loaded_at) > self._cache_ttl
 
     def _load_from_disk(self) -> bool:
-        if not self._cache_path or not self._cache_path.exists():
+        if not self._cache_path:
+            return False
+        try:
+            st = self._cache_path.stat()
+        except OSError:
             return False
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if stat_key == self._disk_stat:
+            # Same snapshot as last time: the index (or the rejection) still stands.
+            return self._disk_result
+        self._disk_stat = stat_key
+        self._disk_result = self._parse_disk_snapshot()
+        return self._disk_result
+
+    def _parse_disk_snapshot(self) -> bool:
         try:
             with open(self._cache_path) as f:
                 data = json.load(f)
@@ -470,6 +553,22 @@ class InstrumentSpecRegistry:
             key = (s.base + "USD").upper()
             if key not in self._by_raw:
                 self._by_raw[key] = s
+        self._build_aliases()
+
+    def _build_aliases(self) -> None:
+        """Precompute alias -> spec for every indexed contract (exact keys win)."""
+        aliases: Dict[str, InstrumentSpec] = {}
+        aliases.update(self._by_ccxt)
+        aliases.update(self._by_raw)
+        for spec in list(self._by_raw.values()):
+            # Fuzzy spellings resolve to the base's canonical entry, as the
+            # normalized lookup in _resolve_uncached does.
+            target = self._by_raw.get((spec.base + "USD").upper(), spec)
+            for variant in _alias_variants(spec):
+                aliases.setdefault(variant, target)
+        self._aliases = aliases
+        self._aliases_for = self._by_raw
+        self._memo = {}
     
     async def _enrich_from_ccxt_markets(self, specs: List[InstrumentSpec]) -> None:
         """
@@ -621,7 +720,10 @@ class InstrumentSpecRegistry:
             # Enrich with CCXT market precision.amount if available
             if self._ccxt_exchange:
                 await self._enrich_from_ccxt_markets(specs)
+            previous = {sp.symbol_raw: sp for sp in self._by_raw.values()}
             self._index(specs)
+            if previous:
+                self._report_diff(previous)
             self._loaded_at = time.time()
             self._save_to_disk()
             # Startup sanity check: fail fast if size_step >> min_size
@@ -630,6 +732,22 @@ class InstrumentSpecRegistry:
         elif self._loaded_at == 0:
             self._load_from_disk()
 
+    def _report_diff(self, previous: Dict[str, InstrumentSpec]) -> None:
+        current = {sp.symbol_raw: sp for sp in self._by_raw.values()}
+        diff = diff_specs(previous, current)
+        self.last_diff = diff
+        if diff.empty:
+            return
+        logger.warning(
+            "INSTRUMENT_SPECS_CHANGED",
+            added=list(diff.added),
+            removed=list(diff.removed),
+            changed=diff.to_dict()["changed"],
+            added_count=len(diff.added),
+            removed_count=len(diff.removed),
+            changed_count=len(diff.changed),
+        )
+
     def ensure_loaded(self) -> bool:
         """Ensure in-memory index is populated (from cache if not stale)."""
         if self._by_raw and not self._is_stale():
@@ -647,16 +765,38 @@ class InstrumentSpecRegistry:
         s = (futures_symbol_any_format or "").strip().upper()
         if not s:
             return None
+        if self._aliases_for is not self._by_raw:
+            # Index was replaced without _index() (e.g. assigned directly).
+            self._build_aliases()
+        out = self._aliases.get(s)
+        if out is not None:
+            return out
+        out = self._memo.get(s, _MISSING)
+        if out is not _MISSING:
+            return out
+        out = self._resolve_uncached(s)
+        if len(self._memo) < _ALIAS_MEMO_MAX:
+            self._memo[s] = out
+        return out
+
+    def _resolve_uncached(self, s: str) -> Optional[InstrumentSpec]:
+        """Normalize an upper-cased symbol and look it up (no alias index)."""
         # Direct
         out = self._by_raw.get(s) or self._by_ccxt.get(s)
         if out:
             return out
         # Normalized
         s = s.replace("PF_", "").replace("PI_", "").replace("FI_", "").replace("/", "").replace(":", "").replace("-", "").replace("_", "")
+        if s.endswith("USDUSD"):  # BASE/USD:USD
+            s = s[:-3]
         if s.endswith("USD"):
             out = self._by_raw.get(s) or self._by_raw.get("PF_" + s)
         else:
             out = self._by_raw.get(s + "USD") or self._by_raw.get("PF_" + s + "USD")
+        if out is None and s[:3] in ("BTC", "XBT"):
+            # Kraken futures lists bitcoin as XBT; spot/ccxt callers say BTC.
+            swapped = ("XBT" if s[:3] == "BTC" else "BTC") + s[3:]
+            out = self._by_raw.get(swapped) or self._by_raw.get("PF_" + swapped)
         return out
 
     def get_effective_min_size(self, futures_symbol_any_format: str) -> Decimal:
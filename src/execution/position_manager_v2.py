@@ -26,6 +26,7 @@ from src.execution.position_state_machine import (
     check_invariant
 )
 from src.execution.instrument_specs import InstrumentSpecRegistry
+from src.config.runtime_params import ExitParams
 from src.data.symbol_utils import position_symbol_matches_order
 from src.domain.models import Side, OrderType, Signal, SignalType
 from src.monitoring.logger import get_logger
@@ -154,6 +155,7 @@ class PositionManagerV2:
         instrument_spec_registry: Optional[InstrumentSpecRegistry] = None,
         strategy_config: Optional[Any] = None,
         institutional_memory: Optional[Any] = None,
+        exit_params: Optional[ExitParams] = None,
     ):
         """
         Initialize with optional custom registry and multi-TP config.
@@ -162,9 +164,12 @@ class PositionManagerV2:
             registry: Position registry (uses singleton if not provided)
             multi_tp_config: Optional MultiTPConfig for runner mode settings
             instrument_spec_registry: Optional registry for venue min_size; used to guard partial closes
+            exit_params: Precompiled ExitParams for ``multi_tp_config`` (compiled if not given)
         """
         self.registry = registry or get_position_registry()
         self._multi_tp_config = multi_tp_config
+        self._exit_params = exit_params
+        self._exit_params_source = multi_tp_config if exit_params is not None else None
         self._instrument_spec_registry = instrument_spec_registry
         self._strategy_config = strategy_config
         self._institutional_memory = institutional_memory
@@ -202,6 +207,26 @@ class PositionManagerV2:
             "errors": 0
         }
     
+    @property
+    def exit_params(self) -> ExitParams:
+        """Precompiled view of the multi-TP config; rebuilt when that config object is replaced."""
+        if self._exit_params is None or self._exit_params_source is not self._multi_tp_config:
+            self._exit_params = ExitParams.from_multi_tp(self._multi_tp_config)
+            self._exit_params_source = self._multi_tp_config
+        return self._exit_params
+
+    def apply_config(
+        self,
+        multi_tp_config=None,
+        strategy_config: Optional[Any] = None,
+        exit_params: Optional[ExitParams] = None,
+    ) -> None:
+        """Swap in hot-reloaded multi-TP / strategy config; managed positions are untouched."""
+        self._multi_tp_config = multi_tp_config
+        self._strategy_config = strategy_config
+        self._exit_params = exit_params
+        self._exit_params_source = multi_tp_config if exit_params is not None else None
+
     def _get_min_size_for_partial(self, symbol: str) -> Decimal:
         """
         Get venue minimum size for partial closes. Used to avoid ORDER_REJECTED_BY_VENUE.
@@ -694,14 +719,13 @@ class PositionManagerV2:
                 # Do NOT return early -- allow subsequent rules to run
         
         # ========== RULE 10.5: PROGRESSIVE TRAILING (R-based tightening) ==========
+        exit_params = self.exit_params
         if (
             position.runner_mode
             and position.trailing_active
             and current_atr
-            and self._multi_tp_config
-            and getattr(self._multi_tp_config, 'progressive_trail_enabled', False)
+            and exit_params.progressive_trail_enabled
         ):
-            prog_levels = getattr(self._multi_tp_config, 'progressive_trail_levels', [])
             # Compute current R-multiple
             entry_ref = position.avg_entry_price or position.initial_entry_price
             if position.initial_stop_price and entry_ref:
@@ -713,10 +737,9 @@ class PositionManagerV2:
                         current_r = (entry_ref - current_price) / risk_per_unit
                     
                     # Check each level (sorted by r_threshold ascending)
-                    sorted_levels = sorted(prog_levels, key=lambda x: x.get("r_threshold", 0))
-                    for idx, level in enumerate(sorted_levels):
-                        r_thresh = Decimal(str(level.get("r_threshold", 999)))
-                        atr_m = Decimal(str(level.get("atr_mult", 2.0)))
+                    for idx, level in enumerate(exit_params.progressive_trail_levels):
+                        r_thresh = level.r_threshold
+                        atr_m = level.atr_mult
                         
                         if current_r >= r_thresh and idx > position.highest_r_tighten_level:
                             # New R-level reached: tighten trail
@@ -825,10 +848,7 @@ class PositionManagerV2:
         
         # ========== TRAILING ACTIVATION (guard at TP1) ==========
         if position.tp1_filled and not position.trailing_active and current_atr:
-            atr_min = Decimal("0")
-            if self._multi_tp_config:
-                atr_min = Decimal(str(getattr(self._multi_tp_config, "trailing_activation_atr_min", 0)))
-            position.activate_trailing_if_guard_passes(current_atr, atr_min)
+            position.activate_trailing_if_guard_passes(current_atr, self.exit_params.trailing_activation_atr_min)
 
         # ========== RULE 9: TRAILING STOP ==========
         if (position.break_even_triggered or position.trailing_active) and current_atr:
@@ -25,9 +25,11 @@ from src.execution.position_state_machine import (
     PositionState,
     ExitReason,
     FillRecord,
+    get_position_registry,
     set_position_registry
 )
 from src.domain.models import Side
+from src.execution.event_dedup import EventDedupWindow
 from src.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
@@ -42,6 +44,8 @@ class PositionPersistence:
         """Initialize persistence with database path."""
         self.db_path = db_path
         self._local = threading.local()
+        # Registry version at the last save_registry, for change detection.
+        self._saved_registry_version: Optional[int] = None
         
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -240,7 +244,7 @@ class PositionPersistence:
                 1 if position.intent_confirmed else 0,
                 position.created_at.isoformat(),
                 position.updated_at.isoformat(),
-                json.dumps(list(position.processed_event_hashes)),
+                position.processed_event_hashes.to_json(),
                 1 if position.trade_recorded else 0,
             ))
             
@@ -249,6 +253,8 @@ class PositionPersistence:
                 self._save_fill(position.position_id, fill)
             for fill in position.exit_fills:
                 self._save_fill(position.position_id, fill)
+        # Persisted state is what status readers see: republish the snapshot.
+        get_position_registry().publish_position(position)
     
     def _save_fill(self, position_id: str, fill: FillRecord) -> bool:
         """Save a fill record with global fill_id idempotency."""
@@ -427,7 +433,7 @@ class PositionPersistence:
             
             # Load processed event hashes
             hashes = row.get("processed_event_hashes", "[]")
-            pos.processed_event_hashes = set(json.loads(hashes))
+            pos.processed_event_hashes = EventDedupWindow.from_json(hashes)
             
             # Load fills
             self._load_fills(pos)
@@ -521,7 +527,11 @@ class PositionPersistence:
         Persists both active positions (from _positions) and recently closed
         positions (from _closed_positions, last 100). This ensures closed
         position history survives restarts for trade recording and audit.
+        Skipped when the registry version hasn't moved since the last save.
         """
+        version = registry.version
+        if version == self._saved_registry_version:
+            return
         # Save all active positions
         for position in registry.get_all():
             self.save_position(position)
@@ -534,6 +544,7 @@ class PositionPersistence:
         data = registry.to_dict()
         for symbol, side_str in data.get("pending_reversals", {}).items():
             self.save_pending_reversal(symbol, Side(side_str))
+        self._saved_registry_version = version
     
     def load_registry(self) -> PositionRegistry:
         """
@@ -13,11 +13,14 @@ This module enforces world-class position management with:
 
 NO TRADE CAN EXIST OUTSIDE THIS STATE MACHINE.
 """
+import copy
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from decimal import Decimal, ROUND_DOWN
 from enum import Enum
 from datetime import datetime, timezone
-from typing import Optional, Dict, List, Tuple, Set
+from types import MappingProxyType
+from typing import Optional, Dict, Iterable, Iterator, List, Mapping, Tuple, Set
 import threading
 import hashlib
 import json
@@ -26,6 +29,7 @@ from src.domain.models import Side, OrderType
 from src.exceptions import OperationalError, DataError
 from src.monitoring.logger import get_logger
 from src.data.symbol_utils import normalize_symbol_for_position_match
+from src.execution.event_dedup import EventDedupWindow
 
 logger = get_logger(__name__)
 
@@ -158,6 +162,9 @@ class OrderEventType(str, Enum):
     REPLACED = "replaced"
 
 
+_FILL_EVENT_TYPES = frozenset({OrderEventType.PARTIAL_FILL, OrderEventType.FILLED})
+
+
 # ============ ORDER EVENT (for idempotent handling) ============
 
 @dataclass(frozen=True)
@@ -259,7 +266,8 @@ class ManagedPosition:
     pending_exit_client_order_id: Optional[str] = None
     
     # ========== EVENT TRACKING (for idempotency) ==========
-    processed_event_hashes: Set[str] = field(default_factory=set)
+    # Bounded window (fixed-size int hashes, terminal orders collapse to a tombstone)
+    processed_event_hashes: EventDedupWindow = field(default_factory=EventDedupWindow)
     
     # ========== STATE FLAGS ==========
     entry_acknowledged: bool = False  # Invariant C kicks in after this
@@ -307,7 +315,7 @@ class ManagedPosition:
     # Progressive trailing state: tracks the highest R-level tightening applied
     highest_r_tighten_level: int = -1  # Index into progressive_trail_levels; -1 = none applied yet
     current_trail_atr_mult: Optional[Decimal] = None  # Current effective ATR mult (set by progressive trail)
-    
+
     def __post_init__(self):
         """Validate position parameters."""
         check_invariant(
@@ -418,11 +426,24 @@ class ManagedPosition:
     
     def _is_duplicate_event(self, event: OrderEvent) -> bool:
         """Check if event was already processed."""
-        return event.event_hash() in self.processed_event_hashes
+        return self.processed_event_hashes.seen(
+            event.order_id,
+            event.event_hash(),
+            is_fill=event.event_type in _FILL_EVENT_TYPES,
+        )
     
     def _mark_event_processed(self, event: OrderEvent) -> None:
-        """Mark event as processed for idempotency."""
-        self.processed_event_hashes.add(event.event_hash())
+        """Mark event as processed for idempotency.
+
+        Once the order is fully FILLED its per-event hashes are evicted; the
+        window keeps a tombstone so late duplicate fills are still rejected.
+        Cancelled/rejected/expired orders keep exact per-event dedup only: a
+        genuine partial fill can still race the cancel.
+        """
+        event_hash = event.event_hash()
+        self.processed_event_hashes.add(event.order_id, event_hash)
+        if event.event_type == OrderEventType.FILLED:
+            self.processed_event_hashes.close_order(event.order_id, keep_key=event_hash)
         self.updated_at = datetime.now(timezone.utc)
 
     def _matches_entry_event(self, event: OrderEvent) -> bool:
@@ -1061,7 +1082,7 @@ class ManagedPosition:
                 {"fill_id": f.fill_id, "qty": str(f.qty), "price": str(f.price), "ts": f.timestamp.isoformat()}
                 for f in self.exit_fills
             ],
-            "processed_event_hashes": list(self.processed_event_hashes),
+            "processed_event_hashes": self.processed_event_hashes.to_state(),
             "trade_recorded": self.trade_recorded,
             "trade_record_attempts": self.trade_record_attempts,
         }
@@ -1123,7 +1144,7 @@ class ManagedPosition:
                 is_entry=False
             ))
         
-        pos.processed_event_hashes = set(data.get("processed_event_hashes", []))
+        pos.processed_event_hashes = EventDedupWindow.from_state(data.get("processed_event_hashes"))
         pos.trade_recorded = data.get("trade_recorded", False)
         pos.trade_record_attempts = data.get("trade_record_attempts", 0)
         
@@ -1132,6 +1153,147 @@ class ManagedPosition:
 
 # ============ POSITION REGISTRY ============
 
+class _PositionIndex(dict):
+    """
+    ``symbol -> ManagedPosition`` dict with a normalized-symbol secondary index.
+
+    The index maps ``_normalize_symbol(key)`` to the stored keys (in insertion
+    order) and is maintained on every mutation, so format-variant lookups
+    (PF_XBTUSD vs BTC/USD:USD) are dict hits instead of scans. It is a dict
+    subclass so existing ``registry._positions[...]`` callers (persistence,
+    takeover, gateway startup) keep the index consistent for free.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._by_norm: Dict[str, Dict[str, None]] = {}
+        # Registry version: bumped on every membership change here and by
+        # PositionRegistry._publish for in-place transitions.
+        self.mutations = 0
+        self.update(*args, **kwargs)
+
+    def _index_add(self, key: str) -> None:
+        self.mutations += 1
+        self._by_norm.setdefault(_normalize_symbol(key), {})[key] = None
+
+    def _index_remove(self, key: str) -> None:
+        self.mutations += 1
+        norm = _normalize_symbol(key)
+        keys = self._by_norm.get(norm)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._by_norm[norm]
+
+    def __setitem__(self, key: str, value: "ManagedPosition") -> None:
+        super().__setitem__(key, value)
+        self._index_add(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._index_remove(key)
+
+    _MISSING = object()
+
+    def pop(self, key, default=_MISSING):
+        if key in self:
+            value = super().pop(key)
+            self._index_remove(key)
+            return value
+        if default is self._MISSING:
+            raise KeyError(key)
+        return default
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._index_remove(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self._by_norm.clear()
+        self.mutations += 1
+
+    def keys_for(self, symbol: str) -> List[str]:
+        """Stored keys whose normalized form matches ``symbol``."""
+        return list(self._by_norm.get(_normalize_symbol(symbol), ()))
+
+    def find(self, symbol: str) -> Optional["ManagedPosition"]:
+        """Exact key first, then first stored variant with the same normalized form."""
+        pos = self.get(symbol)
+        if pos is not None:
+            return pos
+        keys = self._by_norm.get(_normalize_symbol(symbol))
+        if keys:
+            return self.get(next(iter(keys)))
+        return None
+
+
+def _lookup(positions: Mapping[str, "ManagedPosition"], by_norm: Mapping[str, Tuple[str, ...]], symbol: str):
+    """Exact key first, then first stored variant (same rule as the live index)."""
+    pos = positions.get(symbol)
+    if pos is not None:
+        return pos
+    keys = by_norm.get(_normalize_symbol(symbol))
+    return positions.get(keys[0]) if keys else None
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """
+    Immutable, versioned view of the registry.
+    
+    Published copy-on-write by PositionRegistry after each registry-routed
+    mutation, so readers (health endpoint, Telegram status, get_system_status)
+    never take the registry lock. ``positions`` holds deep copies taken under
+    the symbol locks, so they never change after publish; ``live`` maps the
+    same keys to the registry's own objects for callers that mutate them
+    (``get_position``).
+    """
+    version: int
+    positions: Mapping[str, "ManagedPosition"]
+    by_normalized: Mapping[str, Tuple[str, ...]]
+    live: Mapping[str, "ManagedPosition"] = field(default_factory=dict, repr=False, compare=False)
+    
+    @classmethod
+    def build(
+        cls, version: int, frozen: Dict[str, "ManagedPosition"], live: Dict[str, "ManagedPosition"]
+    ) -> "RegistrySnapshot":
+        by_norm: Dict[str, List[str]] = {}
+        for key in live:
+            by_norm.setdefault(_normalize_symbol(key), []).append(key)
+        return cls(
+            version=version,
+            positions=MappingProxyType(frozen),
+            by_normalized=MappingProxyType({k: tuple(v) for k, v in by_norm.items()}),
+            live=MappingProxyType(live),
+        )
+    
+    def keys_for(self, symbol: str) -> List[str]:
+        return list(self.by_normalized.get(_normalize_symbol(symbol), ()))
+    
+    def find(self, symbol: str) -> Optional["ManagedPosition"]:
+        return _lookup(self.positions, self.by_normalized, symbol)
+    
+    def all(self) -> List["ManagedPosition"]:
+        return list(self.positions.values())
+    
+    def active(self) -> List["ManagedPosition"]:
+        return [p for p in self.positions.values() if not p.is_terminal]
+    
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
 class PositionRegistry:
     """
     Single source of truth for all managed positions.
@@ -1140,11 +1302,27 @@ class PositionRegistry:
     1. One position per symbol (Invariant A)
     2. Full close before direction change (Invariant E)
     3. Thread-safe, idempotent access
+    
+    LOCKING:
+    - ``_lock`` (global) guards membership, reversals and reconciliation.
+    - Per-symbol locks guard state transitions on one position, so order
+      events for different symbols never serialize behind each other.
+      Lock order is always global -> symbol (several symbols: sorted), and
+      registry-wide methods that read or write positions take the symbol
+      locks too (``_locked_symbols``), so they never see a half-applied event.
+    - Every locked mutator republishes the snapshot (``_publish``), which
+      bumps the single registry version. Readers use ``snapshot()`` and take
+      no lock unless ``_positions`` was written directly since the last
+      publish. Callers that edit a position in place outside the registry
+      call ``publish_position`` (persistence does on every save).
     """
     
     def __init__(self):
-        self._positions: Dict[str, ManagedPosition] = {}
+        self._positions: _PositionIndex = _PositionIndex()
         self._lock = threading.RLock()
+        self._symbol_locks: Dict[str, threading.RLock] = {}
+        self._symbol_locks_guard = threading.Lock()
+        self._snapshot: RegistrySnapshot = RegistrySnapshot.build(0, {}, {})
         self._pending_reversals: Dict[str, Side] = {}  # symbol -> pending new side
         self._closed_positions: List[ManagedPosition] = []  # History
         # Orphan hysteresis: require consecutive "missing on exchange" observations
@@ -1156,14 +1334,81 @@ class PositionRegistry:
         # position, we still know the exchange has one and block duplicate entries.
         self._known_exchange_symbols: Set[str] = set()  # normalized symbols with live exposure
     
+    # ========== SNAPSHOTS & LOCKS ==========
+    
+    def _publish(self, changed: Iterable[str] = ()) -> RegistrySnapshot:
+        """
+        Bump the version and publish a new snapshot.
+        
+        MUST be called under ``_lock`` plus the symbol locks of ``changed``.
+        Positions in ``changed`` or new since the last publish are copied;
+        the others reuse their previous copy.
+        """
+        changed = set(changed)
+        prev = self._snapshot
+        frozen: Dict[str, ManagedPosition] = {}
+        for key, pos in self._positions.items():
+            if key in changed or prev.live.get(key) is not pos:
+                frozen[key] = copy.deepcopy(pos)
+            else:
+                frozen[key] = prev.positions[key]
+        self._positions.mutations += 1
+        snap = RegistrySnapshot.build(self._positions.mutations, frozen, dict(self._positions))
+        self._snapshot = snap
+        return snap
+    
+    def snapshot(self) -> RegistrySnapshot:
+        """
+        Current consistent snapshot, lock-free on the hot path (one int compare).
+        
+        Direct ``_positions`` writes (persistence load, takeover) bump the
+        version without publishing; the next read republishes once.
+        """
+        snap = self._snapshot
+        if snap.version == self._positions.mutations:
+            return snap
+        with self._lock, self._locked_symbols(self._positions):
+            snap = self._snapshot
+            if snap.version == self._positions.mutations:
+                return snap
+            return self._publish()
+    
+    @property
+    def version(self) -> int:
+        """Monotonic change counter (membership and registry-routed transitions)."""
+        return self.snapshot().version
+    
+    def publish_position(self, position: ManagedPosition) -> None:
+        """Republish after ``position`` was edited in place outside the registry."""
+        with self._lock, self._symbol_lock(position.symbol):
+            if self._positions.get(position.symbol) is position:
+                self._publish(changed=(position.symbol,))
+    
+    def _symbol_lock(self, symbol: str) -> threading.RLock:
+        """Per-market lock (keyed by normalized symbol) for state transitions."""
+        key = _normalize_symbol(symbol)
+        lock = self._symbol_locks.get(key)
+        if lock is None:
+            with self._symbol_locks_guard:
+                lock = self._symbol_locks.setdefault(key, threading.RLock())
+        return lock
+
+    @contextmanager
+    def _locked_symbols(self, symbols: Iterable[str]) -> Iterator[None]:
+        """Hold the symbol locks for ``symbols`` (sorted, deduped). Caller holds ``_lock``."""
+        with ExitStack() as stack:
+            for key in sorted({_normalize_symbol(s) for s in symbols}):
+                stack.enter_context(self._symbol_lock(key))
+            yield
+    
     # ========== INVARIANT A: Single position per symbol ==========
     
     def _check_invariant_a(self, symbol: str) -> None:
         """Invariant A: At most one non-terminal position per symbol (using normalized matching)."""
         target_norm = _normalize_symbol(symbol)
         positions = [
-            p for p in self._positions.values()
-            if _normalize_symbol(p.symbol) == target_norm and not p.is_terminal
+            p for p in (self._positions[k] for k in self._positions.keys_for(symbol))
+            if not p.is_terminal
         ]
         check_invariant(
             len(positions) <= 1,
@@ -1175,48 +1420,41 @@ class PositionRegistry:
     def _find_position_by_normalized(self, symbol: str) -> Optional[ManagedPosition]:
         """Find position by normalized symbol (handles PF_*, /, :USD formats).
         
-        MUST be called under lock.
+        MUST be called under lock. O(1) via the normalized-symbol index.
         """
-        # Try exact match first
-        pos = self._positions.get(symbol)
-        if pos is not None:
-            return pos
-        
-        # Search by normalized symbol
-        target_norm = _normalize_symbol(symbol)
-        for stored_symbol, pos in self._positions.items():
-            if _normalize_symbol(stored_symbol) == target_norm:
-                return pos
-        return None
+        return self._positions.find(symbol)
+
+    def _find_live(self, symbol: str) -> Optional[ManagedPosition]:
+        snap = self.snapshot()
+        return _lookup(snap.live, snap.by_normalized, symbol)
+
+    def get_symbols_by_normalized(self, symbol: str) -> List[str]:
+        """Registry keys (any state) that normalize to the same market as ``symbol``."""
+        return self.snapshot().keys_for(symbol)
     
     def has_position(self, symbol: str) -> bool:
         """Check if symbol has an active position (handles symbol format variants)."""
-        with self._lock:
-            pos = self._find_position_by_normalized(symbol)
-            return pos is not None and not pos.is_terminal
+        pos = self._find_live(symbol)
+        return pos is not None and not pos.is_terminal
     
     def get_position(self, symbol: str) -> Optional[ManagedPosition]:
-        """Get active position for symbol (handles symbol format variants)."""
-        with self._lock:
-            pos = self._find_position_by_normalized(symbol)
-            if pos and not pos.is_terminal:
-                return pos
-            return None
+        """Get the live active position for symbol (handles symbol format variants)."""
+        pos = self._find_live(symbol)
+        if pos and not pos.is_terminal:
+            return pos
+        return None
 
     def get_position_any_state(self, symbol: str) -> Optional[ManagedPosition]:
         """Get position for symbol regardless of state (including terminal/closed)."""
-        with self._lock:
-            return self._find_position_by_normalized(symbol)
+        return self._find_live(symbol)
     
     def get_all_active(self) -> List[ManagedPosition]:
-        """Get all active positions."""
-        with self._lock:
-            return [p for p in self._positions.values() if not p.is_terminal]
+        """Get all live active positions (use ``snapshot().active()`` for read-only status)."""
+        return [p for p in self.snapshot().live.values() if not p.is_terminal]
     
     def get_all(self) -> List[ManagedPosition]:
-        """Get all positions including terminal."""
-        with self._lock:
-            return list(self._positions.values())
+        """Get all live positions including terminal."""
+        return list(self.snapshot().live.values())
     
     # ========== HARD RESET (startup hygiene) ==========
 
@@ -1231,7 +1469,7 @@ class PositionRegistry:
         Returns the list of positions that were closed so the caller can
         persist them.
         """
-        with self._lock:
+        with self._lock, self._locked_symbols(self._positions):
             closed: List[ManagedPosition] = []
             for pos in self._positions.values():
                 pos.state = PositionState.CLOSED
@@ -1241,6 +1479,7 @@ class PositionRegistry:
                 closed.append(pos)
             self._positions.clear()
             self._pending_reversals.clear()
+            self._publish()
 
         if closed:
             logger.critical(
@@ -1359,6 +1598,7 @@ class PositionRegistry:
             to_remove = [s for s in self._pending_reversals if _normalize_symbol(s) == target_norm]
             for s in to_remove:
                 del self._pending_reversals[s]
+            self._publish(changed=(position.symbol,))
             
             logger.info(
                 "Position registered",
@@ -1376,7 +1616,7 @@ class PositionRegistry:
         
         This blocks new opens until close is confirmed.
         """
-        with self._lock:
+        with self._lock, self._symbol_lock(symbol):
             pos = self.get_position(symbol)
             if pos is None:
                 return False
@@ -1385,6 +1625,7 @@ class PositionRegistry:
                 return False  # Not a reversal
             
             self._pending_reversals[symbol] = new_side
+            self._publish()
             logger.info(
                 "Reversal requested",
                 symbol=symbol,
@@ -1397,13 +1638,14 @@ class PositionRegistry:
         """
         Confirm reversal close complete. Returns the new side to open.
         """
-        with self._lock:
+        with self._lock, self._symbol_lock(symbol):
             pos = self.get_position(symbol)
             if pos is not None and not pos.is_terminal:
                 return None  # Not yet closed
             
             new_side = self._pending_reversals.pop(symbol, None)
             if new_side:
+                self._publish()
                 logger.info(f"Reversal confirmed for {symbol}, can now open {new_side.value}")
             return new_side
     
@@ -1413,13 +1655,17 @@ class PositionRegistry:
         """
         Apply order event to position. Idempotent.
         """
-        with self._lock:
+        # Per-symbol lock only: events for other symbols proceed in parallel.
+        with self._symbol_lock(symbol):
             pos = self._positions.get(symbol)
             if pos is None:
                 logger.warning(f"Order event for unknown position: {symbol}")
                 return False
-            
-            return pos.apply_order_event(event)
+            applied = pos.apply_order_event(event)
+        if applied:
+            with self._lock, self._symbol_lock(symbol):
+                self._publish(changed=(symbol,))
+        return applied
     
     # ========== RECONCILIATION ==========
     
@@ -1462,130 +1708,12 @@ class PositionRegistry:
         
         with self._lock:
             # Check for orphaned positions (registry has, exchange doesn't)
-            for symbol, pos in self._positions.items():
-                symbol_norm = normalize_symbol_for_position_match(symbol)
-                if pos.is_terminal:
-                    self._orphan_miss_counts.pop(symbol_norm, None)
-                    continue
-                
-                # Try exact match first, then normalized match
-                exchange_pos = exchange_positions.get(symbol)
-                matched_key = None
-                
-                if exchange_pos is None:
-                    # Try normalized matching
-                    norm_key = normalize_symbol_for_position_match(symbol)
-                    if norm_key in exchange_normalized:
-                        matched_key = norm_key
-                        _, exchange_pos = exchange_normalized[norm_key]
-                else:
-                    matched_key = normalize_symbol_for_position_match(symbol)
-                
-                if matched_key:
-                    matched_exchange_keys.add(matched_key)
-                
-                if exchange_pos is None and pos.remaining_qty > 0:
-                    miss_count = self._orphan_miss_counts.get(symbol_norm, 0) + 1
-                    self._orphan_miss_counts[symbol_norm] = miss_count
-                    if miss_count < self._orphan_miss_threshold:
-                        issues.append(
-                            (
-                                symbol,
-                                f"MISSING_ON_EXCHANGE_PENDING: miss_count={miss_count}/{self._orphan_miss_threshold}",
-                            )
-                        )
-                        logger.warning(
-                            "Orphan hysteresis pending",
-                            symbol=symbol,
-                            miss_count=miss_count,
-                            threshold=self._orphan_miss_threshold,
-                            remaining_qty=str(pos.remaining_qty),
-                        )
-                        continue
-                    pos.mark_orphaned()
-                    orphaned_symbols.append(symbol)
-                    issues.append((symbol, "ORPHANED: Registry has position, exchange does not"))
-                elif exchange_pos is None and pos.remaining_qty <= 0:
-                    self._orphan_miss_counts.pop(symbol_norm, None)
-                    # Position has no remaining qty and exchange has nothing - mark as closed
-                    pos._mark_closed(ExitReason.RECONCILIATION)
-                    orphaned_symbols.append(symbol)
-                    issues.append((symbol, "STALE: Registry has empty position, marking closed"))
-                elif exchange_pos is not None:
-                    self._orphan_miss_counts.pop(symbol_norm, None)
-                    # Verify qty matches
-                    exchange_qty = Decimal(str(exchange_pos.get('qty', 0)))
-                    if pos.remaining_qty <= qty_epsilon and exchange_qty > qty_epsilon:
-                        # Exchange has quantity but registry shows zero.
-                        # CRITICAL: If the position is PENDING, this is a race condition —
-                        # a market order was filled on the exchange before the fill event
-                        # reached the state machine. We MUST adopt the exchange qty into
-                        # this position, NOT archive it. Archiving a PENDING position
-                        # causes the system to lose track of the position and re-enter
-                        # the same symbol every cycle, compounding exposure until halt.
-                        if pos.state == PositionState.PENDING:
-                            # Race condition: market order filled before fill event processed.
-                            # Adopt exchange quantity into this position via synthetic fill.
-                            exchange_entry_price_raw = exchange_pos.get("entry_price")
-                            ref_price = pos.initial_entry_price
-                            if exchange_entry_price_raw is not None:
-                                try:
-                                    ref_price = Decimal(str(exchange_entry_price_raw))
-                                except (ValueError, TypeError, ArithmeticError):
-                                    pass
-                            now = datetime.now(timezone.utc)
-                            fill = FillRecord(
-                                fill_id=f"sync-adopt-{int(now.timestamp() * 1000)}-{len(pos.entry_fills) + 1}",
-                                order_id=pos.entry_order_id or "sync-adopted",
-                                side=pos.side,
-                                qty=exchange_qty,
-                                price=ref_price,
-                                timestamp=now,
-                                is_entry=True,
-                            )
-                            pos.entry_fills.append(fill)
-                            pos._update_state_after_entry_fill()
-                            pos.updated_at = datetime.now(timezone.utc)
-                            logger.warning(
-                                "PENDING position adopted exchange qty (race condition fix)",
-                                symbol=symbol,
-                                adopted_qty=str(exchange_qty),
-                                entry_price=str(ref_price),
-                                new_state=pos.state.value,
-                            )
-                            issues.append((symbol, f"PENDING_ADOPTED: Registry adopted {exchange_qty} from exchange (was PENDING)"))
-                        else:
-                            # Non-PENDING zero-qty position: truly stale from prior restart.
-                            # Close and archive so startup import can adopt the live position.
-                            pos._mark_closed(ExitReason.RECONCILIATION)
-                            orphaned_symbols.append(symbol)
-                            issues.append((symbol, f"STALE_ZERO_QTY: Registry {pos.remaining_qty} vs Exchange {exchange_qty}"))
-                            logger.info(
-                                "Stale zero-qty position archived",
-                                symbol=symbol,
-                                state=pos.state.value,
-                                exchange_qty=str(exchange_qty),
-                            )
-                    elif abs(exchange_qty - pos.remaining_qty) > qty_epsilon:
-                        exchange_entry_price_raw = exchange_pos.get("entry_price")
-                        exchange_entry_price: Optional[Decimal] = None
-                        if exchange_entry_price_raw is not None:
-                            try:
-                                exchange_entry_price = Decimal(str(exchange_entry_price_raw))
-                            except (ValueError, TypeError, ArithmeticError):
-                                exchange_entry_price = None
-
-                        sync_summary = pos.reconcile_quantity_to_exchange(
-                            exchange_qty=exchange_qty,
-                            exchange_entry_price=exchange_entry_price,
-                            qty_epsilon=qty_epsilon,
-                        )
-                        if sync_summary:
-                            issues.append((symbol, f"QTY_SYNCED: {sync_summary}"))
-                            if pos.state == PositionState.CLOSED:
-                                orphaned_symbols.append(symbol)
-                        else:
-                            issues.append((symbol, f"QTY_MISMATCH: Registry {pos.remaining_qty} vs Exchange {exchange_qty}"))
+            for symbol, pos in list(self._positions.items()):
+                with self._symbol_lock(symbol):
+                    self._reconcile_one(
+                        symbol, pos, exchange_positions, exchange_normalized,
+                        matched_exchange_keys, orphaned_symbols, issues, qty_epsilon,
+                    )
             
             # Move orphaned positions to closed history (so they don't reappear)
             for symbol in orphaned_symbols:
@@ -1607,9 +1735,148 @@ class PositionRegistry:
                 norm_key = normalize_symbol_for_position_match(ex_symbol)
                 if norm_key not in matched_exchange_keys and norm_key not in registry_normalized:
                     issues.append((ex_symbol, "PHANTOM: Exchange has position, registry does not"))
+            
+            with self._locked_symbols(self._positions):
+                self._publish(changed=self._positions)
         
         return issues
     
+    def _reconcile_one(
+        self,
+        symbol: str,
+        pos: ManagedPosition,
+        exchange_positions: Dict[str, Dict],
+        exchange_normalized: Dict[str, tuple],
+        matched_exchange_keys: Set[str],
+        orphaned_symbols: List[str],
+        issues: List[Tuple[str, str]],
+        qty_epsilon: Decimal,
+    ) -> None:
+        """Reconcile one registry position. Caller holds ``_lock`` and the symbol lock."""
+        symbol_norm = normalize_symbol_for_position_match(symbol)
+        if pos.is_terminal:
+            self._orphan_miss_counts.pop(symbol_norm, None)
+            return
+        
+        # Try exact match first, then normalized match
+        exchange_pos = exchange_positions.get(symbol)
+        matched_key = None
+        
+        if exchange_pos is None:
+            # Try normalized matching
+            norm_key = normalize_symbol_for_position_match(symbol)
+            if norm_key in exchange_normalized:
+                matched_key = norm_key
+                _, exchange_pos = exchange_normalized[norm_key]
+        else:
+            matched_key = normalize_symbol_for_position_match(symbol)
+        
+        if matched_key:
+            matched_exchange_keys.add(matched_key)
+        
+        if exchange_pos is None and pos.remaining_qty > 0:
+            miss_count = self._orphan_miss_counts.get(symbol_norm, 0) + 1
+            self._orphan_miss_counts[symbol_norm] = miss_count
+            if miss_count < self._orphan_miss_threshold:
+                issues.append(
+                    (
+                        symbol,
+                        f"MISSING_ON_EXCHANGE_PENDING: miss_count={miss_count}/{self._orphan_miss_threshold}",
+                    )
+                )
+                logger.warning(
+                    "Orphan hysteresis pending",
+                    symbol=symbol,
+                    miss_count=miss_count,
+                    threshold=self._orphan_miss_threshold,
+                    remaining_qty=str(pos.remaining_qty),
+                )
+                return
+            pos.mark_orphaned()
+            orphaned_symbols.append(symbol)
+            issues.append((symbol, "ORPHANED: Registry has position, exchange does not"))
+        elif exchange_pos is None and pos.remaining_qty <= 0:
+            self._orphan_miss_counts.pop(symbol_norm, None)
+            # Position has no remaining qty and exchange has nothing - mark as closed
+            pos._mark_closed(ExitReason.RECONCILIATION)
+            orphaned_symbols.append(symbol)
+            issues.append((symbol, "STALE: Registry has empty position, marking closed"))
+        elif exchange_pos is not None:
+            self._orphan_miss_counts.pop(symbol_norm, None)
+            # Verify qty matches
+            exchange_qty = Decimal(str(exchange_pos.get('qty', 0)))
+            if pos.remaining_qty <= qty_epsilon and exchange_qty > qty_epsilon:
+                # Exchange has quantity but registry shows zero.
+                # CRITICAL: If the position is PENDING, this is a race condition —
+                # a market order was filled on the exchange before the fill event
+                # reached the state machine. We MUST adopt the exchange qty into
+                # this position, NOT archive it. Archiving a PENDING position
+                # causes the system to lose track of the position and re-enter
+                # the same symbol every cycle, compounding exposure until halt.
+                if pos.state == PositionState.PENDING:
+                    # Race condition: market order filled before fill event processed.
+                    # Adopt exchange quantity into this position via synthetic fill.
+                    exchange_entry_price_raw = exchange_pos.get("entry_price")
+                    ref_price = pos.initial_entry_price
+                    if exchange_entry_price_raw is not None:
+                        try:
+                            ref_price = Decimal(str(exchange_entry_price_raw))
+                        except (ValueError, TypeError, ArithmeticError):
+                            pass
+                    now = datetime.now(timezone.utc)
+                    fill = FillRecord(
+                        fill_id=f"sync-adopt-{int(now.timestamp() * 1000)}-{len(pos.entry_fills) + 1}",
+                        order_id=pos.entry_order_id or "sync-adopted",
+                        side=pos.side,
+                        qty=exchange_qty,
+                        price=ref_price,
+                        timestamp=now,
+                        is_entry=True,
+                    )
+                    pos.entry_fills.append(fill)
+                    pos._update_state_after_entry_fill()
+                    pos.updated_at = datetime.now(timezone.utc)
+                    logger.warning(
+                        "PENDING position adopted exchange qty (race condition fix)",
+                        symbol=symbol,
+                        adopted_qty=str(exchange_qty),
+                        entry_price=str(ref_price),
+                        new_state=pos.state.value,
+                    )
+                    issues.append((symbol, f"PENDING_ADOPTED: Registry adopted {exchange_qty} from exchange (was PENDING)"))
+                else:
+                    # Non-PENDING zero-qty position: truly stale from prior restart.
+                    # Close and archive so startup import can adopt the live position.
+                    pos._mark_closed(ExitReason.RECONCILIATION)
+                    orphaned_symbols.append(symbol)
+                    issues.append((symbol, f"STALE_ZERO_QTY: Registry {pos.remaining_qty} vs Exchange {exchange_qty}"))
+                    logger.info(
+                        "Stale zero-qty position archived",
+                        symbol=symbol,
+                        state=pos.state.value,
+                        exchange_qty=str(exchange_qty),
+                    )
+            elif abs(exchange_qty - pos.remaining_qty) > qty_epsilon:
+                exchange_entry_price_raw = exchange_pos.get("entry_price")
+                exchange_entry_price: Optional[Decimal] = None
+                if exchange_entry_price_raw is not None:
+                    try:
+                        exchange_entry_price = Decimal(str(exchange_entry_price_raw))
+                    except (ValueError, TypeError, ArithmeticError):
+                        exchange_entry_price = None
+
+                sync_summary = pos.reconcile_quantity_to_exchange(
+                    exchange_qty=exchange_qty,
+                    exchange_entry_price=exchange_entry_price,
+                    qty_epsilon=qty_epsilon,
+                )
+                if sync_summary:
+                    issues.append((symbol, f"QTY_SYNCED: {sync_summary}"))
+                    if pos.state == PositionState.CLOSED:
+                        orphaned_symbols.append(symbol)
+                else:
+                    issues.append((symbol, f"QTY_MISMATCH: Registry {pos.remaining_qty} vs Exchange {exchange_qty}"))
+    
     # ========== HISTORY ==========
     
     def get_closed_history(self, limit: int = 100) -> List[ManagedPosition]:
@@ -1619,7 +1886,7 @@ class PositionRegistry:
     
     def cleanup_stale(self, max_age_hours: int = 24) -> int:
         """Remove very old closed positions from memory."""
-        with self._lock:
+        with self._lock, self._locked_symbols(p.symbol for p in self._closed_positions):
             cutoff = datetime.now(timezone.utc)
             original_count = len(self._closed_positions)
             self._closed_positions = [
@@ -1628,6 +1895,7 @@ class PositionRegistry:
             ]
             removed = original_count - len(self._closed_positions)
             if removed > 0:
+                self._publish()
                 logger.info(f"Cleaned up {removed} stale closed positions")
             return removed
     
@@ -1635,7 +1903,7 @@ class PositionRegistry:
     
     def to_dict(self) -> Dict:
         """Serialize registry for persistence."""
-        with self._lock:
+        with self._lock, self._locked_symbols(self._positions):
             return {
                 "positions": {s: p.to_dict() for s, p in self._positions.items()},
                 "pending_reversals": {s: side.value for s, side in self._pending_reversals.items()},
@@ -14,6 +14,7 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, List, Set
 from enum import Enum
 import asyncio
+import time
 
 from src.execution.position_state_machine import (
     ManagedPosition,
@@ -22,8 +23,10 @@ from src.execution.position_state_machine import (
     InvariantViolation
 )
 from src.data.symbol_utils import position_symbol_matches_order
+from src.execution.event_dedup import EventDedupWindow
 from src.domain.models import Side
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics import LatencyHistogram
 from src.exceptions import OperationalError, DataError, InvariantError
 
 logger = get_logger(__name__)
@@ -94,6 +97,10 @@ class SafetyConfig:
     # Short grace specifically for freshly reconciled/adopted positions before
     # stop binding catches up in the same cycle.
     reconcile_fresh_grace_seconds: int = 3
+    # Protection sweep: concurrent per-symbol checks, bounded by a sweep deadline
+    # (well inside the 30s sweep interval). Timed-out symbols go first next sweep.
+    protection_check_concurrency: int = 8
+    protection_sweep_deadline_seconds: float = 20.0
     
     # Event ordering
     reject_stale_events: bool = True
@@ -448,14 +455,22 @@ class EventOrderingEnforcer:
     
     - Maintains per-order last_event_seq
     - Rejects/queues older events
-    - De-duplicates by fill_id (primary)
+    - De-duplicates by fill_id (primary), in a bounded EventDedupWindow
+      shared with ManagedPosition (terminal orders collapse to a tombstone)
     """
     
+    # Gateway-wide: covers every order in flight, not just one position.
+    MAX_TRACKED_FILLS = 4096
+    MAX_CLOSED_ORDERS = 2048
+    
     def __init__(self):
         # order_id -> last processed event_seq
         self._last_event_seq: Dict[str, int] = {}
-        # fill_id -> True (for deduplication)
-        self._processed_fill_ids: Set[str] = set()
+        # fill_id dedup (bounded; grouped by order for terminal eviction)
+        self._processed_fills = EventDedupWindow(
+            max_keys=self.MAX_TRACKED_FILLS,
+            max_closed_orders=self.MAX_CLOSED_ORDERS,
+        )
     
     def should_process_event(
         self,
@@ -471,7 +486,7 @@ class EventOrderingEnforcer:
         - Fill_id was already processed (duplicate fill)
         """
         # Fill ID deduplication (primary for fills)
-        if fill_id and fill_id in self._processed_fill_ids:
+        if fill_id and self._processed_fills.seen(order_id, fill_id, is_fill=True):
             logger.debug(f"Duplicate fill_id ignored: {fill_id}")
             return False
         
@@ -498,7 +513,17 @@ class EventOrderingEnforcer:
         )
         
         if fill_id:
-            self._processed_fill_ids.add(fill_id)
+            self._processed_fills.add(order_id, fill_id)
+    
+    def mark_order_filled(self, order_id: str) -> None:
+        """
+        Order fully filled: evict its fill ids, keep a tombstone.
+
+        Only for FILLED. A cancelled/rejected order can still receive a late
+        fill with a new fill_id, so those keep exact fill_id dedup (bounded by
+        the window) and nothing else.
+        """
+        self._processed_fills.close_order(order_id)
     
     def cleanup_old_orders(self, active_order_ids: Set[str]) -> None:
         """Clean up tracking for orders no longer active."""
@@ -834,7 +859,13 @@ class PositionProtectionMonitor:
         # Readable from health_monitor to detect systemic instability.
         self.layer3_saves_total: int = 0
 
-    async def check_all_positions(self) -> Dict[str, bool]:
+        # ── Sweep scheduling / latency ──
+        # Symbols whose check missed the last sweep deadline (checked first next time).
+        self._timed_out_symbols: Set[str] = set()
+        self.check_latency_ms = LatencyHistogram()
+        self.sweep_latency_ms = LatencyHistogram()
+
+    async def check_all_positions(self) -> Dict[str, Optional[bool]]:
         """
         Check all positions for protection.
         
@@ -847,19 +878,33 @@ class PositionProtectionMonitor:
                  A filled stop is expected behavior, not a safety violation.
         Layer 3: Only flag as NAKED if the stop truly vanished without filling.
         
-        Returns {symbol: is_protected}
+        Per-symbol checks run concurrently (bounded by
+        ``protection_check_concurrency``) against one shared orders/positions
+        snapshot, under a ``protection_sweep_deadline_seconds`` budget.
+        
+        Returns {symbol: is_protected}; symbols that missed the deadline map
+        to None (unknown: not proven naked, not proven protected)
         """
         from src.data.symbol_utils import normalize_symbol_for_position_match
         
-        results = {}
+        results: Dict[str, Optional[bool]] = {}
+        sweep_started = time.perf_counter()
         
-        try:
-            exchange_orders = await self.client.get_futures_open_orders()
-        except InvariantError:
-            raise  # Safety violation — propagate
-        except (OperationalError, DataError) as e:
-            logger.error(f"Failed to fetch orders for protection check: {e}", error_type=type(e).__name__)
+        # One shared snapshot per sweep: orders and positions fetched concurrently.
+        orders_result, positions_result = await asyncio.gather(
+            self.client.get_futures_open_orders(),
+            self.client.get_all_futures_positions(),
+            return_exceptions=True,
+        )
+        
+        if isinstance(orders_result, InvariantError):
+            raise orders_result  # Safety violation — propagate
+        if isinstance(orders_result, (OperationalError, DataError)):
+            logger.error(f"Failed to fetch orders for protection check: {orders_result}", error_type=type(orders_result).__name__)
             return results
+        if isinstance(orders_result, BaseException):
+            raise orders_result
+        exchange_orders = orders_result
         
         # Diagnostic: log what orders are visible so future incidents are 30-second diagnoses
         if exchange_orders:
@@ -882,15 +927,16 @@ class PositionProtectionMonitor:
         else:
             logger.debug("Protection check: no exchange orders visible")
         
-        # CRITICAL: Fetch actual positions from exchange to verify they exist
-        try:
-            exchange_positions = await self.client.get_all_futures_positions()
-        except InvariantError:
-            raise  # Safety violation — propagate
-        except (OperationalError, DataError) as e:
-            logger.error(f"Failed to fetch positions for protection check: {e}", error_type=type(e).__name__)
+        # CRITICAL: actual exchange positions are needed to verify exposure exists
+        if isinstance(positions_result, InvariantError):
+            raise positions_result  # Safety violation — propagate
+        if isinstance(positions_result, (OperationalError, DataError)):
+            logger.error(f"Failed to fetch positions for protection check: {positions_result}", error_type=type(positions_result).__name__)
             # If we can't verify positions, assume protected to avoid false positives
             return results
+        if isinstance(positions_result, BaseException):
+            raise positions_result
+        exchange_positions = positions_result
         
         # Build map of exchange positions by normalized symbol
         exchange_position_map = {}
@@ -901,155 +947,209 @@ class PositionProtectionMonitor:
                 normalized = normalize_symbol_for_position_match(pos_symbol)
                 exchange_position_map[normalized] = pos_size
         
-        for position in self.registry.get_all_active():
-            if position.remaining_qty > 0:
-                now = datetime.now(timezone.utc)
-                updated_age_seconds = max(0, int((now - position.updated_at).total_seconds()))
-                # CRITICAL CHECK: Verify position actually exists on exchange
-                normalized_sym = normalize_symbol_for_position_match(position.symbol)
-                exchange_size = exchange_position_map.get(normalized_sym, 0)
-                
-                if exchange_size == 0:
-                    # Position closed on exchange but registry not updated yet
-                    # This is NOT a naked position - it's a closed position!
-                    logger.info(
-                        "Position closed on exchange (stop filled?), skipping protection check",
-                        symbol=position.symbol,
-                        registry_qty=str(position.remaining_qty),
-                        exchange_qty=0
+        positions = [p for p in self.registry.get_all_active() if p.remaining_qty > 0]
+        # Symbols that timed out last sweep go first so they are not starved again.
+        positions.sort(key=lambda p: p.symbol not in self._timed_out_symbols)
+        
+        cfg = self.enforcer.config
+        semaphore = asyncio.Semaphore(max(1, cfg.protection_check_concurrency))
+        
+        async def _bounded_check(position: ManagedPosition) -> bool:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    return await self._check_position(
+                        position, exchange_orders, exchange_position_map
                     )
-                    results[position.symbol] = True  # Treat as protected (closed)
-                    continue
+                finally:
+                    self.check_latency_ms.observe((time.perf_counter() - started) * 1000)
+        
+        tasks = {
+            asyncio.ensure_future(_bounded_check(position)): position.symbol
+            for position in positions
+        }
+        timed_out: Set[str] = set()
+        if tasks:
+            done, pending = await asyncio.wait(
+                tasks.keys(), timeout=cfg.protection_sweep_deadline_seconds
+            )
+            for task in pending:
+                task.cancel()
+                timed_out.add(tasks[task])
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            for task in done:
+                # Re-raises InvariantError (and anything unexpected) exactly
+                # like the old sequential loop did.
+                results[tasks[task]] = task.result()
+        
+        # Timed-out symbols are reported as unknown (None) and prioritised on
+        # the next sweep.
+        for symbol in timed_out:
+            results[symbol] = None
+        self._timed_out_symbols = timed_out
+        self.sweep_latency_ms.observe((time.perf_counter() - sweep_started) * 1000)
+        if timed_out:
+            logger.warning(
+                "Protection sweep deadline exceeded; unchecked symbols prioritised next sweep",
+                timed_out_symbols=sorted(timed_out),
+                deadline_seconds=cfg.protection_sweep_deadline_seconds,
+                checked=len(results),
+            )
+        
+        return results
 
-                # Fresh reconcile/adopt grace: avoid tripping safety while stop bind
-                # runs in the same loop for newly updated positions.
-                if (
-                    updated_age_seconds <= self.enforcer.config.reconcile_fresh_grace_seconds
-                    and not position.stop_order_id
-                ):
-                    logger.warning(
-                        "INVARIANT_K_FRESH_RECONCILE_GRACE",
-                        symbol=position.symbol,
-                        qty=str(position.remaining_qty),
-                        exchange_qty=exchange_size,
-                        updated_age_seconds=updated_age_seconds,
-                        grace_seconds=self.enforcer.config.reconcile_fresh_grace_seconds,
-                    )
-                    results[position.symbol] = True
-                    continue
-                
-                layer1_protected = await self.enforcer.verify_protection(
-                    position,
-                    exchange_orders,
-                    log_violation=False,
+    async def _check_position(
+        self,
+        position: ManagedPosition,
+        exchange_orders: List[Dict],
+        exchange_position_map: Dict[str, float],
+    ) -> bool:
+        """Layered protection verdict for one position against the shared sweep snapshot."""
+        from src.data.symbol_utils import normalize_symbol_for_position_match
+        
+        now = datetime.now(timezone.utc)
+        updated_age_seconds = max(0, int((now - position.updated_at).total_seconds()))
+        # CRITICAL CHECK: Verify position actually exists on exchange
+        normalized_sym = normalize_symbol_for_position_match(position.symbol)
+        exchange_size = exchange_position_map.get(normalized_sym, 0)
+        
+        if exchange_size == 0:
+            # Position closed on exchange but registry not updated yet
+            # This is NOT a naked position - it's a closed position!
+            logger.info(
+                "Position closed on exchange (stop filled?), skipping protection check",
+                symbol=position.symbol,
+                registry_qty=str(position.remaining_qty),
+                exchange_qty=0
+            )
+            return True  # Treat as protected (closed)
+
+        # Fresh reconcile/adopt grace: avoid tripping safety while stop bind
+        # runs in the same loop for newly updated positions.
+        if (
+            updated_age_seconds <= self.enforcer.config.reconcile_fresh_grace_seconds
+            and not position.stop_order_id
+        ):
+            logger.warning(
+                "INVARIANT_K_FRESH_RECONCILE_GRACE",
+                symbol=position.symbol,
+                qty=str(position.remaining_qty),
+                exchange_qty=exchange_size,
+                updated_age_seconds=updated_age_seconds,
+                grace_seconds=self.enforcer.config.reconcile_fresh_grace_seconds,
+            )
+            return True
+        
+        layer1_protected = await self.enforcer.verify_protection(
+            position,
+            exchange_orders,
+            log_violation=False,
+        )
+        layer1_seen_orders_count = sum(
+            1
+            for o in exchange_orders
+            if position_symbol_matches_order(position.symbol, str(o.get("symbol") or ""))
+        )
+        
+        is_protected = layer1_protected
+        layer2_status = "not_run"
+        layer3_attempted = False
+        layer3_succeeded = False
+        self._layer2_last_status[position.symbol] = "not_run"
+        
+        # ---- LAYER 2: Stop-fill verification before declaring naked ----
+        # Check the specific order ID stored on the position.
+        if not layer1_protected and position.stop_order_id:
+            layer2_protected = await self._check_stop_was_filled(
+                position, exchange_size
+            )
+            layer2_status = self._layer2_last_status.get(position.symbol, "unknown")
+            if layer2_protected:
+                logger.info(
+                    "Protection check: Layer 1 missed stop but Layer 2 confirmed ALIVE by ID",
+                    symbol=position.symbol,
+                    stop_order_id=position.stop_order_id,
                 )
-                layer1_seen_orders_count = sum(
-                    1
-                    for o in exchange_orders
-                    if position_symbol_matches_order(position.symbol, str(o.get("symbol") or ""))
+            is_protected = layer2_protected
+        
+        # ---- LAYER 3: Broad stop search via recent orders ----
+        # The position's stop_order_id may be stale (e.g. stop was replaced
+        # by protection_ops but in-memory position wasn't updated).  Search
+        # ALL recent orders for this symbol to find any alive stop we missed.
+        if not is_protected:
+            layer3_attempted = True
+            layer3_protected = await self._check_any_stop_for_symbol(
+                position, exchange_orders
+            )
+            layer3_succeeded = layer3_protected
+            if layer3_protected:
+                logger.info(
+                    "Protection check: Layer 3 found alive stop via broad search",
+                    symbol=position.symbol,
                 )
-                
-                is_protected = layer1_protected
-                layer2_status = "not_run"
-                layer3_attempted = False
-                layer3_succeeded = False
-                self._layer2_last_status[position.symbol] = "not_run"
-                
-                # ---- LAYER 2: Stop-fill verification before declaring naked ----
-                # Check the specific order ID stored on the position.
-                if not layer1_protected and position.stop_order_id:
-                    layer2_protected = await self._check_stop_was_filled(
-                        position, exchange_size
-                    )
-                    layer2_status = self._layer2_last_status.get(position.symbol, "unknown")
-                    if layer2_protected:
-                        logger.info(
-                            "Protection check: Layer 1 missed stop but Layer 2 confirmed ALIVE by ID",
-                            symbol=position.symbol,
-                            stop_order_id=position.stop_order_id,
-                        )
-                    is_protected = layer2_protected
-                
-                # ---- LAYER 3: Broad stop search via recent orders ----
-                # The position's stop_order_id may be stale (e.g. stop was replaced
-                # by protection_ops but in-memory position wasn't updated).  Search
-                # ALL recent orders for this symbol to find any alive stop we missed.
-                if not is_protected:
-                    layer3_attempted = True
-                    layer3_protected = await self._check_any_stop_for_symbol(
-                        position, exchange_orders
-                    )
-                    layer3_succeeded = layer3_protected
-                    if layer3_protected:
-                        logger.info(
-                            "Protection check: Layer 3 found alive stop via broad search",
-                            symbol=position.symbol,
-                        )
-                    is_protected = layer3_protected
-                
-                # ---- PENDING-GRACE OVERRIDE (reduces false-positive naked alerts) ----
-                # Treat newly-updated/open positions as temporarily protected when stop
-                # attach/visibility is still settling and Layer 2 is inconclusive.
-                if not is_protected:
-                    now = datetime.now(timezone.utc)
-                    position_age_seconds = max(0, int((now - position.created_at).total_seconds()))
-                    updated_age_seconds = max(0, int((now - position.updated_at).total_seconds()))
-                    stop_order_id_present = bool(position.stop_order_id)
-                    within_grace = updated_age_seconds <= self.enforcer.config.stop_pending_grace_seconds
-                    layer2_ambiguous = layer2_status in {
-                        "not_run",
-                        "fetch_not_supported",
-                        "no_order_data",
-                    }
-                    if within_grace and (not stop_order_id_present or layer2_ambiguous):
-                        logger.warning(
-                            "TEMP_PROTECTION_PENDING",
-                            symbol=position.symbol,
-                            qty=str(position.remaining_qty),
-                            exchange_qty=exchange_size,
-                            position_age_seconds=position_age_seconds,
-                            updated_age_seconds=updated_age_seconds,
-                            stop_order_id_present=stop_order_id_present,
-                            stop_order_id=position.stop_order_id or "none",
-                            layer1_seen_orders_count=layer1_seen_orders_count,
-                            layer2_fetch_order_status=layer2_status,
-                            self_heal_attempted=layer3_attempted,
-                            self_heal_succeeded=layer3_succeeded,
-                            grace_seconds=self.enforcer.config.stop_pending_grace_seconds,
-                        )
-                        results[position.symbol] = True
-                        continue
+            is_protected = layer3_protected
+        
+        # ---- PENDING-GRACE OVERRIDE (reduces false-positive naked alerts) ----
+        # Treat newly-updated/open positions as temporarily protected when stop
+        # attach/visibility is still settling and Layer 2 is inconclusive.
+        if not is_protected:
+            now = datetime.now(timezone.utc)
+            position_age_seconds = max(0, int((now - position.created_at).total_seconds()))
+            updated_age_seconds = max(0, int((now - position.updated_at).total_seconds()))
+            stop_order_id_present = bool(position.stop_order_id)
+            within_grace = updated_age_seconds <= self.enforcer.config.stop_pending_grace_seconds
+            layer2_ambiguous = layer2_status in {
+                "not_run",
+                "fetch_not_supported",
+                "no_order_data",
+            }
+            if within_grace and (not stop_order_id_present or layer2_ambiguous):
+                logger.warning(
+                    "TEMP_PROTECTION_PENDING",
+                    symbol=position.symbol,
+                    qty=str(position.remaining_qty),
+                    exchange_qty=exchange_size,
+                    position_age_seconds=position_age_seconds,
+                    updated_age_seconds=updated_age_seconds,
+                    stop_order_id_present=stop_order_id_present,
+                    stop_order_id=position.stop_order_id or "none",
+                    layer1_seen_orders_count=layer1_seen_orders_count,
+                    layer2_fetch_order_status=layer2_status,
+                    self_heal_attempted=layer3_attempted,
+                    self_heal_succeeded=layer3_succeeded,
+                    grace_seconds=self.enforcer.config.stop_pending_grace_seconds,
+                )
+                return True
 
-                results[position.symbol] = is_protected
-                
-                if not is_protected:
-                    # CRITICAL: Position is truly naked on exchange!
-                    now = datetime.now(timezone.utc)
-                    position_age_seconds = max(0, int((now - position.created_at).total_seconds()))
-                    updated_age_seconds = max(0, int((now - position.updated_at).total_seconds()))
-                    logger.critical(
-                        "INVARIANT K VIOLATION: Position has exposure but NO STOP!",
-                        symbol=position.symbol,
-                        remaining_qty=str(position.remaining_qty),
-                        exchange_qty=exchange_size,
-                        expected_stop_id=position.stop_order_id or None,
-                    )
-                    logger.critical(
-                        "NAKED POSITION DETECTED",
-                        symbol=position.symbol,
-                        qty=str(position.remaining_qty),
-                        exchange_qty=exchange_size,
-                        stop_order_id=position.stop_order_id or "none",
-                        position_age_seconds=position_age_seconds,
-                        updated_age_seconds=updated_age_seconds,
-                        stop_order_id_present=bool(position.stop_order_id),
-                        layer1_seen_orders_count=layer1_seen_orders_count,
-                        layer2_fetch_order_status=layer2_status,
-                        self_heal_attempted=layer3_attempted,
-                        self_heal_succeeded=layer3_succeeded,
-                    )
+        if not is_protected:
+            # CRITICAL: Position is truly naked on exchange!
+            now = datetime.now(timezone.utc)
+            position_age_seconds = max(0, int((now - position.created_at).total_seconds()))
+            updated_age_seconds = max(0, int((now - position.updated_at).total_seconds()))
+            logger.critical(
+                "INVARIANT K VIOLATION: Position has exposure but NO STOP!",
+                symbol=position.symbol,
+                remaining_qty=str(position.remaining_qty),
+                exchange_qty=exchange_size,
+                expected_stop_id=position.stop_order_id or None,
+            )
+            logger.critical(
+                "NAKED POSITION DETECTED",
+                symbol=position.symbol,
+                qty=str(position.remaining_qty),
+                exchange_qty=exchange_size,
+                stop_order_id=position.stop_order_id or "none",
+                position_age_seconds=position_age_seconds,
+                updated_age_seconds=updated_age_seconds,
+                stop_order_id_present=bool(position.stop_order_id),
+                layer1_seen_orders_count=layer1_seen_orders_count,
+                layer2_fetch_order_status=layer2_status,
+                self_heal_attempted=layer3_attempted,
+                self_heal_succeeded=layer3_succeeded,
+            )
         
-        return results
+        return is_protected
 
     async def _check_any_stop_for_symbol(
         self,
@@ -1598,15 +1698,17 @@ class PositionProtectionMonitor:
             try:
                 results = await self.check_all_positions()
                 
-                naked_count = sum(1 for v in results.values() if not v)
+                naked_count = sum(1 for v in results.values() if v is False)
                 if naked_count > 0:
                     logger.critical(
                         f"PROTECTION CHECK: {naked_count} naked positions detected!",
                         details=results
                     )
                 else:
+                    verified = sum(1 for v in results.values() if v)
                     logger.debug(
-                        f"Protection check passed: {len(results)} positions verified"
+                        f"Protection check passed: {verified} positions verified",
+                        unknown=len(results) - verified,
                     )
                     
             except InvariantError:
@@ -1616,6 +1718,14 @@ class PositionProtectionMonitor:
             
             await asyncio.sleep(interval_seconds)
     
+    def get_sweep_stats(self) -> Dict:
+        """Per-symbol check and whole-sweep latency (ms) plus last timed-out symbols."""
+        return {
+            "check_latency_ms": self.check_latency_ms.snapshot(),
+            "sweep_latency_ms": self.sweep_latency_ms.snapshot(),
+            "timed_out_symbols": sorted(self._timed_out_symbols),
+        }
+    
     def stop(self) -> None:
         """Stop periodic checks."""
         self._running = False
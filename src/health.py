@@ -64,19 +64,27 @@ def _metrics_prometheus() -> Tuple[str, int]:
             if isinstance(v, (int, float)):
                 lines.append(f"trading_{k} {v}")
             elif isinstance(v, str) and k == "last_tick_at":
-                lines.append(f'trading_{k}_iso "{v}"')
-            else:
-                continue
+                try:
+                    ts = datetime.fromisoformat(v.replace("Z", "+00:00")).timestamp()
+                except ValueError:
+                    continue
+                lines.append(f"trading_last_tick_timestamp_seconds {ts}")
         return ("\n".join(lines) + "\n", 200)
     except (OperationalError, DataError, OSError) as e:
         return (f"# error: {e}\n", 200)
 
 
+def _metrics_in_process() -> Tuple[str, int]:
+    """/metrics for the worker: the in-process registry only, so scrapes never touch the DB."""
+    from src.monitoring.metrics import get_metrics_registry
+    return (get_metrics_registry().render_prometheus(), 200)
+
+
 def get_worker_health_app(enable_debug: bool = False) -> FastAPI:
     """
     Health app for worker (prod-live entrypoint with `WITH_HEALTH=1`).
-    Serves /, /health. Also /api, /api/health, /api/debug/signals, /debug/signals
-    so the default app URL (which routes to worker) can serve debug endpoints.
+    Serves /, /health. Also /api, /api/health, /api/debug/signals, /debug/signals,
+    /api/debug/status so the default app URL (which routes to worker) can serve debug endpoints.
     """
     w = FastAPI(title="Worker Health")
 
@@ -135,15 +143,49 @@ def get_worker_health_app(enable_debug: bool = False) -> FastAPI:
         data = _debug_signals_impl(symbol_filter=symbol)
         return _debug_signals_respond(data, request, format_param=format)
 
+    @w.get("/api/debug/status")
+    async def api_debug_status():
+        """Worker read models: account/positions, rolling performance, recent decisions."""
+        if not enable_debug:
+            return JSONResponse(content={"error": "Debug endpoints disabled"}, status_code=403)
+        import json
+
+        from src.monitoring.read_models import get_read_model
+        read_model = get_read_model()
+        if read_model is None:
+            return JSONResponse(content={"error": "Read models not initialized"}, status_code=503)
+        return JSONResponse(content=json.loads(json.dumps(read_model.snapshot(), default=str)))
+
+    @w.get("/api/debug/cycles")
+    async def api_debug_cycles(limit: int = 10):
+        """Per-tick stage breakdowns: recent ticks and the slowest ones."""
+        if not enable_debug:
+            return JSONResponse(content={"error": "Debug endpoints disabled"}, status_code=403)
+        from src.runtime.cycle_guard import get_cycle_guard
+        return JSONResponse(content=get_cycle_guard().get_profile_report(limit=max(1, min(limit, 50))))
+
+    @w.get("/api/debug/memory")
+    async def api_debug_memory():
+        """Tracked cache/buffer sizes, RSS and tracemalloc growth from the last sample."""
+        if not enable_debug:
+            return JSONResponse(content={"error": "Debug endpoints disabled"}, status_code=403)
+        from src.monitoring.memory_profiler import get_memory_profiler
+        profiler = get_memory_profiler()
+        if profiler is None:
+            return JSONResponse(content={"error": "Memory monitor not running"}, status_code=503)
+        return JSONResponse(content=profiler.report())
+
     @w.get("/api/metrics")
     async def api_metrics():
         content, status = _metrics_json()
+        from src.monitoring.metrics import get_metrics_registry
+        content["in_process"] = get_metrics_registry().snapshot()
         return JSONResponse(content=content, status_code=status)
 
     @w.get("/metrics")
     async def metrics_prometheus():
-        body, status = _metrics_prometheus()
-        return PlainTextResponse(body, status_code=status)
+        body, status = _metrics_in_process()
+        return PlainTextResponse(body, status_code=status, media_type="text/plain; version=0.0.4")
 
     return w
 
@@ -292,9 +334,27 @@ async def test_system():
 
 
 def _debug_signals_impl(symbol_filter: Optional[str] = None) -> dict:
-    """Shared logic for /api/debug/signals and /debug/signals."""
+    """
+    Shared logic for /api/debug/signals and /debug/signals.
+
+    Inside the worker the decision projection answers without touching the
+    DB; the standalone app can read the worker's persisted snapshot
+    (READ_MODEL_SNAPSHOT_PATH, unfiltered view only). Otherwise the recent
+    DECISION_TRACE events are queried and digested per request.
+    """
     import json
 
+    from src.monitoring.read_models import digest_decision, get_read_model, is_entry_signal, load_snapshot
+
+    read_model = get_read_model()
+    if read_model is not None and read_model.decisions.ready:
+        return read_model.decisions.debug_signals(symbol_filter)
+    snapshot_path = os.getenv("READ_MODEL_SNAPSHOT_PATH", "")
+    if snapshot_path and not symbol_filter:
+        snap = load_snapshot(snapshot_path)
+        if snap and snap.get("decisions"):
+            return {**snap["decisions"], "source": "read_model_snapshot", "snapshot_at": snap.get("at")}
+
     try:
         from src.storage.repository import get_recent_events
 
@@ -331,29 +391,11 @@ def _debug_signals_impl(symbol_filter: Optional[str] = None) -> dict:
                 data = json.loads(data)
             except (ValueError, TypeError, KeyError):
                 data = {"error": "failed to parse details"}
-        signal = data.get("signal", "NONE")
-        quality = data.get("setup_quality", 0)
-        reason = data.get("reason")
-        if isinstance(reason, list) and reason:
-            reasoning_tip = reason[-1]
-        elif isinstance(reason, str) and reason.strip():
-            reasoning_tip = reason.strip().split("\n")[-1] if "\n" in reason else reason.strip()
-        else:
-            reasoning_tip = "No reasoning logged"
-
-        op = data.get("order_placed")
-        op_reason = data.get("order_fail_reason") or ""
-        results["recent_decisions"].append({
-            "time": ts,
-            "symbol": sym,
-            "signal": signal,
-            "quality": quality,
-            "reasoning": reasoning_tip,
-            "order_placed": op,
-            "order_fail_reason": op_reason,
-        })
-
-        if signal and str(signal).upper() in ("LONG", "SHORT") and results["last_signal"] is None:
+        row = digest_decision(ts, sym, data)
+        results["recent_decisions"].append(row)
+        signal, quality = row["signal"], row["quality"]
+
+        if is_entry_signal(signal) and results["last_signal"] is None:
             results["last_signal"] = {
                 "timestamp": ts,
                 "symbol": sym,
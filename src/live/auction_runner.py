@@ -6,16 +6,24 @@ Extracted from live_trading.py to reduce god-object size.
 from __future__ import annotations
 
 import asyncio
+import inspect
 from collections import Counter
+from dataclasses import asdict
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING, Dict, List
 
+from src.config.runtime_params import SymbolCooldownPolicy
+from src.data.symbol_utils import spot_symbol_key
 from src.exceptions import OperationalError, DataError
 from src.execution.equity import calculate_effective_equity
+from src.live.exchange_sync import record_status_account
 from src.live.policy_fingerprint import build_policy_hash
+from src.portfolio.auction_allocator import AuctionAllocator, PortfolioLimits
 from src.monitoring.logger import get_logger
-from src.storage.repository import get_active_position, get_trades_since
+from src.risk.risk_manager import TradeRequest
+from src.storage.repository import get_active_position
+from src.storage.trade_ledger import recent_trades
 
 if TYPE_CHECKING:
     from src.live.live_trading import LiveTrading
@@ -23,6 +31,52 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def build_auction_allocator(config) -> AuctionAllocator:
+    """
+    AuctionAllocator from ``config.risk``.
+
+    Used at startup and on config hot reload (the allocator keeps no state
+    between cycles, so a rebuilt one is equivalent to an updated one).
+    """
+    limits = PortfolioLimits(
+        max_positions=config.risk.auction_max_positions,
+        max_margin_util=config.risk.auction_max_margin_util,
+        max_per_cluster=config.risk.auction_max_per_cluster,
+        max_per_symbol=config.risk.auction_max_per_symbol,
+        direction_concentration_penalty=config.risk.auction_direction_concentration_penalty,
+    )
+    allocator_kwargs = {
+        "limits": limits,
+        "swap_threshold": config.risk.auction_swap_threshold,
+        "min_hold_minutes": config.risk.auction_min_hold_minutes,
+        "max_trades_per_cycle": config.risk.auction_max_trades_per_cycle,
+        "max_new_opens_per_cycle": config.risk.auction_max_new_opens_per_cycle,
+        "max_closes_per_cycle": config.risk.auction_max_closes_per_cycle,
+        "entry_cost": config.risk.auction_entry_cost,
+        "exit_cost": config.risk.auction_exit_cost,
+        "rebalancer_enabled": config.risk.auction_rebalancer_enabled,
+        "rebalancer_trigger_pct_equity": config.risk.auction_rebalancer_trigger_pct_equity,
+        "rebalancer_clear_pct_equity": config.risk.auction_rebalancer_clear_pct_equity,
+        "rebalancer_per_symbol_trim_cooldown_cycles": config.risk.auction_rebalancer_per_symbol_trim_cooldown_cycles,
+        "rebalancer_max_reductions_per_cycle": config.risk.auction_rebalancer_max_reductions_per_cycle,
+        "rebalancer_max_total_margin_reduced_per_cycle": config.risk.auction_rebalancer_max_total_margin_reduced_per_cycle,
+        "no_signal_persistence_enabled": config.risk.auction_no_signal_persistence_enabled,
+        "no_signal_close_persistence_cycles": config.risk.auction_no_signal_close_persistence_cycles,
+        "no_signal_persistence_canary_symbols": config.risk.auction_no_signal_persistence_canary_symbols,
+        "solver": config.risk.auction_solver,
+        "exact_max_contenders": config.risk.auction_exact_max_contenders,
+    }
+    accepted_params = set(inspect.signature(AuctionAllocator.__init__).parameters.keys())
+    filtered_kwargs = {k: v for k, v in allocator_kwargs.items() if k in accepted_params}
+    dropped_kwargs = sorted(set(allocator_kwargs.keys()) - set(filtered_kwargs.keys()))
+    if dropped_kwargs:
+        logger.warning(
+            "AuctionAllocator does not support some config args; using compatible subset",
+            dropped_kwargs=dropped_kwargs,
+        )
+    return AuctionAllocator(**filtered_kwargs)
+
+
 def _is_qty_synced_dust(issue_text: str) -> bool:
     """
     Treat tiny QTY_SYNCED residuals as non-blocking dust.
@@ -100,45 +154,17 @@ def _filter_strategic_closes_for_gate(
 
 
 def _normalize_symbol_key(symbol: str) -> str:
-    key = (symbol or "").strip().upper()
-    key = key.split(":")[0]
-    if key.startswith("PF_"):
-        base = key.replace("PF_", "").replace("USD", "")
-        if base:
-            return f"{base}/USD"
-    return key
+    return spot_symbol_key(symbol)
 
 
 def _resolve_symbol_cooldown_params(strategy_config, symbol: str) -> Dict[str, float]:
     """
     Resolve cooldown parameters for a symbol, with optional canary overrides.
+
+    The auction loop reads the precompiled ``lt.runtime_params.auction.symbol_cooldown``
+    instead; this builds the same policy on the fly.
     """
-    params = {
-        "lookback_hours": int(getattr(strategy_config, "symbol_loss_lookback_hours", 24)),
-        "loss_threshold": int(getattr(strategy_config, "symbol_loss_threshold", 3)),
-        "cooldown_hours": int(getattr(strategy_config, "symbol_loss_cooldown_hours", 12)),
-        "min_pnl_pct": float(getattr(strategy_config, "symbol_loss_min_pnl_pct", -0.5)),
-        "canary_applied": False,
-    }
-    if not bool(getattr(strategy_config, "symbol_loss_cooldown_canary_enabled", False)):
-        return params
-    canary_symbols = {
-        _normalize_symbol_key(s) for s in (getattr(strategy_config, "symbol_loss_cooldown_canary_symbols", []) or [])
-    }
-    if canary_symbols and _normalize_symbol_key(symbol) not in canary_symbols:
-        return params
-
-    for field_name, key_name in (
-        ("symbol_loss_cooldown_canary_lookback_hours", "lookback_hours"),
-        ("symbol_loss_cooldown_canary_threshold", "loss_threshold"),
-        ("symbol_loss_cooldown_canary_hours", "cooldown_hours"),
-        ("symbol_loss_cooldown_canary_min_pnl_pct", "min_pnl_pct"),
-    ):
-        override_value = getattr(strategy_config, field_name, None)
-        if override_value is not None:
-            params[key_name] = override_value
-    params["canary_applied"] = True
-    return params
+    return asdict(SymbolCooldownPolicy.from_strategy(strategy_config).resolve(symbol))
 
 
 def _symbol_in_canary(symbol: str, canary_symbols: List[str]) -> bool:
@@ -181,7 +207,7 @@ async def _compute_quick_reversal_metrics(lt: "LiveTrading") -> Dict[str, object
     hold_minutes_threshold = int(getattr(risk_cfg, "auction_chop_quick_reversal_hold_minutes", 60) or 60)
     opposite_reentry_minutes = int(getattr(risk_cfg, "auction_chop_opposite_reentry_minutes", 120) or 120)
     now_utc = datetime.now(timezone.utc)
-    trades = await asyncio.to_thread(get_trades_since, now_utc - timedelta(hours=window_hours))
+    trades = await recent_trades(now_utc - timedelta(hours=window_hours))
 
     by_symbol: Dict[str, List] = {}
     for trade in trades:
@@ -242,7 +268,7 @@ async def _compute_quick_reversal_metrics(lt: "LiveTrading") -> Dict[str, object
 
 async def _compute_symbol_churn_cooldowns(lt: "LiveTrading") -> Dict[str, datetime]:
     """
-    Build per-symbol churn cooldown expiries from DB trades.
+    Build per-symbol churn cooldown expiries from recent trades (trade ledger, else DB).
 
     Churn event definition:
     - A trade closes quickly (holding <= hold_max_minutes), and
@@ -264,7 +290,7 @@ async def _compute_symbol_churn_cooldowns(lt: "LiveTrading") -> Dict[str, dateti
 
     now_utc = datetime.now(timezone.utc)
     window_start = now_utc - timedelta(hours=window_hours)
-    trades = await asyncio.to_thread(get_trades_since, window_start)
+    trades = await recent_trades(window_start)
 
     by_symbol: Dict[str, List] = {}
     for trade in trades:
@@ -332,9 +358,10 @@ async def run_auction_allocation(lt: "LiveTrading", raw_positions: List[Dict]) -
         # Get account state
         balance = await lt.client.get_futures_balance()
         base = getattr(lt.config.exchange, "base_currency", "USD")
-        equity, available_margin, _ = await calculate_effective_equity(
+        equity, available_margin, margin_used = await calculate_effective_equity(
             balance, base_currency=base, kraken_client=lt.client
         )
+        record_status_account(lt, equity, margin_used)
 
         # Build spot-to-futures mapping for symbol matching
         spot_to_futures_map: Dict[str, str] = {}
@@ -460,18 +487,20 @@ async def run_auction_allocation(lt: "LiveTrading", raw_positions: List[Dict]) -
 
         candidate_signals = []
         signal_to_candidate: dict = {}
+        risk_requests: List[TradeRequest] = []
+        risk_context: List[tuple] = []
         requested_leverage = int(getattr(lt.config.risk, "target_leverage", 7) or 7)
 
         from src.risk.symbol_cooldown import check_symbol_cooldown
 
+        auction_params = lt.runtime_params.auction
+        adx_threshold = auction_params.chop_adx_threshold
+        score_std_threshold = auction_params.chop_score_std_threshold
+
         for signal, spot_price, mark_price in lt.auction_signals_this_tick:
             try:
                 normalized_signal_symbol = _normalize_symbol_key(signal.symbol)
                 adx_value = float(getattr(signal, "adx", 0) or 0)
-                adx_threshold = float(getattr(lt.config.risk, "auction_chop_adx_threshold", 18.0) or 18.0)
-                score_std_threshold = float(
-                    getattr(lt.config.risk, "auction_chop_score_std_threshold", 6.0) or 6.0
-                )
                 symbol_quick_reversals = int(per_symbol_quick_reversal.get(normalized_signal_symbol, 0) or 0)
                 symbol_is_chop = (
                     adx_value < adx_threshold
@@ -493,16 +522,16 @@ async def run_auction_allocation(lt: "LiveTrading", raw_positions: List[Dict]) -
                     )
                     continue
 
-                if getattr(lt.config.strategy, "symbol_loss_cooldown_enabled", True):
-                    cooldown_params = _resolve_symbol_cooldown_params(lt.config.strategy, signal.symbol)
-                    if cooldown_params["canary_applied"]:
+                if auction_params.symbol_cooldown.enabled:
+                    cooldown_params = auction_params.symbol_cooldown.resolve(signal.symbol)
+                    if cooldown_params.canary_applied:
                         canary_overrides_applied += 1
                     is_on_cooldown, cooldown_reason = check_symbol_cooldown(
                         symbol=signal.symbol,
-                        lookback_hours=int(cooldown_params["lookback_hours"]),
-                        loss_threshold=int(cooldown_params["loss_threshold"]),
-                        cooldown_hours=int(cooldown_params["cooldown_hours"]),
-                        min_pnl_pct=float(cooldown_params["min_pnl_pct"]),
+                        lookback_hours=cooldown_params.lookback_hours,
+                        loss_threshold=cooldown_params.loss_threshold,
+                        cooldown_hours=cooldown_params.cooldown_hours,
+                        min_pnl_pct=cooldown_params.min_pnl_pct,
                     )
                     if is_on_cooldown:
                         funnel_rejections["SYMBOL_COOLDOWN"] += 1
@@ -546,14 +575,47 @@ async def run_auction_allocation(lt: "LiveTrading", raw_positions: List[Dict]) -
                             reason="Dynamic classification is authoritative",
                         )
 
-                decision = lt.risk_manager.validate_trade(
-                    signal,
+                risk_requests.append(
+                    TradeRequest(
+                        signal=signal,
+                        spot_price=spot_price,
+                        perp_mark_price=mark_price,
+                        symbol_tier=symbol_tier,
+                    )
+                )
+                risk_context.append((symbol_is_chop, symbol_quick_reversals))
+            except (OperationalError, DataError, ValueError, TypeError, KeyError) as e:
+                funnel_rejections[f"CANDIDATE_BUILD_{type(e).__name__}"] += 1
+                logger.error(
+                    "Failed to create candidate signal for auction",
+                    symbol=signal.symbol,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+        # One risk pass over all surviving signals (shared equity / margin budget)
+        decisions = []
+        if risk_requests:
+            try:
+                decisions = lt.risk_manager.validate_trades(
+                    risk_requests,
                     equity,
-                    spot_price,
-                    mark_price,
                     available_margin=auction_budget_margin,
-                    symbol_tier=symbol_tier,
                 )
+            except (OperationalError, DataError, ValueError, TypeError, KeyError) as e:
+                funnel_rejections[f"CANDIDATE_BUILD_{type(e).__name__}"] += len(risk_requests)
+                logger.error(
+                    "Failed to risk-check auction candidates",
+                    count=len(risk_requests),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+        for request, decision, (symbol_is_chop, symbol_quick_reversals) in zip(
+            risk_requests, decisions, risk_context
+        ):
+            signal = request.signal
+            try:
                 if not decision.approved:
                     risk_rejected_count += 1
                     for reason in (decision.rejection_reasons or []):
@@ -735,7 +797,11 @@ async def run_auction_allocation(lt: "LiveTrading", raw_positions: List[Dict]) -
             reductions=[(sym, str(qty)) for sym, qty in plan.reductions],
             reasons=plan.reasons,
         )
-        _, policy_hash = build_policy_hash(lt.config)
+        snapshot = getattr(lt, "config_snapshot", None)
+        if snapshot is not None and snapshot.config is lt.config:
+            policy_hash = snapshot.policy_hash
+        else:
+            _, policy_hash = build_policy_hash(lt.config)
         logger.info(
             "AUCTION_CHOP_SUMMARY",
             policy_hash=policy_hash,
@@ -1004,9 +1070,10 @@ async def run_auction_allocation(lt: "LiveTrading", raw_positions: List[Dict]) -
 
         try:
             balance_after_actions = await lt.client.get_futures_balance()
-            equity_after, refreshed_available_margin, _ = await calculate_effective_equity(
+            equity_after, refreshed_available_margin, margin_used_after = await calculate_effective_equity(
                 balance_after_actions, base_currency=base, kraken_client=lt.client
             )
+            record_status_account(lt, equity_after, margin_used_after)
             fresh_snapshot_ok = True
             logger.info(
                 "Auction: Margin refreshed after management actions",
@@ -1066,28 +1133,15 @@ async def run_auction_allocation(lt: "LiveTrading", raw_positions: List[Dict]) -
             seen_opens.add(signal.symbol)
             try:
                 # Hard entry blocklist
-                spot_key = (signal.symbol or "").strip().upper().split(":")[0]
-                base_cur = spot_key.split("/")[0].strip() if "/" in spot_key else spot_key
-                blocked_spot = set(
-                    s.strip().upper().split(":")[0]
-                    for s in getattr(lt.config.execution, "entry_blocklist_spot_symbols", []) or []
-                )
-                blocked_base = set(
-                    b.strip().upper()
-                    for b in getattr(lt.config.execution, "entry_blocklist_bases", []) or []
-                )
-                if (spot_key and spot_key in blocked_spot) or (base_cur and base_cur in blocked_base):
+                blocked_reason = lt.runtime_params.auction.entry_blocklist.block_reason(signal.symbol)
+                if blocked_reason:
                     opens_failed += 1
                     reason = "ENTRY_BLOCKED"
                     rejection_counts[reason] = rejection_counts.get(reason, 0) + 1
                     logger.warning(
                         "Auction: Open blocked by entry blocklist",
                         symbol=signal.symbol,
-                        reason=(
-                            "blocked_spot_symbol"
-                            if spot_key in blocked_spot
-                            else "blocked_base"
-                        ),
+                        reason=blocked_reason,
                     )
                     continue
 
@@ -1209,6 +1263,7 @@ async def run_auction_allocation(lt: "LiveTrading", raw_positions: List[Dict]) -
             "symbols_skipped_by_reason": analysis_funnel.get("symbols_skipped_by_reason"),
             "setups_found": analysis_funnel.get("setups_found"),
             "signals_scored": analysis_funnel.get("signals_scored"),
+            "signals_cached": analysis_funnel.get("signals_cached"),
             "signals_above_threshold": analysis_funnel.get("signals_above_threshold"),
             "signals_generated": analysis_funnel.get("signals_generated"),
             "signals_raw": pre_filter_count,
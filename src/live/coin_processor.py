@@ -4,7 +4,7 @@ Coin/market universe operations extracted from LiveTrading.
 Functions in this module handle:
 - Market symbol filtering (blocklist, fiat exclusion)
 - Static tier lookup (deprecated legacy helper)
-- Market universe discovery and update
+- Market universe discovery and update (applied as a delta)
 
 All functions receive the LiveTrading instance as their first argument (``lt``)
 to access shared state, following the same delegate pattern used by the other
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, List, Optional
 
 from src.exceptions import OperationalError, DataError
 from src.data.fiat_currencies import has_disallowed_base
+from src.data.market_discovery import UniverseDelta, universe_delta
 from src.monitoring.logger import get_logger
 
 if TYPE_CHECKING:
@@ -167,26 +168,35 @@ async def update_market_universe(lt: "LiveTrading") -> None:
         # Track last successful discovery count
         lt._last_discovered_count = new_count
 
-        # Log added/removed symbols vs current universe
-        prev_symbols = set(market_symbols(lt))
-        supported = set(mapping.keys())
-        dropped = prev_symbols - supported
-        added = supported - prev_symbols
-        for sym in sorted(dropped):
-            logger.warning("SYMBOL_REMOVED", symbol=sym)
-        for sym in sorted(added):
-            logger.info("SYMBOL_ADDED", symbol=sym)
-
-        # Update internal state (Maintain Spot -> Futures mapping)
-        lt.markets = mapping
-        lt.futures_adapter.set_spot_to_futures_override(mapping)
-
-        # Update Data Acquisition
-        new_spot_symbols = list(mapping.keys())
-        new_futures_symbols = list(mapping.values())
-        lt.data_acq.update_symbols(new_spot_symbols, new_futures_symbols)
+        if not isinstance(lt.markets, dict):
+            # Static list universe (config): first discovery replaces it wholesale.
+            delta = universe_delta({}, mapping)
+            lt.markets = {}
+        else:
+            delta = universe_delta(lt.markets, mapping)
+        if delta.is_empty:
+            logger.info("Market universe unchanged", count=len(lt.markets))
+            return
+        apply_universe_delta(lt, delta)
 
         logger.info("Market universe updated", count=len(lt.markets))
 
     except (OperationalError, DataError) as e:
         logger.error("Failed to update market universe", error=str(e), error_type=type(e).__name__)
+
+
+def apply_universe_delta(lt: "LiveTrading", delta: UniverseDelta) -> None:
+    """Apply a discovery delta to the live universe in place (no rebuild of unchanged symbols)."""
+    for sym in sorted(delta.removed):
+        logger.warning("SYMBOL_REMOVED", symbol=sym)
+        lt.markets.pop(sym, None)
+    for sym in sorted(delta.added):
+        logger.info("SYMBOL_ADDED", symbol=sym)
+    for sym, fut in sorted(delta.remapped.items()):
+        logger.info("SYMBOL_REMAPPED", symbol=sym, futures_symbol=fut, previous=lt.markets.get(sym))
+    lt.markets.update(delta.added)
+    lt.markets.update(delta.remapped)
+
+    # Maintain Spot -> Futures mapping and Data Acquisition symbol lists
+    lt.futures_adapter.set_spot_to_futures_override(dict(lt.markets))
+    lt.data_acq.update_symbols(list(lt.markets.keys()), list(lt.markets.values()))
@@ -0,0 +1,377 @@
+"""
+Hot config reload for live trading.
+
+``ConfigWatcher.poll`` runs between ticks. When config.yaml or safety.yaml
+changed on disk it loads them the way startup does (``Config.from_yaml`` +
+``validate_config``, ``load_safety_config`` + ``create_system_invariants``),
+diffs the result against the active ``ConfigSnapshot`` and returns a
+``ConfigReload`` if every changed setting can be applied in place.
+``apply_config_reload`` then swaps the new snapshot into LiveTrading without
+awaiting, so a tick or a background monitor sees either the old config or
+the new one, never a mix.
+
+Only components whose inputs changed are touched: candles, instrument specs,
+the order book cache and discovery state stay warm, and the SMC indicator
+cache is dropped only when the indicator periods change. Settings baked into
+long-lived objects (exchange client, universe, data pipeline, ShockGuard,
+gateway fees, ...) need a restart; a change to any of them rejects the whole
+reload and the running config stays in force.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import yaml
+
+from src.config.config import Config
+from src.config.runtime_params import RuntimeParams, compile_runtime_params
+from src.live.policy_fingerprint import build_policy_hash, hash_policy_snapshot
+from src.monitoring.logger import get_logger
+# src.safety first: src.config.safety_config can't be the first import of the cycle.
+from src.safety.invariant_monitor import SystemInvariants
+from src.config.safety_config import create_system_invariants, load_safety_config
+
+if TYPE_CHECKING:
+    from src.live.live_trading import LiveTrading
+
+logger = get_logger(__name__)
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.yaml"
+DEFAULT_SAFETY_PATH = Path(__file__).resolve().parent.parent / "config" / "safety.yaml"
+
+# Top-level sections that can change without a restart ("safety" = safety.yaml).
+HOT_RELOADABLE_SECTIONS = frozenset({"risk", "strategy", "execution", "multi_tp", "safety"})
+
+# Settings inside those sections that are captured at startup. Prefix match on the dotted path.
+RESTART_REQUIRED = (
+    "risk.auction_mode_enabled",  # allocator + auction loop wiring
+    "risk.shock_",  # ShockGuard is built once with these
+    "risk.basis_shock_pct",
+    "risk.emergency_buffer_pct",
+    "risk.trim_buffer_pct",
+    "risk.maker_fee_bps",  # ExecutionGateway trade-recording fees
+    "risk.taker_fee_bps",
+    "risk.funding_rate_daily_bps",
+    "strategy.memory_enabled",
+)
+_HOT_SAFETY_PREFIX = "safety.invariants."
+
+_SECRET_MARKERS = ("key", "secret", "password", "token", "database_url")
+
+
+def requires_restart(path: str) -> bool:
+    """True if the setting at dotted ``path`` cannot be applied to a running process."""
+    section = path.split(".", 1)[0]
+    if section not in HOT_RELOADABLE_SECTIONS:
+        return True
+    if section == "safety":
+        return not path.startswith(_HOT_SAFETY_PREFIX)
+    return path.startswith(RESTART_REQUIRED)
+
+
+def diff_settings(old: Any, new: Any, prefix: str = "") -> Dict[str, Tuple[Any, Any]]:
+    """Dotted path -> (old, new) for every leaf that differs; lists compare as a whole."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes: Dict[str, Tuple[Any, Any]] = {}
+        for key in sorted(set(old) | set(new), key=str):
+            path = f"{prefix}.{key}" if prefix else str(key)
+            changes.update(diff_settings(old.get(key), new.get(key), path))
+        return changes
+    return {} if old == new else {prefix: (old, new)}
+
+
+def _settings(config: Config, safety_config: dict) -> dict:
+    return {**config.model_dump(), "safety": safety_config.get("safety", {})}
+
+
+def _loggable_changes(changes: Dict[str, Tuple[Any, Any]]) -> Dict[str, List[str]]:
+    """Changes rendered for logs / events, with credential-like values masked."""
+    out = {}
+    for path, (old, new) in changes.items():
+        leaf = path.rsplit(".", 1)[-1].lower()
+        if any(marker in leaf for marker in _SECRET_MARKERS):
+            out[path] = ["***", "***"]
+        else:
+            out[path] = [str(old), str(new)]
+    return out
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    One loaded config + safety config and everything derived from them.
+
+    ``policy_hash`` is the auction rollout fingerprint (``build_policy_hash``);
+    ``config_hash`` covers every setting, so it identifies the exact live config.
+    Never mutated after construction; a reload builds a new snapshot.
+    """
+    config: Config
+    safety_config: dict
+    invariants: SystemInvariants
+    runtime_params: RuntimeParams
+    policy_snapshot: Dict[str, Any]
+    policy_hash: str
+    config_hash: str
+    version: int = 1
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @classmethod
+    def build(cls, config: Config, safety_config: dict, version: int = 1) -> "ConfigSnapshot":
+        policy_snapshot, policy_hash = build_policy_hash(config)
+        return cls(
+            config=config,
+            safety_config=safety_config,
+            invariants=create_system_invariants(safety_config),
+            runtime_params=compile_runtime_params(config),
+            policy_snapshot=policy_snapshot,
+            policy_hash=policy_hash,
+            config_hash=hash_policy_snapshot(_settings(config, safety_config), default=str),
+            version=version,
+        )
+
+    def settings(self) -> dict:
+        """Plain-dict view used for diffing (config sections + ``safety``)."""
+        return _settings(self.config, self.safety_config)
+
+
+@dataclass(frozen=True)
+class ConfigReload:
+    """A validated, hot-applicable change from ``previous`` to ``snapshot``."""
+    previous: ConfigSnapshot
+    snapshot: ConfigSnapshot
+    changes: Dict[str, Tuple[Any, Any]]
+
+    @property
+    def sections(self) -> FrozenSet[str]:
+        return frozenset(path.split(".", 1)[0] for path in self.changes)
+
+    def changed(self, prefix: str) -> bool:
+        """True if any changed path starts with ``prefix``."""
+        return any(path.startswith(prefix) for path in self.changes)
+
+
+# Everything a malformed or half-written file can raise while loading / validating.
+_LOAD_ERRORS = (
+    ValueError, TypeError, KeyError, AttributeError, ArithmeticError, OSError, yaml.YAMLError, Warning,
+)
+
+
+class ConfigWatcher:
+    """
+    Polls config.yaml / safety.yaml on (mtime, size) and stages validated reloads.
+
+    Each on-disk version is loaded once: an invalid or restart-only edit is
+    logged and ignored until the file changes again.
+    """
+
+    def __init__(
+        self,
+        config_path: Optional[Path] = None,
+        safety_path: Optional[Path] = None,
+        compatibility_check: Optional[Callable[[Config, SystemInvariants], List[str]]] = None,
+    ):
+        self.config_path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+        self.safety_path = Path(safety_path) if safety_path else DEFAULT_SAFETY_PATH
+        self._compatibility_check = compatibility_check
+        self._stamps = self._read_stamps()
+
+    def _read_stamps(self) -> Tuple[Optional[Tuple[int, int]], ...]:
+        stamps = []
+        for path in (self.config_path, self.safety_path):
+            try:
+                st = path.stat()
+                stamps.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def poll(self, current: ConfigSnapshot) -> Optional[ConfigReload]:
+        """A reload from ``current`` if the files changed and the change is hot-applicable, else None."""
+        stamps = self._read_stamps()
+        if stamps == self._stamps:
+            return None
+        self._stamps = stamps
+
+        try:
+            config = Config.from_yaml(self.config_path)
+            config.validate_config()
+            safety_config = load_safety_config(str(self.safety_path))
+            candidate = ConfigSnapshot.build(config, safety_config, version=current.version + 1)
+        except _LOAD_ERRORS as e:
+            logger.error(
+                "CONFIG_RELOAD_INVALID",
+                error=str(e),
+                error_type=type(e).__name__,
+                config_path=str(self.config_path),
+                safety_path=str(self.safety_path),
+                active_policy_hash=current.policy_hash,
+            )
+            return None
+
+        changes = diff_settings(current.settings(), candidate.settings())
+        if not changes:
+            logger.info("CONFIG_RELOAD_NOOP", active_version=current.version)
+            return None
+
+        restart_required = sorted(path for path in changes if requires_restart(path))
+        if restart_required:
+            logger.warning(
+                "CONFIG_RELOAD_REJECTED",
+                reason="restart_required",
+                restart_required=restart_required,
+                changed=sorted(changes),
+                active_policy_hash=current.policy_hash,
+            )
+            return None
+
+        if self._compatibility_check is not None:
+            errors = self._compatibility_check(candidate.config, candidate.invariants)
+            if errors:
+                logger.error(
+                    "CONFIG_RELOAD_REJECTED",
+                    reason="config_safety_mismatch",
+                    errors=errors,
+                    active_policy_hash=current.policy_hash,
+                )
+                return None
+
+        return ConfigReload(previous=current, snapshot=candidate, changes=changes)
+
+
+# LiveTrading attributes replaced wholesale by a reload; restored as-is on rollback.
+_SWAPPED_ATTRS = (
+    "config", "runtime_params", "config_snapshot", "_policy_snapshot", "_policy_hash",
+    "_signal_cooldown_hours", "auction_allocator", "execution_engine",
+)
+
+
+def _apply_snapshot(lt: "LiveTrading", snapshot: ConfigSnapshot, sections: FrozenSet[str]) -> None:
+    """Push ``snapshot`` into the in-place components that ``sections`` affect."""
+    config = snapshot.config
+    params = snapshot.runtime_params
+    if "risk" in sections:
+        lt.risk_manager.apply_config(config.risk, params=params.risk)
+    if "strategy" in sections:
+        lt.smc_engine.apply_config(config.strategy)
+    if "execution" in sections:
+        lt.executor.apply_config(config.execution)
+    if sections & {"strategy", "execution", "multi_tp"} and getattr(lt, "position_manager_v2", None) is not None:
+        lt.position_manager_v2.apply_config(
+            multi_tp_config=getattr(config, "multi_tp", None),
+            strategy_config=config.strategy,
+            exit_params=params.exits,
+        )
+    if getattr(lt, "hardening", None) is not None:
+        lt.hardening.apply_config(config, snapshot.safety_config, snapshot.invariants)
+
+
+def apply_config_reload(lt: "LiveTrading", reload: ConfigReload) -> List[str]:
+    """
+    Swap ``reload.snapshot`` into ``lt``. Synchronous on purpose (atomic between awaits).
+
+    Replacement components are built before anything on ``lt`` changes. If a
+    component rejects the new config, every component is re-applied with
+    ``reload.previous`` and the swapped attributes are restored before the
+    error propagates, so the previous snapshot stays fully active.
+
+    Returns the names of the components that were updated.
+    """
+    snapshot = reload.snapshot
+    config = snapshot.config
+    sections = reload.sections
+    updated: List[str] = []
+
+    # Build phase: nothing on lt is touched yet.
+    allocator = lt.auction_allocator
+    if "risk" in sections and allocator is not None and reload.changed("risk.auction_"):
+        from src.live.auction_runner import build_auction_allocator
+        allocator = build_auction_allocator(config)
+    execution_engine = lt.execution_engine
+    if sections & {"strategy", "execution", "multi_tp"}:
+        from src.execution.execution_engine import ExecutionEngine
+        execution_engine = ExecutionEngine(config)
+    cooldown_hours = lt._signal_cooldown_hours
+    if "strategy" in sections:
+        cooldown_hours = float(getattr(config.strategy, "signal_cooldown_hours", 4.0))
+
+    # Apply phase: roll back to the previous snapshot if any component raises.
+    saved = {attr: getattr(lt, attr) for attr in _SWAPPED_ATTRS}
+    try:
+        _apply_snapshot(lt, snapshot, sections)
+    except Exception as e:
+        try:
+            _apply_snapshot(lt, reload.previous, sections)
+        except Exception as rollback_error:
+            logger.critical(
+                "CONFIG_RELOAD_ROLLBACK_FAILED",
+                error=str(rollback_error),
+                error_type=type(rollback_error).__name__,
+            )
+        for attr, value in saved.items():
+            setattr(lt, attr, value)
+        logger.error(
+            "CONFIG_RELOAD_ROLLED_BACK",
+            version=snapshot.version,
+            active_config_hash=reload.previous.config_hash,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise
+
+    # Commit phase: plain attribute assignments only.
+    if "risk" in sections:
+        updated.append("risk_manager")
+        if allocator is not lt.auction_allocator:
+            lt.auction_allocator = allocator
+            updated.append("auction_allocator")
+    if "strategy" in sections:
+        lt._signal_cooldown_hours = cooldown_hours
+        updated.append("smc_engine")
+    if "execution" in sections:
+        updated.append("executor")
+    if execution_engine is not lt.execution_engine:
+        lt.execution_engine = execution_engine
+        updated.append("execution_engine")
+        if getattr(lt, "position_manager_v2", None) is not None:
+            updated.append("position_manager_v2")
+    if getattr(lt, "hardening", None) is not None and "safety" in sections:
+        updated.append("invariant_monitor")
+
+    lt.config = config
+    lt.runtime_params = snapshot.runtime_params
+    lt.config_snapshot = snapshot
+    lt._policy_snapshot = snapshot.policy_snapshot
+    lt._policy_hash = snapshot.policy_hash
+
+    changes = _loggable_changes(reload.changes)
+    logger.warning(
+        "CONFIG_RELOADED",
+        version=snapshot.version,
+        previous_policy_hash=reload.previous.policy_hash,
+        policy_hash=snapshot.policy_hash,
+        previous_config_hash=reload.previous.config_hash,
+        config_hash=snapshot.config_hash,
+        changes=changes,
+        updated=updated,
+    )
+    try:
+        from src.storage.repository import record_event
+        record_event(
+            "CONFIG_RELOADED",
+            "system",
+            {
+                "version": snapshot.version,
+                "previous_policy_hash": reload.previous.policy_hash,
+                "policy_hash": snapshot.policy_hash,
+                "previous_config_hash": reload.previous.config_hash,
+                "config_hash": snapshot.config_hash,
+                "changes": changes,
+                "updated": updated,
+            },
+        )
+    except Exception as e:
+        logger.debug("Failed to record CONFIG_RELOADED event", error=str(e))
+    return updated
@@ -238,6 +238,7 @@ async def sync_account_state(lt: "LiveTrading") -> None:
             available_margin=avail_margin,
             unrealized_pnl=Decimal("0.0"),  # Included in portfolioValue usually
         )
+        record_status_account(lt, equity, margin_used_val)
 
         # Initialize daily loss tracking if not set
         if lt.risk_manager.daily_start_equity <= 0:
@@ -250,6 +251,18 @@ async def sync_account_state(lt: "LiveTrading") -> None:
         logger.error("Failed to sync account state", error=str(e), error_type=type(e).__name__)
 
 
+def record_status_account(lt: "LiveTrading", equity: Decimal, margin_used: Decimal) -> None:
+    """
+    Feed effective equity / margin used the tick already fetched into the
+    status read model. Never calls the exchange: ticks without a fetch
+    (hardening off, management ticks) leave it to age, and
+    get_system_status falls back to a live fetch.
+    """
+    read_model = getattr(lt, "_read_model", None)
+    if read_model is not None:
+        read_model.status.update_account(equity, margin_used)
+
+
 # ---------------------------------------------------------------------------
 # Trade history
 # ---------------------------------------------------------------------------
@@ -65,7 +65,9 @@ async def run_protection_checks(lt: "LiveTrading", interval_seconds: int = 30) -
     If a naked position is detected in prod live, attempt self-healing
     (place missing stop) before escalating to kill switch.
 
-    Escalation ladder:
+    Escalation ladder (a detection is a naked result, or an unknown one when
+    the symbol's check missed the sweep deadline; only a confirmed-protected
+    result resets a symbol's count):
       1-4 consecutive detections → WARN, let main loop / self-heal fix it
       5   consecutive detections → attempt to place missing stops ourselves
       6+  still naked after heal → activate kill switch
@@ -112,7 +114,17 @@ async def run_protection_checks(lt: "LiveTrading", interval_seconds: int = 30) -
             continue
         try:
             results = await lt._protection_monitor.check_all_positions()
-            naked = [s for s, ok in results.items() if not ok]
+            # A counter is only cleared once the symbol is confirmed protected
+            # (True) or no longer held. Unknown results (None: the check missed
+            # the sweep deadline) escalate like naked ones, so a naked position
+            # whose check keeps timing out is still caught.
+            confirmed = [s for s in consecutive_naked_count if results.get(s, True) is True]
+            for s in confirmed:
+                del consecutive_naked_count[s]
+            if confirmed:
+                logger.info("Naked position counters cleared (confirmed protected)", symbols=confirmed)
+            naked = [s for s, ok in results.items() if ok is not True]
+            unknown = [s for s in naked if results[s] is None]
             if naked:
                 for s in naked:
                     consecutive_naked_count[s] = consecutive_naked_count.get(s, 0) + 1
@@ -130,6 +142,7 @@ async def run_protection_checks(lt: "LiveTrading", interval_seconds: int = 30) -
                     logger.critical(
                         "NAKED_POSITIONS_DETECTED (persistent, self-heal failed)",
                         naked_symbols=persistent_naked,
+                        unknown_symbols=[s for s in persistent_naked if s in unknown],
                         details=results,
                         consecutive_counts={
                             s: consecutive_naked_count[s] for s in persistent_naked
@@ -174,8 +187,10 @@ async def run_protection_checks(lt: "LiveTrading", interval_seconds: int = 30) -
                         await asyncio.sleep(5)
                         # Re-check immediately
                         results2 = await lt._protection_monitor.check_all_positions()
-                        still_naked = [s for s, ok in results2.items() if not ok]
-                        if not still_naked:
+                        still_naked = [s for s, ok in results2.items() if ok is False]
+                        # A heal candidate whose re-check timed out is not proven protected.
+                        unverified = [s for s in heal_candidates if results2.get(s) is None]
+                        if not still_naked and not unverified:
                             metrics["stop_self_heal_success_total"] += 1
                             logger.info(
                                 "Self-heal SUCCESS: naked positions now protected",
@@ -193,7 +208,8 @@ async def run_protection_checks(lt: "LiveTrading", interval_seconds: int = 30) -
                                 )
                             except (OperationalError, ImportError, OSError):
                                 pass
-                            consecutive_naked_count.clear()
+                            for s in heal_candidates:
+                                consecutive_naked_count.pop(s, None)
                             _heal_attempted = False
                             await asyncio.sleep(interval_seconds)
                             continue
@@ -202,7 +218,11 @@ async def run_protection_checks(lt: "LiveTrading", interval_seconds: int = 30) -
                             logger.warning(
                                 "Self-heal PARTIAL: some positions still naked after stop placement",
                                 still_naked=still_naked,
-                                healed=[s for s in heal_candidates if s not in still_naked],
+                                unverified=unverified,
+                                healed=[
+                                    s for s in heal_candidates
+                                    if s not in still_naked and s not in unverified
+                                ],
                                 stop_self_heal_failures_total=metrics["stop_self_heal_failures_total"],
                                 stop_self_heal_attempts_total=metrics["stop_self_heal_attempts_total"],
                             )
@@ -210,8 +230,9 @@ async def run_protection_checks(lt: "LiveTrading", interval_seconds: int = 30) -
                                 await send_alert(
                                     "SELF_HEAL_PARTIAL",
                                     f"Stop self-heal partial — still naked:\n"
-                                    f"{', '.join(still_naked)}\n"
-                                    f"Healed: {', '.join(s for s in heal_candidates if s not in still_naked) or 'none'}\n"
+                                    f"{', '.join(still_naked) or 'none'}\n"
+                                    f"Unverified (check timed out): {', '.join(unverified) or 'none'}\n"
+                                    f"Healed: {', '.join(s for s in heal_candidates if s not in still_naked and s not in unverified) or 'none'}\n"
                                     f"Failures: {metrics['stop_self_heal_failures_total']}",
                                     urgent=True,
                                 )
@@ -244,6 +265,7 @@ async def run_protection_checks(lt: "LiveTrading", interval_seconds: int = 30) -
                 logger.warning(
                     "NAKED_POSITIONS_DETECTED (monitoring, self-heal pending)",
                     naked_symbols=naked,
+                    unknown_symbols=unknown,
                     details=results,
                     consecutive_counts={
                         s: consecutive_naked_count.get(s, 0) for s in naked
@@ -252,12 +274,6 @@ async def run_protection_checks(lt: "LiveTrading", interval_seconds: int = 30) -
                     kill_at=KILL_THRESHOLD,
                 )
             else:
-                if consecutive_naked_count:
-                    logger.info(
-                        "Naked position counters cleared (all positions protected)",
-                        previous_counts=dict(consecutive_naked_count),
-                    )
-                consecutive_naked_count.clear()
                 _heal_attempted = False
 
             # ── Periodic metrics snapshot (every check, in structured log) ──
@@ -676,6 +692,10 @@ async def run_trade_recording_monitor(
 # System status (Telegram data provider)
 # ---------------------------------------------------------------------------
 
+# Older than this (ticks stalled), /status goes back to the exchange.
+STATUS_PROJECTION_MAX_AGE_SECONDS = 600
+
+
 async def get_system_status(lt: "LiveTrading") -> dict:
     """
     Data provider for Telegram command handler.
@@ -693,6 +713,23 @@ async def get_system_status(lt: "LiveTrading") -> dict:
         "universe_size": len(lt._market_symbols()),
     }
 
+    # Served from the worker's status projection while it is fresh; the live
+    # exchange fetch below is the fallback (startup, stalled ticks).
+    from src.monitoring.read_models import get_read_model
+
+    read_model = get_read_model()
+    if read_model is not None and read_model.status.ready:
+        age = read_model.status.age_seconds()
+        if age is not None and age <= STATUS_PROJECTION_MAX_AGE_SECONDS:
+            account = read_model.status.account()
+            result["equity"] = account["equity"]
+            result["margin_used"] = account["margin_used"]
+            result["margin_pct"] = account["margin_pct"]
+            result["positions"] = account["positions"]
+            result["as_of"] = account["as_of"]
+            _fill_system_state(lt, result)
+            return result
+
     try:
         balance = await lt.client.get_futures_balance()
         base = getattr(lt.config.exchange, "base_currency", "USD")
@@ -735,6 +772,11 @@ async def get_system_status(lt: "LiveTrading") -> dict:
     except (OperationalError, DataError) as e:
         logger.warning("Status: failed to get positions", error=str(e))
 
+    _fill_system_state(lt, result)
+    return result
+
+
+def _fill_system_state(lt: "LiveTrading", result: dict) -> None:
     # System state
     kill_active = lt.kill_switch.is_active() if lt.kill_switch else False
     result["kill_switch_active"] = kill_active
@@ -755,8 +797,6 @@ async def get_system_status(lt: "LiveTrading") -> dict:
     except (OperationalError, DataError, OSError, ImportError):
         pass
 
-    return result
-
 
 # ---------------------------------------------------------------------------
 # Daily P&L summary
@@ -1,5 +1,4 @@
 import asyncio
-import inspect
 import os
 import re
 import time
@@ -9,12 +8,16 @@ from decimal import Decimal
 from typing import List, Dict, Optional, Any
 
 from src.config.config import Config
+from src.config.runtime_params import compile_runtime_params
 from src.data.market_discovery import MarketDiscoveryService
-from src.monitoring.logger import get_logger
+from src.monitoring.logger import debug_enabled, get_logger
+from src.monitoring.memory_profiler import get_memory_profiler, get_memory_registry, init_memory_profiler
+from src.monitoring.metrics import last_tick_gauge, set_snapshot_gauges
 from src.data.fiat_currencies import has_disallowed_base
 from src.data.kraken_client import KrakenClient
 from src.data.data_acquisition import DataAcquisition
 from src.data.candle_manager import CandleManager
+from src.strategy.analysis_cache import AnalysisCache, config_hash as analysis_config_hash
 from src.strategy.smc_engine import SMCEngine
 from src.risk.risk_manager import RiskManager
 from src.execution.executor import Executor
@@ -47,8 +50,11 @@ from src.execution.production_safety import (
 from src.utils.kill_switch import KillSwitch, KillSwitchReason
 from src.exceptions import CircuitOpenError, OperationalError, DataError, InvariantError
 from src.runtime.startup_phases import StartupStateMachine, StartupPhase
+from src.runtime.cycle_guard import get_cycle_guard
 from src.domain.models import Candle, Signal, SignalType, Position, Side
-from src.storage.repository import record_event, record_metrics_snapshot, get_trades_since
+from src.storage.repository import record_event, record_metrics_snapshot
+from src.storage.trade_ledger import init_trade_ledger, recent_trades
+from src.monitoring.read_models import init_read_model
 from src.storage.maintenance import DatabasePruner
 from src.live.startup_validator import ensure_all_coins_have_traces
 from src.live.maintenance import periodic_data_maintenance
@@ -61,22 +67,19 @@ from src.safety.integration import (
     HardeningDecision,
 )
 
-from src.data.symbol_utils import exchange_position_side as _exchange_position_side
+from src.data.symbol_utils import exchange_position_side as _exchange_position_side, spot_symbol_key
 from src.data.data_sanity import SanityThresholds, check_ticker_sanity, check_candle_sanity
 from src.data.data_quality_tracker import DataQualityTracker
+from src.live.config_reload import ConfigSnapshot, ConfigWatcher, apply_config_reload
+from src.live.exchange_sync import record_status_account
 from src.live.policy_fingerprint import build_policy_hash
+from src.live.universe_resolution import resolve_universe
 
 logger = get_logger(__name__)
 
 
 def _normalize_symbol_key(symbol: str) -> str:
-    key = (symbol or "").strip().upper()
-    key = key.split(":")[0]
-    if key.startswith("PF_"):
-        base = key.replace("PF_", "").replace("USD", "")
-        if base:
-            return f"{base}/USD"
-    return key
+    return spot_symbol_key(symbol)
 
 
 def _attach_thesis_trace_fields(trace_details: Dict[str, Any], thesis_snapshot: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -180,9 +183,11 @@ class LiveTrading:
     CRITICAL: Real capital at risk. Enforces all safety gates.
     """
     
-    def __init__(self, config: Config):
-        """Initialize live trading."""
+    def __init__(self, config: Config, config_path: Optional[str] = None):
+        """Initialize live trading. ``config_path`` is the YAML the hot-reload watcher polls."""
         self.config = config
+        # Hot-path views of the config (pre-converted Decimals, sorted tables, normalized sets)
+        self.runtime_params = compile_runtime_params(config)
 
         # ========== STARTUP STATE MACHINE (P2.3) ==========
         self._startup_sm = StartupStateMachine()
@@ -226,6 +231,11 @@ class LiveTrading:
             breaker_failure_threshold=getattr(config.exchange, "circuit_breaker_failure_threshold", 5),
             breaker_rate_limit_threshold=getattr(config.exchange, "circuit_breaker_rate_limit_threshold", 2),
             breaker_cooldown_seconds=getattr(config.exchange, "circuit_breaker_cooldown_seconds", 60.0),
+            spot_ticker_chunk_size=getattr(config.exchange, "spot_ticker_chunk_size", 50),
+            spot_ticker_concurrency=getattr(config.exchange, "spot_ticker_concurrency", 4),
+            spot_ticker_request_timeout_seconds=getattr(config.exchange, "spot_ticker_request_timeout_seconds", 3.0),
+            spot_ticker_deadline_seconds=getattr(config.exchange, "spot_ticker_deadline_seconds", 10.0),
+            bad_symbol_ttl_seconds=getattr(config.exchange, "bad_symbol_ttl_minutes", 60) * 60,
         )
         
         # CRITICAL: Verify client is not a mock
@@ -254,7 +264,12 @@ class LiveTrading:
             event_recorder=record_event,
             institutional_memory=self.institutional_memory_manager,
         )
-        self.risk_manager = RiskManager(config.risk, liquidity_filters=config.liquidity_filters, event_recorder=record_event)
+        self.risk_manager = RiskManager(
+            config.risk,
+            liquidity_filters=config.liquidity_filters,
+            event_recorder=record_event,
+            params=self.runtime_params.risk,
+        )
         from src.execution.instrument_specs import InstrumentSpecRegistry
         self.instrument_spec_registry = InstrumentSpecRegistry(
             get_instruments_fn=self.client.get_futures_instruments,
@@ -316,49 +331,12 @@ class LiveTrading:
         # Auto halt recovery tracking (instance-level, not class-level)
         self._auto_recovery_attempts: list = []
         if config.risk.auction_mode_enabled:
-            from src.portfolio.auction_allocator import (
-                AuctionAllocator,
-                PortfolioLimits,
-            )
-            limits = PortfolioLimits(
-                max_positions=config.risk.auction_max_positions,
-                max_margin_util=config.risk.auction_max_margin_util,
-                max_per_cluster=config.risk.auction_max_per_cluster,
-                max_per_symbol=config.risk.auction_max_per_symbol,
-                direction_concentration_penalty=config.risk.auction_direction_concentration_penalty,
-            )
-            allocator_kwargs = {
-                "limits": limits,
-                "swap_threshold": config.risk.auction_swap_threshold,
-                "min_hold_minutes": config.risk.auction_min_hold_minutes,
-                "max_trades_per_cycle": config.risk.auction_max_trades_per_cycle,
-                "max_new_opens_per_cycle": config.risk.auction_max_new_opens_per_cycle,
-                "max_closes_per_cycle": config.risk.auction_max_closes_per_cycle,
-                "entry_cost": config.risk.auction_entry_cost,
-                "exit_cost": config.risk.auction_exit_cost,
-                "rebalancer_enabled": config.risk.auction_rebalancer_enabled,
-                "rebalancer_trigger_pct_equity": config.risk.auction_rebalancer_trigger_pct_equity,
-                "rebalancer_clear_pct_equity": config.risk.auction_rebalancer_clear_pct_equity,
-                "rebalancer_per_symbol_trim_cooldown_cycles": config.risk.auction_rebalancer_per_symbol_trim_cooldown_cycles,
-                "rebalancer_max_reductions_per_cycle": config.risk.auction_rebalancer_max_reductions_per_cycle,
-                "rebalancer_max_total_margin_reduced_per_cycle": config.risk.auction_rebalancer_max_total_margin_reduced_per_cycle,
-                "no_signal_persistence_enabled": config.risk.auction_no_signal_persistence_enabled,
-                "no_signal_close_persistence_cycles": config.risk.auction_no_signal_close_persistence_cycles,
-                "no_signal_persistence_canary_symbols": config.risk.auction_no_signal_persistence_canary_symbols,
-            }
-            accepted_params = set(inspect.signature(AuctionAllocator.__init__).parameters.keys())
-            filtered_kwargs = {k: v for k, v in allocator_kwargs.items() if k in accepted_params}
-            dropped_kwargs = sorted(set(allocator_kwargs.keys()) - set(filtered_kwargs.keys()))
-            if dropped_kwargs:
-                logger.warning(
-                    "AuctionAllocator does not support some config args; using compatible subset",
-                    dropped_kwargs=dropped_kwargs,
-                )
-            self.auction_allocator = AuctionAllocator(**filtered_kwargs)
+            from src.live.auction_runner import build_auction_allocator
+            self.auction_allocator = build_auction_allocator(config)
             policy_snapshot, policy_hash = build_policy_hash(config)
             self._policy_snapshot = policy_snapshot
             self._policy_hash = policy_hash
-            logger.info("Auction mode enabled", max_positions=limits.max_positions)
+            logger.info("Auction mode enabled", max_positions=self.auction_allocator.limits.max_positions)
             logger.info(
                 "STARTUP_POLICY_FINGERPRINT",
                 policy_hash=policy_hash,
@@ -366,6 +344,27 @@ class LiveTrading:
             )
         
         self._last_partial_close_at: Optional[datetime] = None
+
+        # Bar-close-aligned loop scheduling (analysis on bar close, management in between)
+        self._bar_scheduler = None
+        self._current_wake = None  # None = analyse everything (legacy / first tick)
+        if config.data.bar_aligned_scheduler_enabled:
+            from src.runtime.bar_scheduler import BarCloseScheduler
+            self._bar_scheduler = BarCloseScheduler(
+                timeframes=config.data.bar_scheduler_timeframes,
+                settle_seconds=config.data.bar_close_settle_seconds,
+                management_interval_seconds=config.data.management_tick_seconds,
+                min_gap_seconds=get_cycle_guard().min_interval.total_seconds(),
+            )
+
+        # Per-symbol input fingerprints: reuse NO_SIGNAL results for unchanged inputs
+        self._analysis_cache = None
+        if config.data.incremental_analysis_enabled:
+            self._analysis_cache = AnalysisCache(
+                price_bucket_bps=config.data.analysis_price_bucket_bps,
+                max_age_seconds=config.data.analysis_cache_max_age_seconds,
+            )
+
         if self.use_state_machine_v2:
             logger.critical("🚀 POSITION STATE MACHINE V2 ENABLED")
             
@@ -379,11 +378,24 @@ class LiveTrading:
             self.position_manager_v2 = PositionManagerV2(
                 registry=self.position_registry,
                 multi_tp_config=getattr(self.config, "multi_tp", None),
+                exit_params=self.runtime_params.exits,
                 instrument_spec_registry=getattr(self, "instrument_spec_registry", None),
                 strategy_config=self.config.strategy,
                 institutional_memory=self.institutional_memory_manager,
             )
             
+            # L2 depth cache for entry liquidity checks (REST snapshots of watched symbols)
+            self.orderbook_cache = None
+            if config.data.orderbook_cache_enabled:
+                from src.data.orderbook import OrderBookDepthCache
+                self.orderbook_cache = OrderBookDepthCache(
+                    fetch_snapshot=lambda sym: self.client.get_futures_orderbook(
+                        sym, limit=config.data.orderbook_depth_levels
+                    ),
+                    max_age_seconds=config.data.orderbook_max_age_seconds,
+                    watch_ttl_seconds=config.data.orderbook_watch_ttl_seconds,
+                )
+            
             # Initialize Execution Gateway - ALL orders flow through here
             self.execution_gateway = ExecutionGateway(
                 exchange_client=self.client,
@@ -397,6 +409,7 @@ class LiveTrading:
                 maker_fee_bps=config.risk.maker_fee_bps,
                 taker_fee_bps=config.risk.taker_fee_bps,
                 funding_rate_daily_bps=config.risk.funding_rate_daily_bps,
+                orderbook_cache=self.orderbook_cache,
             )
             
             logger.critical("State Machine V2 running - all orders via gateway")
@@ -419,6 +432,7 @@ class LiveTrading:
         self.last_trace_log: Dict[str, datetime] = {} # Dashboard update throttling
         self.last_account_sync = datetime.min.replace(tzinfo=timezone.utc)
         self.last_maintenance_run = datetime.min.replace(tzinfo=timezone.utc)
+        self._maintenance_task: Optional[asyncio.Task] = None
         self.last_data_maintenance = datetime.min.replace(tzinfo=timezone.utc)
         self.last_recon_time = datetime.min.replace(tzinfo=timezone.utc)
         self.last_metrics_emit = datetime.min.replace(tzinfo=timezone.utc)
@@ -469,6 +483,28 @@ class LiveTrading:
         except (ValueError, TypeError, KeyError, ImportError, OSError) as e:
             logger.warning("Failed to initialize ProductionHardeningLayer", error=str(e), error_type=type(e).__name__)
             self.hardening = None
+
+        # ===== HOT CONFIG RELOAD =====
+        # Active config lives in an immutable snapshot; the watcher stages a new one
+        # between ticks when config.yaml / safety.yaml change (see config_reload.py).
+        self.config_snapshot = ConfigSnapshot.build(
+            config,
+            self.hardening.safety_config if self.hardening else {"safety": {}},
+        )
+        logger.info(
+            "CONFIG_SNAPSHOT_ACTIVE",
+            config_hash=self.config_snapshot.config_hash,
+            policy_hash=self.config_snapshot.policy_hash,
+            hot_reload_enabled=config.system.config_hot_reload_enabled,
+        )
+        self._config_watcher: Optional[ConfigWatcher] = None
+        if config.system.config_hot_reload_enabled:
+            self._config_watcher = ConfigWatcher(
+                config_path,
+                compatibility_check=(
+                    self.hardening.validate_config_safety_compatibility if self.hardening else None
+                ),
+            )
         
         # ===== DATA SANITY GATE + QUALITY TRACKER =====
         try:
@@ -510,6 +546,66 @@ class LiveTrading:
                    state_machine_v2=self.use_state_machine_v2,
                    hardening_enabled=self.hardening is not None)
 
+    async def _run_startup_loads(self) -> None:
+        """
+        Startup loads that touch neither the exchange account nor the position
+        registry, so they can overlap the sync/reconcile phases.
+        """
+        symbols = self._market_symbols()
+
+        async def _specs():
+            registry = getattr(self, "instrument_spec_registry", None)
+            if registry is None:
+                return
+            with self._startup_sm.step("spec_registry_load"):
+                try:
+                    await registry.refresh()
+                except (OperationalError, DataError, OSError) as e:
+                    logger.warning("Startup spec registry load failed", error=str(e), error_type=type(e).__name__)
+
+        async def _candles():
+            logger.info("Loading candles from database...")
+            with self._startup_sm.step("candle_hydration"):
+                try:
+                    await self.candle_manager.initialize(symbols)
+                except (OperationalError, DataError) as e:
+                    logger.error("Failed to hydrate candles", error=str(e), error_type=type(e).__name__)
+
+        async def _traces():
+            # Ensure all monitored coins have DECISION_TRACE (dashboard coverage)
+            with self._startup_sm.step("trace_coverage"):
+                try:
+                    await ensure_all_coins_have_traces(symbols)
+                except (OperationalError, DataError, OSError) as e:
+                    logger.error("Startup trace validation failed", error=str(e), error_type=type(e).__name__)
+
+        async def _ledger():
+            ledger = getattr(self, "_trade_ledger", None)
+            if ledger is None:
+                return
+            with self._startup_sm.step("trade_ledger_hydration"):
+                try:
+                    await ledger.resync()
+                except (OperationalError, DataError, OSError) as e:
+                    # Unhydrated ledger: window queries keep going to the DB.
+                    logger.warning("Trade ledger hydration failed", error=str(e), error_type=type(e).__name__)
+
+        async def _performance():
+            read_model = getattr(self, "_read_model", None)
+            if read_model is None:
+                return
+            with self._startup_sm.step("performance_read_model"):
+                try:
+                    since = datetime.now(timezone.utc) - read_model.performance.window
+                    from src.storage.repository import get_trades_since
+
+                    read_model.performance.hydrate(await asyncio.to_thread(get_trades_since, since))
+                except (OperationalError, DataError, OSError) as e:
+                    # Unhydrated: /trades and /perf keep querying the DB.
+                    logger.warning("Performance read model hydration failed", error=str(e), error_type=type(e).__name__)
+
+        await asyncio.gather(_specs(), _candles(), _traces(), _ledger(), _performance())
+
     def _market_symbols(self) -> List[str]:
         """Return filtered spot symbols -- delegates to coin_processor module."""
         from src.live.coin_processor import market_symbols
@@ -601,11 +697,18 @@ class LiveTrading:
                 universe_size=len(self._market_symbols()),
             )
 
-            # 1.6 Startup: ensure all monitored coins have DECISION_TRACE (dashboard coverage)
-            try:
-                await ensure_all_coins_have_traces(self._market_symbols())
-            except (OperationalError, DataError, OSError) as e:
-                logger.error("Startup trace validation failed", error=str(e), error_type=type(e).__name__)
+            # 1.6 Independent startup loads (instrument specs, candle history from DB,
+            # DECISION_TRACE coverage) run concurrently with the exchange sync and
+            # reconciliation below; awaited at step 3.
+            if self.config.data.trade_ledger_enabled:
+                self._trade_ledger = init_trade_ledger(
+                    retention_hours=self.config.data.trade_ledger_retention_hours,
+                    resync_interval_seconds=self.config.data.trade_ledger_resync_seconds,
+                )
+            self._read_model = init_read_model(
+                performance_window_days=self.config.monitoring.read_model_performance_window_days,
+            )
+            self._startup_loads_task = asyncio.create_task(self._run_startup_loads())
 
             # ===== PHASE: INITIALIZING → SYNCING =====
             self._startup_sm.advance_to(StartupPhase.SYNCING, reason="client initialized, market discovered")
@@ -616,9 +719,10 @@ class LiveTrading:
             else:
                 # Sync Account
                 try:
-                    await self._sync_account_state()
-                    await self._sync_positions()
-                    await self.executor.sync_open_orders()
+                    with self._startup_sm.step("exchange_sync"):
+                        await self._sync_account_state()
+                        await self._sync_positions()
+                        await self.executor.sync_open_orders()
                 except (OperationalError, DataError) as e:
                     logger.error("Initial sync failed", error=str(e), error_type=type(e).__name__)
                     if not self.config.system.dry_run:
@@ -628,9 +732,10 @@ class LiveTrading:
             if self.use_state_machine_v2 and self.execution_gateway:
                 try:
                     logger.info("Starting Position State Machine V2 recovery...")
-                    await self.execution_gateway.startup()
+                    with self._startup_sm.step("position_recovery"):
+                        await self.execution_gateway.startup()
                     logger.info("Position State Machine V2 recovery complete",
-                               active_positions=len(self.position_registry.get_all_active()) if self.position_registry else 0)
+                               active_positions=len(self.position_registry.snapshot().active()) if self.position_registry else 0)
                 except (OperationalError, DataError) as e:
                     logger.error("Position State Machine V2 startup failed", error=str(e), error_type=type(e).__name__)
 
@@ -657,7 +762,8 @@ class LiveTrading:
                             ),
                         )
                         logger.critical("Running startup takeover (V2)...")
-                        stats = await takeover.execute_takeover()
+                        with self._startup_sm.step("takeover"):
+                            stats = await takeover.execute_takeover()
                         logger.critical("Startup takeover complete", **stats)
                         self.last_recon_time = datetime.now(timezone.utc)
                     except (OperationalError, DataError) as ex:
@@ -734,6 +840,38 @@ class LiveTrading:
             except (ValueError, TypeError, RuntimeError) as e:
                 logger.error("Failed to start spec refresh task", error=str(e), error_type=type(e).__name__)
 
+            # 2.6c.5 Order book depth cache refresh (keeps watched symbols warm)
+            if getattr(self, "orderbook_cache", None) is not None:
+                try:
+                    self._orderbook_refresh_task = asyncio.create_task(
+                        self.orderbook_cache.run(
+                            interval_seconds=self.config.data.orderbook_refresh_seconds
+                        )
+                    )
+                    logger.info(
+                        "Order book depth cache started",
+                        interval=self.config.data.orderbook_refresh_seconds,
+                    )
+                except (ValueError, TypeError, RuntimeError) as e:
+                    logger.error("Failed to start order book refresh task", error=str(e), error_type=type(e).__name__)
+
+            # 2.6c.6 Memory monitor (tracked cache sizes, tracemalloc diffs, RSS dumps)
+            if self.config.monitoring.memory_monitor_enabled:
+                try:
+                    self._register_memory_tracked()
+                    mon = self.config.monitoring
+                    profiler = init_memory_profiler(
+                        tracemalloc_frames=mon.memory_tracemalloc_frames,
+                        rss_dump_threshold_mb=mon.memory_rss_dump_threshold_mb,
+                        dump_dir=mon.memory_dump_dir,
+                    )
+                    self._memory_monitor_task = asyncio.create_task(
+                        profiler.run(interval_seconds=mon.memory_sample_interval_seconds)
+                    )
+                    logger.info("Memory monitor started", interval=mon.memory_sample_interval_seconds)
+                except (ValueError, TypeError, RuntimeError) as e:
+                    logger.error("Failed to start memory monitor", error=str(e), error_type=type(e).__name__)
+
             # 2.6d Runtime regression monitors (trade starvation + winner churn)
             try:
                 self._starvation_monitor_task = asyncio.create_task(
@@ -772,13 +910,8 @@ class LiveTrading:
             except (ValueError, TypeError, RuntimeError) as e:
                 logger.error("Failed to start Telegram command handler", error=str(e), error_type=type(e).__name__)
 
-            # 3. Fast Startup - Load candles
-            logger.info("Loading candles from database...")
-            try:
-                # 3. Fast Startup - Load candles via Manager
-                await self.candle_manager.initialize(self._market_symbols())
-            except (OperationalError, DataError) as e:
-                logger.error("Failed to hydrate candles", error=str(e), error_type=type(e).__name__)
+            # 3. Fast Startup - candles were loaded by the concurrent startup loads (1.6)
+            await self._startup_loads_task
 
             # 3.5 Start WebSocket candle feed AFTER DB hydration
             try:
@@ -872,6 +1005,8 @@ class LiveTrading:
                         await self._update_market_universe()
                         self.last_discovery_time = now
                 
+                self._poll_config_reload()
+
                 loop_start = datetime.now(timezone.utc)
                 cycle_id = f"tick_{loop_count}_{int(loop_start.timestamp())}"
 
@@ -910,9 +1045,10 @@ class LiveTrading:
                 # P0.4: Write heartbeat file after each successful tick
                 self._write_heartbeat()
                 now = datetime.now(timezone.utc)
+                last_tick_gauge().set(now.timestamp())
                 if (now - self.last_metrics_emit).total_seconds() >= 60.0:
                     try:
-                        record_metrics_snapshot({
+                        snapshot = {
                             "last_tick_at": now.isoformat(),
                             "ticks_last_min": self.ticks_since_emit,
                             "signals_last_min": self.signals_since_emit,
@@ -922,7 +1058,9 @@ class LiveTrading:
                             "orders_per_minute": self.execution_gateway._order_rate_limiter.orders_last_minute,
                             "orders_per_10s": self.execution_gateway._order_rate_limiter.orders_last_10s,
                             "orders_blocked_total": self.execution_gateway._order_rate_limiter.orders_blocked_total,
-                        })
+                        }
+                        set_snapshot_gauges(snapshot)
+                        record_metrics_snapshot(snapshot)
                         self.last_metrics_emit = now
                         self.ticks_since_emit = 0
                         self.signals_since_emit = 0
@@ -968,7 +1106,7 @@ class LiveTrading:
                 try:
                     positions_count = 0
                     if self.use_state_machine_v2 and self.execution_gateway:
-                        positions_count = len(self.execution_gateway.registry.get_all_active())
+                        positions_count = len(self.execution_gateway.registry.snapshot().active())
                     elif self.position_manager_v2:
                         positions_count = len(self.position_manager_v2.get_all_positions())
                     
@@ -1008,10 +1146,14 @@ class LiveTrading:
                     # Bug in summary logic — log but don't crash the loop for it
                     logger.error("CYCLE_SUMMARY_BUG", error=str(summary_err), error_type=type(summary_err).__name__)
 
-                # Dynamic sleep to align with 1m intervals
-                elapsed = cycle_elapsed
-                sleep_time = max(5.0, 60.0 - elapsed)
-                await asyncio.sleep(sleep_time)
+                if self._bar_scheduler is not None:
+                    # Sleep until the next bar close (analysis) or management tick
+                    self._current_wake = await self._bar_scheduler.wait()
+                else:
+                    # Dynamic sleep to align with 1m intervals
+                    elapsed = cycle_elapsed
+                    sleep_time = max(5.0, 60.0 - elapsed)
+                    await asyncio.sleep(sleep_time)
             
             # Smoke mode summary
             if is_smoke_mode:
@@ -1035,6 +1177,15 @@ class LiveTrading:
             raise
         finally:
             self.active = False
+            if getattr(self, "_startup_loads_task", None) and not self._startup_loads_task.done():
+                self._startup_loads_task.cancel()
+                try:
+                    await self._startup_loads_task
+                except asyncio.CancelledError:
+                    pass
+            if self._maintenance_task and not self._maintenance_task.done():
+                # The worker thread finishes its current statement on its own.
+                self._maintenance_task.cancel()
             if getattr(self, "_protection_monitor", None):
                 self._protection_monitor.stop()
             if getattr(self, "_protection_task", None) and not self._protection_task.done():
@@ -1067,6 +1218,23 @@ class LiveTrading:
                     await self._spec_refresh_task
                 except asyncio.CancelledError:
                     pass
+            if getattr(self, "orderbook_cache", None) is not None:
+                self.orderbook_cache.stop()
+            if getattr(self, "_orderbook_refresh_task", None) and not self._orderbook_refresh_task.done():
+                self._orderbook_refresh_task.cancel()
+                try:
+                    await self._orderbook_refresh_task
+                except asyncio.CancelledError:
+                    pass
+            profiler = get_memory_profiler()
+            if profiler is not None:
+                profiler.stop()
+            if getattr(self, "_memory_monitor_task", None) and not self._memory_monitor_task.done():
+                self._memory_monitor_task.cancel()
+                try:
+                    await self._memory_monitor_task
+                except asyncio.CancelledError:
+                    pass
             if getattr(self, "_ws_candle_feed", None):
                 await self._ws_candle_feed.stop()
             if getattr(self, "_ws_candle_task", None) and not self._ws_candle_task.done():
@@ -1148,10 +1316,14 @@ class LiveTrading:
                     registry._loaded_at = 0  # force refresh
                     await registry.refresh()
                     new_count = len(registry._by_raw)
+                    diff = getattr(registry, "last_diff", None)
                     logger.info(
                         "Periodic instrument spec refresh completed",
                         old_count=old_count,
                         new_count=new_count,
+                        added=len(diff.added) if diff else 0,
+                        removed=len(diff.removed) if diff else 0,
+                        changed=len(diff.changed) if diff else 0,
                     )
             except asyncio.CancelledError:
                 break
@@ -1171,6 +1343,7 @@ class LiveTrading:
             interval=15,
             max_retries=self.config.data.ws_reconnect_max_retries,
             backoff_base=self.config.data.ws_reconnect_backoff_seconds,
+            on_bar_close=self._bar_scheduler.notify_bar_close if getattr(self, "_bar_scheduler", None) else None,
         )
         await self._ws_candle_feed.run()
 
@@ -1184,6 +1357,42 @@ class LiveTrading:
         from src.live.health_monitor import run_winner_churn_monitor
         await run_winner_churn_monitor(self, interval_seconds)
 
+    def _register_memory_tracked(self) -> None:
+        """Register long-lived caches/buffers with the memory registry."""
+        from src.monitoring.decision_audit import get_decision_audit_logger
+
+        reg = get_memory_registry()
+        reg.register("smc.indicator_cache", self.smc_engine, "indicator_cache")
+        reg.register("smc.signal_fingerprint_last_seen", self.smc_engine, "_signal_fingerprint_last_seen")
+        reg.register("cycle_guard.processed_candle_timestamps", get_cycle_guard(), "_processed_candle_timestamps")
+        reg.register("decision_audit.buffer", get_decision_audit_logger(), "_buffer")
+        reg.register("live.last_no_spec_log", self, "_last_no_spec_log")
+        reg.register("live.last_trace_log", self, "last_trace_log")
+        reg.register("live.signal_cooldown", self, "_signal_cooldown")
+        for tf in ("15m", "1h", "4h", "1d"):
+            reg.register_callable(
+                f"candles.{tf}", lambda tf=tf: self.candle_manager.candles.get(tf)
+            )
+        fetcher = getattr(self.candle_manager, "ohlcv_fetcher", None)
+        if fetcher is not None:
+            for attr in ("_failure_count", "_cooldown_until", "_cooldown_logged"):
+                reg.register(f"ohlcv_fetcher.{attr.lstrip('_')}", fetcher, attr)
+        if getattr(self, "position_registry", None) is not None:
+            reg.register("position_registry.closed_positions", self.position_registry, "_closed_positions")
+        if getattr(self, "orderbook_cache", None) is not None:
+            reg.register("orderbook_cache.books", self.orderbook_cache, "_books")
+        if getattr(self, "_analysis_cache", None) is not None:
+            reg.register("analysis_cache.entries", self._analysis_cache, "_entries")
+        if getattr(self, "_trade_ledger", None) is not None:
+            reg.register("trade_ledger.trade_ids", self._trade_ledger, "_ids")
+        if getattr(self, "_read_model", None) is not None:
+            reg.register("read_model.decisions", self._read_model.decisions, "_recent")
+            reg.register("read_model.decision_symbols", self._read_model.decisions, "_by_symbol")
+            reg.register("read_model.trades", self._read_model.performance, "_trades")
+        if getattr(self, "instrument_spec_registry", None) is not None:
+            reg.register("instrument_specs.aliases", self.instrument_spec_registry, "_aliases")
+            reg.register("instrument_specs.memo", self.instrument_spec_registry, "_memo")
+
     async def _run_trade_recording_monitor(self, interval_seconds: int = 300) -> None:
         """Trade recording invariant monitor -- delegates to health_monitor module."""
         from src.live.health_monitor import run_trade_recording_monitor
@@ -1230,7 +1439,20 @@ class LiveTrading:
         """
         Single iteration of live trading logic.
         Optimized for batch processing (Phase 10).
+        
+        Stage timings are recorded by the CycleGuard profiler: laps at each
+        numbered section below, nested spans per symbol inside process_coin.
         """
+        profiler = get_cycle_guard().profiler
+        profiler.begin()
+        try:
+            await self._tick_stages(profiler)
+        finally:
+            # No-op when post_tick_cleanup() already ended the cycle
+            profiler.finish()
+
+    async def _tick_stages(self, profiler):
+        """Body of _tick (see there)."""
         # Gate: no tick before READY (P0.1 invariant)
         if not self._startup_sm.is_ready:
             raise InvariantError(
@@ -1239,6 +1461,7 @@ class LiveTrading:
             )
 
         # 0. Kill Switch Check (HIGHEST PRIORITY)
+        profiler.lap("kill_switch")
         # P0.3: SAFE_HOLD semantics — kill switch active does NOT auto-flatten.
         # Only emergency=True activation (via KillSwitch.activate(emergency=True))
         # triggers position closure. That path runs inside activate() itself.
@@ -1327,6 +1550,7 @@ class LiveTrading:
             return
         
         # 0.1 Order Timeout Monitoring (CRITICAL: Check first)
+        profiler.lap("order_timeouts")
         try:
             cancelled_count = await self.executor.check_order_timeouts()
             if cancelled_count > 0:
@@ -1335,11 +1559,13 @@ class LiveTrading:
             logger.error("Failed to check order timeouts", error=str(e), error_type=type(e).__name__)
         
         # 1. Check Data Health
+        profiler.lap("data_health")
         if not self.data_acq.is_healthy():
             logger.error("Data acquisition unhealthy")
             return
 
         # 2. Sync Active Positions (Global Sync)
+        profiler.lap("sync_positions")
         # Phase 2 Fix: Pass positions to _sync_positions to avoid duplicate API call
         try:
             # This updates global state in Repository and internal trackers
@@ -1352,8 +1578,12 @@ class LiveTrading:
         except (OperationalError, DataError) as e:
             logger.error("Failed to sync positions", error=str(e), error_type=type(e).__name__)
             return
+        read_model = getattr(self, "_read_model", None)
+        if read_model is not None:
+            read_model.status.update_positions(all_raw_positions)
 
         # 2.1 PRODUCTION HARDENING V2: Pre-tick Invariant Check
+        profiler.lap("pre_tick_check")
         # This checks all hard limits (drawdown, positions, margin) and halts if violated
         # Uses HardeningDecision enum for explicit state handling
         if self.hardening:
@@ -1364,6 +1594,7 @@ class LiveTrading:
                 available_margin = Decimal(str(account_info.get("availableMargin", 0)))
                 margin_used = Decimal(str(account_info.get("marginUsed", 0)))
                 margin_util = margin_used / current_equity if current_equity > 0 else Decimal("0")
+                record_status_account(self, current_equity, margin_used)
                 
                 # Convert raw positions to Position objects for check
                 position_objs = [self._convert_to_position(p) for p in all_raw_positions if p.get('size', 0) != 0]
@@ -1410,6 +1641,7 @@ class LiveTrading:
                 return
 
         # 2.5. Cleanup orphan reduce-only orders (SL/TP orders for closed positions)
+        profiler.lap("orphan_order_cleanup")
         try:
             await self._cleanup_orphan_reduce_only_orders(all_raw_positions)
         except (OperationalError, DataError) as e:
@@ -1417,6 +1649,7 @@ class LiveTrading:
             # Don't return - continue with trading loop
 
         # 3. Batch Data Fetching (Optimization)
+        profiler.lap("fetch_tickers")
         try:
             import time
             _t0 = time.perf_counter()
@@ -1459,16 +1692,21 @@ class LiveTrading:
             self.last_fetch_latency_ms = round((_t1 - _t0) * 1000)
             map_positions = {p["symbol"]: p for p in all_raw_positions}
             recent_close_by_symbol: Dict[str, Dict[str, Any]] = {}
+            ledger = getattr(self, "_trade_ledger", None)
+            if ledger is not None:
+                try:
+                    await ledger.maybe_resync()
+                except (OperationalError, DataError) as e:
+                    logger.warning("Trade ledger resync failed", error=str(e), error_type=type(e).__name__)
             if bool(getattr(self.config.strategy, "signal_post_close_cooldown_enabled", True)):
                 close_lookback_hours = int(
                     getattr(self.config.strategy, "signal_post_close_lookback_hours", 24)
                 )
                 try:
-                    recent_trades = await asyncio.to_thread(
-                        get_trades_since,
-                        datetime.now(timezone.utc) - timedelta(hours=close_lookback_hours),
+                    closed_trades = await recent_trades(
+                        datetime.now(timezone.utc) - timedelta(hours=close_lookback_hours)
                     )
-                    for trade in recent_trades:
+                    for trade in closed_trades:
                         symbol_key = _normalize_symbol_key(getattr(trade, "symbol", ""))
                         if not symbol_key:
                             continue
@@ -1502,6 +1740,8 @@ class LiveTrading:
             self.executor.latest_futures_tickers = map_futures_tickers
             # Update adapter cache for use when futures_tickers not explicitly passed
             self.futures_adapter.update_cached_futures_tickers(map_futures_tickers)
+            if read_model is not None:
+                read_model.status.update_marks(map_futures_tickers)
             
             # Ensure instrument specs are loaded (used to decide tradability and size/leverage rules).
             # This is TTL-cached; refresh() is a cheap no-op when not stale.
@@ -1690,6 +1930,7 @@ class LiveTrading:
                             )
             
             # 2.4. Fetch open orders once, index by *normalized* symbol (for position hydration)
+            profiler.lap("open_orders")
             # This is critical because positions are PF_* while CCXT orders often use unified symbols (e.g. X/USD:USD).
             from src.data.symbol_utils import normalize_symbol_for_position_match
             orders_by_symbol: Dict[str, List[Dict]] = {}
@@ -1721,6 +1962,7 @@ class LiveTrading:
                 logger.warning("Failed to fetch open orders for hydration", error=str(e), error_type=type(e).__name__)
             
             # 2.5. TP Backfill / Reconciliation (after position sync and price data fetch)
+            profiler.lap("tp_backfill")
             try:
                 # Build current prices map for backfill logic (use futures ticker data)
                 current_prices_map = {}
@@ -1746,17 +1988,20 @@ class LiveTrading:
             except (OperationalError, DataError, ValueError) as e:
                 logger.exception("TP backfill reconciliation failed", error=str(e), error_type=type(e).__name__)
                 # Don't return - continue with trading loop
-            symbols_with_spot = len([s for s in market_symbols if s in map_spot_tickers])
-            # Use futures_tickers for accurate coverage counting
-            symbols_with_futures = len([
-                s for s in market_symbols
-                if self.futures_adapter.map_spot_to_futures(s, futures_tickers=map_futures_tickers) in map_futures_tickers
-            ])
-            symbols_with_neither = len([
-                s for s in market_symbols
-                if s not in map_spot_tickers
-                and self.futures_adapter.map_spot_to_futures(s, futures_tickers=map_futures_tickers) not in map_futures_tickers
-            ])
+            # 3.9 Universe resolution: map every symbol once against this tick's
+            # ticker snapshot (futures symbol, ticker presence, spec availability).
+            with profiler.stage("universe_resolution"):
+                universe = resolve_universe(
+                    market_symbols,
+                    map_spot_tickers,
+                    map_futures_tickers,
+                    self.futures_adapter,
+                    getattr(self, "instrument_spec_registry", None),
+                )
+            self._universe = universe
+            symbols_with_spot = universe.with_spot
+            symbols_with_futures = universe.with_futures
+            symbols_with_neither = universe.with_neither
             self._last_ticker_with = symbols_with_spot
             self._last_ticker_without = len(market_symbols) - symbols_with_spot
             self._last_futures_count = symbols_with_futures
@@ -1777,6 +2022,7 @@ class LiveTrading:
             return
 
         # 4. Parallel Analysis Loop
+        profiler.lap("analysis")
         # Semaphore to control concurrency for candle fetching.
         # Most time is I/O-bound (waiting on Kraken API), so higher concurrency is safe.
         sem = asyncio.Semaphore(50)
@@ -1787,6 +2033,7 @@ class LiveTrading:
             "symbols_skipped_by_reason": {},
             "setups_found": 0,
             "signals_scored": 0,
+            "signals_cached": 0,
             "signals_above_threshold": 0,
             "signals_generated": 0,
             "suppress_in_position": 0,
@@ -1803,24 +2050,31 @@ class LiveTrading:
             skips = analysis_funnel.setdefault("symbols_skipped_by_reason", {})
             skips[reason] = int(skips.get(reason, 0) or 0) + 1
         
+        wake = getattr(self, "_current_wake", None)
+        analysis_due = wake is None or wake.is_analysis
+        analysis_cache = getattr(self, "_analysis_cache", None)
+        strategy_cfg_hash = analysis_config_hash(self.config.strategy) if analysis_cache is not None else ""
+
         async def process_coin(spot_symbol: str):
             async with sem:
                 try:
                     _af_inc("symbols_analyzed")
-                    # Use futures tickers for improved mapping
-                    futures_symbol = self.futures_adapter.map_spot_to_futures(spot_symbol, futures_tickers=map_futures_tickers)
-                    has_spot = spot_symbol in map_spot_tickers
-                    has_futures = futures_symbol in map_futures_tickers
+                    # Resolved once per tick in the universe-resolution stage
+                    resolved = universe.get(spot_symbol)
+                    if resolved is None:
+                        _af_skip("unresolved_symbol")
+                        return
+                    futures_symbol = resolved.futures_symbol
+                    has_spot = resolved.has_spot
+                    has_futures = resolved.has_futures
                     
                     # Debug: Log when futures symbol not found
-                    if not has_futures and spot_symbol in map_spot_tickers:
-                        # Check if similar futures symbols exist
-                        similar = [s for s in map_futures_tickers.keys() if spot_symbol.split('/')[0].upper() in s.upper()][:3]
+                    if not has_futures and has_spot and debug_enabled(__name__):
                         logger.debug(
                             "Futures symbol not found for signal",
                             spot_symbol=spot_symbol,
                             mapped_futures=futures_symbol,
-                            similar_futures=similar,
+                            similar_futures=universe.similar_futures(spot_symbol),
                             total_futures_available=len(map_futures_tickers)
                         )
                     
@@ -1845,12 +2099,7 @@ class LiveTrading:
                     # Tradability gate:
                     # - Must have a futures ticker
                     # - Must have an instrument spec (otherwise execution will fail with NO_SPEC)
-                    has_spec = True
-                    if has_futures and getattr(self, "instrument_spec_registry", None):
-                        try:
-                            has_spec = self.instrument_spec_registry.get_spec(futures_symbol) is not None
-                        except (ValueError, TypeError, KeyError, AttributeError):
-                            has_spec = False
+                    has_spec = resolved.has_spec
                     
                     skip_reason: Optional[str] = None
                     if not has_futures:
@@ -1897,8 +2146,11 @@ class LiveTrading:
                             )
                             return
 
-                    # Update Candles (spot first; futures fallback when spot unavailable)
-                    await self._update_candles(spot_symbol)
+                    # Update Candles (spot first; futures fallback when spot unavailable).
+                    # Management-only wakes skip candle I/O and signal generation.
+                    if analysis_due:
+                        with profiler.stage("update_candles", symbol=spot_symbol):
+                            await self._update_candles(spot_symbol)
                     
                     # Position Management (V2 State Machine)
                     position_data = map_positions.get(futures_symbol)
@@ -1929,7 +2181,11 @@ class LiveTrading:
                                 error_type=type(e).__name__,
                             )
                             raise
-                            
+
+                    if not analysis_due:
+                        _af_skip("no_bar_close")
+                        return
+
                     # ShockGuard: Skip signal generation if entries paused
                     if self.shock_guard and self.shock_guard.should_pause_entries():
                         logger.debug(
@@ -2000,14 +2256,39 @@ class LiveTrading:
                     # 4H: Decision authority (OB/FVG/BOS, ATR for stops)
                     # 1H: Refinement (ADX, swing points)
                     # 15m: Refinement (entry timing)
-                    signal = self.smc_engine.generate_signal(
-                        symbol=spot_symbol,
-                        regime_candles_1d=self.candle_manager.get_candles(spot_symbol, "1d"),
-                        decision_candles_4h=self.candle_manager.get_candles(spot_symbol, "4h"),
-                        refine_candles_1h=self.candle_manager.get_candles(spot_symbol, "1h"),
-                        refine_candles_15m=candles,
-                    )
-                    _af_inc("signals_scored")
+                    signal_inputs = {
+                        "1d": self.candle_manager.get_candles(spot_symbol, "1d"),
+                        "4h": self.candle_manager.get_candles(spot_symbol, "4h"),
+                        "1h": self.candle_manager.get_candles(spot_symbol, "1h"),
+                        "15m": candles,
+                    }
+                    signal = None
+                    fingerprint = None
+                    if analysis_cache is not None:
+                        fingerprint = analysis_cache.fingerprint(
+                            signal_inputs,
+                            position_side=(position_data.get("side") or "unknown") if position_data else None,
+                            cfg_hash=strategy_cfg_hash,
+                        )
+                        signal = analysis_cache.lookup(spot_symbol, fingerprint)
+                    if signal is not None:
+                        # No closed bar changed: skip the engine but keep thesis conviction current.
+                        self.smc_engine.refresh_thesis_conviction(
+                            spot_symbol, signal_inputs["4h"], signal_inputs["1h"]
+                        )
+                        _af_inc("signals_cached")
+                    else:
+                        with profiler.stage("generate_signal", symbol=spot_symbol):
+                            signal = self.smc_engine.generate_signal(
+                                symbol=spot_symbol,
+                                regime_candles_1d=signal_inputs["1d"],
+                                decision_candles_4h=signal_inputs["4h"],
+                                refine_candles_1h=signal_inputs["1h"],
+                                refine_candles_15m=candles,
+                            )
+                        if fingerprint is not None:
+                            analysis_cache.store(spot_symbol, fingerprint, signal)
+                        _af_inc("signals_scored")
                     if signal.signal_type != SignalType.NO_SIGNAL:
                         _af_inc("setups_found")
                         _af_inc("signals_above_threshold")
@@ -2140,6 +2421,8 @@ class LiveTrading:
                             # Collect signal for auction mode (if enabled)
                             if self.auction_allocator and is_tradable:
                                 self.auction_signals_this_tick.append((signal, spot_price, mark_price))
+                                if getattr(self, "orderbook_cache", None) is not None:
+                                    self.orderbook_cache.watch(futures_symbol)
                                 _af_inc("signals_generated")
                         
                             if not is_tradable:
@@ -2216,6 +2499,9 @@ class LiveTrading:
                                 timestamp=now
                             )
                             self.last_trace_log[spot_symbol] = now
+                            read_model = getattr(self, "_read_model", None)
+                            if read_model is not None:
+                                read_model.decisions.record(spot_symbol, trace_details, now)
                         except (OperationalError, DataError, OSError) as e:
                             logger.error("Failed to record decision trace", symbol=spot_symbol, error=str(e), error_type=type(e).__name__)
 
@@ -2246,7 +2532,12 @@ class LiveTrading:
         self._analysis_funnel_metrics = analysis_funnel
         
         # Run auction mode allocation (if enabled) - after all signals processed
-        if self.auction_allocator:
+        profiler.lap("auction")
+        if self.auction_allocator and not analysis_due:
+            # No fresh signals on a management tick; allocating now would treat
+            # every open position as signal-less.
+            logger.debug("Auction: Skipped (management tick)")
+        elif self.auction_allocator:
             signals_count = len(self.auction_signals_this_tick)
             logger.info("AUCTION_START", signals_collected=signals_count)
             logger.info(
@@ -2304,20 +2595,20 @@ class LiveTrading:
                 logger.error("Failed to log status summary", error=str(e), error_type=type(e).__name__)
         
         # 4.5 CRITICAL: Validate all positions have stop loss protection
+        profiler.lap("protection")
         # Legacy validation removed - using new _validate_position_protection after initial tick
         
         # 5. Account Sync (Throttled) - Moved to step 2 to prevent duplicate calls
         # Reference: _sync_positions call in Step 2 handles global state update
             
         # 7. Operational Maintenance (Daily)
+        profiler.lap("maintenance")
         now = datetime.now(timezone.utc)
         if (now - self.last_maintenance_run).total_seconds() > 86400: # 24 hours
-            try:
-                results = self.db_pruner.run_maintenance()
-                logger.info("Daily database maintenance complete", results=results)
+            if self._maintenance_task is None or self._maintenance_task.done():
+                # Advanced up front: a failed run is retried tomorrow, not every tick.
                 self.last_maintenance_run = now
-            except (OperationalError, DataError, OSError) as e:
-                logger.error("Daily maintenance failed", error=str(e), error_type=type(e).__name__)
+                self._maintenance_task = asyncio.create_task(self._run_db_maintenance())
 
         # 8. Periodic data maintenance (hourly): stale/missing trace recovery
         if (now - self.last_data_maintenance).total_seconds() > 3600:
@@ -2328,6 +2619,7 @@ class LiveTrading:
                 logger.error("Periodic data maintenance failed", error=str(e), error_type=type(e).__name__)
 
         # 9. PRODUCTION HARDENING V2: Post-tick Cleanup
+        profiler.lap("post_tick")
         # CRITICAL: This must always run, even on exceptions
         # The post_tick_cleanup() method internally uses try/finally to ensure lock release
         if self.hardening:
@@ -2335,6 +2627,18 @@ class LiveTrading:
 
     # _background_hydration_task removed (Replaced by CandleManager.initialize)
 
+    def _poll_config_reload(self) -> None:
+        """Apply a pending config.yaml / safety.yaml change between ticks (no-op if unchanged)."""
+        if self._config_watcher is None:
+            return
+        try:
+            reload = self._config_watcher.poll(self.config_snapshot)
+            if reload is not None:
+                apply_config_reload(self, reload)
+        except Exception as e:
+            # Never let a bad reload take the loop down; the previous snapshot stays active.
+            logger.error("Config hot reload failed", error=str(e), error_type=type(e).__name__)
+
     # ===== AUTO HALT RECOVERY =====
     _AUTO_RECOVERY_MAX_PER_DAY = 2
     _AUTO_RECOVERY_COOLDOWN_SECONDS = 300  # 5 minutes since halt
@@ -2345,6 +2649,14 @@ class LiveTrading:
         from src.live.health_monitor import try_auto_recovery
         return await try_auto_recovery(self)
 
+    async def _run_db_maintenance(self) -> None:
+        """Daily DB maintenance in a worker thread, so DDL/backfills never block ticks or monitors."""
+        try:
+            results = await asyncio.to_thread(self.db_pruner.run_maintenance)
+            logger.info("Daily database maintenance complete", results=results)
+        except (OperationalError, DataError, OSError) as e:
+            logger.error("Daily maintenance failed", error=str(e), error_type=type(e).__name__)
+
     async def _sync_account_state(self):
         """Fetch and persist real-time account state -- delegates to exchange_sync module."""
         from src.live.exchange_sync import sync_account_state
@@ -2454,6 +2766,11 @@ class LiveTrading:
         except OSError as e:
             logger.debug("Failed to write heartbeat", error=str(e))
 
+        read_model = getattr(self, "_read_model", None)
+        persist_path = self.config.monitoring.read_model_persist_path
+        if read_model is not None and persist_path:
+            read_model.save(persist_path)
+
     async def _on_trade_recorded(self, position, trade) -> None:
         """
         Callback fired by ExecutionGateway after a trade is recorded.
@@ -2462,6 +2779,10 @@ class LiveTrading:
         This replaces the old save_trade_history() risk manager update path
         that was orphaned when V2 moved to trade_recorder.
         """
+        # The trade ledger is fed by repository.save_trade for every writer.
+        read_model = getattr(self, "_read_model", None)
+        if read_model is not None and trade is not None:
+            read_model.performance.record(trade)
         try:
             from src.execution.equity import calculate_effective_equity
             
@@ -2478,9 +2799,11 @@ class LiveTrading:
             # Get current equity for risk manager
             balance = await self.client.get_futures_balance()
             base = getattr(self.config.exchange, "base_currency", "USD")
-            equity_now, _, _ = await calculate_effective_equity(
+            equity_now, _, margin_used_now = await calculate_effective_equity(
                 balance, base_currency=base, kraken_client=self.client
             )
+            if read_model is not None:
+                read_model.status.update_account(equity_now, margin_used_now)
             self.risk_manager.record_trade_result(net_pnl, equity_now, setup_type)
             
             # Check if daily loss limit approached
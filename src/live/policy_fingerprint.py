@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 def build_auction_policy_snapshot(config: Any) -> Dict[str, Any]:
@@ -51,8 +51,8 @@ def build_auction_policy_snapshot(config: Any) -> Dict[str, Any]:
     }
 
 
-def hash_policy_snapshot(snapshot: Dict[str, Any]) -> str:
-    payload = json.dumps(snapshot, sort_keys=True, separators=(",", ":"))
+def hash_policy_snapshot(snapshot: Dict[str, Any], default: Optional[Callable[[Any], Any]] = None) -> str:
+    payload = json.dumps(snapshot, sort_keys=True, separators=(",", ":"), default=default)
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
 
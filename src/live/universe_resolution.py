@@ -0,0 +1,96 @@
+"""
+Per-tick universe resolution.
+
+Resolves every symbol of the tick's universe once against the ticker
+snapshot: spot -> futures symbol (``FuturesAdapter.map_spot_to_futures``,
+which applies the market-discovery overrides), spot/futures ticker
+presence and instrument-spec availability. A base -> futures-ticker-keys
+index of the snapshot replaces per-symbol scans over all ticker keys.
+
+``process_coin`` and the ticker-coverage log read the resolved records
+instead of re-mapping each symbol (previously up to three times per symbol
+per tick).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from src.data.symbol_utils import normalize_to_base
+from src.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ResolvedSymbol:
+    """Tick-scoped facts about one universe symbol."""
+    spot_symbol: str
+    futures_symbol: str
+    base: str
+    has_spot: bool
+    has_futures: bool
+    has_spec: bool
+
+
+@dataclass
+class UniverseResolution:
+    records: Dict[str, ResolvedSymbol] = field(default_factory=dict)
+    # normalized base (XBT -> BTC) -> futures ticker keys carrying it
+    futures_by_base: Dict[str, List[str]] = field(default_factory=dict)
+
+    def get(self, spot_symbol: str) -> Optional[ResolvedSymbol]:
+        return self.records.get(spot_symbol)
+
+    def similar_futures(self, spot_symbol: str, limit: int = 3) -> List[str]:
+        """Futures ticker keys sharing the spot symbol's base asset (diagnostics)."""
+        return self.futures_by_base.get(normalize_to_base(spot_symbol), [])[:limit]
+
+    @property
+    def with_spot(self) -> int:
+        return sum(1 for r in self.records.values() if r.has_spot)
+
+    @property
+    def with_futures(self) -> int:
+        return sum(1 for r in self.records.values() if r.has_futures)
+
+    @property
+    def with_neither(self) -> int:
+        return sum(1 for r in self.records.values() if not r.has_spot and not r.has_futures)
+
+
+def resolve_universe(
+    symbols: Iterable[str],
+    spot_tickers: Mapping[str, Any],
+    futures_tickers: Mapping[str, Any],
+    futures_adapter: Any,
+    spec_registry: Any = None,
+) -> UniverseResolution:
+    """Build the tick's resolution records from one ticker snapshot."""
+    futures_by_base: Dict[str, List[str]] = {}
+    for key in futures_tickers:
+        futures_by_base.setdefault(normalize_to_base(key), []).append(key)
+
+    records: Dict[str, ResolvedSymbol] = {}
+    for spot_symbol in symbols:
+        try:
+            futures_symbol = futures_adapter.map_spot_to_futures(spot_symbol, futures_tickers=futures_tickers)
+        except ValueError as e:
+            logger.warning("Universe resolution: unmappable symbol", symbol=spot_symbol, error=str(e))
+            futures_symbol = ""
+        has_futures = bool(futures_symbol) and futures_symbol in futures_tickers
+        has_spec = True
+        if has_futures and spec_registry is not None:
+            try:
+                has_spec = spec_registry.get_spec(futures_symbol) is not None
+            except (ValueError, TypeError, KeyError, AttributeError):
+                has_spec = False
+        records[spot_symbol] = ResolvedSymbol(
+            spot_symbol=spot_symbol,
+            futures_symbol=futures_symbol,
+            base=normalize_to_base(spot_symbol),
+            has_spot=spot_symbol in spot_tickers,
+            has_futures=has_futures,
+            has_spec=has_spec,
+        )
+    return UniverseResolution(records=records, futures_by_base=futures_by_base)
@@ -12,7 +12,6 @@ import os
 import asyncio
 from datetime import datetime, timezone
 from typing import Optional
-import aiohttp
 
 from src.exceptions import OperationalError
 from src.monitoring.logger import get_logger
@@ -129,6 +128,10 @@ async def send_alert(
     prefix = "🚨" if urgent else "📊"
     formatted = f"{prefix} [{event_type}] {timestamp}\n{message}"
     
+    # Imported here: aiohttp costs ~0.2s and CLI paths (kill-switch, status)
+    # import this module without ever sending.
+    import aiohttp
+
     try:
         async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
             if _is_telegram(webhook_url):
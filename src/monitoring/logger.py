@@ -2,16 +2,158 @@
 Structured logging setup for the trading system.
 
 Uses structlog for JSON-formatted context-aware logging with all required fields.
+
+Async mode (``async_mode=True``): the event loop thread only renders the
+event and enqueues it on a bounded queue; a ``QueueListener`` thread owns
+the stdout/file handlers, so tick latency no longer depends on disk or
+stdout throughput. When the queue is full the record is dropped and
+counted rather than blocking the caller.
 """
+import atexit
+import json
+import queue
 import structlog
 import logging
+import logging.handlers
 import sys
+import time
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 from src.monitoring.redaction import structlog_redaction_processor
 
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson (extra "perf")
+    orjson = None
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["NonBlockingQueueHandler"] = None
+
+
+def fast_json_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSON serializer for structlog's JSONRenderer (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
+
+
+_EXC_FORMATTER = logging.Formatter()
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops (and counts) records instead of blocking when full."""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
 
-def setup_logging(log_level: str = "INFO", log_format: str = "json", log_file: str | None = None) -> None:
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # structlog already rendered the message; skip re-formatting and
+        # drop args/exc_info so the record is cheap and safe to hand over.
+        # The traceback is kept as text (exc_text), which the listener's
+        # formatters append just as they would for a live exc_info.
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class EventRateLimiter:
+    """
+    structlog processor: at most ``max_events`` per ``window_seconds`` per event key.
+
+    The key is (logger, level, event, symbol) so per-symbol lines are limited
+    per symbol. ERROR and above are never limited. The first event after a
+    suppressed burst carries ``suppressed=<n>``.
+    """
+
+    EXEMPT_LEVELS = frozenset({"error", "critical", "exception"})
+
+    def __init__(self, max_events: int, window_seconds: float = 60.0, max_keys: int = 10_000):
+        self.max_events = max_events
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        # key -> [window_start, count_in_window, suppressed]
+        self._state: Dict[Tuple[Any, ...], list] = {}
+
+    def __call__(self, logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+        if self.max_events <= 0 or method_name in self.EXEMPT_LEVELS:
+            return event_dict
+        key = (
+            getattr(logger, "name", None),
+            method_name,
+            event_dict.get("event"),
+            event_dict.get("symbol"),
+        )
+        now = time.monotonic()
+        slot = self._state.get(key)
+        if slot is None:
+            if len(self._state) >= self.max_keys:
+                self._state.clear()
+            self._state[key] = [now, 1, 0]
+            return event_dict
+        if now - slot[0] >= self.window_seconds:
+            suppressed = slot[2]
+            slot[0], slot[1], slot[2] = now, 1, 0
+            if suppressed:
+                event_dict["suppressed"] = suppressed
+            return event_dict
+        if slot[1] >= self.max_events:
+            slot[2] += 1
+            raise structlog.DropEvent
+        slot[1] += 1
+        return event_dict
+
+
+def debug_enabled(name: Optional[str] = None) -> bool:
+    """True when DEBUG would be emitted; guard expensive debug-only arguments with this."""
+    return logging.getLogger(name).isEnabledFor(logging.DEBUG)
+
+
+def logging_stats() -> Dict[str, Any]:
+    """Queue depth / drop counters of the async pipeline (empty when synchronous)."""
+    if _queue_handler is None:
+        return {"async": False}
+    return {
+        "async": True,
+        "queue_depth": _queue_handler.queue.qsize(),
+        "dropped": _queue_handler.dropped,
+    }
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the async writer, handing its handlers back to the root logger."""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    _listener.stop()
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = None
+    _queue_handler = None
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    log_format: str = "json",
+    log_file: str | None = None,
+    *,
+    async_mode: bool = False,
+    queue_size: int = 10_000,
+    rate_limit_per_key: int = 0,
+    rate_limit_window_seconds: float = 60.0,
+) -> None:
     """
     Configure structured logging for the application.
     
@@ -19,8 +161,15 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json", log_file: s
         log_level: Logging level (DEBUG/INFO/WARNING/ERROR/CRITICAL)
         log_format: Format (json or text)
         log_file: Optional log file path
+        async_mode: Hand records to a background writer thread via a bounded queue
+        queue_size: Max queued records in async mode (excess is dropped and counted)
+        rate_limit_per_key: Max events per key per window (0 = unlimited)
+        rate_limit_window_seconds: Rate-limit window
     """
     import os
+
+    # Re-configuration: give handlers back before rebuilding
+    shutdown_logging()
     
     # Auto-detect log file from environment if not provided
     if log_file is None:
@@ -44,9 +193,13 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json", log_file: s
         stream=sys.stdout,
         level=getattr(logging, log_level.upper()),
     )
+    # basicConfig is a no-op when handlers already exist; the level must still apply
+    logging.getLogger().setLevel(getattr(logging, log_level.upper()))
     
-    # Configure structlog processors
+    # Configure structlog processors.
+    # filter_by_level runs first so suppressed levels cost no further processing.
     processors = [
+        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso", utc=True),
@@ -55,9 +208,11 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json", log_file: s
         structlog.processors.format_exc_info,
         structlog_redaction_processor,
     ]
+    if rate_limit_per_key > 0:
+        processors.insert(1, EventRateLimiter(rate_limit_per_key, rate_limit_window_seconds))
     
     if log_format == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=fast_json_dumps))
     else:
         # "text" or "plain": human-readable one line per event, no ANSI colors (good for files and tail)
         processors.append(structlog.dev.ConsoleRenderer(colors=False))
@@ -87,10 +242,37 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json", log_file: s
         
         # Add to root logger
         logging.root.addHandler(file_handler)
-        
+
+    if async_mode:
+        _start_async_writer(queue_size)
+
+    if log_file:
         # Log startup message to confirm dual output
         logger = get_logger(__name__)
-        logger.info("Logging initialized", log_file=str(log_file), log_level=log_level, log_format=log_format)
+        logger.info(
+            "Logging initialized",
+            log_file=str(log_file),
+            log_level=log_level,
+            log_format=log_format,
+            async_mode=async_mode,
+        )
+
+
+def _start_async_writer(queue_size: int) -> None:
+    """Move the root handlers behind a QueueListener thread."""
+    global _listener, _queue_handler
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    for handler in handlers:
+        root.removeHandler(handler)
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+atexit.register(shutdown_logging)
 
 
 def get_logger(name: str) -> structlog.BoundLogger:
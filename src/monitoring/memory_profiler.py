@@ -0,0 +1,312 @@
+"""
+Memory introspection for long-running workers.
+
+Three pieces:
+- ``MemoryRegistry``: caches and buffers register a getter; each report gives
+  the entry count and an approximate size (shallow container size plus a
+  sampled per-item estimate). Owners are held by weak reference so
+  registration never keeps an object alive.
+- ``MemoryProfiler``: periodic tracemalloc snapshots, diffed against the
+  previous one (top growth by allocation site), plus process RSS.
+- RSS threshold: when RSS crosses ``rss_dump_threshold_mb`` a JSON dump
+  (registry report + top allocation sites) is written, at most once per
+  ``dump_cooldown_seconds``.
+
+Reports are served at ``/api/debug/memory`` and exported as
+``trading_memory_*`` gauges.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.monitoring.logger import get_logger
+from src.monitoring.metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_bytes() -> int:
+    """Current resident set size (Linux /proc); falls back to peak RSS elsewhere."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def approx_size(container: Any, sample: int = 32) -> int:
+    """Shallow size of ``container`` plus a sampled estimate of its items."""
+    try:
+        total = sys.getsizeof(container)
+        n = len(container)
+    except TypeError:
+        return sys.getsizeof(container)
+    if n == 0:
+        return total
+    items = container.items() if isinstance(container, dict) else container
+    sampled = 0
+    size = 0
+    for item in itertools.islice(items, sample):
+        if isinstance(item, tuple):
+            size += sum(sys.getsizeof(part) for part in item)
+        else:
+            size += sys.getsizeof(item)
+        sampled += 1
+    return total + (size // sampled) * n if sampled else total
+
+
+@dataclass(frozen=True)
+class TrackedStats:
+    name: str
+    entries: int
+    approx_bytes: int
+
+
+class MemoryRegistry:
+    """Named caches/buffers that can report their size on demand."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._getters: Dict[str, Callable[[], Any]] = {}
+
+    def register(self, name: str, owner: Any, attr: Optional[str] = None) -> None:
+        """
+        Track ``owner.attr`` (or ``owner`` itself when ``attr`` is None).
+
+        The owner is weakly referenced where possible; the entry reports
+        nothing once the owner is gone.
+        """
+        try:
+            ref = weakref.ref(owner)
+        except TypeError:
+            def ref(owner=owner):  # plain containers (dict/list) can't be weakly referenced
+                return owner
+
+        def getter():
+            obj = ref()
+            if obj is None:
+                return None
+            return getattr(obj, attr, None) if attr else obj
+
+        with self._lock:
+            self._getters[name] = getter
+
+    def register_callable(self, name: str, fn: Callable[[], Any]) -> None:
+        """Track whatever container ``fn()`` returns."""
+        with self._lock:
+            self._getters[name] = fn
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._getters.pop(name, None)
+
+    def collect(self) -> List[TrackedStats]:
+        with self._lock:
+            getters = list(self._getters.items())
+        out = []
+        for name, getter in getters:
+            try:
+                container = getter()
+            except (AttributeError, RuntimeError, TypeError):
+                continue
+            if container is None:
+                continue
+            try:
+                entries = len(container)
+            except TypeError:
+                continue
+            out.append(TrackedStats(name, entries, approx_size(container)))
+        return sorted(out, key=lambda s: -s.approx_bytes)
+
+
+class MemoryProfiler:
+    """tracemalloc snapshot diffs + RSS watermark dumps."""
+
+    def __init__(
+        self,
+        registry: MemoryRegistry,
+        tracemalloc_frames: int = 0,
+        top_n: int = 15,
+        rss_dump_threshold_mb: float = 0.0,
+        dump_dir: str = "logs",
+        dump_cooldown_seconds: float = 3600.0,
+    ):
+        self.registry = registry
+        self.tracemalloc_frames = tracemalloc_frames
+        self.top_n = top_n
+        self.rss_dump_threshold_mb = rss_dump_threshold_mb
+        self.dump_dir = Path(dump_dir)
+        self.dump_cooldown_seconds = dump_cooldown_seconds
+        self._prev_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._last_report: Dict[str, Any] = {}
+        self._last_dump_at = 0.0
+        self._running = False
+        metrics = get_metrics_registry()
+        self._rss_gauge = metrics.gauge("trading_memory_rss_bytes", "Process resident set size")
+        self._entries_gauge = metrics.gauge(
+            "trading_memory_tracked_entries", "Entries in a registered cache/buffer", ("name",)
+        )
+        self._bytes_gauge = metrics.gauge(
+            "trading_memory_tracked_bytes", "Approximate bytes of a registered cache/buffer", ("name",)
+        )
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start_tracing(self) -> None:
+        if self.tracemalloc_frames > 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(self.tracemalloc_frames)
+
+    def _top_growth(self) -> List[Dict[str, Any]]:
+        if not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        prev, self._prev_snapshot = self._prev_snapshot, snapshot
+        if prev is None:
+            stats = snapshot.statistics("lineno")[: self.top_n]
+            return [
+                {"site": str(s.traceback), "size_bytes": s.size, "count": s.count} for s in stats
+            ]
+        diff = snapshot.compare_to(prev, "lineno")[: self.top_n]
+        return [
+            {
+                "site": str(d.traceback),
+                "size_bytes": d.size,
+                "size_diff_bytes": d.size_diff,
+                "count_diff": d.count_diff,
+            }
+            for d in diff
+        ]
+
+    def sample(self, top_growth: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Take one sample: registry sizes, RSS, tracemalloc growth; update gauges.
+
+        Must run on the thread that mutates the tracked containers (the event
+        loop); ``top_growth`` may be precomputed elsewhere.
+        """
+        if top_growth is None:
+            top_growth = self._top_growth()
+        rss = rss_bytes()
+        tracked = self.registry.collect()
+        self._rss_gauge.set(rss)
+        for s in tracked:
+            self._entries_gauge.labels(name=s.name).set(s.entries)
+            self._bytes_gauge.labels(name=s.name).set(s.approx_bytes)
+        report = {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "rss_mb": round(rss / 1_048_576, 1),
+            "tracemalloc": self.tracing,
+            "tracked": [
+                {"name": s.name, "entries": s.entries, "approx_bytes": s.approx_bytes} for s in tracked
+            ],
+            "top_growth": top_growth,
+        }
+        self._last_report = report
+        if self.rss_dump_threshold_mb > 0 and rss >= self.rss_dump_threshold_mb * 1_048_576:
+            self._maybe_dump(report)
+        return report
+
+    def _maybe_dump(self, report: Dict[str, Any]) -> Optional[Path]:
+        now = time.monotonic()
+        if self._last_dump_at and now - self._last_dump_at < self.dump_cooldown_seconds:
+            return None
+        self._last_dump_at = now
+        self.dump_dir.mkdir(parents=True, exist_ok=True)
+        path = self.dump_dir / f"memory_dump_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+        try:
+            path.write_text(json.dumps(report, indent=2, default=str))
+        except OSError as e:
+            logger.warning("MEMORY_DUMP_WRITE_FAILED", path=str(path), error=str(e))
+            return None
+        logger.warning(
+            "MEMORY_RSS_THRESHOLD_DUMP",
+            rss_mb=report["rss_mb"],
+            threshold_mb=self.rss_dump_threshold_mb,
+            path=str(path),
+            largest=[t["name"] for t in report["tracked"][:3]],
+        )
+        return path
+
+    def report(self) -> Dict[str, Any]:
+        """Last sample taken by the monitor loop (read-only; safe from other threads)."""
+        return self._last_report or {"status": "no sample yet"}
+
+    async def run(self, interval_seconds: float) -> None:
+        """Sample every ``interval_seconds`` until ``stop()``."""
+        self._running = True
+        self.start_tracing()
+        while self._running:
+            try:
+                # Snapshot/diff walks every traced block; keep it off the loop.
+                # Registry sizes are read on the loop, where the containers live.
+                growth = await asyncio.to_thread(self._top_growth)
+                self.sample(top_growth=growth)
+            except (OSError, RuntimeError, ValueError) as e:
+                logger.warning("Memory sample failed", error=str(e), error_type=type(e).__name__)
+            await asyncio.sleep(interval_seconds)
+
+    def stop(self) -> None:
+        self._running = False
+        if self.tracemalloc_frames > 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._prev_snapshot = None
+
+
+# ---------- singletons ----------
+
+_registry: Optional[MemoryRegistry] = None
+_profiler: Optional[MemoryProfiler] = None
+_singleton_lock = threading.Lock()
+
+
+def get_memory_registry() -> MemoryRegistry:
+    global _registry
+    if _registry is None:
+        with _singleton_lock:
+            if _registry is None:
+                _registry = MemoryRegistry()
+    return _registry
+
+
+def get_memory_profiler() -> Optional[MemoryProfiler]:
+    """The worker's profiler, or None when memory monitoring is not running."""
+    return _profiler
+
+
+def init_memory_profiler(**kwargs: Any) -> MemoryProfiler:
+    global _profiler
+    registry = get_memory_registry()
+    with _singleton_lock:
+        _profiler = MemoryProfiler(registry, **kwargs)
+    return _profiler
+
+
+def reset_memory_profiler() -> None:
+    """For tests."""
+    global _registry, _profiler
+    with _singleton_lock:
+        if _profiler is not None:
+            _profiler.stop()
+        _registry = None
+        _profiler = None
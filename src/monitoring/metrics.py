@@ -1,13 +1,79 @@
 """
 Real-time metrics and alerting.
+
+Also hosts the in-process Prometheus registry (``get_metrics_registry``):
+counters, gauges and latency histograms with labels, rendered directly by
+the worker health app's ``/metrics`` without touching the database.
 """
+import abc
+import asyncio
+import bisect
+import functools
+import threading
+import time
 from decimal import Decimal
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from src.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# Default latency buckets (milliseconds): sub-ms dict work up to slow exchange calls.
+DEFAULT_LATENCY_BUCKETS_MS: Sequence[float] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (per-bucket counts + running sum).
+
+    Cheap enough to observe on every check; quantiles are estimated by linear
+    interpolation inside the bucket, Prometheus ``histogram_quantile`` style.
+    """
+
+    def __init__(self, buckets_ms: Optional[Sequence[float]] = None):
+        self.buckets_ms: List[float] = sorted(buckets_ms or DEFAULT_LATENCY_BUCKETS_MS)
+        # One count per bucket, plus the +Inf overflow bucket.
+        self.counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        idx = bisect.bisect_left(self.buckets_ms, value_ms)
+        self.counts[idx] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def quantile(self, q: float) -> float:
+        """Estimated q-quantile in ms (0.0 when empty)."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for idx, n in enumerate(self.counts):
+            upper = self.buckets_ms[idx] if idx < len(self.buckets_ms) else self.max_ms
+            if n and seen + n >= rank:
+                frac = (rank - seen) / n
+                return lower + (upper - lower) * frac
+            seen += n
+            lower = upper
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.quantile(0.5), 3),
+            "p99_ms": round(self.quantile(0.99), 3),
+        }
+
+
 class MetricsCollector:
     """
     Real-time metrics tracking and alerting.
@@ -39,3 +105,302 @@ class MetricsCollector:
                 usage=f"{margin_usage_pct:.1%}",
                 threshold=f"{threshold_pct:.1%}",
             )
+
+
+# ---------------------------------------------------------------------------
+# In-process Prometheus registry
+# ---------------------------------------------------------------------------
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Value:
+    """Counter/gauge child."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+
+class _MetricFamily(abc.ABC):
+    """A named metric with a fixed label set; children are created per label values."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _new_child(self) -> Any:
+        """A fresh child (value holder) for one label-value combination."""
+
+    def labels(self, *values: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            try:
+                key = tuple(str(kwargs[n]) for n in self.labelnames)
+            except KeyError as e:
+                raise ValueError(f"{self.name}: missing label {e}") from None
+        else:
+            key = tuple(str(v) for v in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name}: expected labels {self.labelnames}, got {key}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def children(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def clear(self) -> None:
+        """Drop every child; the family object (and references to it) stays valid."""
+        with self._lock:
+            self._children.clear()
+
+    def _label_str(self, values: Tuple[str, ...], extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = [f'{n}="{_escape_label(v)}"' for n, v in zip(self.labelnames, values)]
+        if extra is not None:
+            pairs.append(f'{extra[0]}="{extra[1]}"')
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in self.children():
+            lines.append(f"{self.name}{self._label_str(values)} {_fmt_value(child.value)}")
+        return lines
+
+
+class Counter(_MetricFamily):
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(_MetricFamily):
+    kind = "gauge"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class Histogram(_MetricFamily):
+    """Latency histogram family (milliseconds); children are ``LatencyHistogram``."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets_ms: Optional[Sequence[float]] = None,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets_ms = tuple(sorted(buckets_ms or DEFAULT_LATENCY_BUCKETS_MS))
+
+    def _new_child(self) -> LatencyHistogram:
+        return LatencyHistogram(self.buckets_ms)
+
+    def observe(self, value_ms: float) -> None:
+        self.labels().observe(value_ms)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for values, hist in self.children():
+            cumulative = 0
+            for upper, n in zip(hist.buckets_ms, hist.counts):
+                cumulative += n
+                le = ("le", f"{upper:g}")
+                lines.append(f"{self.name}_bucket{self._label_str(values, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{self._label_str(values, ('le', '+Inf'))} {hist.count}")
+            lines.append(f"{self.name}_sum{self._label_str(values)} {_fmt_value(round(hist.sum_ms, 6))}")
+            lines.append(f"{self.name}_count{self._label_str(values)} {hist.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide metric families, get-or-create by name.
+
+    Re-registering a name returns the existing family (so module-level
+    ``histogram(...)`` calls in several modules share one family); a kind or
+    label mismatch raises ``ValueError``.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, _MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, help_text: str, labelnames: Sequence[str], **kwargs) -> Any:
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = cls(name, help_text, labelnames, **kwargs)
+                self._families[name] = family
+            elif type(family) is not cls or family.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered as {family.kind}{family.labelnames}")
+            return family
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets_ms: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets_ms=buckets_ms)
+
+    def families(self) -> List[_MetricFamily]:
+        with self._lock:
+            return list(self._families.values())
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        lines: List[str] = []
+        for family in sorted(self.families(), key=lambda f: f.name):
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """JSON-friendly view: values for counters/gauges, count/p50/p99 for histograms."""
+        out: Dict[str, List[Dict[str, Any]]] = {}
+        for family in self.families():
+            rows = []
+            for values, child in family.children():
+                row: Dict[str, Any] = {"labels": dict(zip(family.labelnames, values))}
+                if isinstance(family, Histogram):
+                    row.update(child.snapshot())
+                else:
+                    row["value"] = child.value
+                rows.append(row)
+            out[family.name] = rows
+        return out
+
+    def reset(self) -> None:
+        """
+        Zero all metrics (tests only).
+
+        Families are kept and emptied in place: modules hold module-level
+        references to them, so replacing them would orphan those writers.
+        """
+        for family in self.families():
+            family.clear()
+
+
+_metrics_registry: Optional[MetricsRegistry] = None
+_metrics_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the singleton in-process MetricsRegistry."""
+    global _metrics_registry
+    if _metrics_registry is None:
+        with _metrics_registry_lock:
+            if _metrics_registry is None:
+                _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+
+def tick_stage_histogram() -> Histogram:
+    """Shared ``trading_tick_stage_latency_ms{stage}`` family (candles, signal, auction, ...)."""
+    return get_metrics_registry().histogram(
+        "trading_tick_stage_latency_ms", "Latency of per-tick pipeline stages", ("stage",)
+    )
+
+
+def last_tick_gauge() -> Gauge:
+    """``trading_last_tick_timestamp_seconds``: unix time of the last completed tick."""
+    return get_metrics_registry().gauge(
+        "trading_last_tick_timestamp_seconds", "Unix time of the last completed live tick"
+    )
+
+
+def set_snapshot_gauges(snapshot: Dict[str, Any]) -> None:
+    """Mirror the numeric fields of a worker metrics snapshot as ``trading_<key>`` gauges."""
+    registry = get_metrics_registry()
+    for key, value in snapshot.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            registry.gauge(f"trading_{key}", f"Worker snapshot field {key}").set(value)
+
+
+def timed(histogram: Histogram, **labels: str) -> Callable:
+    """
+    Decorator observing call latency (ms) into ``histogram``; sync or async.
+
+    If the family has an ``outcome`` label it is filled with ``ok``/``error``.
+    """
+    with_outcome = "outcome" in histogram.labelnames
+
+    def _observe(start: float, outcome: str) -> None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if with_outcome:
+            histogram.labels(outcome=outcome, **labels).observe(elapsed_ms)
+        else:
+            histogram.labels(**labels).observe(elapsed_ms)
+
+    def decorator(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                outcome = "error"
+                try:
+                    result = await fn(*args, **kwargs)
+                    outcome = "ok"
+                    return result
+                finally:
+                    _observe(start, outcome)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = fn(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                _observe(start, outcome)
+        return wrapper
+
+    return decorator
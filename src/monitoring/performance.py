@@ -31,8 +31,16 @@ def calculate_performance_metrics(days: int = 30) -> Dict:
     from src.storage.repository import get_trades_since
     
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    trades = get_trades_since(cutoff)
-    
+    return performance_metrics_from_trades(get_trades_since(cutoff))
+
+
+def performance_metrics_from_trades(trades: List) -> Dict:
+    """
+    Metrics over an already-selected set of trades.
+
+    Shared by ``calculate_performance_metrics`` and the worker's
+    performance read model, so both report identical numbers.
+    """
     if not trades:
         return {
             "total_trades": 0,
@@ -0,0 +1,338 @@
+"""
+In-process read models for the operator surfaces.
+
+The worker projects what it already knows into three small structures as
+events happen; the health/debug API and the Telegram bot read them without
+touching the exchange or the DB:
+
+- ``StatusProjection``: equity/margin (the tick's account fetch), open
+  positions (the tick's position sync) and their marks (the tick's ticker
+  batch). Serves /status and /positions.
+- ``PerformanceProjection``: closed trades of the last ``window_days``,
+  hydrated once and appended from the trade-recorded hook. Metrics come from
+  ``performance_metrics_from_trades`` and are recomputed only when the
+  window changes. Serves /trades and /perf.
+- ``DecisionProjection``: recent decision traces, digested at write time
+  into the ``/api/debug/signals`` shape (no per-request JSON decoding).
+
+A projection reports ``ready`` once populated; callers keep their previous
+(live) path until then. ``ReadModel.save`` writes a JSON snapshot for
+processes that don't host the worker (``load_snapshot``).
+
+Writers run on the worker's event loop, readers on the health server thread,
+so each projection guards its state with a lock and hands out copies.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from bisect import insort
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional
+
+from src.monitoring.logger import get_logger
+from src.monitoring.performance import performance_metrics_from_trades
+
+logger = get_logger(__name__)
+
+
+def digest_decision(timestamp: str, symbol: str, details: Mapping[str, Any]) -> Dict[str, Any]:
+    """One ``recent_decisions`` row of /api/debug/signals from a DECISION_TRACE payload."""
+    reason = details.get("reason")
+    if isinstance(reason, list) and reason:
+        reasoning_tip = reason[-1]
+    elif isinstance(reason, str) and reason.strip():
+        reasoning_tip = reason.strip().split("\n")[-1] if "\n" in reason else reason.strip()
+    else:
+        reasoning_tip = "No reasoning logged"
+    return {
+        "time": timestamp,
+        "symbol": symbol,
+        "signal": details.get("signal", "NONE"),
+        "quality": details.get("setup_quality", 0),
+        "reasoning": reasoning_tip,
+        "order_placed": details.get("order_placed"),
+        "order_fail_reason": details.get("order_fail_reason") or "",
+    }
+
+
+def is_entry_signal(signal: Any) -> bool:
+    return bool(signal) and str(signal).upper() in ("LONG", "SHORT")
+
+
+def _iso(ts: Optional[datetime]) -> str:
+    if ts is None:
+        ts = datetime.now(timezone.utc)
+    elif ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.isoformat()
+
+
+class DecisionProjection:
+    """Newest-first digests of the worker's decision traces."""
+
+    def __init__(self, maxlen: int = 200, per_symbol: int = 20):
+        self._lock = threading.Lock()
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
+        self._by_symbol: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._per_symbol = per_symbol
+        self._last_signal: Optional[Dict[str, Any]] = None
+        self._last_signal_by_symbol: Dict[str, Dict[str, Any]] = {}
+        self._count = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._count > 0
+
+    def record(self, symbol: str, details: Mapping[str, Any], timestamp: Optional[datetime] = None) -> None:
+        ts = _iso(timestamp)
+        row = digest_decision(ts, symbol, details)
+        signal = None
+        if is_entry_signal(row["signal"]):
+            signal = {
+                "timestamp": ts,
+                "symbol": symbol,
+                "signal": row["signal"],
+                "quality": row["quality"],
+                # JSON-safe copy (traces carry Decimals); entry signals are rare.
+                "details": json.loads(json.dumps(dict(details), default=str)),
+                "reasoning": details.get("reason"),
+            }
+        with self._lock:
+            self._recent.appendleft(row)
+            per = self._by_symbol.get(symbol)
+            if per is None:
+                per = self._by_symbol[symbol] = deque(maxlen=self._per_symbol)
+            per.appendleft(row)
+            if signal is not None:
+                self._last_signal = signal
+                self._last_signal_by_symbol[symbol] = signal
+            self._count += 1
+
+    def debug_signals(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Same shape as the DB-backed /api/debug/signals payload."""
+        limit = 20 if symbol else 50
+        with self._lock:
+            source = self._by_symbol.get(symbol, ()) if symbol else self._recent
+            rows = [dict(r) for r, _ in zip(source, range(limit))]
+            last = self._last_signal_by_symbol.get(symbol) if symbol else self._last_signal
+        return {
+            "status": "success",
+            "source": "read_model",
+            "last_signal": dict(last) if last else None,
+            "checked_events": len(rows),
+            "recent_decisions": rows,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.debug_signals()
+
+
+class StatusProjection:
+    """
+    Account and open-position view as of the worker's last tick.
+
+    ``update_account`` takes effective equity / margin used
+    (``calculate_effective_equity``), never the raw account-info fields.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._equity: Optional[Decimal] = None
+        self._margin_used = Decimal("0")
+        self._positions: Optional[List[Dict[str, Any]]] = None
+        self._marks: Dict[str, Decimal] = {}
+        self._account_at: Optional[datetime] = None
+        self._positions_at: Optional[datetime] = None
+        self._updated_at: Optional[datetime] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._equity is not None and self._positions is not None
+
+    def age_seconds(self) -> Optional[float]:
+        """Age of the older of the account and position data."""
+        if self._account_at is None or self._positions_at is None:
+            return None
+        oldest = min(self._account_at, self._positions_at)
+        return (datetime.now(timezone.utc) - oldest).total_seconds()
+
+    def update_account(self, equity: Decimal, margin_used: Decimal) -> None:
+        with self._lock:
+            self._equity = Decimal(str(equity))
+            self._margin_used = Decimal(str(margin_used))
+            self._account_at = self._updated_at = datetime.now(timezone.utc)
+
+    def update_positions(self, raw_positions: Iterable[Mapping[str, Any]]) -> None:
+        active = [dict(p) for p in raw_positions if p.get("size", 0) != 0]
+        with self._lock:
+            self._positions = active
+            self._enrich()
+            self._positions_at = self._updated_at = datetime.now(timezone.utc)
+
+    def update_marks(self, marks: Mapping[str, Decimal]) -> None:
+        with self._lock:
+            self._marks = dict(marks)
+            self._enrich()
+
+    def _enrich(self) -> None:
+        """Mark price + unrealized PnL per position (same math as the live status path)."""
+        for p in self._positions or ():
+            mark = self._marks.get(p.get("symbol", ""))
+            if mark is None:
+                continue
+            try:
+                p["mark_price"] = mark
+                entry = p.get("entry_price", Decimal("0"))
+                size = p.get("size", Decimal("0"))
+                if p.get("side", "long") == "long":
+                    p["unrealized_pnl"] = (mark - entry) * size
+                else:
+                    p["unrealized_pnl"] = (entry - mark) * size
+            except (ValueError, TypeError, ArithmeticError):
+                continue
+
+    def account(self) -> Dict[str, Any]:
+        """equity / margin_used / margin_pct / positions, copied."""
+        with self._lock:
+            equity = self._equity or Decimal("0")
+            return {
+                "equity": equity,
+                "margin_used": self._margin_used,
+                "margin_pct": float((self._margin_used / equity) * 100) if equity > 0 else 0,
+                "positions": [dict(p) for p in self._positions or ()],
+                "as_of": _iso(self._updated_at) if self._updated_at else None,
+            }
+
+
+class PerformanceProjection:
+    """Closed trades of the trailing window plus cached metrics over them."""
+
+    def __init__(self, window_days: int = 30):
+        self.window = timedelta(days=window_days)
+        self._lock = threading.Lock()
+        self._trades: List[Any] = []
+        self._ids: set = set()
+        self._metrics: Optional[Dict[str, Any]] = None
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def hydrate(self, trades: Iterable[Any]) -> None:
+        with self._lock:
+            for t in trades:
+                self._add(t)
+            self._ready = True
+
+    def record(self, trade: Any) -> None:
+        with self._lock:
+            self._add(trade)
+
+    def _add(self, trade: Any) -> None:
+        trade_id = getattr(trade, "trade_id", None)
+        if trade_id is not None:
+            if trade_id in self._ids:
+                return
+            self._ids.add(trade_id)
+        insort(self._trades, trade, key=lambda t: t.exited_at)
+        self._metrics = None
+
+    def _prune(self) -> None:
+        cutoff = datetime.now(timezone.utc) - self.window
+        n = 0
+        while n < len(self._trades) and self._trades[n].exited_at < cutoff:
+            self._ids.discard(getattr(self._trades[n], "trade_id", None))
+            n += 1
+        if n:
+            del self._trades[:n]
+            self._metrics = None
+
+    def metrics(self) -> Dict[str, Any]:
+        """``performance_metrics_from_trades`` over the window; cached until it changes."""
+        with self._lock:
+            self._prune()
+            if self._metrics is None:
+                self._metrics = performance_metrics_from_trades(self._trades)
+                self._metrics["window_days"] = self.window.days
+            return dict(self._metrics)
+
+    def recent_trades(self, n: int = 5) -> List[Any]:
+        """Newest ``n`` trades of the window, newest first."""
+        with self._lock:
+            return list(reversed(self._trades[-n:])) if n > 0 else []
+
+
+class ReadModel:
+    def __init__(self, performance_window_days: int = 30):
+        self.status = StatusProjection()
+        self.performance = PerformanceProjection(window_days=performance_window_days)
+        self.decisions = DecisionProjection()
+        self._saved_at = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        account = self.status.account() if self.status.ready else None
+        return {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "status": account,
+            "performance": self.performance.metrics() if self.performance.ready else None,
+            "decisions": self.decisions.to_dict() if self.decisions.ready else None,
+        }
+
+    def save(self, path: str, min_interval_seconds: float = 30.0) -> bool:
+        """Atomically write ``snapshot()`` as JSON, at most every ``min_interval_seconds``."""
+        now = time.monotonic()
+        if self._saved_at and now - self._saved_at < min_interval_seconds:
+            return False
+        self._saved_at = now
+        target = Path(path)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(target.suffix + ".tmp")
+            tmp.write_text(json.dumps(self.snapshot(), default=str))
+            tmp.replace(target)
+        except OSError as e:
+            logger.debug("Read model snapshot write failed", path=path, error=str(e))
+            return False
+        return True
+
+
+def load_snapshot(path: str, max_age_seconds: float = 300.0) -> Optional[Dict[str, Any]]:
+    """A snapshot written by ``ReadModel.save``; None when missing or older than ``max_age_seconds``."""
+    target = Path(path)
+    try:
+        if time.time() - target.stat().st_mtime > max_age_seconds:
+            return None
+        return json.loads(target.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+# ---------- singleton ----------
+
+_read_model: Optional[ReadModel] = None
+_read_model_lock = threading.Lock()
+
+
+def get_read_model() -> Optional[ReadModel]:
+    """The worker's read model, or None outside the worker process."""
+    return _read_model
+
+
+def init_read_model(**kwargs: Any) -> ReadModel:
+    global _read_model
+    with _read_model_lock:
+        _read_model = ReadModel(**kwargs)
+    return _read_model
+
+
+def reset_read_model() -> None:
+    """For tests."""
+    global _read_model
+    with _read_model_lock:
+        _read_model = None
@@ -5,6 +5,8 @@ Runs as a background async task, polling for incoming commands.
 Supports:
   /status  - Equity, margin, positions, system state
   /positions - Detailed open positions with P&L
+  /trades  - Last 5 closed trades
+  /perf    - Rolling performance metrics
   /help    - List available commands
 
 Requires ALERT_WEBHOOK_URL (Telegram bot URL) and ALERT_CHAT_ID env vars.
@@ -118,6 +120,8 @@ class TelegramCommandHandler:
                 await self._handle_positions()
             elif text in ("/trades", "/t"):
                 await self._handle_trades()
+            elif text in ("/perf",):
+                await self._handle_perf()
             elif text in ("/help", "/start"):
                 await self._handle_help()
             # Silently ignore unknown commands
@@ -146,6 +150,7 @@ class TelegramCommandHandler:
             "/status - Equity, margin, system state\n"
             "/positions - Open positions with P&L\n"
             "/trades - Last 5 closed trades\n"
+            "/perf - Rolling performance metrics\n"
             "/help - This message"
         )
     
@@ -238,12 +243,16 @@ class TelegramCommandHandler:
 
     async def _handle_trades(self) -> None:
         """Respond to /trades with recent closed trades."""
+        from src.monitoring.read_models import get_read_model
+
+        read_model = get_read_model()
+        trades = read_model.performance.recent_trades(5) if read_model and read_model.performance.ready else []
         try:
-            import asyncio
-            from src.storage.repository import get_all_trades
-            
-            trades = await asyncio.to_thread(get_all_trades)
-            trades = trades[:5]  # Last 5
+            if not trades:
+                from src.storage.repository import get_all_trades
+
+                trades = await asyncio.to_thread(get_all_trades)
+                trades = trades[:5]  # Last 5
         except (OperationalError, DataError, OSError) as e:
             await self._send_message(f"❌ Failed to fetch trades: {e}")
             return
@@ -294,6 +303,38 @@ class TelegramCommandHandler:
         
         await self._send_message("\n".join(lines))
 
+    async def _handle_perf(self) -> None:
+        """Respond to /perf with metrics over the read model's trailing window."""
+        from src.monitoring.read_models import get_read_model
+
+        read_model = get_read_model()
+        try:
+            if read_model is not None and read_model.performance.ready:
+                m = read_model.performance.metrics()
+            else:
+                from src.monitoring.performance import calculate_performance_metrics
+
+                m = await asyncio.to_thread(calculate_performance_metrics, 30)
+                m["window_days"] = 30
+        except (OperationalError, DataError, OSError) as e:
+            await self._send_message(f"❌ Failed to compute performance: {e}")
+            return
+
+        if not m.get("total_trades"):
+            await self._send_message(f"📋 No closed trades in the last {m.get('window_days', 30)} days")
+            return
+
+        pnl = Decimal(str(m.get("total_pnl", 0)))
+        pnl_sign = "+" if pnl >= 0 else ""
+        pnl_emoji = "🟢" if pnl >= 0 else "🔴"
+        await self._send_message(
+            f"📊 <b>Performance ({m.get('window_days', 30)}d)</b>\n\n"
+            f"{pnl_emoji} Net P&L: <b>{pnl_sign}${pnl:.2f}</b>\n"
+            f"🎯 Win rate: {m.get('win_rate', 0):.1f}% ({m.get('winning_trades', 0)}/{m.get('total_trades', 0)})\n"
+            f"⚖️ Profit factor: {m.get('profit_factor', 0):.2f}\n"
+            f"📉 Max drawdown: {m.get('max_drawdown', 0):.1f}%"
+        )
+
 
 def _resolve_telegram_config() -> tuple[Optional[str], Optional[str]]:
     """
@@ -2,7 +2,10 @@
 Auction-based portfolio allocator.
 
 Implements deterministic auction logic to select the best 50 positions each cycle,
-with hysteresis and cost penalties to prevent churn.
+with hysteresis and cost penalties to prevent churn. Winner selection is a
+single greedy pass over the sorted contenders against incremental aggregates
+(see auction_solver); ``solver="exact"`` optionally refines it with a
+branch-and-bound search for small contender sets.
 """
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Set, Tuple
@@ -13,6 +16,8 @@ from enum import Enum
 from src.domain.models import Position, Signal, Side
 from src.data.symbol_utils import normalize_symbol_for_position_match as _normalize_symbol_for_matching
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics import tick_stage_histogram, timed
+from src.portfolio.auction_solver import SelectionState, solve_exact
 
 logger = get_logger(__name__)
 
@@ -119,6 +124,9 @@ class AuctionAllocator:
         no_signal_persistence_enabled: bool = False,
         no_signal_close_persistence_cycles: int = 3,
         no_signal_persistence_canary_symbols: Optional[List[str]] = None,
+        solver: str = "greedy",
+        exact_max_contenders: int = 40,
+        exact_node_limit: int = 200_000,
     ):
         """
         Initialize auction allocator.
@@ -132,6 +140,8 @@ class AuctionAllocator:
             max_closes_per_cycle: Maximum closes per cycle
             entry_cost: Entry cost penalty in score points
             exit_cost: Exit cost penalty in score points
+            solver: "greedy" (default) or "exact" (branch and bound over the hard caps,
+                greedy fallback above exact_max_contenders or past exact_node_limit)
         """
         self.limits = limits
         self.swap_threshold = swap_threshold
@@ -154,6 +164,11 @@ class AuctionAllocator:
         self.no_signal_persistence_canary_symbols = {
             str(s).strip().upper() for s in (no_signal_persistence_canary_symbols or [])
         }
+        if solver not in ("greedy", "exact"):
+            raise ValueError(f"Unknown auction solver: {solver!r}")
+        self.solver = solver
+        self.exact_max_contenders = exact_max_contenders
+        self.exact_node_limit = exact_node_limit
         
         logger.info(
             "AuctionAllocator initialized",
@@ -163,6 +178,7 @@ class AuctionAllocator:
             rebalancer_enabled=rebalancer_enabled,
             no_signal_persistence_enabled=self.no_signal_persistence_enabled,
             no_signal_close_persistence_cycles=self.no_signal_close_persistence_cycles,
+            solver=solver,
         )
 
     def _symbol_in_persistence_canary(self, symbol: str) -> bool:
@@ -171,6 +187,7 @@ class AuctionAllocator:
         normalized = str(symbol).strip().upper().split(":")[0]
         return normalized in self.no_signal_persistence_canary_symbols
     
+    @timed(tick_stage_histogram(), stage="auction_allocate")
     def allocate(
         self,
         open_positions: List[OpenPositionMetadata],
@@ -205,6 +222,8 @@ class AuctionAllocator:
         
         # Step C: Select winners under constraints
         winners = self._select_winners(contenders, portfolio_state)
+        if self.solver == "exact":
+            winners = self._select_winners_exact(contenders, portfolio_state, winners)
         
         # Step D: Translate into actions
         winner_symbols = {c.symbol for c in winners}
@@ -261,19 +280,15 @@ class AuctionAllocator:
         remaining_closes = []
         remaining_opens = []
         
-        # First, pair up closes with opens (swaps)
-        close_by_cluster = {op.position.symbol: op for op in final_closes}
+        # First, pair up closes with opens (swaps): each open takes the first
+        # unpaired close in its cluster.
+        closes_by_cluster: Dict[str, List[OpenPositionMetadata]] = {}
+        for close_op in reversed(final_closes):
+            closes_by_cluster.setdefault(close_op.cluster, []).append(close_op)
         for new_contender in final_opens[:max_swaps]:
-            # Find best matching close in same cluster
-            matching_close = None
-            for close_op in final_closes:
-                if close_op.cluster == new_contender.cluster and close_op.position.symbol not in [p[0] for p in swap_pairs]:
-                    if matching_close is None or close_op.position.symbol not in [p[0] for p in swap_pairs]:
-                        matching_close = close_op
-                        break
-            
-            if matching_close:
-                swap_pairs.append((matching_close.position.symbol, new_contender))
+            cluster_closes = closes_by_cluster.get(new_contender.cluster)
+            if cluster_closes:
+                swap_pairs.append((cluster_closes.pop().position.symbol, new_contender))
             else:
                 remaining_opens.append(new_contender)
         
@@ -667,54 +682,24 @@ class AuctionAllocator:
         increasingly higher base scores to be selected.
         """
         winners = []
-        margin_used = Decimal("0")
-        cluster_counts: Dict[str, int] = {}
-        symbol_counts: Dict[str, int] = {}
-        long_count = 0
-        short_count = 0
-        available_margin = Decimal(str(portfolio_state.get("available_margin", 0)))
-        max_margin = available_margin * Decimal(str(self.limits.max_margin_util))
+        state = self._selection_state(portfolio_state)
+        symbol_keys: Dict[str, str] = {}
         
         for contender in contenders:
-            if len(winners) >= self.limits.max_positions:
+            if state.count >= self.limits.max_positions:
                 break
             
-            if margin_used + contender.required_margin > max_margin:
-                continue
-            
-            contender_normalized = _normalize_symbol_for_matching(contender.symbol)
+            contender_normalized = symbol_keys.get(contender.symbol)
+            if contender_normalized is None:
+                contender_normalized = _normalize_symbol_for_matching(contender.symbol)
+                symbol_keys[contender.symbol] = contender_normalized
             
-            existing_count = 0
-            for winner in winners:
-                winner_normalized = _normalize_symbol_for_matching(winner.symbol)
-                if winner_normalized == contender_normalized:
-                    existing_count += 1
-            
-            if existing_count >= self.limits.max_per_symbol:
-                continue
-            
-            cluster_count = cluster_counts.get(contender.cluster, 0)
-            if cluster_count >= self.limits.max_per_cluster:
+            # Margin, per-symbol, per-cluster and net exposure caps
+            if not state.fits(contender, contender_normalized):
                 continue
             
-            # Net exposure caps
-            if self.limits.max_net_long is not None:
-                if contender.direction == Side.LONG:
-                    net_long_margin = sum(
-                        w.required_margin for w in winners if w.direction == Side.LONG
-                    )
-                    if net_long_margin + contender.required_margin > self.limits.max_net_long:
-                        continue
-            if self.limits.max_net_short is not None:
-                if contender.direction == Side.SHORT:
-                    net_short_margin = sum(
-                        w.required_margin for w in winners if w.direction == Side.SHORT
-                    )
-                    if net_short_margin + contender.required_margin > self.limits.max_net_short:
-                        continue
-            
             # Dynamic directional concentration penalty
-            dir_penalty = self._direction_penalty(contender.direction, long_count, short_count)
+            dir_penalty = self._direction_penalty(contender.direction, state.long_count, state.short_count)
             adjusted_value = contender.value - dir_penalty
             
             # Reject if penalty pushes value negative (not worth the concentration risk)
@@ -725,21 +710,16 @@ class AuctionAllocator:
                     direction=contender.direction.value,
                     base_value=f"{contender.value:.1f}",
                     penalty=f"{dir_penalty:.1f}",
-                    long_count=long_count,
-                    short_count=short_count,
+                    long_count=state.long_count,
+                    short_count=state.short_count,
                 )
                 continue
             
             winners.append(contender)
-            margin_used += contender.required_margin
-            cluster_counts[contender.cluster] = cluster_count + 1
-            symbol_counts[contender_normalized] = symbol_counts.get(contender_normalized, 0) + 1
-            
-            if contender.direction == Side.LONG:
-                long_count += 1
-            else:
-                short_count += 1
+            state.add(contender, contender_normalized)
         
+        long_count = state.long_count
+        short_count = state.short_count
         if long_count + short_count > 0:
             logger.info(
                 "Auction directional balance",
@@ -751,6 +731,57 @@ class AuctionAllocator:
         
         return winners
     
+    def _selection_state(self, portfolio_state: Dict[str, any]) -> SelectionState:
+        available_margin = Decimal(str(portfolio_state.get("available_margin", 0)))
+        return SelectionState(
+            max_margin=available_margin * Decimal(str(self.limits.max_margin_util)),
+            max_per_cluster=self.limits.max_per_cluster,
+            max_per_symbol=self.limits.max_per_symbol,
+            max_net_long=self.limits.max_net_long,
+            max_net_short=self.limits.max_net_short,
+        )
+
+    def _select_winners_exact(
+        self,
+        contenders: List[Contender],
+        portfolio_state: Dict[str, any],
+        greedy_winners: List[Contender],
+    ) -> List[Contender]:
+        """
+        Exact mode: maximize total penalty-adjusted value under the hard caps.
+        
+        The directional penalty and the adjusted-value < 0 rejection are
+        applied exactly as in the greedy pass; the greedy winners seed the
+        search and are kept on ties, when there are too many contenders, or
+        when no strictly better set turns up.
+        """
+        if len(contenders) > self.exact_max_contenders:
+            logger.debug(
+                "Exact auction solver skipped (too many contenders)",
+                contenders=len(contenders),
+                limit=self.exact_max_contenders,
+            )
+            return greedy_winners
+        position_of = {id(c): i for i, c in enumerate(contenders)}
+        chosen, optimal = solve_exact(
+            contenders,
+            [_normalize_symbol_for_matching(c.symbol) for c in contenders],
+            max_positions=self.limits.max_positions,
+            state=self._selection_state(portfolio_state),
+            incumbent=[position_of[id(c)] for c in greedy_winners],
+            node_limit=self.exact_node_limit,
+            direction_penalty=self._direction_penalty,
+        )
+        winners = [contenders[i] for i in chosen]
+        logger.debug(
+            "Exact auction solver",
+            contenders=len(contenders),
+            greedy_value=f"{sum(c.value for c in greedy_winners):.1f}",
+            exact_value=f"{sum(c.value for c in winners):.1f}",
+            optimal=optimal,
+        )
+        return winners
+
     def _apply_hysteresis(
         self,
         to_close: List[OpenPositionMetadata],
@@ -803,9 +834,14 @@ class AuctionAllocator:
             )
         }
         
-        # Build lookup maps
-        close_by_symbol = {op.position.symbol: op for op in to_close}
-        open_by_symbol = {op.position.symbol: op for op in to_keep}
+        # Best new candidate per cluster (first on ties) and overall, computed once
+        best_new_by_cluster: Dict[str, Contender] = {}
+        for new_contender in to_open:
+            current = best_new_by_cluster.get(new_contender.cluster)
+            if current is None or new_contender.value > current.value:
+                best_new_by_cluster[new_contender.cluster] = new_contender
+        best_new_overall = max(to_open, key=lambda c: c.value) if to_open else None
+        selected_new_ids: Set[int] = set()
         
         # Match closes to opens by cluster (or globally if no cluster match)
         for close_op in to_close:
@@ -818,16 +854,8 @@ class AuctionAllocator:
                 )
                 continue
             
-            # Find best matching new candidate in same cluster
-            matching_new = None
-            for new_contender in to_open:
-                if new_contender.cluster == close_op.cluster:
-                    if matching_new is None or new_contender.value > matching_new.value:
-                        matching_new = new_contender
-            
-            # If no cluster match, find globally best
-            if matching_new is None and to_open:
-                matching_new = max(to_open, key=lambda c: c.value)
+            # Best matching new candidate in same cluster, else globally best
+            matching_new = best_new_by_cluster.get(close_op.cluster, best_new_overall)
             
             # Check swap threshold
             if matching_new:
@@ -846,7 +874,8 @@ class AuctionAllocator:
                 if new_value >= close_value + swap_threshold_effective:
                     # Swap approved
                     final_closes.append(close_op)
-                    if matching_new not in final_opens:
+                    if id(matching_new) not in selected_new_ids:
+                        selected_new_ids.add(id(matching_new))
                         final_opens.append(matching_new)
                     logger.debug(
                         "Swap approved",
@@ -907,7 +936,7 @@ class AuctionAllocator:
         
         # Add remaining opens that weren't matched to closes
         for new_contender in to_open:
-            if new_contender not in final_opens:
+            if id(new_contender) not in selected_new_ids:
                 final_opens.append(new_contender)
         
         return final_closes, final_opens, stats
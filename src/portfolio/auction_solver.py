@@ -0,0 +1,205 @@
+"""
+Winner-selection core for the auction allocator.
+
+``SelectionState`` keeps the running aggregates the portfolio caps are
+checked against (margin, per-symbol, per-cluster and per-direction counts
+and margin), so testing or adding a contender is O(1) instead of rescanning
+the winners. The greedy pass in ``AuctionAllocator._select_winners`` walks
+the sorted contenders once against it.
+
+``solve_exact`` is the optional exact mode: a pure-Python branch and bound
+that maximizes total contender value under the same hard caps and the same
+directional concentration penalty as the greedy pass. It is meant
+for small contender sets (the allocator falls back to greedy above a size
+limit) and is seeded with the greedy result, so it never returns a set
+worse than greedy's unless greedy left out a locked contender; if the node
+budget runs out it returns the best set found so far.
+"""
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.domain.models import Side
+
+_EPS = 1e-9
+
+
+class SelectionState:
+    """Running aggregates for a set of selected contenders."""
+
+    __slots__ = (
+        "max_margin", "max_per_cluster", "max_per_symbol", "max_net_long", "max_net_short",
+        "count", "margin", "cluster_counts", "symbol_counts",
+        "long_count", "short_count", "long_margin", "short_margin",
+    )
+
+    def __init__(
+        self,
+        max_margin: Decimal,
+        max_per_cluster: int,
+        max_per_symbol: int,
+        max_net_long: Optional[Decimal] = None,
+        max_net_short: Optional[Decimal] = None,
+    ):
+        self.max_margin = max_margin
+        self.max_per_cluster = max_per_cluster
+        self.max_per_symbol = max_per_symbol
+        self.max_net_long = max_net_long
+        self.max_net_short = max_net_short
+        self.count = 0
+        self.margin = Decimal("0")
+        self.cluster_counts: Dict[str, int] = {}
+        self.symbol_counts: Dict[str, int] = {}
+        self.long_count = 0
+        self.short_count = 0
+        self.long_margin = Decimal("0")
+        self.short_margin = Decimal("0")
+
+    def fits(self, contender: Any, symbol_key: str) -> bool:
+        """True if adding ``contender`` keeps every cap satisfied."""
+        required = contender.required_margin
+        if self.margin + required > self.max_margin:
+            return False
+        if self.symbol_counts.get(symbol_key, 0) >= self.max_per_symbol:
+            return False
+        if self.cluster_counts.get(contender.cluster, 0) >= self.max_per_cluster:
+            return False
+        if contender.direction == Side.LONG:
+            if self.max_net_long is not None and self.long_margin + required > self.max_net_long:
+                return False
+        elif contender.direction == Side.SHORT:
+            if self.max_net_short is not None and self.short_margin + required > self.max_net_short:
+                return False
+        return True
+
+    def add(self, contender: Any, symbol_key: str) -> None:
+        self._update(contender, symbol_key, 1)
+
+    def remove(self, contender: Any, symbol_key: str) -> None:
+        self._update(contender, symbol_key, -1)
+
+    def _update(self, contender: Any, symbol_key: str, sign: int) -> None:
+        required = contender.required_margin if sign > 0 else -contender.required_margin
+        self.count += sign
+        self.margin += required
+        self.cluster_counts[contender.cluster] = self.cluster_counts.get(contender.cluster, 0) + sign
+        self.symbol_counts[symbol_key] = self.symbol_counts.get(symbol_key, 0) + sign
+        # Counts split LONG / everything else; margin caps apply to LONG / SHORT only.
+        if contender.direction == Side.LONG:
+            self.long_count += sign
+            self.long_margin += required
+        else:
+            self.short_count += sign
+            if contender.direction == Side.SHORT:
+                self.short_margin += required
+
+
+class _NodeBudgetExceeded(Exception):
+    pass
+
+
+def solve_exact(
+    contenders: Sequence[Any],
+    symbol_keys: Sequence[str],
+    *,
+    max_positions: int,
+    state: SelectionState,
+    incumbent: Sequence[int] = (),
+    node_limit: int = 200_000,
+    direction_penalty: Optional[Callable[[Side, int, int], float]] = None,
+) -> Tuple[List[int], bool]:
+    """
+    Choose the subset of ``contenders`` with the largest total adjusted value.
+
+    ``contenders`` must be sorted by value, descending. Locked contenders are
+    committed first (they cannot be closed, so they hold their slot either
+    way). Each unlocked contender is added in contender order, like the
+    greedy pass, and counts ``value - direction_penalty(direction,
+    long_count, short_count)`` against the running direction counts; it is
+    never chosen when that adjusted value is negative. ``state`` holds the
+    caps and is mutated during the search (and left empty again);
+    ``incumbent`` is the greedy solution as indices, used as the starting
+    bound (when it is feasible under these rules) and returned on ties.
+
+    Returns (indices in contender order, proved_optimal).
+    """
+    def adjusted(c: Any) -> float:
+        if direction_penalty is None:
+            return c.value
+        return c.value - direction_penalty(c.direction, state.long_count, state.short_count)
+
+    chosen: List[int] = []
+    committed_value = 0.0
+    for i, c in enumerate(contenders):
+        if c.locked and state.count < max_positions and state.fits(c, symbol_keys[i]):
+            state.add(c, symbol_keys[i])
+            chosen.append(i)
+            committed_value += c.value
+    committed = list(chosen)
+
+    free = [i for i, c in enumerate(contenders) if not c.locked and c.value >= 0]
+    values = [contenders[i].value for i in free]
+    prefix = [0.0]
+    for v in values:
+        prefix.append(prefix[-1] + v)
+    n = len(free)
+
+    # The greedy set only bounds the search if it is reachable from the committed
+    # (locked) contenders under the same caps and penalty rule.
+    incumbent_set = set(incumbent)
+    best_value, best = float("-inf"), list(committed)
+    if incumbent_set and incumbent_set.issuperset(committed):
+        replayed: List[int] = []
+        value = committed_value
+        for i in sorted(incumbent_set.difference(committed)):
+            c = contenders[i]
+            adj = adjusted(c)
+            if c.locked or adj < 0 or not state.fits(c, symbol_keys[i]):
+                break
+            state.add(c, symbol_keys[i])
+            replayed.append(i)
+            value += adj
+        else:
+            best_value, best = value, sorted(incumbent_set)
+        for i in reversed(replayed):
+            state.remove(contenders[i], symbol_keys[i])
+    nodes = 0
+
+    def dfs(pos: int, slots: int, value: float) -> None:
+        nonlocal nodes, best_value, best
+        nodes += 1
+        if nodes > node_limit:
+            raise _NodeBudgetExceeded
+        if value > best_value + _EPS:
+            best_value = value
+            best = sorted(chosen)
+        if pos == n or slots == 0:
+            return
+        # Upper bound: the next ``slots`` values are the largest remaining (sorted
+        # input); penalties only lower them.
+        if value + prefix[min(n, pos + slots)] - prefix[pos] <= best_value + _EPS:
+            return
+        idx = free[pos]
+        c = contenders[idx]
+        key = symbol_keys[idx]
+        adj = adjusted(c)
+        if adj >= 0 and state.fits(c, key):
+            state.add(c, key)
+            chosen.append(idx)
+            try:
+                dfs(pos + 1, slots - 1, value + adj)
+            finally:
+                chosen.pop()
+                state.remove(c, key)
+        dfs(pos + 1, slots, value)
+
+    optimal = True
+    try:
+        dfs(0, max_positions - len(committed), committed_value)
+    except _NodeBudgetExceeded:
+        optimal = False
+    finally:
+        for i in reversed(committed):
+            state.remove(contenders[i], symbol_keys[i])
+    return best, optimal
@@ -1,15 +1,25 @@
 """
 Risk management for position sizing, leverage control, and safety limits.
+
+``validate_trade`` checks one signal; ``validate_trades`` checks a batch of
+candidates against one shared account snapshot (the auction's pre-ranking
+pass). Both run the same per-signal code on a ``_RiskTerms`` holding the
+account- and config-level inputs, so batch decisions are identical to the
+scalar ones; the batch only computes those inputs once. The config-level
+part of those inputs is itself precompiled (``RiskParams``) and only rebuilt
+when ``self.config`` is replaced.
 """
 from enum import Enum
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 from decimal import Decimal
 from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from src.domain.models import Signal, RiskDecision, Position, Side
 from src.config.config import RiskConfig, TierConfig, LiquidityFilters
+from src.config.runtime_params import RiskParams, fee_edge_costs
 from src.monitoring.logger import get_logger
+from src.exceptions import OperationalError, DataError
 from src.domain.protocols import EventRecorder, _noop_event_recorder
 from src.risk.basis_guard import BasisGuard
 
@@ -18,6 +28,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Per-request failures validate_trades turns into a rejection instead of failing the batch.
+_VALIDATION_ERRORS = (OperationalError, DataError, ValueError, TypeError, KeyError, ArithmeticError)
+
 
 class BindingConstraint(str, Enum):
     """Single winner: the final constraint that limited position size."""
@@ -32,6 +45,62 @@ class BindingConstraint(str, Enum):
     MIN_NOTIONAL_REJECT = "min_notional_reject"
 
 
+@dataclass(frozen=True)
+class TradeRequest:
+    """Per-signal arguments of ``RiskManager.validate_trade``, for ``validate_trades``."""
+    signal: Signal
+    spot_price: Decimal
+    perp_mark_price: Decimal
+    symbol_tier: Optional[str] = None
+    exchange_liquidation_price: Optional[Decimal] = None
+    futures_entry_price: Optional[Decimal] = None
+    futures_stop_loss: Optional[Decimal] = None
+    notional_override: Optional[Decimal] = None
+
+
+@dataclass
+class _RiskTerms:
+    """
+    Inputs to trade validation that depend only on config and account state.
+
+    Built once per ``validate_trade`` call, or once per ``validate_trades``
+    batch. Expressions are the ones validate_trade used inline, so results
+    are unchanged.
+    """
+    account_equity: Decimal
+    target_leverage: Decimal
+    sizing_method: str
+    risk_per_trade_pct: Decimal
+    base_risk_amount: Decimal
+    kelly_fraction: Optional[Decimal]
+    kelly_risk_amount: Optional[Decimal]
+    vol_thresholds: Optional[Tuple[float, float, float, float]]  # high, low, high-vol penalty, low-vol boost
+    max_usd: Decimal
+    max_single_margin_pct: Decimal
+    max_aggregate_margin_pct: Decimal
+    max_single_margin: Decimal
+    max_aggregate_margin: Decimal
+    existing_notional: Decimal
+    max_loss_per_trade_usd: Decimal
+    min_liquidation_buffer_pct: Decimal
+    basis_max: Decimal
+    open_position_count: int
+    position_limit: int
+    account_rejections: List[str]  # daily loss limit / loss-streak cooldown
+    taker_fee_rate: Decimal
+    daily_funding_rate: Decimal
+    tight_funding_probability: Decimal
+    wide_funding_intervals: Decimal
+    tight_cost_cap_decimal: Decimal
+    tight_min_rr: Decimal
+    wide_max_distortion: Decimal
+    wide_projected_funding_bps: Decimal
+    wide_funding_cap_bps: Decimal
+    tight_stop_threshold: Decimal
+    fee_edge_costs: Dict[str, dict] = field(default_factory=dict)  # regime -> cost side of the fee-edge gate
+    tiers: Dict[str, Tuple[Optional[Decimal], Optional[Decimal]]] = field(default_factory=dict)
+
+
 class RiskManager:
     """
     Risk management and position sizing.
@@ -51,6 +120,7 @@ class RiskManager:
         *,
         liquidity_filters: Optional[LiquidityFilters] = None,
         event_recorder: EventRecorder = _noop_event_recorder,
+        params: Optional[RiskParams] = None,
     ):
         """
         Initialize risk manager.
@@ -59,10 +129,13 @@ class RiskManager:
             config: Risk configuration
             liquidity_filters: Optional liquidity filters with tier configs for tier-based sizing
             event_recorder: Callable for recording system events (injected; defaults to no-op)
+            params: Precompiled RiskParams for ``config`` (compiled lazily if not given)
         """
         self.config = config
         self.liquidity_filters = liquidity_filters
         self._record_event = event_recorder
+        self._params = params
+        self._params_source = config if params is not None else None
         
         # Portfolio state tracking
         self.current_positions: List[Position] = []
@@ -78,6 +151,20 @@ class RiskManager:
         tier_info = "enabled" if liquidity_filters else "disabled"
         logger.info("Risk Manager initialized", config=config.model_dump(), tier_based_sizing=tier_info)
     
+    @property
+    def params(self) -> RiskParams:
+        """Precompiled view of ``self.config``; rebuilt when the config object is replaced."""
+        if self._params is None or self._params_source is not self.config:
+            self._params = RiskParams.from_risk_config(self.config)
+            self._params_source = self.config
+        return self._params
+
+    def apply_config(self, config: RiskConfig, params: Optional[RiskParams] = None) -> None:
+        """Swap in a hot-reloaded risk config; P&L, streak and cooldown state are kept."""
+        self.config = config
+        self._params = params
+        self._params_source = config if params is not None else None
+
     def get_tier_config(self, tier: str) -> Optional[TierConfig]:
         """Get tier-specific config if liquidity_filters is set."""
         if self.liquidity_filters:
@@ -115,6 +202,180 @@ class RiskManager:
         Returns:
             RiskDecision with approval status and details
         """
+        request = TradeRequest(
+            signal=signal,
+            spot_price=spot_price,
+            perp_mark_price=perp_mark_price,
+            symbol_tier=symbol_tier,
+            exchange_liquidation_price=exchange_liquidation_price,
+            futures_entry_price=futures_entry_price,
+            futures_stop_loss=futures_stop_loss,
+            notional_override=notional_override,
+        )
+        return self._validate(
+            request,
+            self._risk_terms(account_equity),
+            available_margin=available_margin,
+            skip_margin_check=skip_margin_check,
+        )
+
+    def validate_trades(
+        self,
+        requests: Sequence[TradeRequest],
+        account_equity: Decimal,
+        available_margin: Optional[Decimal] = None,
+        skip_margin_check: bool = False,
+        record_events: bool = True,
+    ) -> List[RiskDecision]:
+        """
+        Validate a batch of candidate trades against one account snapshot.
+        
+        Each decision is the one validate_trade would return for that request
+        with the same account_equity / available_margin / skip_margin_check;
+        config- and account-level terms (leverage, Kelly risk amount, margin
+        ceilings, existing exposure, daily-loss/cooldown state, cost model)
+        are computed once for the whole batch.
+        
+        Args:
+            requests: Per-signal inputs
+            account_equity: Current account equity (shared)
+            available_margin: Margin available to the batch (shared; not reduced between requests)
+            skip_margin_check: As for validate_trade
+            record_events: False for what-if evaluation (no RISK_VALIDATION events)
+        
+        Returns:
+            One RiskDecision per request, in order. A request whose check
+            raises gets a rejected decision; the rest of the batch still runs.
+        """
+        terms = self._risk_terms(account_equity)
+        decisions: List[RiskDecision] = []
+        for request in requests:
+            try:
+                decision = self._validate(
+                    request,
+                    terms,
+                    available_margin=available_margin,
+                    skip_margin_check=skip_margin_check,
+                    record_event=record_events,
+                )
+            except _VALIDATION_ERRORS as e:
+                logger.error(
+                    "Risk validation failed for candidate",
+                    symbol=request.signal.symbol,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                decision = RiskDecision(
+                    approved=False,
+                    rejection_reasons=[f"Risk validation error: {type(e).__name__}"],
+                    position_notional=Decimal("0"),
+                    leverage=Decimal("1"),
+                    margin_required=Decimal("0"),
+                    liquidation_buffer_pct=Decimal("0"),
+                    basis_divergence_pct=Decimal("0"),
+                    estimated_fees_funding=Decimal("0"),
+                )
+            decisions.append(decision)
+        return decisions
+
+    def _risk_terms(self, account_equity: Decimal) -> _RiskTerms:
+        """Config- and account-level inputs shared by every signal validated against this snapshot."""
+        params = self.params
+
+        kelly_risk_amount = None
+        if params.kelly_fraction is not None and params.kelly_fraction > 0:
+            # Risk Amount = Equity * Kelly%, bounded by the absolute max risk cap
+            abs_risk_cap = account_equity * params.kelly_abs_risk_cap_pct
+            kelly_risk_amount = min(account_equity * params.kelly_fraction, abs_risk_cap)
+
+        existing_notional = sum(
+            abs(Decimal(str(p.size)) * Decimal(str(p.current_mark_price or p.entry_price or 0)))
+            for p in self.current_positions
+            if p.size and p.size != 0
+        )
+
+        account_rejections: List[str] = []
+        # Daily loss limit
+        daily_loss_pct = abs(self.daily_pnl) / self.daily_start_equity if self.daily_start_equity > 0 else Decimal("0")
+        if self.daily_pnl < 0 and daily_loss_pct > params.daily_loss_limit_pct:
+            account_rejections.append(
+                f"Daily loss limit exceeded: {daily_loss_pct:.1%} > {self.config.daily_loss_limit_pct:.1%}"
+            )
+        # Time-based loss streak cooldown (NEW - prevents deadlock)
+        now = datetime.now(timezone.utc)
+        if self.cooldown_until and now < self.cooldown_until:
+            remaining_minutes = int((self.cooldown_until - now).total_seconds() / 60)
+            account_rejections.append(
+                f"Loss streak cooldown active: {remaining_minutes} minutes remaining until {self.cooldown_until.strftime('%H:%M UTC')}"
+            )
+
+        return _RiskTerms(
+            account_equity=account_equity,
+            target_leverage=params.target_leverage,
+            sizing_method=params.sizing_method,
+            risk_per_trade_pct=params.risk_per_trade_pct,
+            base_risk_amount=account_equity * params.risk_per_trade_pct,
+            kelly_fraction=params.kelly_fraction,
+            kelly_risk_amount=kelly_risk_amount,
+            vol_thresholds=params.vol_thresholds,
+            max_usd=params.max_usd,
+            max_single_margin_pct=params.max_single_margin_pct,
+            max_aggregate_margin_pct=params.max_aggregate_margin_pct,
+            max_single_margin=account_equity * params.max_single_margin_pct,
+            max_aggregate_margin=account_equity * params.max_aggregate_margin_pct,
+            existing_notional=existing_notional,
+            max_loss_per_trade_usd=params.max_loss_per_trade_usd,
+            min_liquidation_buffer_pct=params.min_liquidation_buffer_pct,
+            basis_max=params.basis_max,
+            open_position_count=len(self.current_positions),
+            position_limit=params.position_limit,
+            account_rejections=account_rejections,
+            taker_fee_rate=params.taker_fee_rate,
+            daily_funding_rate=params.daily_funding_rate,
+            tight_funding_probability=params.tight_funding_probability,
+            wide_funding_intervals=params.wide_funding_intervals,
+            tight_cost_cap_decimal=params.tight_cost_cap_decimal,
+            tight_min_rr=params.tight_min_rr,
+            wide_max_distortion=params.wide_max_distortion,
+            wide_projected_funding_bps=params.wide_projected_funding_bps,
+            wide_funding_cap_bps=params.wide_funding_cap_bps,
+            tight_stop_threshold=params.tight_stop_threshold,
+            fee_edge_costs=params.fee_edge_costs if params.fee_edge_guard_enabled else {},
+        )
+
+    def _tier_caps(self, terms: _RiskTerms, symbol_tier: Optional[str]) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        """(tier max leverage, tier max position size) for symbol_tier, memoized on terms."""
+        if not symbol_tier:
+            return None, None
+        caps = terms.tiers.get(symbol_tier)
+        if caps is None:
+            tier_config = self.get_tier_config(symbol_tier)
+            caps = (
+                Decimal(str(tier_config.max_leverage)) if tier_config else None,
+                tier_config.max_position_size_usd if tier_config else None,
+            )
+            terms.tiers[symbol_tier] = caps
+        return caps
+
+    def _validate(
+        self,
+        request: TradeRequest,
+        terms: _RiskTerms,
+        *,
+        available_margin: Optional[Decimal],
+        skip_margin_check: bool,
+        record_event: bool = True,
+    ) -> RiskDecision:
+        """validate_trade for one request against precomputed account/config terms."""
+        signal = request.signal
+        account_equity = terms.account_equity
+        spot_price = request.spot_price
+        perp_mark_price = request.perp_mark_price
+        exchange_liquidation_price = request.exchange_liquidation_price
+        futures_entry_price = request.futures_entry_price
+        futures_stop_loss = request.futures_stop_loss
+        notional_override = request.notional_override
+        symbol_tier = request.symbol_tier
         rejection_reasons = []
 
         # Calculate position size using FUTURES prices if available (more accurate)
@@ -189,12 +450,10 @@ class RiskManager:
         # Calculate leverage setting (use target leverage for sizing)
         # target_leverage determines actual position leverage (e.g., 7x)
         # max_leverage is the absolute cap for safety checks (10x)
-        requested_leverage = Decimal(str(getattr(self.config, 'target_leverage', self.config.max_leverage)))
+        requested_leverage = terms.target_leverage
         
         # Apply tier-specific leverage cap if symbol_tier is provided
-        tier_config = self.get_tier_config(symbol_tier) if symbol_tier else None
-        tier_max_leverage = Decimal(str(tier_config.max_leverage)) if tier_config else None
-        tier_max_size = tier_config.max_position_size_usd if tier_config else None
+        tier_max_leverage, tier_max_size = self._tier_caps(terms, symbol_tier)
         
         logger.info(
             "Trade tier classification",
@@ -215,7 +474,7 @@ class RiskManager:
             requested_leverage = tier_max_leverage
         
         # Get sizing method (needed for later logic even if using override)
-        sizing_method = getattr(self.config, 'sizing_method', 'fixed')
+        sizing_method = terms.sizing_method
         
         # Calculate buying_power (needed for later checks even if using override)
         buying_power = account_equity * requested_leverage
@@ -245,7 +504,7 @@ class RiskManager:
             # Leverage-Based Sizing (Simple)
             # Position size = Equity × Leverage × Risk%
             if sizing_method == "leverage_based":
-                position_notional = buying_power * Decimal(str(self.config.risk_per_trade_pct))
+                position_notional = buying_power * terms.risk_per_trade_pct
                 logger.debug(
                     "Leverage-based sizing",
                     equity=str(account_equity),
@@ -256,32 +515,14 @@ class RiskManager:
             else:
                 # Base Sizing (Fixed Risk)
                 # Position size = (Equity * Risk%) / Stop_Dist%
-                base_risk_amount = account_equity * Decimal(str(self.config.risk_per_trade_pct))
-                position_notional = base_risk_amount / stop_distance_pct
+                position_notional = terms.base_risk_amount / stop_distance_pct
 
             # Kelly Criterion Sizing (skip if leverage_based)
             if sizing_method in ["kelly", "kelly_volatility"]:
-                win_prob = Decimal(str(self.config.kelly_win_prob))
-                win_loss_ratio = Decimal(str(self.config.kelly_win_loss_ratio))
-                
-                # Kelly % = W - (1-W)/R
-                kelly_pct = win_prob - ((Decimal("1") - win_prob) / win_loss_ratio)
-                
-                # Apply Cap (Quarter Kelly defaults to 0.25)
-                max_kelly = Decimal(str(self.config.kelly_max_fraction))
-                kelly_fraction = min(kelly_pct, max_kelly)
-                
+                kelly_fraction = terms.kelly_fraction
                 if kelly_fraction > 0:
-                    # Kelly suggests risking X% of bankroll per trade
-                    # Risk Amount = Equity * Kelly%
-                    kelly_risk_amount = account_equity * kelly_fraction
-                    
-                    # Check absolute max risk cap
-                    max_risk_pct = Decimal(str(self.config.max_risk_per_trade_entry_pct))
-                    abs_risk_cap = account_equity * max_risk_pct
-                    
-                    final_risk_amount = min(kelly_risk_amount, abs_risk_cap)
-                    
+                    # Kelly suggests risking X% of bankroll per trade (capped; see _risk_terms)
+                    final_risk_amount = terms.kelly_risk_amount
                     kelly_notional = final_risk_amount / stop_distance_pct
                     position_notional = kelly_notional
                     logger.debug(f"Kelly Sizing: Frac={kelly_fraction:.2f}, Risk=${final_risk_amount:.2f}")
@@ -293,16 +534,13 @@ class RiskManager:
                     ratio = float(signal.atr_ratio)
                     scaler = 1.0
                     
-                    high_threshold = float(getattr(self.config, 'vol_sizing_atr_threshold_high', 1.5))
-                    low_threshold = float(getattr(self.config, 'vol_sizing_atr_threshold_low', 0.8))
+                    high_threshold, low_threshold, penalty, boost = terms.vol_thresholds
                     
                     if ratio > high_threshold:
-                        penalty = float(getattr(self.config, 'vol_sizing_high_vol_penalty', 0.6))
                         scaler = penalty
                         logger.debug(f"Volatility Sizing: High Vol (Ratio {ratio:.2f}) -> Penalty {penalty}x")
                         
                     elif ratio < low_threshold:
-                        boost = float(getattr(self.config, 'vol_sizing_low_vol_boost', 1.2))
                         scaler = boost
                         logger.debug(f"Volatility Sizing: Low Vol (Ratio {ratio:.2f}) -> Boost {boost}x")
                         
@@ -313,7 +551,7 @@ class RiskManager:
             computed_notional_from_risk = position_notional
             
             # Hard Cap: Max Notional USD (use tier-specific cap if available)
-            max_usd = Decimal(str(self.config.max_position_size_usd))
+            max_usd = terms.max_usd
             if tier_max_size and tier_max_size < max_usd:
                 effective_max_usd = tier_max_size
                 logger.debug(
@@ -341,9 +579,9 @@ class RiskManager:
 
         min_notional_viable = Decimal("10")
         # Margin caps (capital utilisation): limit margin vs equity, not notional
-        max_single_margin_pct = Decimal(str(getattr(self.config, "max_single_position_margin_pct_equity", 0.25)))
-        max_aggregate_margin_pct = Decimal(str(getattr(self.config, "max_aggregate_margin_pct_equity", 2.0)))
-        max_single_margin = account_equity * max_single_margin_pct
+        max_single_margin_pct = terms.max_single_margin_pct
+        max_aggregate_margin_pct = terms.max_aggregate_margin_pct
+        max_single_margin = terms.max_single_margin
         max_single_notional = max_single_margin * requested_leverage
         per_position_ceiling = max_single_notional
         if position_notional > max_single_notional:
@@ -359,14 +597,10 @@ class RiskManager:
             position_notional = max_single_notional
             binding_constraint = BindingConstraint.SINGLE_MARGIN
             binding_constraints.append(BindingConstraint.SINGLE_MARGIN)
-        existing_notional = sum(
-            abs(Decimal(str(p.size)) * Decimal(str(p.current_mark_price or p.entry_price or 0)))
-            for p in self.current_positions
-            if p.size and p.size != 0
-        )
+        existing_notional = terms.existing_notional
         existing_margin = existing_notional / requested_leverage if requested_leverage > 0 else Decimal("0")
         new_margin = position_notional / requested_leverage
-        max_aggregate_margin = account_equity * max_aggregate_margin_pct
+        max_aggregate_margin = terms.max_aggregate_margin
         aggregate_margin_remaining = max_aggregate_margin - existing_margin
         projected_margin = existing_margin + new_margin
         if projected_margin > max_aggregate_margin:
@@ -495,7 +729,7 @@ class RiskManager:
                 max_factor = Decimal(str(getattr(self.config, "utilisation_boost_max_factor", 2.0)))
 
                 # Compute max notional cap (tier-specific or global)
-                _max_usd_global = Decimal(str(self.config.max_position_size_usd))
+                _max_usd_global = terms.max_usd
                 _tier_max = tier_max_size if tier_max_size else _max_usd_global
                 _effective_max_usd = min(_tier_max, _max_usd_global)
 
@@ -550,7 +784,7 @@ class RiskManager:
                     binding_constraints.append(BindingConstraint.UTILISATION_BOOST)
         
         logger.debug(
-            f"Validating trade: {len(self.current_positions)} active positions",
+            f"Validating trade: {terms.open_position_count} active positions",
             symbol=signal.symbol,
             equity=str(account_equity),
             buying_power=str(buying_power),
@@ -559,7 +793,7 @@ class RiskManager:
 
         # P0.3: Max dollar loss per trade — explicit cap on worst-case loss if stop hits.
         # Computed after all sizing adjustments (caps, boosts) so it reflects actual position size.
-        max_loss_per_trade_usd = Decimal(str(getattr(self.config, "max_loss_per_trade_usd", 500.0)))
+        max_loss_per_trade_usd = terms.max_loss_per_trade_usd
         if position_notional > 0 and stop_distance_pct > 0:
             # Dollar loss = notional * stop_distance_pct
             estimated_loss_at_stop = position_notional * stop_distance_pct
@@ -613,7 +847,7 @@ class RiskManager:
                 signal.signal_type.value,
             )
             
-            min_buffer = Decimal(str(self.config.min_liquidation_buffer_pct))
+            min_buffer = terms.min_liquidation_buffer_pct
             
             if liquidation_buffer_pct < min_buffer:
                 rejection_reasons.append(
@@ -650,7 +884,7 @@ class RiskManager:
         
         # BASIS GUARD ENFORCEMENT
         # This was missing a hard check
-        basis_max = Decimal(str(getattr(self.config, 'basis_max_pct', '0.0075'))) 
+        basis_max = terms.basis_max
         if basis_divergence_pct > basis_max:
              rejection_reasons.append(
                 f"Basis divergence {basis_divergence_pct:.2%} > limit {basis_max:.2%}"
@@ -661,9 +895,9 @@ class RiskManager:
         close_symbol = None
         
         # If auction mode is enabled, ignore max_concurrent_positions and use auction_max_positions instead
-        position_limit = self.config.auction_max_positions if self.config.auction_mode_enabled else self.config.max_concurrent_positions
+        position_limit = terms.position_limit
         
-        if len(self.current_positions) >= position_limit:
+        if terms.open_position_count >= position_limit:
             # Replacement is explicitly opt-in.
             # Default behavior (especially in prod): reject when at limit (no close-then-open race).
             if not bool(getattr(self.config, "replacement_enabled", False)):
@@ -716,21 +950,8 @@ class RiskManager:
                         f"Max concurrent positions ({position_limit}) reached"
                     )
         
-        # Daily loss limit
-        daily_loss_pct = abs(self.daily_pnl) / self.daily_start_equity if self.daily_start_equity > 0 else Decimal("0")
-        if self.daily_pnl < 0 and daily_loss_pct > Decimal(str(self.config.daily_loss_limit_pct)):
-            rejection_reasons.append(
-                f"Daily loss limit exceeded: {daily_loss_pct:.1%} > {self.config.daily_loss_limit_pct:.1%}"
-            )
-        
-        # Time-based loss streak cooldown (NEW - prevents deadlock)
-        now = datetime.now(timezone.utc)
-        
-        if self.cooldown_until and now < self.cooldown_until:
-            remaining_minutes = int((self.cooldown_until - now).total_seconds() / 60)
-            rejection_reasons.append(
-                f"Loss streak cooldown active: {remaining_minutes} minutes remaining until {self.cooldown_until.strftime('%H:%M UTC')}"
-            )
+        # Daily loss limit / loss streak cooldown (account-level; see _risk_terms)
+        rejection_reasons.extend(terms.account_rejections)
         
         # **REGIME-SPECIFIC VALIDATION** (NEW)
         # Different cost models for tight-stop SMC vs wide-stop structure
@@ -742,10 +963,10 @@ class RiskManager:
             # INSTEAD: Absolute cost cap + minimum R multiple
             
             # 1. Calculate expected costs with probabilistic funding
-            estimated_fees_funding = self._estimate_costs_tight_smc(position_notional, stop_distance_pct)
+            estimated_fees_funding = self._estimate_costs_tight_smc(position_notional, terms)
             
             # 2. Absolute cost cap (e.g., 25 bps max)
-            cost_cap_decimal = Decimal(str(self.config.tight_smc_cost_cap_bps / 10000))  # bps to decimal
+            cost_cap_decimal = terms.tight_cost_cap_decimal
             if estimated_fees_funding > position_notional * cost_cap_decimal:
                 rejection_reasons.append(
                     f"Total cost ${estimated_fees_funding:.2f} exceeds {self.config.tight_smc_cost_cap_bps:.0f} bps cap on ${position_notional:.2f} notional"
@@ -757,7 +978,7 @@ class RiskManager:
                 stop_distance = abs(signal.stop_loss - signal.entry_price)
                 rr_multiple = tp_distance / stop_distance if stop_distance > 0 else Decimal("0")
                 
-                min_rr = Decimal(str(self.config.tight_smc_min_rr_multiple))
+                min_rr = terms.tight_min_rr
                 if rr_multiple < min_rr:
                     rejection_reasons.append(
                         f"R:R multiple {rr_multiple:.1f} < minimum {min_rr:.1f} for tight-stop SMC"
@@ -772,24 +993,22 @@ class RiskManager:
             # Wide-stop structure (BOS/TREND): 1.5-3.0% stops
             # KEEP R:R distortion filter (existing logic)
             
-            estimated_fees_funding = self._estimate_costs_wide_structure(position_notional, stop_distance_pct)
+            estimated_fees_funding = self._estimate_costs_wide_structure(position_notional, terms)
             
             # Cost-aware R:R distortion
             risk_amount = position_notional * stop_distance_pct
             rr_distortion = estimated_fees_funding / risk_amount if risk_amount > 0 else Decimal("0")
             
             # Use regime-specific distortion limit (e.g., 15%)
-            max_distortion = Decimal(str(self.config.wide_structure_max_distortion_pct))
+            max_distortion = terms.wide_max_distortion
             
             if rr_distortion > max_distortion:
                 rejection_reasons.append(
                     f"Fees+funding distort R:R by {rr_distortion:.1%} > max {max_distortion:.1%} (Stop: {stop_distance_pct:.2%})"
                 )
             # Hard funding gate for prolonged contango burden in wide-structure regime.
-            daily_funding_bps = Decimal(str(self.config.funding_rate_daily_bps))
-            wide_hold_hours = Decimal(str(self.config.wide_structure_avg_hold_hours))
-            projected_funding_bps = daily_funding_bps * (wide_hold_hours / Decimal("24"))
-            funding_cap_bps = Decimal(str(getattr(self.config, "wide_structure_funding_hard_cap_bps", 0.0)))
+            projected_funding_bps = terms.wide_projected_funding_bps
+            funding_cap_bps = terms.wide_funding_cap_bps
             if funding_cap_bps > 0 and projected_funding_bps > funding_cap_bps:
                 rejection_reasons.append("REJECT_WIDE_FUNDING_CONTANGO")
                 logger.info(
@@ -801,11 +1020,12 @@ class RiskManager:
                 )
 
         fee_edge_metrics = None
-        if bool(getattr(self.config, "fee_edge_guard_enabled", False)):
+        if terms.fee_edge_costs:
             fee_edge_metrics = self._compute_fee_edge_metrics(
                 signal=signal,
                 entry_price=entry_for_risk,
                 regime=regime,
+                costs=terms.fee_edge_costs.get(regime),
             )
             edge_bps = fee_edge_metrics["edge_bps"]
             required_bps = fee_edge_metrics["required_bps"]
@@ -904,7 +1124,7 @@ class RiskManager:
         # --- EXPLAINABILITY INSTRUMENTATION ---
         
         # Determine strictness tier for logging
-        tight_threshold = Decimal(str(self.config.tight_stop_threshold_pct))
+        tight_threshold = terms.tight_stop_threshold
         strictness_tier = "TIGHT" if stop_distance_pct <= tight_threshold else "NORMAL"
         
         validation_data = {
@@ -932,7 +1152,8 @@ class RiskManager:
                 float(fee_edge_metrics["edge_bps"]) if fee_edge_metrics["edge_bps"] is not None else None
             )
         
-        self._record_event("RISK_VALIDATION", signal.symbol, validation_data)
+        if record_event:
+            self._record_event("RISK_VALIDATION", signal.symbol, validation_data)
         
         return decision
     
@@ -952,26 +1173,17 @@ class RiskManager:
         
         return distance
     
-    def _estimate_costs_tight_smc(self, position_notional: Decimal, stop_distance_pct: Decimal) -> Decimal:
+    def _estimate_costs_tight_smc(self, position_notional: Decimal, terms: _RiskTerms) -> Decimal:
         """
         Estimate costs for TIGHT-STOP SMC trades (OB/FVG).
         """
-        taker_fee_bps = Decimal(str(self.config.taker_fee_bps))
-        
-        entry_fee = position_notional * (taker_fee_bps / Decimal("10000"))
-        exit_fee = position_notional * (taker_fee_bps / Decimal("10000"))
+        entry_fee = position_notional * terms.taker_fee_rate
+        exit_fee = position_notional * terms.taker_fee_rate
         
-        # Probabilistic funding
-        avg_hold_hours = Decimal(str(self.config.tight_smc_avg_hold_hours))  # e.g., 6 hours
-        funding_interval_hours = Decimal("8")  # Funding every 8 hours
+        # Probabilistic funding: P(paying funding) = min(avg_hold / 8h, 1.0)
+        one_interval_funding = position_notional * terms.daily_funding_rate / Decimal("3")  # Daily / 3 intervals
         
-        # Probability of paying funding = min(avg_hold / 8, 1.0)
-        funding_probability = min(avg_hold_hours / funding_interval_hours, Decimal("1.0"))
-        
-        daily_funding_bps = Decimal(str(self.config.funding_rate_daily_bps))
-        one_interval_funding = position_notional * (daily_funding_bps / Decimal("10000")) / Decimal("3")  # Daily / 3 intervals
-        
-        expected_funding = one_interval_funding * funding_probability
+        expected_funding = one_interval_funding * terms.tight_funding_probability
         
         total = entry_fee + exit_fee + expected_funding
         
@@ -986,74 +1198,48 @@ class RiskManager:
                 return candidate
         return None
 
-    def _compute_fee_edge_metrics(self, signal: Signal, entry_price: Decimal, regime: str) -> dict:
+    def _compute_fee_edge_metrics(
+        self,
+        signal: Signal,
+        entry_price: Decimal,
+        regime: str,
+        costs: Optional[dict] = None,
+    ) -> dict:
         """
         Compute deterministic edge-vs-cost gate metrics in bps.
 
-        edge_bps uses TP1 proxy; fee_bps_rt uses conservative fee + slippage + funding
-        with a configurable cost buffer multiplier.
+        edge_bps uses TP1 proxy; the cost side (``costs``, from _fee_edge_costs
+        when not given) is per regime, not per signal.
         """
         tp1_proxy = self._resolve_tp1_proxy(signal)
         edge_bps: Optional[Decimal] = None
         if tp1_proxy and entry_price > 0:
             edge_bps = abs(tp1_proxy - entry_price) / entry_price * Decimal("10000")
+        if costs is None:
+            costs = self._fee_edge_costs(regime)
+        return {"edge_bps": edge_bps, **costs}
 
-        taker_fee_bps = Decimal(str(self.config.taker_fee_bps))
-        maker_fee_bps = Decimal(str(self.config.maker_fee_bps))
-        conservative_taker = bool(getattr(self.config, "fee_edge_use_conservative_taker", True))
-        fees_bps_rt = (
-            taker_fee_bps * Decimal("2")
-            if conservative_taker
-            else (maker_fee_bps + taker_fee_bps)
-        )
-        slippage_bps_rt = Decimal(str(getattr(self.config, "fee_edge_slippage_bps_est", 4.0)))
-        avg_hold_hours = Decimal(
-            str(
-                self.config.tight_smc_avg_hold_hours
-                if regime == "tight_smc"
-                else self.config.wide_structure_avg_hold_hours
-            )
-        )
-        funding_bps_from_hold = Decimal(str(self.config.funding_rate_daily_bps)) * (
-            avg_hold_hours / Decimal("24")
-        )
-        funding_floor_bps = Decimal(str(getattr(self.config, "fee_edge_funding_floor_bps", 2.0)))
-        funding_bps_est = max(funding_bps_from_hold, funding_floor_bps)
-
-        buffer_mult = Decimal(str(getattr(self.config, "fee_edge_cost_buffer_multiplier", 1.2)))
-        fee_bps_rt = (fees_bps_rt + slippage_bps_rt + funding_bps_est) * buffer_mult
-        edge_multiple_k = Decimal(str(getattr(self.config, "fee_edge_multiple_k", 5.0)))
-        required_bps = fee_bps_rt * edge_multiple_k
+    def _fee_edge_costs(self, regime: str) -> dict:
+        """
+        Cost side of the fee-edge gate in bps: conservative fee + slippage + funding
+        with a configurable cost buffer multiplier, and the required edge.
+        """
+        costs = self.params.fee_edge_costs.get(regime)
+        if costs is None:
+            costs = fee_edge_costs(self.config, regime)
+        return costs
 
-        return {
-            "edge_bps": edge_bps,
-            "fee_bps_rt": fee_bps_rt,
-            "required_bps": required_bps,
-            "fees_bps_rt": fees_bps_rt,
-            "slippage_bps_rt": slippage_bps_rt,
-            "funding_bps_est": funding_bps_est,
-            "edge_multiple_k": edge_multiple_k,
-        }
-    
-    def _estimate_costs_wide_structure(self, position_notional: Decimal, stop_distance_pct: Decimal) -> Decimal:
+    def _estimate_costs_wide_structure(self, position_notional: Decimal, terms: _RiskTerms) -> Decimal:
         """
         Estimate costs for WIDE-STOP structure trades (BOS/TREND).
         """
-        taker_fee_bps = Decimal(str(self.config.taker_fee_bps))
-        
-        entry_fee = position_notional * (taker_fee_bps / Decimal("10000"))
-        exit_fee = position_notional * (taker_fee_bps / Decimal("10000"))
-        
-        # Multi-interval funding
-        avg_hold_hours = Decimal(str(self.config.wide_structure_avg_hold_hours))  # e.g., 36 hours
-        funding_interval_hours = Decimal("8")
-        
-        funding_intervals = avg_hold_hours / funding_interval_hours
+        entry_fee = position_notional * terms.taker_fee_rate
+        exit_fee = position_notional * terms.taker_fee_rate
         
-        daily_funding_bps = Decimal(str(self.config.funding_rate_daily_bps))
-        one_interval_funding = position_notional * (daily_funding_bps / Decimal("10000")) / Decimal("3")
+        # Multi-interval funding (avg hold / 8h intervals)
+        one_interval_funding = position_notional * terms.daily_funding_rate / Decimal("3")
         
-        expected_funding = one_interval_funding * funding_intervals
+        expected_funding = one_interval_funding * terms.wide_funding_intervals
         
         total = entry_fee + exit_fee + expected_funding
         
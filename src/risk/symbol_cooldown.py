@@ -10,8 +10,9 @@ from typing import Dict, Optional, Tuple
 from decimal import Decimal
 
 from src.exceptions import OperationalError, DataError
-from src.data.symbol_utils import normalize_to_base as normalize_symbol
+from src.data.symbol_utils import normalize_to_base as normalize_symbol, symbol_key
 from src.monitoring.logger import get_logger
+from src.storage.trade_ledger import get_trade_ledger
 
 logger = get_logger(__name__)
 
@@ -25,8 +26,8 @@ _LOSS_STATS_CACHE_TTL = 300  # 5 minutes
 
 def get_symbol_loss_stats(symbol: str, lookback_hours: int = 24) -> Tuple[int, float]:
     """
-    Query database for recent losses on a symbol.
-    Uses SQLAlchemy connection pool (not raw psycopg2) and a 5-minute TTL cache.
+    Recent losses on a symbol: from the in-memory trade ledger when it covers
+    the window, else a DB query (SQLAlchemy pool) behind a 5-minute TTL cache.
     
     Args:
         symbol: Trading symbol (e.g., 'WIF/USD' or 'PF_WIFUSD')
@@ -37,37 +38,28 @@ def get_symbol_loss_stats(symbol: str, lookback_hours: int = 24) -> Tuple[int, f
     """
     import time as _time
 
+    ledger = get_trade_ledger()
+    if ledger.covers(datetime.now(timezone.utc) - timedelta(hours=lookback_hours)):
+        return ledger.loss_stats(symbol, lookback_hours)
+
     cache_key = f"{symbol}:{lookback_hours}"
     cached = _loss_stats_cache.get(cache_key)
     if cached and _time.monotonic() < cached[1]:
         return cached[0]
 
     try:
-        from sqlalchemy import text
         from src.storage.db import get_db
+        from src.storage.repository import symbol_losses_query
 
         database_url = os.getenv("DATABASE_URL")
         if not database_url:
             return 0, 0.0
         
         db = get_db()
-        base_symbol = normalize_symbol(symbol)
+        since = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
         
         with db.get_session() as session:
-            result = session.execute(
-                text("""
-                    SELECT COUNT(*), COALESCE(SUM(net_pnl), 0), COALESCE(SUM(size_notional), 0)
-                    FROM trades 
-                    WHERE (
-                        UPPER(REPLACE(REPLACE(symbol, 'PF_', ''), '/', '')) LIKE :base1
-                        OR UPPER(REPLACE(REPLACE(symbol, 'USD', ''), '/', '')) LIKE :base2
-                    )
-                    AND net_pnl < 0
-                    AND exited_at >= NOW() - INTERVAL :hours
-                """),
-                {"base1": f"%{base_symbol}%", "base2": f"%{base_symbol}%", "hours": f"{lookback_hours} hours"},
-            )
-            row = result.fetchone()
+            row = symbol_losses_query(session, symbol_key(symbol), since).one()
         
         loss_count = row[0] if row and row[0] else 0
         total_pnl = float(row[1]) if row and row[1] else 0.0
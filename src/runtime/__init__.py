@@ -1,16 +1,22 @@
 """
 Runtime hardening utilities (prod-live guards, distributed locks, cycle management, etc.).
 """
+from src.runtime.bar_scheduler import BarCloseScheduler, WakeEvent
 from src.runtime.cycle_guard import (
     CycleGuard,
     CycleState,
     get_cycle_guard,
     init_cycle_guard,
 )
+from src.runtime.cycle_profiler import CycleProfile, CycleProfiler
 
 __all__ = [
     "CycleGuard",
     "CycleState",
     "get_cycle_guard",
     "init_cycle_guard",
+    "CycleProfile",
+    "CycleProfiler",
+    "BarCloseScheduler",
+    "WakeEvent",
 ]
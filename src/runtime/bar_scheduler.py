@@ -0,0 +1,139 @@
+"""
+BarCloseScheduler: wakes the trading loop on bar closes instead of a fixed 60s sleep.
+
+Two kinds of wake:
+- ``analysis``: a decision/refine bar closed. Fires at the timeframe
+  boundary plus a settle delay, or as soon as the WS feed reports a bar
+  close for that boundary (skipping the settle wait). Full signal analysis
+  runs.
+- ``management``: lightweight tick on its own cadence (position
+  management, trailing stops, protection) with no candle fetch or signal
+  generation.
+
+Wakes are never closer together than ``min_gap_seconds`` (the CycleGuard
+minimum interval), so a bar-close wake is never rejected as TOO_SOON: a
+management tick that would land inside that gap before the next bar close
+is folded into the bar-close wake.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from src.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+TIMEFRAME_SECONDS: Dict[str, int] = {
+    "1m": 60, "5m": 300, "15m": 900, "30m": 1800,
+    "1h": 3600, "4h": 14400, "1d": 86400,
+}
+
+WAKE_ANALYSIS = "analysis"
+WAKE_MANAGEMENT = "management"
+
+
+@dataclass(frozen=True)
+class WakeEvent:
+    """Why the loop woke up."""
+    kind: str
+    at: datetime
+    timeframes: FrozenSet[str] = frozenset()
+    ws_confirmed: bool = False
+
+    @property
+    def is_analysis(self) -> bool:
+        return self.kind == WAKE_ANALYSIS
+
+
+def next_boundary(now: datetime, timeframe: str) -> datetime:
+    """Next close (UTC epoch-aligned) of ``timeframe`` strictly after ``now``."""
+    step = TIMEFRAME_SECONDS[timeframe]
+    ts = int(now.timestamp())
+    return datetime.fromtimestamp((ts // step + 1) * step, tz=timezone.utc)
+
+
+class BarCloseScheduler:
+    """Computes the next wake and sleeps until it (or until the WS feed signals a close)."""
+
+    def __init__(
+        self,
+        timeframes: Iterable[str] = ("15m", "1h", "4h"),
+        settle_seconds: float = 5.0,
+        management_interval_seconds: float = 60.0,
+        min_gap_seconds: float = 60.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.timeframes = tuple(tf for tf in timeframes if tf in TIMEFRAME_SECONDS)
+        if not self.timeframes:
+            raise ValueError(f"No supported timeframes in {list(timeframes)}")
+        self.settle = timedelta(seconds=settle_seconds)
+        self.management_interval = timedelta(seconds=management_interval_seconds)
+        self.min_gap = timedelta(seconds=min_gap_seconds)
+        self._clock = clock
+        self._last_wake: Optional[datetime] = None
+        self._ws_event = asyncio.Event()
+        self.stats = {WAKE_ANALYSIS: 0, WAKE_MANAGEMENT: 0, "ws_bar_closes": 0, "ws_early_wakes": 0}
+
+    # ---------- feed hook ----------
+
+    def notify_bar_close(self, symbol: str, timeframe: str, bar_start: Optional[datetime] = None) -> None:
+        """Called by the WS candle feed when a bar for ``symbol`` has closed."""
+        self.stats["ws_bar_closes"] += 1
+        self._ws_event.set()
+
+    # ---------- planning ----------
+
+    def next_bar_wake(self, now: datetime) -> Tuple[datetime, FrozenSet[str]]:
+        """Earliest boundary+settle after ``now`` and the timeframes closing there."""
+        boundaries = {tf: next_boundary(now - self.settle, tf) for tf in self.timeframes}
+        at = min(boundaries.values())
+        closing = frozenset(tf for tf, b in boundaries.items() if b == at)
+        return at + self.settle, closing
+
+    def _earliest(self, now: datetime) -> datetime:
+        return max(now, self._last_wake + self.min_gap) if self._last_wake else now
+
+    def plan(self, now: datetime) -> WakeEvent:
+        """The next scheduled (timer) wake, honouring ``min_gap``."""
+        earliest = self._earliest(now)
+        bar_at, closing = self.next_bar_wake(now)
+        bar_at = max(bar_at, earliest)
+        mgmt_at = (self._last_wake + self.management_interval) if self._last_wake else now
+        mgmt_at = max(mgmt_at, earliest)
+        # Fold a management tick that would crowd out the bar-close wake.
+        if mgmt_at < bar_at and bar_at - mgmt_at >= self.min_gap:
+            return WakeEvent(WAKE_MANAGEMENT, mgmt_at)
+        return WakeEvent(WAKE_ANALYSIS, bar_at, timeframes=closing)
+
+    # ---------- waiting ----------
+
+    async def wait(self) -> WakeEvent:
+        """Sleep until the next wake; a WS bar close can pull an analysis wake forward."""
+        planned = self.plan(self._clock())
+        while True:
+            now = self._clock()
+            delay = (planned.at - now).total_seconds()
+            if delay <= 0:
+                return self._consume(planned)
+            self._ws_event.clear()
+            try:
+                await asyncio.wait_for(self._ws_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                return self._consume(planned)
+            # WS reported a close. It only matters once the planned bar
+            # boundary has passed (i.e. we are inside the settle window).
+            now = self._clock()
+            if planned.is_analysis and now >= planned.at - self.settle:
+                planned = WakeEvent(
+                    WAKE_ANALYSIS, self._earliest(now), timeframes=planned.timeframes, ws_confirmed=True
+                )
+
+    def _consume(self, wake: WakeEvent) -> WakeEvent:
+        self._last_wake = self._clock()
+        self.stats[wake.kind] += 1
+        if wake.ws_confirmed:
+            self.stats["ws_early_wakes"] += 1
+        return wake
@@ -24,6 +24,11 @@ Usage:
                 guard.record_coin_processed()
     finally:
         guard.end_cycle()
+
+Stage timings (see cycle_profiler.py):
+    guard.profiler.lap("fetch_tickers")
+    with guard.stage("update_candles", symbol=symbol):
+        ...
 """
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
@@ -31,6 +36,7 @@ from typing import Dict, List, Optional, Tuple
 import uuid
 
 from src.monitoring.logger import get_logger
+from src.runtime.cycle_profiler import CycleProfiler
 
 logger = get_logger(__name__)
 
@@ -48,6 +54,8 @@ class CycleState:
     is_complete: bool = False
     overlapped_previous: bool = False
     error: Optional[str] = None
+    # Top-level stage -> ms (filled from the CycleProfiler at end_cycle)
+    stage_breakdown: Dict[str, float] = field(default_factory=dict)
     
     def duration_seconds(self) -> float:
         """Get cycle duration in seconds."""
@@ -73,6 +81,8 @@ class CycleGuard:
         max_cycle_duration_seconds: int = 300,
         max_candle_age_seconds: int = 120,
         max_clock_skew_seconds: int = 30,
+        profile_slow_cycle_seconds: float = 0.0,
+        profile_sample_every: int = 0,
     ):
         """
         Initialize CycleGuard.
@@ -82,6 +92,8 @@ class CycleGuard:
             max_cycle_duration_seconds: Maximum allowed cycle duration
             max_candle_age_seconds: Maximum age for a candle to be considered fresh
             max_clock_skew_seconds: Maximum allowed clock skew
+            profile_slow_cycle_seconds: Log SLOW_CYCLE (and keep cProfile stats) above this; 0 = off
+            profile_sample_every: Run every Nth tick under cProfile; 0 = never
         """
         self.min_interval = timedelta(seconds=min_cycle_interval_seconds)
         self.max_duration = timedelta(seconds=max_cycle_duration_seconds)
@@ -100,6 +112,12 @@ class CycleGuard:
         self._overlapped_cycles = 0
         self._skipped_cycles = 0
         
+        # Per-tick stage timings (laps + nested spans)
+        self.profiler = CycleProfiler(
+            slow_cycle_seconds=profile_slow_cycle_seconds,
+            profile_sample_every=profile_sample_every,
+        )
+        
         logger.info(
             "CycleGuard initialized",
             min_interval=min_cycle_interval_seconds,
@@ -155,6 +173,7 @@ class CycleGuard:
         )
         
         self._total_cycles += 1
+        self.profiler.attach(cycle_id)
         
         logger.info(
             "CYCLE_START",
@@ -186,10 +205,17 @@ class CycleGuard:
         
         elapsed = now - self.current_cycle.started_at
         
+        profile = self.profiler.finish()
+        if profile is not None:
+            self.current_cycle.stage_breakdown = {
+                path: round(ms, 1) for path, (ms, _) in profile.stages.items() if "/" not in path
+            }
+        
         logger.info(
             "CYCLE_END",
             cycle_id=self.current_cycle.cycle_id,
             duration_seconds=round(elapsed.total_seconds(), 2),
+            stages_ms=self.current_cycle.stage_breakdown or None,
             coins_processed=self.current_cycle.coins_processed,
             signals_generated=self.current_cycle.signals_generated,
             orders_placed=self.current_cycle.orders_placed,
@@ -309,10 +335,21 @@ class CycleGuard:
                 "orders_placed": c.orders_placed,
                 "orders_rejected": c.orders_rejected,
                 "error": c.error,
+                "stages_ms": c.stage_breakdown,
             }
             for c in self.cycle_history[-limit:]
         ]
     
+    def stage(self, name: str, symbol: Optional[str] = None):
+        """Nested stage span for the running tick (no-op outside a tick)."""
+        return self.profiler.stage(name, symbol=symbol)
+    
+    def get_profile_report(self, limit: int = 10) -> Dict:
+        """Recent and slowest ticks with their stage breakdowns (for /api/debug/cycles)."""
+        report = self.profiler.report(limit)
+        report["stats"] = self.get_cycle_stats()
+        return report
+    
     def clear_candle_history(self, older_than_hours: int = 24):
         """
         Clear old candle timestamps to prevent memory growth.
@@ -355,6 +392,8 @@ def init_cycle_guard(
     max_cycle_duration_seconds: int = 300,
     max_candle_age_seconds: int = 120,
     max_clock_skew_seconds: int = 30,
+    profile_slow_cycle_seconds: float = 0.0,
+    profile_sample_every: int = 0,
 ) -> CycleGuard:
     """Initialize global cycle guard with custom settings."""
     global _cycle_guard
@@ -363,5 +402,7 @@ def init_cycle_guard(
         max_cycle_duration_seconds=max_cycle_duration_seconds,
         max_candle_age_seconds=max_candle_age_seconds,
         max_clock_skew_seconds=max_clock_skew_seconds,
+        profile_slow_cycle_seconds=profile_slow_cycle_seconds,
+        profile_sample_every=profile_sample_every,
     )
     return _cycle_guard
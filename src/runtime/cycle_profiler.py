@@ -0,0 +1,245 @@
+"""
+CycleProfiler: per-tick stage timings for the trading loop.
+
+Two ways to record time:
+- ``lap(stage)`` closes the running top-level stage and opens the next one.
+  Used at the numbered section boundaries of ``LiveTrading._tick`` so the
+  long method needs no re-indentation.
+- ``stage(name, symbol=...)`` is a context manager for nested spans. The span
+  stack lives in a ContextVar, so concurrent ``process_coin`` tasks nest
+  under the lap that spawned them without seeing each other's spans.
+
+``finish()`` turns the tick into an immutable ``CycleProfile`` that is kept
+in a recent-ticks ring and a slowest-ticks window, and observed into the
+``trading_tick_stage_latency_ms{stage}`` histogram.
+
+Optional sampling capture: every ``profile_sample_every``-th tick runs under
+cProfile; the stats are kept only if the tick exceeded
+``slow_cycle_seconds``. (yappi is not a dependency; cProfile sees the event
+loop thread, which is where all tick work runs.)
+"""
+from __future__ import annotations
+
+import contextvars
+import cProfile
+import heapq
+import io
+import pstats
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from src.monitoring.logger import get_logger
+from src.monitoring.metrics import tick_stage_histogram
+
+logger = get_logger(__name__)
+
+# Current span path for the running task, e.g. ("analysis", "update_candles")
+_span_path: contextvars.ContextVar[Tuple[str, ...]] = contextvars.ContextVar(
+    "cycle_profiler_span_path", default=()
+)
+
+
+@dataclass(frozen=True)
+class CycleProfile:
+    """Stage breakdown of one completed tick."""
+    cycle_id: Optional[str]
+    started_at: datetime
+    duration_ms: float
+    # "lap" or "lap/span/..." -> (total_ms, count)
+    stages: Dict[str, Tuple[float, int]]
+    # slowest symbols: (symbol, total_ms, {stage: ms})
+    slow_symbols: Tuple[Tuple[str, float, Dict[str, float]], ...] = ()
+    profile_stats: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "cycle_id": self.cycle_id,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 1),
+            "stages": {
+                path: {"ms": round(ms, 1), "count": n}
+                for path, (ms, n) in sorted(self.stages.items(), key=lambda kv: -kv[1][0])
+            },
+            "slow_symbols": [
+                {"symbol": s, "ms": round(ms, 1), "stages": {k: round(v, 1) for k, v in st.items()}}
+                for s, ms, st in self.slow_symbols
+            ],
+            "profile_stats": self.profile_stats,
+        }
+
+
+@dataclass
+class _ActiveTick:
+    started_at: datetime
+    started: float
+    cycle_id: Optional[str] = None
+    lap_name: Optional[str] = None
+    lap_started: float = 0.0
+    stages: Dict[str, List[float]] = field(default_factory=dict)
+    symbols: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    profiler: Optional[cProfile.Profile] = None
+
+    def add(self, path: str, ms: float) -> None:
+        slot = self.stages.get(path)
+        if slot is None:
+            self.stages[path] = [ms, 1]
+        else:
+            slot[0] += ms
+            slot[1] += 1
+
+
+class CycleProfiler:
+    """Records nested stage durations per tick and keeps the slowest ticks."""
+
+    def __init__(
+        self,
+        history_size: int = 50,
+        slowest_size: int = 10,
+        slow_symbols_per_tick: int = 10,
+        slow_cycle_seconds: float = 0.0,
+        profile_sample_every: int = 0,
+    ):
+        self.slow_cycle_seconds = slow_cycle_seconds
+        self.profile_sample_every = profile_sample_every
+        self.slow_symbols_per_tick = slow_symbols_per_tick
+        self._slowest_size = slowest_size
+        self._recent: Deque[CycleProfile] = deque(maxlen=history_size)
+        # min-heap of (duration_ms, seq, profile): root is the fastest of the slow set
+        self._slowest: List[Tuple[float, int, CycleProfile]] = []
+        self._seq = 0
+        self._active: Optional[_ActiveTick] = None
+        self._histogram = tick_stage_histogram()
+
+    @property
+    def active(self) -> bool:
+        return self._active is not None
+
+    # ---------- tick lifecycle ----------
+
+    def begin(self) -> None:
+        """Start a tick (an unfinished previous tick is discarded)."""
+        if self._active is not None and self._active.profiler is not None:
+            self._active.profiler.disable()
+        self._seq += 1
+        tick = _ActiveTick(started_at=datetime.now(timezone.utc), started=time.perf_counter())
+        if self.profile_sample_every > 0 and self._seq % self.profile_sample_every == 0:
+            tick.profiler = cProfile.Profile()
+            tick.profiler.enable()
+        self._active = tick
+
+    def attach(self, cycle_id: str) -> None:
+        """Bind the running tick to a CycleGuard cycle id (begins one if needed)."""
+        if self._active is None:
+            self.begin()
+        self._active.cycle_id = cycle_id
+
+    def lap(self, stage_name: str) -> None:
+        """Close the current top-level stage and open ``stage_name``."""
+        tick = self._active
+        if tick is None:
+            return
+        now = time.perf_counter()
+        self._close_lap(tick, now)
+        tick.lap_name = stage_name
+        tick.lap_started = now
+
+    def _close_lap(self, tick: _ActiveTick, now: float) -> None:
+        if tick.lap_name is not None:
+            ms = (now - tick.lap_started) * 1000
+            tick.add(tick.lap_name, ms)
+            self._histogram.labels(stage=tick.lap_name).observe(ms)
+            tick.lap_name = None
+
+    @contextmanager
+    def stage(self, name: str, symbol: Optional[str] = None) -> Iterator[None]:
+        """Nested span under the current lap/span; no-op outside a tick."""
+        tick = self._active
+        if tick is None:
+            yield
+            return
+        parent = _span_path.get()
+        if not parent and tick.lap_name:
+            parent = (tick.lap_name,)
+        path = parent + (name,)
+        token = _span_path.set(path)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            _span_path.reset(token)
+            # The tick may have been finished/replaced while we awaited.
+            if self._active is tick:
+                key = "/".join(path)
+                tick.add(key, ms)
+                if symbol is not None:
+                    per = tick.symbols.setdefault(symbol, {})
+                    per[name] = per.get(name, 0.0) + ms
+
+    def finish(self) -> Optional[CycleProfile]:
+        """Complete the running tick. Idempotent: returns None if none is active."""
+        tick = self._active
+        if tick is None:
+            return None
+        self._active = None
+        now = time.perf_counter()
+        self._close_lap(tick, now)
+        duration_ms = (now - tick.started) * 1000
+        self._histogram.labels(stage="tick_total").observe(duration_ms)
+
+        stats_text = None
+        if tick.profiler is not None:
+            tick.profiler.disable()
+            if duration_ms >= self.slow_cycle_seconds * 1000:
+                buf = io.StringIO()
+                pstats.Stats(tick.profiler, stream=buf).sort_stats("cumulative").print_stats(30)
+                stats_text = buf.getvalue()
+
+        slow_symbols = heapq.nlargest(
+            self.slow_symbols_per_tick,
+            ((s, sum(st.values()), st) for s, st in tick.symbols.items()),
+            key=lambda row: row[1],
+        )
+        profile = CycleProfile(
+            cycle_id=tick.cycle_id,
+            started_at=tick.started_at,
+            duration_ms=duration_ms,
+            stages={k: (v[0], int(v[1])) for k, v in tick.stages.items()},
+            slow_symbols=tuple(slow_symbols),
+            profile_stats=stats_text,
+        )
+        self._recent.append(profile)
+        entry = (duration_ms, self._seq, profile)
+        if len(self._slowest) < self._slowest_size:
+            heapq.heappush(self._slowest, entry)
+        elif duration_ms > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+        if self.slow_cycle_seconds > 0 and duration_ms >= self.slow_cycle_seconds * 1000:
+            top = sorted(profile.stages.items(), key=lambda kv: -kv[1][0])[:5]
+            logger.warning(
+                "SLOW_CYCLE",
+                cycle_id=tick.cycle_id,
+                duration_ms=int(duration_ms),
+                top_stages={k: int(v[0]) for k, v in top},
+                profiled=stats_text is not None,
+            )
+        return profile
+
+    # ---------- reporting ----------
+
+    def recent(self, limit: int = 10) -> List[CycleProfile]:
+        return list(self._recent)[-limit:]
+
+    def slowest(self, limit: int = 10) -> List[CycleProfile]:
+        return [p for _, _, p in sorted(self._slowest, key=lambda e: -e[0])][:limit]
+
+    def report(self, limit: int = 10) -> Dict:
+        return {
+            "recent": [p.to_dict() for p in self.recent(limit)],
+            "slowest": [p.to_dict() for p in self.slowest(limit)],
+        }
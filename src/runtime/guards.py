@@ -16,9 +16,6 @@ from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import urlparse
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.pool import NullPool
-
 from src.exceptions import OperationalError
 from src.monitoring.logger import get_logger
 from src.utils.secret_manager import get_database_url
@@ -26,6 +23,14 @@ from src.utils.secret_manager import get_database_url
 logger = get_logger(__name__)
 
 
+def _sql(statement: str):
+    # SQLAlchemy is imported on first use: the env/fingerprint helpers here run
+    # on every CLI start, the advisory lock only in prod-live.
+    from sqlalchemy import text
+
+    return text(statement)
+
+
 def _env(name: str, default: Optional[str] = None) -> Optional[str]:
     v = os.getenv(name)
     if v is None:
@@ -157,9 +162,12 @@ class ProdLiveAdvisoryLock:
         if self._conn is not None:
             return
 
+        from sqlalchemy import create_engine
+        from sqlalchemy.pool import NullPool
+
         self._engine = create_engine(self.database_url, poolclass=NullPool, future=True)
         self._conn = self._engine.connect()
-        ok = bool(self._conn.execute(text("SELECT pg_try_advisory_lock(:k)"), {"k": self.lock_key}).scalar())
+        ok = bool(self._conn.execute(_sql("SELECT pg_try_advisory_lock(:k)"), {"k": self.lock_key}).scalar())
         if not ok:
             try:
                 self._conn.close()
@@ -185,7 +193,7 @@ class ProdLiveAdvisoryLock:
         if self._conn is None:
             raise RuntimeError("PROD_LIVE_LOCK_LOST: lock connection is not initialized")
         # If the connection is dead, the advisory lock is already lost (session-level lock).
-        self._conn.execute(text("SELECT 1"))
+        self._conn.execute(_sql("SELECT 1"))
 
     def db_identity(self) -> dict:
         """
@@ -211,7 +219,7 @@ class ProdLiveAdvisoryLock:
             return None
         try:
             rows = self._conn.execute(
-                text(
+                _sql(
                     """
                     SELECT table_name, column_name, data_type, is_nullable, ordinal_position
                     FROM information_schema.columns
@@ -232,7 +240,7 @@ class ProdLiveAdvisoryLock:
         if self._conn is None:
             return
         try:
-            self._conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": self.lock_key})
+            self._conn.execute(_sql("SELECT pg_advisory_unlock(:k)"), {"k": self.lock_key})
         except (OperationalError, OSError) as e:
             logger.warning("PROD_LIVE_LOCK_RELEASE_FAILED", error=str(e), lock_key_short=self.lock_key_short)
         finally:
@@ -0,0 +1,80 @@
+"""
+Import-time measurement for ``run.py diagnose-startup``.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter
+(so nothing is already cached in ``sys.modules``) and parses the per-module
+self/cumulative microseconds the interpreter writes to stderr.
+"""
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportReport:
+    target: str
+    timings: List[ImportTiming]
+    wall_seconds: float
+
+    @property
+    def total_us(self) -> int:
+        """Cumulative time of the top-level imports (depth 0)."""
+        return sum(t.cumulative_us for t in self.timings if t.depth == 0)
+
+    def top_cumulative(self, n: int = 25) -> List[ImportTiming]:
+        return sorted(self.timings, key=lambda t: -t.cumulative_us)[:n]
+
+    def top_self(self, n: int = 25) -> List[ImportTiming]:
+        return sorted(self.timings, key=lambda t: -t.self_us)[:n]
+
+    def find(self, module: str) -> Optional[ImportTiming]:
+        for t in self.timings:
+            if t.module == module:
+                return t
+        return None
+
+
+def parse_importtime(text: str) -> List[ImportTiming]:
+    """Parse ``-X importtime`` stderr; unrelated lines (and the header) are skipped."""
+    out: List[ImportTiming] = []
+    for line in text.splitlines():
+        m = _IMPORTTIME_LINE.match(line)
+        if not m:
+            continue
+        self_us, cum_us, indent, name = m.groups()
+        # One leading space is the column separator; nesting adds two per level.
+        depth = max(0, (len(indent) - 1) // 2)
+        out.append(ImportTiming(name, int(self_us), int(cum_us), depth))
+    return out
+
+
+def measure_imports(target: str, python: str = sys.executable, timeout: float = 120.0) -> ImportReport:
+    """Import ``target`` in a child interpreter under ``-X importtime``."""
+    import time
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"import {target} failed (exit {proc.returncode}): {tail}")
+    return ImportReport(target=target, timings=parse_importtime(proc.stderr), wall_seconds=wall)
@@ -17,10 +17,17 @@ Usage:
     sm.advance_to(StartupPhase.RECONCILING)
     sm.advance_to(StartupPhase.READY)
     sm.assert_ready()  # Use before any trading action
+
+Timing: every transition records the wall-clock spent in the phase it
+leaves (``phase_durations_seconds`` in ``get_status``), and ``step(name)``
+times individual startup steps inside a phase -- including steps that run
+concurrently, which is why step durations can sum to more than the phase.
 """
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from enum import Enum, unique
-from typing import Optional
+from typing import Dict, Iterator, Optional
 
 from src.monitoring.logger import get_logger
 
@@ -72,6 +79,11 @@ class StartupStateMachine:
         }
         self._startup_epoch: Optional[datetime] = None
         self._failure_reason: Optional[str] = None
+        self._created_mono: float = time.monotonic()
+        self._phase_started_mono: float = self._created_mono
+        self._phase_durations: Dict[StartupPhase, float] = {}
+        self._step_durations: Dict[str, float] = {}
+        self._time_to_ready: Optional[float] = None
 
     # -- Public API ----------------------------------------------------------
 
@@ -119,12 +131,17 @@ class StartupStateMachine:
             )
 
         now = datetime.now(timezone.utc)
+        now_mono = time.monotonic()
         prev_phase = self._phase
+        elapsed = now_mono - self._phase_started_mono
+        self._phase_durations[prev_phase] = elapsed
+        self._phase_started_mono = now_mono
         self._phase = next_phase
         self._phase_timestamps[next_phase] = now
 
         if next_phase == StartupPhase.READY:
             self._startup_epoch = now
+            self._time_to_ready = now_mono - self._created_mono
 
         if next_phase == StartupPhase.FAILED:
             self._failure_reason = reason or "unspecified"
@@ -134,7 +151,6 @@ class StartupStateMachine:
                 reason=self._failure_reason,
             )
         else:
-            elapsed = (now - self._phase_timestamps.get(prev_phase, now)).total_seconds()
             logger.info(
                 "Startup phase transition",
                 from_phase=prev_phase.value,
@@ -143,6 +159,15 @@ class StartupStateMachine:
                 reason=reason or None,
             )
 
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time one startup step (recorded even if the step raises)."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._step_durations[name] = time.monotonic() - started
+
     def fail(self, reason: str) -> None:
         """Transition directly to FAILED from any non-terminal state."""
         if self._phase == StartupPhase.FAILED:
@@ -198,4 +223,13 @@ class StartupStateMachine:
                 p.value: ts.isoformat()
                 for p, ts in self._phase_timestamps.items()
             },
+            "phase_durations_seconds": {
+                p.value: round(d, 3) for p, d in self._phase_durations.items()
+            },
+            "step_durations_seconds": {
+                name: round(d, 3) for name, d in self._step_durations.items()
+            },
+            "time_to_ready_seconds": (
+                round(self._time_to_ready, 3) if self._time_to_ready is not None else None
+            ),
         }
@@ -288,7 +288,7 @@ class ProductionHardeningLayer:
         # operational thresholds, causing false HALTs every time the system
         # operates at its intended capacity. (Same class as Bug #1: margin
         # threshold mismatch.)
-        threshold_errors = self._validate_config_safety_compatibility()
+        threshold_errors = self.validate_config_safety_compatibility()
         errors.extend(threshold_errors)
         
         success = len(errors) == 0
@@ -300,9 +300,16 @@ class ProductionHardeningLayer:
         
         return success, errors
     
-    def _validate_config_safety_compatibility(self) -> List[str]:
+    def validate_config_safety_compatibility(
+        self,
+        config: Any = None,
+        invariants: Optional[SystemInvariants] = None,
+    ) -> List[str]:
         """
         Validate that safety thresholds are compatible with operational config.
+
+        Checks the active config and invariants unless ``config`` /
+        ``invariants`` are given (a candidate hot reload).
         
         Rules:
         1. safety.max_concurrent_positions >= risk.auction_max_positions
@@ -314,8 +321,8 @@ class ProductionHardeningLayer:
             List of error strings (empty = all good)
         """
         errors = []
-        inv = self.invariant_monitor.invariants
-        risk = getattr(self.config, "risk", None)
+        inv = invariants if invariants is not None else self.invariant_monitor.invariants
+        risk = getattr(config if config is not None else self.config, "risk", None)
         
         if risk is None:
             logger.warning("Config-safety validation skipped: no risk config found")
@@ -378,9 +385,25 @@ class ProductionHardeningLayer:
                 safety_max_margin=str(inv.max_margin_utilization_pct),
                 auction_max_margin=str(auction_max_margin),
             )
-        
+
         return errors
-    
+
+    def apply_config(self, config: Any, safety_config: dict, invariants: SystemInvariants) -> None:
+        """
+        Swap in a hot-reloaded config and invariant thresholds.
+
+        Callers validate first (``validate_config_safety_compatibility``);
+        monitor history, cycle guard and reconciler state are kept.
+        """
+        self.config = config
+        self.safety_config = safety_config
+        self.invariant_monitor.invariants = invariants
+        logger.info(
+            "Hardening layer config swapped",
+            max_drawdown=str(invariants.max_equity_drawdown_pct),
+            max_positions=invariants.max_concurrent_positions,
+        )
+
     # ===== HALT STATE PERSISTENCE =====
     
     def _load_halt_state(self) -> Optional[PersistedHaltState]:
@@ -6,11 +6,13 @@ Includes connection-pool observability via SQLAlchemy pool events.
 """
 import sqlalchemy
 from sqlalchemy import create_engine, event
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from sqlalchemy.pool import Pool
 from contextlib import contextmanager
-from typing import Generator, Dict, Any
+from typing import Generator, Dict, Any, List
 import os
+import re
 import time
 
 from src.exceptions import OperationalError, DataError
@@ -21,6 +23,19 @@ _pool_logger = get_logger("db.pool")
 # Base class for ORM models
 Base = declarative_base()
 
+# Indexes added after their tables first shipped (``create_all`` only builds
+# indexes for tables it creates). Applied by ``run_index_migrations`` from the
+# daily maintenance run and scripts/create_indexes.py, not on every connect.
+INDEX_MIGRATIONS = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trade_symkey_exited ON trades (symbol_key, exited_at)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trade_symkey_reason_exited "
+    "ON trades (symbol_key, exit_reason, exited_at)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_type_symbol_time "
+    "ON system_events (event_type, symbol, timestamp DESC)",
+]
+
+_INDEX_TABLE_RE = re.compile(r"\bON\s+(\w+)\s*\(")
+
 
 class Database:
     """Database engine and session manager."""
@@ -86,14 +101,17 @@ class Database:
     def _run_migrations(self):
         """Add columns that may be missing on existing deployments.
         
-        Uses ADD COLUMN IF NOT EXISTS (Postgres >=9.6).  Wrapped in
-        try/except per-statement so one failure doesn't block others.
+        Uses ADD COLUMN IF NOT EXISTS (Postgres >=9.6).  Wrapped in try/except
+        per-statement so one failure doesn't block others.  Index builds and
+        the symbol_key backfill are heavier and live in ``run_index_migrations``
+        / ``backfill_symbol_keys`` (daily maintenance), so connecting stays cheap.
         """
         import logging
         migrations = [
             "ALTER TABLE trades ADD COLUMN IF NOT EXISTS size NUMERIC(20,8)",
             "ALTER TABLE trades ADD COLUMN IF NOT EXISTS maker_fills_count INTEGER",
             "ALTER TABLE trades ADD COLUMN IF NOT EXISTS taker_fills_count INTEGER",
+            "ALTER TABLE trades ADD COLUMN IF NOT EXISTS symbol_key VARCHAR",
         ]
         with self.engine.connect() as conn:
             for stmt in migrations:
@@ -111,6 +129,7 @@ class Database:
                     except (OperationalError, OSError):
                         pass
 
+
     def drop_all(self):
         """Drop all tables (use with caution!)."""
         Base.metadata.drop_all(bind=self.engine)
@@ -143,6 +162,34 @@ class Database:
 _db_instance: Database | None = None
 
 
+def run_index_migrations(engine) -> List[str]:
+    """
+    Apply ``INDEX_MIGRATIONS``; returns the statements that were executed.
+
+    Indexes are built CONCURRENTLY so a first build on a large table doesn't
+    block writers. Postgres rejects CONCURRENTLY on a partitioned parent
+    (relkind 'p', see scripts/partition_tables.py), so those are issued as
+    a plain CREATE INDEX, which is a no-op once the index exists.
+    """
+    import logging
+    applied: List[str] = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for stmt in INDEX_MIGRATIONS:
+            match = _INDEX_TABLE_RE.search(stmt)
+            try:
+                relkind = conn.execute(
+                    sqlalchemy.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:t)"),
+                    {"t": match.group(1)},
+                ).scalar() if match else None
+                if relkind == "p":
+                    stmt = stmt.replace(" CONCURRENTLY", "", 1)
+                conn.execute(sqlalchemy.text(stmt))
+                applied.append(stmt)
+            except (DBAPIError, OperationalError, OSError) as e:
+                logging.warning(f"Index migration warning: {stmt!r} -> {e}")
+    return applied
+
+
 def get_db() -> Database:
     """
     Get or create the global database instance.
@@ -8,19 +8,38 @@ Retention policies:
   - 1h candles:  90 days
   - 4h candles:  365 days (1 year)
   - 1d candles:  kept indefinitely
-  - DECISION_TRACE events: 3 days
+  - DECISION_TRACE events: 3 days (and ``latest_trace_per_symbol`` rows
+    whose newest trace is older than that, e.g. delisted symbols)
+
+Once ``system_events`` / ``candles`` are partitioned (see
+``src.storage.partitioning``), retention drops whole partitions instead of
+DELETEing rows; plain tables keep the DELETE path.
 """
 from datetime import datetime, timedelta, timezone
-from typing import Dict
+from typing import Dict, List
 
 from sqlalchemy import text, func
+from sqlalchemy.exc import DBAPIError
 
+from src.data.symbol_utils import symbol_key
 from src.exceptions import OperationalError, DataError
 from src.monitoring.logger import get_logger
-from src.storage.db import get_db
+from src.storage.db import get_db, run_index_migrations
+from src.storage.partitioning import (
+    CANDLE_GROUPS,
+    EVENT_GROUPS,
+    TRACE_GROUP,
+    RangeGroup,
+    drop_expired,
+    ensure_partitions,
+    is_partitioned,
+)
 
 logger = get_logger(__name__)
 
+# Driver errors surface as sqlalchemy DBAPIError, not the repo's exception types.
+_DB_ERRORS = (DBAPIError, OperationalError, OSError)
+
 # Candle retention policies: timeframe -> max age in days.
 # 1d candles are intentionally omitted (kept forever).
 CANDLE_RETENTION_DAYS: Dict[str, int] = {
@@ -30,6 +49,30 @@ CANDLE_RETENTION_DAYS: Dict[str, int] = {
 }
 
 
+def backfill_symbol_keys(engine) -> int:
+    """
+    Populate ``trades.symbol_key`` for rows written before the column existed.
+
+    One UPDATE per distinct raw symbol (a few hundred at most), each served by
+    the ``(symbol, ...)`` indexes. Idempotent; returns the number of rows set.
+    """
+    updated = 0
+    with engine.connect() as conn:
+        symbols = conn.execute(
+            text("SELECT DISTINCT symbol FROM trades WHERE symbol_key IS NULL")
+        ).scalars().all()
+        for raw in symbols:
+            result = conn.execute(
+                text("UPDATE trades SET symbol_key = :key WHERE symbol = :symbol AND symbol_key IS NULL"),
+                {"key": symbol_key(raw), "symbol": raw},
+            )
+            updated += result.rowcount or 0
+        conn.commit()
+    if updated:
+        logger.info("Backfilled trades.symbol_key", rows=updated, symbols=len(symbols))
+    return updated
+
+
 class DatabasePruner:
     """Service for cleaning up old database records."""
 
@@ -44,12 +87,92 @@ class DatabasePruner:
             self._db = get_db()
         return self._db
 
+    def _is_partitioned(self, table: str) -> bool:
+        try:
+            with self.db.engine.connect() as conn:
+                return is_partitioned(conn, table)
+        except _DB_ERRORS as e:
+            logger.warning("Partition check failed", table=table, error=str(e))
+            return False
+
+    def _drop_expired(self, group: RangeGroup, cutoff: datetime) -> int:
+        try:
+            with self.db.engine.connect() as conn:
+                dropped, rows = drop_expired(conn, group, cutoff)
+                conn.commit()
+        except _DB_ERRORS as e:
+            logger.error("Failed to drop expired partitions", parent=group.parent, error=str(e))
+            return 0
+        if dropped:
+            logger.info(
+                "Dropped expired partitions",
+                parent=group.parent,
+                partitions=dropped,
+                approx_rows=rows,
+                cutoff=cutoff.isoformat(),
+            )
+        return rows
+
+    def maintain_partitions(self) -> List[str]:
+        """Create upcoming partitions for whichever tables are partitioned."""
+        created: List[str] = []
+        for table, groups in (("system_events", EVENT_GROUPS), ("candles", tuple(CANDLE_GROUPS.values()))):
+            if not self._is_partitioned(table):
+                continue
+            try:
+                with self.db.engine.connect() as conn:
+                    created += ensure_partitions(conn, groups)
+                    conn.commit()
+            except _DB_ERRORS as e:
+                logger.error("Failed to create partitions", table=table, error=str(e))
+        if created:
+            logger.info("Created partitions", partitions=created)
+        return created
+
+    def apply_schema_migrations(self) -> dict:
+        """
+        Build missing indexes and backfill ``trades.symbol_key``.
+
+        Kept out of ``get_db()`` so short-lived processes don't pay for (or
+        fail on) index builds; the live loop runs this in a worker thread.
+        """
+        result = {"indexes": 0, "symbol_keys_backfilled": 0}
+        try:
+            result["indexes"] = len(run_index_migrations(self.db.engine))
+            result["symbol_keys_backfilled"] = backfill_symbol_keys(self.db.engine)
+        except _DB_ERRORS as e:
+            logger.error("Schema migrations failed", error=str(e))
+        return result
+
+    def prune_latest_traces(self, cutoff: datetime) -> int:
+        """Drop ``latest_trace_per_symbol`` rows older than *cutoff* (symbols no longer traced)."""
+        try:
+            with self.db.engine.connect() as conn:
+                count = conn.execute(
+                    text("DELETE FROM latest_trace_per_symbol WHERE timestamp < :cutoff"),
+                    {"cutoff": cutoff},
+                ).rowcount or 0
+                conn.commit()
+        except _DB_ERRORS as e:
+            logger.error("Failed to prune latest traces", error=str(e))
+            return 0
+        if count:
+            logger.info("Pruned stale latest traces", count=count, cutoff=cutoff.isoformat())
+        return count
+
     def prune_old_traces(self, days_to_keep: int = 3) -> int:
         """
         Delete DECISION_TRACE events older than *days_to_keep* days.
         Retains signals and critical errors, only deletes high-frequency traces.
+
+        On a partitioned ``system_events`` this drops whole daily partitions
+        (the row count is then approximate). ``latest_trace_per_symbol`` is
+        pruned on the same cutoff.
         """
         cutoff = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
+        self.prune_latest_traces(cutoff)
+        if self._is_partitioned("system_events"):
+            return self._drop_expired(TRACE_GROUP, cutoff)
 
         with self.db.get_session() as session:
             try:
@@ -70,7 +193,7 @@ class DatabasePruner:
                 )
                 return count
 
-            except (OperationalError, OSError) as e:
+            except _DB_ERRORS as e:
                 session.rollback()
                 logger.error("Failed to prune decision traces", error=str(e))
                 return 0
@@ -85,13 +208,19 @@ class DatabasePruner:
           - 4h:  365 days (1 year)
           - 1d:  kept indefinitely
 
-        Returns the total number of rows deleted across all timeframes.
+        Returns the total number of rows deleted across all timeframes
+        (approximate when the table is partitioned and partitions are dropped).
         """
         from src.storage.repository import CandleModel
 
         total_deleted = 0
         now = datetime.now(timezone.utc)
 
+        if self._is_partitioned("candles"):
+            for timeframe, max_days in CANDLE_RETENTION_DAYS.items():
+                total_deleted += self._drop_expired(CANDLE_GROUPS[timeframe], now - timedelta(days=max_days))
+            return total_deleted
+
         with self.db.get_session() as session:
             for timeframe, max_days in CANDLE_RETENTION_DAYS.items():
                 cutoff = now - timedelta(days=max_days)
@@ -113,7 +242,7 @@ class DatabasePruner:
                             cutoff=cutoff.isoformat(),
                         )
                     total_deleted += count
-                except (OperationalError, OSError) as e:
+                except _DB_ERRORS as e:
                     logger.error(
                         "Failed to prune candles",
                         timeframe=timeframe,
@@ -123,7 +252,7 @@ class DatabasePruner:
             if total_deleted > 0:
                 try:
                     session.commit()
-                except (OperationalError, OSError) as e:
+                except _DB_ERRORS as e:
                     session.rollback()
                     logger.error(
                         "Failed to commit candle pruning", error=str(e)
@@ -170,15 +299,23 @@ class DatabasePruner:
                     stats[f"candles_{tf}"] = cnt
 
                 logger.info("DB_TABLE_STATS", **stats)
-            except (OperationalError, OSError) as e:
+            except _DB_ERRORS as e:
                 logger.warning("Failed to gather table stats", error=str(e))
 
         return stats
 
     def run_maintenance(self) -> dict:
-        """Run all maintenance tasks and log table stats."""
+        """
+        Run all maintenance tasks and log table stats.
+
+        Blocking (index builds, backfill UPDATEs, partition DDL): the live
+        loop runs it in a worker thread, never on the event loop. Each step
+        logs and swallows its own DB errors so one failure doesn't skip the rest.
+        """
         logger.info("Starting database maintenance...")
 
+        self.apply_schema_migrations()
+        partitions_created = self.maintain_partitions()
         traces_deleted = self.prune_old_traces(days_to_keep=3)
         candles_deleted = self.prune_old_candles()
 
@@ -186,6 +323,7 @@ class DatabasePruner:
         self.log_table_stats()
 
         return {
+            "partitions_created": len(partitions_created),
             "traces_deleted": traces_deleted,
             "candles_deleted": candles_deleted,
         }
@@ -0,0 +1,286 @@
+"""
+Native Postgres partitioning for the high-volume tables.
+
+Layout (built by ``scripts/partition_tables.py``; table names are unchanged,
+so ORM models and queries keep working against the parents):
+
+    system_events                       PARTITION BY LIST (event_type)
+      system_events_trace               ('DECISION_TRACE')  PARTITION BY RANGE (timestamp)
+        system_events_trace_p20260101   one per UTC day
+        system_events_trace_default
+      system_events_audit               ('DECISION_AUDIT')  same, daily
+      system_events_other               DEFAULT: every other event type, unpartitioned
+
+    candles                             PARTITION BY LIST (timeframe)
+      candles_15m                       ('15m')  PARTITION BY RANGE (timestamp)
+        candles_15m_p202601             one per UTC month
+        candles_15m_default
+      candles_1h, candles_4h            same, monthly
+      candles_other                     DEFAULT: 1d (kept forever) and anything else
+
+Retention drops whole partitions (``DatabasePruner``) instead of DELETEing
+rows, so there is no dead-tuple bloat or vacuum backlog. ``ensure_partitions``
+creates upcoming partitions ahead of time; rows outside every range land in
+the group's default partition and are moved out once their partition exists.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+DAY = "day"
+MONTH = "month"
+
+
+@dataclass(frozen=True)
+class RangeGroup:
+    """A LIST partition of ``root`` that is itself range-partitioned by time."""
+    root: str
+    parent: str
+    list_values: Tuple[str, ...]
+    granularity: str
+
+    @property
+    def default(self) -> str:
+        return f"{self.parent}_default"
+
+
+TRACE_GROUP = RangeGroup("system_events", "system_events_trace", ("DECISION_TRACE",), DAY)
+AUDIT_GROUP = RangeGroup("system_events", "system_events_audit", ("DECISION_AUDIT",), DAY)
+EVENT_GROUPS: Tuple[RangeGroup, ...] = (TRACE_GROUP, AUDIT_GROUP)
+
+CANDLE_GROUPS: Dict[str, RangeGroup] = {
+    tf: RangeGroup("candles", f"candles_{tf}", (tf,), MONTH) for tf in ("15m", "1h", "4h")
+}
+
+# How far ahead ``ensure_partitions`` creates partitions, per granularity.
+PERIODS_AHEAD = {DAY: 7, MONTH: 2}
+
+_PARTITION_KEYS = {"system_events": "event_type", "candles": "timeframe"}
+_PRIMARY_KEYS = {"system_events": "(id, event_type, timestamp)", "candles": "(id, timeframe, timestamp)"}
+
+
+# ---------- period arithmetic ----------
+
+def _naive_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def period_start(dt: datetime, granularity: str) -> datetime:
+    """Floor ``dt`` (naive UTC, like the DateTime columns) to its partition period."""
+    dt = _naive_utc(dt)
+    if granularity == DAY:
+        return datetime(dt.year, dt.month, dt.day)
+    return datetime(dt.year, dt.month, 1)
+
+
+def next_period(start: datetime, granularity: str) -> datetime:
+    if granularity == DAY:
+        return start + timedelta(days=1)
+    return datetime(start.year + (start.month == 12), start.month % 12 + 1, 1)
+
+
+def periods(start: datetime, end: datetime, granularity: str) -> List[datetime]:
+    """Period starts covering [start, end]."""
+    out = []
+    cur = period_start(start, granularity)
+    end = _naive_utc(end)
+    while cur <= end:
+        out.append(cur)
+        cur = next_period(cur, granularity)
+    return out
+
+
+# ---------- naming ----------
+
+def partition_name(group: RangeGroup, start: datetime) -> str:
+    suffix = start.strftime("%Y%m%d" if group.granularity == DAY else "%Y%m")
+    return f"{group.parent}_p{suffix}"
+
+
+def parse_partition_start(group: RangeGroup, name: str) -> Optional[datetime]:
+    """Inverse of ``partition_name``; None for the default or foreign tables."""
+    digits = 8 if group.granularity == DAY else 6
+    m = re.fullmatch(rf"{re.escape(group.parent)}_p(\d{{{digits}}})", name)
+    if not m:
+        return None
+    try:
+        return datetime.strptime(m.group(1), "%Y%m%d" if digits == 8 else "%Y%m")
+    except ValueError:
+        return None
+
+
+def expired_partitions(group: RangeGroup, names: Iterable[str], cutoff: datetime) -> List[str]:
+    """Partitions whose whole range ends at or before ``cutoff``, oldest first."""
+    cutoff = _naive_utc(cutoff)
+    dated = [(parse_partition_start(group, n), n) for n in names]
+    return [
+        n for start, n in sorted(d for d in dated if d[0] is not None)
+        if next_period(start, group.granularity) <= cutoff
+    ]
+
+
+# ---------- DDL ----------
+
+def _values(values: Sequence[str]) -> str:
+    return ", ".join("'" + v.replace("'", "''") + "'" for v in values)
+
+
+def create_partition_sql(group: RangeGroup, start: datetime) -> str:
+    end = next_period(start, group.granularity)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(group, start)} PARTITION OF {group.parent} "
+        f"FOR VALUES FROM ('{start:%Y-%m-%d %H:%M:%S}') TO ('{end:%Y-%m-%d %H:%M:%S}')"
+    )
+
+
+def split_default_statements(group: RangeGroup, start: datetime) -> List[str]:
+    """
+    DDL creating ``start``'s partition when the default already holds rows
+    in its range (Postgres refuses the plain CREATE in that case).
+
+    The default is detached, the partition created, the overlapping rows
+    re-inserted through the parent (so they route to the new partition) and
+    deleted from the default, which is then re-attached. Run it in one
+    transaction.
+    """
+    end = next_period(start, group.granularity)
+    in_range = f"timestamp >= '{start:%Y-%m-%d %H:%M:%S}' AND timestamp < '{end:%Y-%m-%d %H:%M:%S}'"
+    return [
+        f"ALTER TABLE {group.parent} DETACH PARTITION {group.default}",
+        create_partition_sql(group, start),
+        f"INSERT INTO {group.parent} SELECT * FROM {group.default} WHERE {in_range}",
+        f"DELETE FROM {group.default} WHERE {in_range}",
+        f"ALTER TABLE {group.parent} ATTACH PARTITION {group.default} DEFAULT",
+    ]
+
+
+def conversion_statements(
+    table: str,
+    groups: Sequence[RangeGroup],
+    starts: Dict[str, datetime],
+    now: datetime,
+    index_ddl: Sequence[str],
+    copy_filter: str = "",
+) -> List[str]:
+    """
+    DDL converting an existing plain ``table`` into the partitioned layout.
+
+    Meant to run in one transaction (``scripts/partition_tables.py``): the
+    old table is renamed, rows are copied into the new tree, the id sequence
+    is handed over and the old table dropped; ``index_ddl`` is then created
+    on the parent (and propagates to every partition). ``starts`` maps each
+    group's parent to the first period to create; ``copy_filter`` is an
+    optional WHERE clause limiting what gets copied.
+    """
+    legacy = f"{table}_legacy"
+    key = _PARTITION_KEYS[table]
+    stmts = [
+        f"ALTER TABLE {table} RENAME TO {legacy}",
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY LIST ({key})",
+        f"ALTER TABLE {table} ADD PRIMARY KEY {_PRIMARY_KEYS[table]}",
+    ]
+    for group in groups:
+        stmts.append(
+            f"CREATE TABLE {group.parent} PARTITION OF {table} "
+            f"FOR VALUES IN ({_values(group.list_values)}) PARTITION BY RANGE (timestamp)"
+        )
+        stmts.append(f"CREATE TABLE {group.default} PARTITION OF {group.parent} DEFAULT")
+        first = starts.get(group.parent, now)
+        ahead = now
+        for _ in range(PERIODS_AHEAD[group.granularity]):
+            ahead = next_period(period_start(ahead, group.granularity), group.granularity)
+        stmts.extend(create_partition_sql(group, p) for p in periods(first, ahead, group.granularity))
+    stmts.append(f"CREATE TABLE {table}_other PARTITION OF {table} DEFAULT")
+    where = f" WHERE {copy_filter}" if copy_filter else ""
+    stmts.append(f"INSERT INTO {table} SELECT * FROM {legacy}{where}")
+    stmts.append(f"ALTER SEQUENCE IF EXISTS {table}_id_seq OWNED BY {table}.id")
+    stmts.append(f"DROP TABLE {legacy}")
+    stmts.extend(index_ddl)
+    return stmts
+
+
+# ---------- catalog / maintenance (Postgres connections) ----------
+
+def is_partitioned(conn, table: str) -> bool:
+    row = conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :t"
+        ),
+        {"t": table},
+    ).first()
+    return row is not None
+
+
+def list_partitions(conn, parent: str) -> List[str]:
+    rows = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :parent"
+        ),
+        {"parent": parent},
+    ).fetchall()
+    return [r[0] for r in rows]
+
+
+def _default_has_rows(conn, group: RangeGroup, start: datetime) -> bool:
+    row = conn.execute(
+        text(f"SELECT 1 FROM {group.default} WHERE timestamp >= :start AND timestamp < :end LIMIT 1"),
+        {"start": start, "end": next_period(start, group.granularity)},
+    ).first()
+    return row is not None
+
+
+def ensure_partitions(conn, groups: Iterable[RangeGroup], now: Optional[datetime] = None) -> List[str]:
+    """
+    Create the current and next ``PERIODS_AHEAD`` partitions of each group.
+
+    Rows that landed in the default partition for a missing period (e.g.
+    maintenance was down) are moved into the new partition.
+    """
+    now = _naive_utc(now or datetime.now(timezone.utc))
+    created = []
+    for group in groups:
+        existing = set(list_partitions(conn, group.parent))
+        start = period_start(now, group.granularity)
+        for _ in range(PERIODS_AHEAD[group.granularity] + 1):
+            name = partition_name(group, start)
+            if name not in existing:
+                if group.default in existing and _default_has_rows(conn, group, start):
+                    stmts = split_default_statements(group, start)
+                else:
+                    stmts = [create_partition_sql(group, start)]
+                for stmt in stmts:
+                    conn.execute(text(stmt))
+                created.append(name)
+            start = next_period(start, group.granularity)
+    return created
+
+
+def drop_expired(conn, group: RangeGroup, cutoff: datetime) -> Tuple[List[str], int]:
+    """
+    Drop the group's partitions entirely older than ``cutoff`` and delete
+    stragglers from its default partition.
+
+    Returns (dropped partition names, approximate rows removed). Row counts
+    of dropped partitions come from planner statistics (``reltuples``).
+    """
+    names = expired_partitions(group, list_partitions(conn, group.parent), cutoff)
+    rows = 0
+    for name in names:
+        est = conn.execute(text("SELECT reltuples::bigint FROM pg_class WHERE relname = :n"), {"n": name}).scalar()
+        rows += max(0, int(est or 0))
+        conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    result = conn.execute(
+        text(f"DELETE FROM {group.default} WHERE timestamp < :cutoff"), {"cutoff": _naive_utc(cutoff)}
+    )
+    rows += result.rowcount or 0
+    return names, rows
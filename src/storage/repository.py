@@ -3,18 +3,32 @@ Persistence functions for storing and retrieving trading data.
 
 Provides repository pattern for clean data access.
 """
-from sqlalchemy import Column, String, Numeric, DateTime, Integer, Boolean, Index, UniqueConstraint
+from sqlalchemy import Column, String, Numeric, DateTime, Integer, Boolean, Index, UniqueConstraint, and_, or_
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from typing import List, Optional, Dict, Tuple, Any
 import json
 from src.exceptions import OperationalError, DataError
 from src.storage.db import Base, get_db
+from src.data.symbol_utils import futures_candidate_symbols, symbol_key
+from src.storage.trade_ledger import get_trade_ledger
 from src.domain.models import Candle, Trade, Position, Side
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics import get_metrics_registry, timed
 
 logger = get_logger(__name__)
 
+_DB_LATENCY = get_metrics_registry().histogram(
+    "trading_db_helper_latency_ms",
+    "Repository helper latency (session + query)",
+    ("helper", "outcome"),
+)
+
+
+def _db_timed(fn):
+    """Observe a repository helper into ``_DB_LATENCY`` labelled by function name."""
+    return timed(_DB_LATENCY, helper=fn.__name__)(fn)
+
 
 # Query Cache
 class QueryCache:
@@ -100,13 +114,21 @@ class TradeModel(Base):
     __table_args__ = (
         # Indexes for common query patterns
         Index('idx_trade_symbol_date', 'symbol', 'entered_at'),
-        Index('idx_trade_symbol_exited', 'symbol', 'exited_at'),  # stopout/loss queries
+        Index('idx_trade_symbol_exited', 'symbol', 'exited_at'),
+        # Per-symbol window queries go through the normalized key (loss
+        # cooldown, stop-out count); see Database._run_migrations and
+        # DatabasePruner.apply_schema_migrations for existing deployments.
+        Index('idx_trade_symkey_exited', 'symbol_key', 'exited_at'),
+        Index('idx_trade_symkey_reason_exited', 'symbol_key', 'exit_reason', 'exited_at'),
         Index('idx_trade_exit_reason', 'exit_reason'),
         Index('idx_trade_pnl', 'net_pnl'),
     )
     
     trade_id = Column(String, primary_key=True)
     symbol = Column(String, nullable=False)
+    # symbol_utils.symbol_key(symbol): PF_XBTUSD, BTC/USD, BTC/USD:USD -> BTCUSD.
+    # Nullable until backfilled on deployments that predate the column.
+    symbol_key = Column(String, nullable=True)
     side = Column(String, nullable=False)
     entry_price = Column(Numeric(precision=20, scale=8), nullable=False)
     exit_price = Column(Numeric(precision=20, scale=8), nullable=False)
@@ -190,6 +212,31 @@ class SystemEventModel(Base):
     details = Column(String, nullable=False) # JSON string
 
 
+# Latest-event-per-(type, symbol) lookups (get_recent_events with both
+# filters, get_latest_traces, last signal per symbol). Declared outside
+# __table_args__ because it needs the DESC column expression.
+Index(
+    'idx_event_type_symbol_time',
+    SystemEventModel.event_type,
+    SystemEventModel.symbol,
+    SystemEventModel.timestamp.desc(),
+)
+
+
+class LatestTraceModel(Base):
+    """Most recent DECISION_TRACE per symbol, upserted alongside each trace event.
+
+    Keeps "latest decision per symbol" a primary-key read instead of a
+    GROUP BY over ``system_events``.
+    """
+    __tablename__ = "latest_trace_per_symbol"
+
+    symbol = Column(String, primary_key=True)
+    timestamp = Column(DateTime, nullable=False)
+    decision_id = Column(String, nullable=True)
+    details = Column(String, nullable=False)  # JSON string
+
+
 class AccountStateModel(Base):
     """ORM model for account balance tracking - OPTIMIZED with index."""
     __tablename__ = "account_state"
@@ -234,6 +281,7 @@ class ThesisModel(Base):
 
 
 # Repository Functions
+@_db_timed
 def save_candle(candle: Candle) -> None:
     """Save a candle to the database."""
     try:
@@ -258,6 +306,7 @@ def save_candle(candle: Candle) -> None:
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy import insert as generic_insert
 
+@_db_timed
 def save_candles_bulk(candles: List[Candle]) -> int:
     """
     Save multiple candles to the database using atomic Upsert.
@@ -340,6 +389,7 @@ def save_candles_bulk(candles: List[Candle]) -> int:
 
 
 
+@_db_timed
 def get_candles(
     symbol: str,
     timeframe: str,
@@ -417,6 +467,7 @@ def _get_candles_from_db(
         ]
 
 
+@_db_timed
 def get_latest_candle_timestamp(symbol: str, timeframe: str) -> Optional[datetime]:
     """
     Get the timestamp of the latest candle for a symbol and timeframe.
@@ -440,6 +491,7 @@ def get_latest_candle_timestamp(symbol: str, timeframe: str) -> Optional[datetim
         return None
 
 
+@_db_timed
 def count_candles(symbol: str, timeframe: str) -> int:
     """Return the number of candles stored for the given symbol and timeframe."""
     db = get_db()
@@ -450,6 +502,7 @@ def count_candles(symbol: str, timeframe: str) -> int:
         ).count()
 
 
+@_db_timed
 def load_candles_map(
     symbols: List[str],
     timeframe: str,
@@ -505,6 +558,7 @@ def load_candles_map(
                     
     return results
 
+@_db_timed
 def save_trade(trade: Trade) -> None:
     """Save a completed trade to the database."""
     if trade.entry_price <= 0 or trade.size_notional <= 0:
@@ -518,6 +572,7 @@ def save_trade(trade: Trade) -> None:
         trade_model = TradeModel(
             trade_id=trade.trade_id,
             symbol=trade.symbol,
+            symbol_key=symbol_key(trade.symbol),
             side=trade.side.value,
             entry_price=trade.entry_price,
             exit_price=trade.exit_price,
@@ -537,7 +592,14 @@ def save_trade(trade: Trade) -> None:
         )
         session.add(trade_model)
 
+    # Every writer (gateway hook, protection monitor stop fills, ...) lands
+    # here, so hot-path cooldown/stop-out gates see the trade immediately.
+    ledger = get_trade_ledger()
+    if ledger.hydrated:
+        ledger.record(trade)
+
 
+@_db_timed
 def save_position(position: Position) -> None:
     """Save or update position state."""
     try:
@@ -607,6 +669,7 @@ def save_position(position: Position) -> None:
         raise  # Re-raise - position persistence is critical
 
 
+@_db_timed
 def delete_position(symbol: str) -> None:
     """Delete a position (when closed)."""
     db = get_db()
@@ -614,6 +677,7 @@ def delete_position(symbol: str) -> None:
         session.query(PositionModel).filter(PositionModel.symbol == symbol).delete()
 
 
+@_db_timed
 def sync_active_positions(positions: List[Position]) -> None:
     """
     Sync database with current active positions.
@@ -704,6 +768,7 @@ def sync_active_positions(positions: List[Position]) -> None:
                 session.add(pm)
 
 
+@_db_timed
 def get_active_position(symbol: str = "BTC/USD") -> Optional[Position]:
     """
     Get active position for symbol.
@@ -753,6 +818,7 @@ def get_active_position(symbol: str = "BTC/USD") -> Optional[Position]:
         )
 
 
+@_db_timed
 def get_active_positions() -> List[Position]:
     """Retrieve all active positions."""
     db = get_db()
@@ -794,6 +860,7 @@ def get_active_positions() -> List[Position]:
         ]
 
 
+@_db_timed
 def get_all_trades() -> List[Trade]:
     """Retrieve all trades from the database."""
     db = get_db()
@@ -825,6 +892,7 @@ def get_all_trades() -> List[Trade]:
         ]
 
 
+@_db_timed
 def get_trades_since(since: datetime) -> List[Trade]:
     """
     Retrieve trades closed since a specific time.
@@ -867,27 +935,68 @@ def get_trades_since(since: datetime) -> List[Trade]:
         ]
 
 
+@_db_timed
 def count_recent_stopouts(symbol: str, lookback_hours: int = 24) -> int:
     """
-    Count recent stop-loss exits for a symbol (spot or futures symbol form).
+    Count recent stop-loss exits for a symbol (any symbol format).
+
+    Served by ``idx_trade_symkey_reason_exited``.
     """
     if not symbol:
         return 0
-    cutoff = _to_naive_utc(datetime.now(timezone.utc) - timedelta(hours=max(1, lookback_hours)))
-    base_symbol = symbol.replace("PF_", "").replace("USD", "/USD").replace("//", "/")
-    futures_symbol = "PF_" + symbol.replace("/", "").replace("PF_", "")
+    since = datetime.now(timezone.utc) - timedelta(hours=max(1, lookback_hours))
 
     db = get_db()
     with db.get_session() as session:
-        return (
-            session.query(TradeModel)
-            .filter(
-                (TradeModel.symbol.ilike(f"%{base_symbol}%")) | (TradeModel.symbol.ilike(f"%{futures_symbol}%")),
-                TradeModel.exit_reason.ilike("Stop Loss%"),
-                TradeModel.exited_at >= cutoff,
-            )
-            .count()
-        )
+        return stopouts_query(session, symbol_key(symbol), since).count()
+
+
+def _legacy_symbol_spellings(key: str) -> List[str]:
+    """Raw ``trades.symbol`` spellings that ``symbol_key`` maps to ``key`` (BTCUSD -> PF_XBTUSD, BTC/USD, ...)."""
+    if not key.endswith("USD") or len(key) <= 3:
+        return [key]
+    base = key[:-3]
+    spot = [f"{b}/USD" for b in (("BTC", "XBT") if base == "BTC" else (base,))]
+    return spot + futures_candidate_symbols(spot[0])
+
+
+def _symbol_key_filter(key: str):
+    """
+    ``symbol_key == key``, plus legacy rows whose key is still NULL.
+
+    Rows written before the column existed stay NULL until
+    ``backfill_symbol_keys`` has run; they are matched on their raw spellings
+    so cooldowns and stop-out counts don't drop them in the meantime. The
+    ``IS NULL`` branch is its own index probe and is empty after the backfill.
+    """
+    return or_(
+        TradeModel.symbol_key == key,
+        and_(TradeModel.symbol_key.is_(None), TradeModel.symbol.in_(_legacy_symbol_spellings(key))),
+    )
+
+
+def stopouts_query(session, key: str, since: datetime):
+    """Stop-loss exits on ``key`` (a ``symbol_key``) since ``since``."""
+    return session.query(TradeModel).filter(
+        _symbol_key_filter(key),
+        TradeModel.exit_reason.ilike("Stop Loss%"),
+        TradeModel.exited_at >= _to_naive_utc(since),
+    )
+
+
+def symbol_losses_query(session, key: str, since: datetime):
+    """(count, sum net_pnl, sum notional) of losing trades on ``key`` since ``since``."""
+    from sqlalchemy import func
+
+    return session.query(
+        func.count(),
+        func.coalesce(func.sum(TradeModel.net_pnl), 0),
+        func.coalesce(func.sum(TradeModel.size_notional), 0),
+    ).filter(
+        _symbol_key_filter(key),
+        TradeModel.exited_at >= _to_naive_utc(since),
+        TradeModel.net_pnl < 0,
+    )
 
 
 def _to_naive_utc(dt: datetime) -> datetime:
@@ -909,6 +1018,7 @@ def _to_naive_utc(dt: datetime) -> datetime:
     return dt
 
 
+@_db_timed
 def count_trades_opened_since(since: datetime) -> int:
     """
     Count trades that were opened (entered_at) since the given time.
@@ -924,6 +1034,7 @@ def count_trades_opened_since(since: datetime) -> int:
         ).count()
 
 
+@_db_timed
 def count_open_positions_opened_since(since: datetime) -> int:
     """
     Count currently-open positions whose opened_at >= since.
@@ -943,6 +1054,7 @@ def clear_cache():
     _query_cache.clear()
 
 
+@_db_timed
 def record_event(
     event_type: str,
     symbol: str,
@@ -990,11 +1102,44 @@ def record_event(
                 details=details_json
             )
             session.add(event)
+            if event_type == "DECISION_TRACE" and symbol:
+                _upsert_latest_trace(
+                    session,
+                    db.database_url.startswith("postgresql"),
+                    symbol=symbol,
+                    timestamp=_to_naive_utc(timestamp),
+                    decision_id=decision_id,
+                    details=details_json,
+                )
     except (OperationalError, DataError, OSError) as e:
         logger.error("Failed to record event", event_type=event_type, symbol=symbol, error=str(e))
         # Don't re-raise - event logging failures shouldn't crash the system
 
 
+def _upsert_latest_trace(session, is_postgres: bool, **row) -> None:
+    """Insert/replace the symbol's latest trace unless a newer one is already stored."""
+    if is_postgres:
+        stmt = pg_insert(LatestTraceModel).values(**row)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["symbol"],
+            set_={
+                "timestamp": stmt.excluded.timestamp,
+                "decision_id": stmt.excluded.decision_id,
+                "details": stmt.excluded.details,
+            },
+            where=LatestTraceModel.timestamp <= stmt.excluded.timestamp,
+        )
+        session.execute(stmt)
+        return
+    existing = session.get(LatestTraceModel, row["symbol"])
+    if existing is None:
+        session.add(LatestTraceModel(**row))
+    elif existing.timestamp <= row["timestamp"]:
+        existing.timestamp = row["timestamp"]
+        existing.decision_id = row["decision_id"]
+        existing.details = row["details"]
+
+
 async def async_record_event(
     event_type: str,
     symbol: str,
@@ -1028,6 +1173,7 @@ async def async_record_event(
     )
 
 
+@_db_timed
 def get_recent_events(limit: int = 50, event_type: Optional[str] = None, symbol: Optional[str] = None) -> List[Dict]:
     """Get recent system events."""
     db = get_db()
@@ -1055,6 +1201,7 @@ def get_recent_events(limit: int = 50, event_type: Optional[str] = None, symbol:
         ]
 
 
+@_db_timed
 def get_last_signal_per_symbol(limit_events: int = 2000) -> Dict[str, datetime]:
     """
     Latest LONG/SHORT SIGNAL_GENERATED timestamp per symbol.
@@ -1098,6 +1245,7 @@ def get_last_signal_per_symbol(limit_events: int = 2000) -> Dict[str, datetime]:
         return {}
 
 
+@_db_timed
 def get_event_stats(symbol: str) -> Dict[str, Any]:
     """Get statistics for system events for a specific symbol."""
     db = get_db()
@@ -1119,11 +1267,13 @@ def get_event_stats(symbol: str) -> Dict[str, Any]:
             "last_event": last_ts.replace(tzinfo=timezone.utc) if last_ts else None
         }
 
+@_db_timed
 def record_metrics_snapshot(details: Dict) -> None:
     """Write a metrics snapshot to system_events for /api/metrics. Worker calls this periodically."""
     record_event("METRICS_SNAPSHOT", "system", details)
 
 
+@_db_timed
 def upsert_thesis(payload: Dict[str, Any]) -> None:
     """
     Insert or update a thesis row.
@@ -1162,6 +1312,7 @@ def _thesis_model_to_payload(model: ThesisModel) -> Dict[str, Any]:
     }
 
 
+@_db_timed
 def get_latest_thesis_for_symbol(
     symbol: str,
     statuses: Optional[List[str]] = None,
@@ -1178,6 +1329,7 @@ def get_latest_thesis_for_symbol(
         return _thesis_model_to_payload(model)
 
 
+@_db_timed
 def list_active_theses(limit: int = 500) -> List[Dict[str, Any]]:
     """Return active/decaying thesis payloads for monitoring."""
     db = get_db()
@@ -1192,6 +1344,7 @@ def list_active_theses(limit: int = 500) -> List[Dict[str, Any]]:
         return [_thesis_model_to_payload(model) for model in models]
 
 
+@_db_timed
 def get_latest_metrics_snapshot() -> Optional[Dict]:
     """Return the latest METRICS_SNAPSHOT details, or None if none found."""
     db = get_db()
@@ -1211,6 +1364,7 @@ def get_latest_metrics_snapshot() -> Optional[Dict]:
             return None
 
 
+@_db_timed
 def get_decision_chain(decision_id: str) -> List[Dict]:
     """Get all events related to a decision ID."""
     db = get_db()
@@ -1230,6 +1384,7 @@ def get_decision_chain(decision_id: str) -> List[Dict]:
         ]
 
 
+@_db_timed
 def save_account_state(
     equity: Decimal,
     balance: Decimal,
@@ -1251,6 +1406,7 @@ def save_account_state(
         session.add(state)
 
 
+@_db_timed
 def get_latest_account_state() -> Optional[Dict[str, Decimal]]:
     """Get latest account snapshot."""
     db = get_db()
@@ -1272,10 +1428,15 @@ def get_latest_account_state() -> Optional[Dict[str, Decimal]]:
         }
 
 
+@_db_timed
 def get_latest_traces(limit: int = 300) -> List[Dict]:
     """
     Get the latest DECISION_TRACE event for each symbol.
     
+    Reads ``latest_trace_per_symbol``. While that table is still empty
+    (first run after it was introduced) the latest traces are derived from
+    ``system_events`` once and seeded into it.
+    
     Args:
         limit: Maximum number of symbols to return
         
@@ -1284,34 +1445,58 @@ def get_latest_traces(limit: int = 300) -> List[Dict]:
     """
     db = get_db()
     with db.get_session() as session:
-        from sqlalchemy import func
-        
-        # Subquery to get latest timestamp per symbol
-        subq = session.query(
-            SystemEventModel.symbol,
-            func.max(SystemEventModel.timestamp).label('max_ts')
-        ).filter(
-            SystemEventModel.event_type == 'DECISION_TRACE'
-        ).group_by(SystemEventModel.symbol).subquery()
-        
-        # Join to get full records
-        events = session.query(SystemEventModel).join(
-            subq,
-            (SystemEventModel.symbol == subq.c.symbol) &
-            (SystemEventModel.timestamp == subq.c.max_ts)
-        ).limit(limit).all()
-        
-        results = []
-        for e in events:
-            results.append({
-                'symbol': e.symbol,
-                'timestamp': e.timestamp.replace(tzinfo=timezone.utc),
-                'details': json.loads(e.details)
-            })
+        rows = (
+            session.query(LatestTraceModel)
+            .order_by(LatestTraceModel.timestamp.desc())
+            .limit(limit)
+            .all()
+        )
+        if not rows:
+            rows = _seed_latest_traces(session, db.database_url.startswith("postgresql"), limit)
 
-        return results
+        return [
+            {
+                'symbol': r.symbol,
+                'timestamp': r.timestamp.replace(tzinfo=timezone.utc),
+                'details': json.loads(r.details)
+            }
+            for r in rows
+        ]
+
+
+def _seed_latest_traces(session, is_postgres: bool, limit: int) -> List[Any]:
+    """Derive the latest trace per symbol from ``system_events`` and store it."""
+    from sqlalchemy import func
+
+    subq = session.query(
+        SystemEventModel.symbol,
+        func.max(SystemEventModel.timestamp).label('max_ts')
+    ).filter(
+        SystemEventModel.event_type == 'DECISION_TRACE'
+    ).group_by(SystemEventModel.symbol).subquery()
+
+    # event_type repeated so both sides use idx_event_type_symbol_time and a
+    # same-timestamp non-trace event can't be picked up
+    events = session.query(SystemEventModel).join(
+        subq,
+        (SystemEventModel.event_type == 'DECISION_TRACE') &
+        (SystemEventModel.symbol == subq.c.symbol) &
+        (SystemEventModel.timestamp == subq.c.max_ts)
+    ).limit(limit).all()
+
+    for e in events:
+        _upsert_latest_trace(
+            session,
+            is_postgres,
+            symbol=e.symbol,
+            timestamp=e.timestamp,
+            decision_id=e.decision_id,
+            details=e.details,
+        )
+    return events
 
 
+@_db_timed
 def save_intent_hash(intent_hash: str, symbol: str, timestamp: datetime) -> None:
     """
     Save order intent hash to prevent duplicate orders after restart.
@@ -1331,6 +1516,7 @@ def save_intent_hash(intent_hash: str, symbol: str, timestamp: datetime) -> None
     )
 
 
+@_db_timed
 def load_recent_intent_hashes(lookback_hours: int = 24) -> set:
     """
     Load recent order intent hashes from database.
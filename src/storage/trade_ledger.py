@@ -0,0 +1,249 @@
+"""
+Process-local rolling ledger of closed trades.
+
+Hot-path gates (symbol loss cooldown, recent stop-outs, auction quick
+reversal / churn, post-close cooldown) used to query the ``trades`` table
+per symbol or per tick, partly with leading-wildcard ``LIKE`` patterns no
+index can serve. The ledger is hydrated from the DB once at startup, fed by
+``repository.save_trade`` (every writer: gateway hook, protection-monitor
+stop fills, ...), and resynced incrementally every ``resync_interval_seconds``
+from the live tick (trades written by other processes are picked up there;
+duplicates are dropped by trade id).
+
+Trades are kept sorted by exit time, globally and per normalized symbol
+(``normalize_to_base``: PF_XBTUSD, BTC/USD:USD and BTC/USD are all "BTC"), so
+a window query is a bisect plus a slice.
+
+Callers must check ``covers(since)``: an unhydrated ledger (backtests,
+scripts) or a window longer than the retention falls back to the DB --
+``recent_trades`` does this for the plain "trades since" query.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.data.symbol_utils import normalize_to_base
+from src.domain.models import Trade
+from src.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _ts(dt: datetime) -> float:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class _Series:
+    """Trades sorted by exit time, with a parallel timestamp list for bisect."""
+
+    __slots__ = ("times", "trades")
+
+    def __init__(self):
+        self.times: List[float] = []
+        self.trades: List[Trade] = []
+
+    def add(self, ts: float, trade: Trade) -> None:
+        idx = bisect_right(self.times, ts)
+        self.times.insert(idx, ts)
+        self.trades.insert(idx, trade)
+
+    def since(self, ts: float) -> List[Trade]:
+        return self.trades[bisect_left(self.times, ts):]
+
+    def drop_before(self, ts: float) -> List[Trade]:
+        idx = bisect_left(self.times, ts)
+        dropped = self.trades[:idx]
+        del self.times[:idx]
+        del self.trades[:idx]
+        return dropped
+
+    def __len__(self) -> int:
+        return len(self.trades)
+
+
+class TradeLedger:
+    """Closed trades of the last ``retention_hours``, indexed by symbol and exit time."""
+
+    def __init__(self, retention_hours: float = 72.0, resync_interval_seconds: float = 900.0):
+        self.retention = timedelta(hours=retention_hours)
+        self.resync_interval_seconds = resync_interval_seconds
+        self._lock = threading.Lock()
+        self._all = _Series()
+        self._by_symbol: Dict[str, _Series] = {}
+        self._ids: Set[str] = set()
+        self._covered_from: Optional[datetime] = None
+        self._synced_at_wall: Optional[datetime] = None
+        self._synced_at: float = 0.0
+
+    # ---------- state ----------
+
+    @property
+    def hydrated(self) -> bool:
+        return self._covered_from is not None
+
+    def covers(self, since: datetime) -> bool:
+        """True when every trade exiting at/after ``since`` is in the ledger."""
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return self._covered_from is not None and since >= self._covered_from
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    # ---------- writes ----------
+
+    def record(self, trade: Trade) -> bool:
+        """Add one closed trade (no-op for a trade id already present)."""
+        with self._lock:
+            added = self._add(trade)
+            self._prune(datetime.now(timezone.utc))
+        return added
+
+    def hydrate(self, trades: List[Trade], since: datetime, now: Optional[datetime] = None) -> int:
+        """Merge trades fetched from the DB for the window starting at ``since``."""
+        now = now or datetime.now(timezone.utc)
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        with self._lock:
+            added = sum(1 for t in trades if self._add(t))
+            if self._covered_from is None or since < self._covered_from:
+                self._covered_from = since
+            self._synced_at_wall = now
+            self._synced_at = time.monotonic()
+            self._prune(now)
+        return added
+
+    def _add(self, trade: Trade) -> bool:
+        trade_id = getattr(trade, "trade_id", None)
+        if trade_id is not None:
+            if trade_id in self._ids:
+                return False
+            self._ids.add(trade_id)
+        ts = _ts(trade.exited_at)
+        self._all.add(ts, trade)
+        key = normalize_to_base(getattr(trade, "symbol", "") or "")
+        series = self._by_symbol.get(key)
+        if series is None:
+            series = self._by_symbol[key] = _Series()
+        series.add(ts, trade)
+        return True
+
+    def _prune(self, now: datetime) -> None:
+        cutoff = now - self.retention
+        cutoff_ts = cutoff.timestamp()
+        if self._all.times and self._all.times[0] < cutoff_ts:
+            for t in self._all.drop_before(cutoff_ts):
+                self._ids.discard(getattr(t, "trade_id", None))
+            for key in list(self._by_symbol):
+                series = self._by_symbol[key]
+                series.drop_before(cutoff_ts)
+                if not series:
+                    del self._by_symbol[key]
+        if self._covered_from is not None and self._covered_from < cutoff:
+            self._covered_from = cutoff
+
+    # ---------- DB sync ----------
+
+    def resync_due(self) -> bool:
+        return not self.hydrated or time.monotonic() - self._synced_at >= self.resync_interval_seconds
+
+    async def resync(self, fetch: Optional[Callable[[datetime], List[Trade]]] = None) -> int:
+        """Fetch trades since the last sync (or the full retention window) and merge them."""
+        if fetch is None:
+            from src.storage.repository import get_trades_since as fetch
+        now = datetime.now(timezone.utc)
+        if self._synced_at_wall is None:
+            since = now - self.retention
+        else:
+            # Overlap: trades are stamped with their exit time, which can
+            # precede the moment they were written.
+            since = max(now - self.retention, self._synced_at_wall - timedelta(hours=1))
+        trades = await asyncio.to_thread(fetch, since)
+        first = not self.hydrated
+        added = self.hydrate(trades, since, now=now)
+        if first:
+            logger.info("Trade ledger hydrated", trades=len(self), window_hours=self.retention.total_seconds() / 3600)
+        elif added:
+            logger.info("Trade ledger resync picked up trades recorded outside the hook", added=added)
+        return added
+
+    async def maybe_resync(self) -> None:
+        if self.resync_due():
+            await self.resync()
+
+    # ---------- window queries ----------
+
+    def trades_since(self, since: datetime) -> List[Trade]:
+        with self._lock:
+            return list(self._all.since(_ts(since)))
+
+    def symbol_trades_since(self, symbol: str, since: datetime) -> List[Trade]:
+        with self._lock:
+            series = self._by_symbol.get(normalize_to_base(symbol or ""))
+            return list(series.since(_ts(since))) if series else []
+
+    def loss_stats(self, symbol: str, lookback_hours: float, now: Optional[datetime] = None) -> Tuple[int, float]:
+        """(losing trade count, their summed net PnL as % of their summed notional)."""
+        now = now or datetime.now(timezone.utc)
+        losses = [t for t in self.symbol_trades_since(symbol, now - timedelta(hours=lookback_hours)) if t.net_pnl < 0]
+        if not losses:
+            return 0, 0.0
+        total_pnl = float(sum(t.net_pnl for t in losses))
+        total_notional = float(sum(t.size_notional for t in losses)) or 1.0
+        return len(losses), (total_pnl / total_notional * 100) if total_notional > 0 else 0.0
+
+    def count_stopouts(self, symbol: str, lookback_hours: float, now: Optional[datetime] = None) -> int:
+        """Trades on ``symbol`` that exited with a "Stop Loss..." reason inside the window."""
+        now = now or datetime.now(timezone.utc)
+        since = now - timedelta(hours=max(1, lookback_hours))
+        return sum(
+            1 for t in self.symbol_trades_since(symbol, since)
+            if str(getattr(t, "exit_reason", "") or "").lower().startswith("stop loss")
+        )
+
+
+async def recent_trades(since: datetime) -> List[Trade]:
+    """Trades closed since ``since``: from the ledger when it covers the window, else the DB."""
+    ledger = get_trade_ledger()
+    if ledger.covers(since):
+        return ledger.trades_since(since)
+    from src.storage.repository import get_trades_since
+
+    return await asyncio.to_thread(get_trades_since, since)
+
+
+# ---------- singleton ----------
+
+_ledger: Optional[TradeLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_trade_ledger() -> TradeLedger:
+    """The process ledger (unhydrated until the live worker syncs it)."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = TradeLedger()
+    return _ledger
+
+
+def init_trade_ledger(**kwargs) -> TradeLedger:
+    global _ledger
+    with _ledger_lock:
+        _ledger = TradeLedger(**kwargs)
+    return _ledger
+
+
+def reset_trade_ledger() -> None:
+    """For tests."""
+    global _ledger
+    with _ledger_lock:
+        _ledger = None
@@ -0,0 +1,148 @@
+"""
+Per-symbol input fingerprints for incremental analysis.
+
+``SMCEngine.generate_signal`` is a pure function of the candle buffers plus
+config, apart from its time-based structure debounce and the institutional
+memory (thesis conviction). When none of a symbol's inputs changed since the
+previous analysis -- no newly *closed* bar on any timeframe, last price inside
+the same price bucket, same open-position state, same strategy config -- the
+previous NO_SIGNAL result is reused instead of recomputing every indicator.
+
+Keying on the last closed bar (not the last buffered bar, which is usually
+the still-forming one) makes hits possible under both schedulers:
+
+- legacy 60s loop: every tick inside a bar whose price stayed in its bucket;
+- bar-close scheduler: symbols whose closed bars did not advance at this
+  wake (no trades in the bar, throttled or failed fetch), so full analysis
+  runs only for symbols whose decision/refine bars actually changed.
+
+Only NO_SIGNAL results are cached: an actionable signal always goes
+through the engine again so the engine's own debounce/dedupe runs exactly
+as before. Callers refresh thesis conviction on a hit
+(``SMCEngine.refresh_thesis_conviction``). Entries also expire after
+``max_age_seconds`` so slow-moving engine inputs outside the fingerprint
+(e.g. recent stop-out counts) are picked up.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from src.domain.models import Candle, Signal, SignalType
+
+
+FINGERPRINT_TIMEFRAMES: Tuple[str, ...] = ("1d", "4h", "1h", "15m")
+_TF_SECONDS = {"15m": 900, "1h": 3600, "4h": 14400, "1d": 86400}
+
+
+@dataclass(frozen=True)
+class InputFingerprint:
+    """Everything the signal depends on, reduced to a hashable key."""
+    bars: Tuple[Tuple[str, Optional[float]], ...]  # (tf, last closed bar ts)
+    price_bucket: Optional[int]
+    position_state: Tuple[bool, Optional[str]]
+    config_hash: str
+
+
+@dataclass
+class _Entry:
+    fingerprint: InputFingerprint
+    signal: Signal
+    stored_at: float
+
+
+def config_hash(strategy_config: Any) -> str:
+    """Stable short hash of the strategy config (pydantic model or plain object)."""
+    try:
+        payload = strategy_config.model_dump_json()
+    except AttributeError:
+        payload = repr(strategy_config)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def price_bucket(price: Optional[Decimal], bucket_bps: float) -> Optional[int]:
+    """Index of ``price`` on a geometric grid with ``bucket_bps`` spacing."""
+    if price is None or bucket_bps <= 0:
+        return None
+    p = float(price)
+    if p <= 0:
+        return None
+    return math.floor(math.log(p) / math.log1p(bucket_bps / 10_000))
+
+
+def last_closed_ts(series: Sequence[Candle], timeframe: str, now: datetime) -> Optional[float]:
+    """Open timestamp (epoch s) of the newest bar in ``series`` that closed by ``now``."""
+    step = _TF_SECONDS.get(timeframe)
+    cutoff = now.timestamp()
+    for candle in reversed(series):
+        ts = candle.timestamp
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        opened = ts.timestamp()
+        if step is None or opened + step <= cutoff:
+            return opened
+    return None
+
+
+class AnalysisCache:
+    """Last NO_SIGNAL result per symbol, keyed by input fingerprint."""
+
+    def __init__(self, price_bucket_bps: float = 10.0, max_age_seconds: float = 3600.0):
+        self.price_bucket_bps = price_bucket_bps
+        self.max_age_seconds = max_age_seconds
+        self._entries: Dict[str, _Entry] = {}
+        self.stats = {"hits": 0, "misses": 0, "expired": 0}
+
+    def fingerprint(
+        self,
+        candles_by_tf: Dict[str, Sequence[Candle]],
+        position_side: Optional[str],
+        cfg_hash: str,
+        now: Optional[datetime] = None,
+    ) -> InputFingerprint:
+        now = now or datetime.now(timezone.utc)
+        bars = tuple(
+            (tf, last_closed_ts(candles_by_tf.get(tf) or (), tf, now)) for tf in FINGERPRINT_TIMEFRAMES
+        )
+        refine = candles_by_tf.get("15m") or ()
+        last_close = refine[-1].close if refine else None
+        return InputFingerprint(
+            bars=bars,
+            price_bucket=price_bucket(last_close, self.price_bucket_bps),
+            position_state=(position_side is not None, position_side),
+            config_hash=cfg_hash,
+        )
+
+    def lookup(self, symbol: str, fingerprint: InputFingerprint) -> Optional[Signal]:
+        """Previous signal for ``symbol`` if its inputs are unchanged, else None."""
+        entry = self._entries.get(symbol)
+        if entry is None or entry.fingerprint != fingerprint:
+            self.stats["misses"] += 1
+            return None
+        if time.monotonic() - entry.stored_at > self.max_age_seconds:
+            self.stats["expired"] += 1
+            del self._entries[symbol]
+            return None
+        self.stats["hits"] += 1
+        return entry.signal
+
+    def store(self, symbol: str, fingerprint: InputFingerprint, signal: Signal) -> None:
+        """Remember ``signal``; actionable signals clear the entry instead."""
+        if signal.signal_type != SignalType.NO_SIGNAL:
+            self._entries.pop(symbol, None)
+            return
+        self._entries[symbol] = _Entry(fingerprint, signal, time.monotonic())
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        if symbol is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(symbol, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
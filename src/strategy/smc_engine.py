@@ -17,9 +17,11 @@ from src.strategy.signal_scorer import SignalScorer
 from src.strategy.market_structure_tracker import MarketStructureTracker
 from src.config.config import StrategyConfig
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics import tick_stage_histogram, timed
 from src.domain.protocols import EventRecorder, _noop_event_recorder
 from src.exceptions import OperationalError, DataError
 from src.storage.repository import count_recent_stopouts
+from src.storage.trade_ledger import get_trade_ledger
 from src.memory.institutional_memory import InstitutionalMemoryManager
 import uuid
 
@@ -41,8 +43,8 @@ _STOPOUT_CACHE_TTL = 300  # 5 minutes
 
 def get_recent_stopouts(symbol: str, lookback_hours: int = 24) -> int:
     """
-    Query database for recent stop-outs on a symbol.
-    Uses SQLAlchemy connection pool (not raw psycopg2) and a 5-minute TTL cache.
+    Recent stop-outs on a symbol: from the in-memory trade ledger when it
+    covers the window, else a DB query (SQLAlchemy pool) behind a 5-minute TTL cache.
     
     Args:
         symbol: Trading symbol (e.g., 'WIF/USD' or 'PF_WIFUSD')
@@ -53,6 +55,10 @@ def get_recent_stopouts(symbol: str, lookback_hours: int = 24) -> int:
     """
     import time as _time
 
+    ledger = get_trade_ledger()
+    if ledger.covers(datetime.now(timezone.utc) - timedelta(hours=max(1, lookback_hours))):
+        return ledger.count_stopouts(symbol, lookback_hours)
+
     cache_key = (symbol, lookback_hours)
     cached = _stopout_cache.get(cache_key)
     if cached and _time.monotonic() < cached[1]:
@@ -142,6 +148,35 @@ class SMCEngine:
         
         logger.info("SMC Engine initialized", config=config.model_dump())
 
+    # Strategy settings the cached indicators (ADX / ATR) are computed with
+    _INDICATOR_CACHE_FIELDS = ("adx_period", "atr_period")
+
+    def apply_config(self, config: StrategyConfig) -> None:
+        """
+        Swap in a hot-reloaded strategy config.
+
+        Rebuilds the config-derived helpers and drops cached indicators only if
+        their periods changed; tracked market structure, fingerprints and
+        higher-TF candle context are kept.
+        """
+        old = self.config
+        self.config = config
+        self.signal_scorer = SignalScorer(config)
+        self.ms_tracker.confirmation_candles = getattr(config, 'ms_confirmation_candles', 3)
+        self.ms_tracker.reconfirmation_candles = getattr(config, 'ms_reconfirmation_candles', 2)
+        self.ms_tracker.entry_zone_tolerance_pct = getattr(config, 'entry_zone_tolerance_pct', 0.015)
+        self.ms_tracker.entry_zone_tolerance_adaptive = getattr(config, 'entry_zone_tolerance_adaptive', True)
+        self.ms_tracker.entry_zone_tolerance_atr_mult = getattr(config, 'entry_zone_tolerance_atr_mult', 0.3)
+        self.entry_zone_tolerance_score_penalty = getattr(config, 'entry_zone_tolerance_score_penalty', -5)
+        self._fvg_min_size_pct_default = Decimal(str(getattr(config, "fvg_min_size_pct", 0.001)))
+        if self._memory_manager is not None:
+            self._memory_manager.config = config
+
+        if any(getattr(old, f, None) != getattr(config, f, None) for f in self._INDICATOR_CACHE_FIELDS):
+            dropped = len(self.indicator_cache)
+            self.indicator_cache.clear()
+            logger.info("SMC indicator cache invalidated by config change", dropped=dropped)
+
     @staticmethod
     def _normalize_symbol_key(raw_symbol: Optional[str]) -> str:
         if not raw_symbol:
@@ -314,6 +349,34 @@ class SMCEngine:
             weekly_confluence_bonus=weekly_confluence_bonus if inside_zone else 0.0,
         )
     
+    def refresh_thesis_conviction(
+        self,
+        symbol: str,
+        decision_candles_4h: List[Candle],
+        refine_candles_1h: List[Candle],
+    ) -> None:
+        """
+        Update the symbol's thesis conviction without a full analysis.
+
+        ``generate_signal`` does this on every call; callers that reuse a
+        cached result (``AnalysisCache``) call this instead so conviction
+        keeps tracking price and volume.
+        """
+        if not (self._memory_manager and self._memory_manager.is_enabled_for_symbol(symbol)):
+            return
+        decision_tf = self.config.decision_timeframes[0] if getattr(self.config, "decision_timeframes", None) else "4h"
+        candles = refine_candles_1h if decision_tf == "1h" else decision_candles_4h
+        if not candles:
+            return
+        recent = candles[-20:]
+        avg_volume = sum((c.volume for c in recent), Decimal("0")) / Decimal(str(len(recent)))
+        self._memory_manager.update_conviction_for_symbol(
+            symbol,
+            current_price=candles[-1].close,
+            current_volume_avg=avg_volume,
+        )
+
+    @timed(tick_stage_histogram(), stage="generate_signal")
     def generate_signal(
         self,
         symbol: str,
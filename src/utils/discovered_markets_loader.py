@@ -2,12 +2,14 @@
 Load discovered markets from JSON (file-based). Used by dashboard.
 
 Live trading uses MarketDiscoveryService (API-based) in src.data.market_discovery.
+The parsed file is cached on its (mtime, size), so repeated loads between
+discovery refreshes don't re-read it.
 """
 import json
 from pathlib import Path
 
 from src.exceptions import OperationalError, DataError
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timezone
 from src.monitoring.logger import get_logger
 from src.data.fiat_currencies import has_disallowed_base
@@ -16,23 +18,37 @@ logger = get_logger(__name__)
 
 MARKETS_FILE = Path(__file__).parent.parent.parent / "data" / "discovered_markets.json"
 
+_cache: Optional[Tuple[Tuple[str, int, int], dict]] = None
+
+
+def _read_markets_file() -> dict:
+    """Parsed discovered_markets.json; raises like json.load / open do."""
+    global _cache
+    st = MARKETS_FILE.stat()
+    key = (str(MARKETS_FILE), st.st_mtime_ns, st.st_size)
+    if _cache is not None and _cache[0] == key:
+        return _cache[1]
+    with open(MARKETS_FILE, "r") as f:
+        data = json.load(f)
+    _cache = (key, data)
+    return data
+
 
 def load_discovered_mapping() -> Optional[dict]:
     """Load spot->futures mapping from discovered_markets.json. Returns None if missing."""
     if not MARKETS_FILE.exists():
         return None
     try:
-        with open(MARKETS_FILE, "r") as f:
-            data = json.load(f)
-            mapping = data.get("mapping") or None
-            if not isinstance(mapping, dict):
-                return None
-            # Filter out any excluded bases (fiat + stablecoin) from cached discovery output.
-            return {
-                spot: fut
-                for spot, fut in mapping.items()
-                if not has_disallowed_base(spot) and not has_disallowed_base(fut)
-            }
+        data = _read_markets_file()
+        mapping = data.get("mapping") or None
+        if not isinstance(mapping, dict):
+            return None
+        # Filter out any excluded bases (fiat + stablecoin) from cached discovery output.
+        return {
+            spot: fut
+            for spot, fut in mapping.items()
+            if not has_disallowed_base(spot) and not has_disallowed_base(fut)
+        }
     except (json.JSONDecodeError, ValueError, TypeError, KeyError, OSError):
         return None
 
@@ -49,22 +65,21 @@ def load_discovered_markets() -> Optional[List[str]]:
         return None
 
     try:
-        with open(MARKETS_FILE, "r") as f:
-            data = json.load(f)
-            markets = data.get("markets", [])
-            discovered_at = data.get("discovered_at", "")
-
-            if markets:
-                # Filter out any excluded bases (fiat + stablecoin) from cached discovery output.
-                markets = [m for m in markets if not has_disallowed_base(m)]
-                logger.info(
-                    "Loaded discovered markets",
-                    count=len(markets),
-                    discovered_at=discovered_at,
-                )
-                return markets
-            logger.warning("Discovered markets file is empty")
-            return None
+        data = _read_markets_file()
+        markets = data.get("markets", [])
+        discovered_at = data.get("discovered_at", "")
+
+        if markets:
+            # Filter out any excluded bases (fiat + stablecoin) from cached discovery output.
+            markets = [m for m in markets if not has_disallowed_base(m)]
+            logger.info(
+                "Loaded discovered markets",
+                count=len(markets),
+                discovered_at=discovered_at,
+            )
+            return markets
+        logger.warning("Discovered markets file is empty")
+        return None
     except json.JSONDecodeError as e:
         logger.error("Failed to parse discovered markets file", error=str(e), error_type=type(e).__name__)
         return None
@@ -78,11 +93,9 @@ def get_discovered_markets_timestamp() -> Optional[datetime]:
     if not MARKETS_FILE.exists():
         return None
     try:
-        with open(MARKETS_FILE, "r") as f:
-            data = json.load(f)
-            discovered_at_str = data.get("discovered_at", "")
-            if discovered_at_str:
-                return datetime.fromisoformat(discovered_at_str.replace("Z", "+00:00"))
+        discovered_at_str = _read_markets_file().get("discovered_at", "")
+        if discovered_at_str:
+            return datetime.fromisoformat(discovered_at_str.replace("Z", "+00:00"))
     except (json.JSONDecodeError, ValueError, TypeError, KeyError, OSError):
         pass
     return None
@@ -0,0 +1,73 @@
+"""
+Microbenchmark fixtures: fixed, seeded synthetic inputs.
+
+Run with ``make bench`` (compares against the stored baseline and fails on
+regression) or ``make bench-baseline`` (records a new baseline). The suite
+needs pytest-benchmark; without it the files are not collected.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List
+
+import pytest
+
+from src.domain.models import Candle
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ["test_*.py"]
+
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+TF_MINUTES = {"15m": 15, "1h": 60, "4h": 240, "1d": 1440}
+
+
+def make_candles(symbol: str, timeframe: str, count: int, start_price: float = 40000.0, seed: int = 7) -> List[Candle]:
+    """Seeded random walk with a mild trend and realistic wicks."""
+    rng = random.Random(f"{symbol}:{timeframe}:{seed}")
+    step = timedelta(minutes=TF_MINUTES[timeframe])
+    price = start_price
+    candles = []
+    for i in range(count):
+        drift = 0.0004 if (i // 40) % 2 == 0 else -0.0003
+        close = price * (1 + drift + rng.gauss(0, 0.006))
+        high = max(price, close) * (1 + abs(rng.gauss(0, 0.003)))
+        low = min(price, close) * (1 - abs(rng.gauss(0, 0.003)))
+        candles.append(
+            Candle(
+                timestamp=BASE_TIME + step * i,
+                symbol=symbol,
+                timeframe=timeframe,
+                open=Decimal(f"{price:.2f}"),
+                high=Decimal(f"{high:.2f}"),
+                low=Decimal(f"{low:.2f}"),
+                close=Decimal(f"{close:.2f}"),
+                volume=Decimal(f"{1000 + rng.random() * 500:.2f}"),
+            )
+        )
+        price = close
+    return candles
+
+
+@pytest.fixture(scope="session")
+def candle_set() -> Dict[str, List[Candle]]:
+    """One symbol's full multi-timeframe history, as generate_signal sees it."""
+    return {
+        "1d": make_candles("BTC/USD", "1d", 250),
+        "4h": make_candles("BTC/USD", "4h", 500),
+        "1h": make_candles("BTC/USD", "1h", 500),
+        "15m": make_candles("BTC/USD", "15m", 500),
+    }
+
+
+@pytest.fixture(scope="session")
+def candle_factory():
+    return make_candles
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if "benchmarks" in str(item.fspath):
+            item.add_marker(pytest.mark.bench)
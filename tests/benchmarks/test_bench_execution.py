@@ -0,0 +1,138 @@
+"""
+Benchmarks: auction allocation and position-registry reads.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.domain.models import Position, SetupType, Side, Signal, SignalType
+from src.execution.position_state_machine import ManagedPosition, PositionRegistry
+from src.portfolio.auction_allocator import (
+    AuctionAllocator,
+    CandidateSignal,
+    OpenPositionMetadata,
+    PortfolioLimits,
+)
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+CLUSTERS = ("tight_smc_ob", "tight_smc_fvg", "wide_structure")
+
+
+def _open(i: int) -> OpenPositionMetadata:
+    symbol = f"PF_OPEN{i}USD"
+    pos = Position(
+        symbol=symbol,
+        side=Side.LONG if i % 2 else Side.SHORT,
+        size=Decimal("10"),
+        size_notional=Decimal("1000"),
+        entry_price=Decimal("100"),
+        current_mark_price=Decimal("101"),
+        leverage=Decimal("5"),
+        margin_used=Decimal("200"),
+        unrealized_pnl=Decimal("10"),
+        liquidation_price=Decimal("70"),
+        opened_at=NOW - timedelta(hours=2),
+        is_protected=True,
+        stop_loss_order_id=f"sl-{i}",
+    )
+    return OpenPositionMetadata(
+        position=pos,
+        entry_time=NOW - timedelta(hours=2),
+        entry_score=50.0 + i % 30,
+        current_pnl_R=Decimal("0.5"),
+        margin_used=Decimal("200"),
+        cluster=CLUSTERS[i % len(CLUSTERS)],
+        direction=pos.side,
+        age_seconds=7200,
+        is_protective_orders_live=True,
+        locked=False,
+        spot_symbol=f"OPEN{i}/USD",
+    )
+
+
+def _candidate(i: int) -> CandidateSignal:
+    symbol = f"CAND{i}/USD"
+    score = 55.0 + (i * 7) % 40
+    signal = Signal(
+        timestamp=NOW,
+        symbol=symbol,
+        signal_type=SignalType.LONG,
+        entry_price=Decimal("100"),
+        stop_loss=Decimal("98"),
+        take_profit=Decimal("106"),
+        reasoning="bench",
+        setup_type=SetupType.OB,
+        regime="tight_smc",
+        higher_tf_bias="bullish",
+        adx=Decimal("25"),
+        atr=Decimal("2"),
+        ema200_slope="up",
+        score=score,
+    )
+    return CandidateSignal(
+        signal=signal,
+        score=score,
+        direction=Side.LONG,
+        symbol=symbol,
+        cluster=CLUSTERS[i % len(CLUSTERS)],
+        required_margin=Decimal("100"),
+        risk_R=Decimal("2"),
+        position_notional=Decimal("500"),
+    )
+
+
+class TestAuctionBenchmarks:
+    # Exact mode falls back to greedy above exact_max_contenders (40), so it is
+    # only benchmarked at sizes where branch and bound actually runs.
+    @pytest.mark.parametrize(
+        "contenders,solver",
+        [(10, "greedy"), (100, "greedy"), (1000, "greedy"), (10, "exact"), (40, "exact")],
+    )
+    def test_allocate(self, benchmark, contenders, solver):
+        allocator = AuctionAllocator(
+            limits=PortfolioLimits(max_positions=25, max_margin_util=0.9, max_per_cluster=12, max_per_symbol=1),
+            swap_threshold=10.0,
+            solver=solver,
+        )
+        n_open = min(20, contenders // 2)
+        opens = [_open(i) for i in range(n_open)]
+        candidates = [_candidate(i) for i in range(contenders - n_open)]
+        state = {"account_equity": Decimal("100000"), "available_margin": Decimal("80000")}
+
+        plan = benchmark(allocator.allocate, opens, candidates, state)
+        assert plan is not None
+
+
+@pytest.fixture(scope="module")
+def registry():
+    registry = PositionRegistry()
+    for i in range(50):
+        registry.register_position(
+            ManagedPosition(
+                symbol=f"PF_SYM{i}USD",
+                side=Side.LONG,
+                position_id=f"bench-{i}",
+                initial_size=Decimal("1"),
+                initial_entry_price=Decimal("100"),
+                initial_stop_price=Decimal("95"),
+                initial_tp1_price=Decimal("110"),
+                initial_tp2_price=None,
+                initial_final_target=None,
+            )
+        )
+    return registry
+
+
+class TestRegistryBenchmarks:
+    def test_get_position(self, benchmark, registry):
+        def lookups():
+            for i in range(50):
+                registry.get_position(f"PF_SYM{i}USD")
+                registry.has_position(f"SYM{i}/USD:USD")
+
+        benchmark(lookups)
+
+    def test_get_all_active(self, benchmark, registry):
+        active = benchmark(registry.get_all_active)
+        assert len(active) == 50
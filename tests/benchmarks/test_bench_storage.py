@@ -0,0 +1,86 @@
+"""
+Benchmarks: candle persistence and one full replay episode.
+
+``save_candles_bulk`` runs against a file-backed SQLite stand-in (its
+non-Postgres branch); set BENCH_DATABASE_URL to a postgresql:// URL to
+measure the real upsert path instead.
+"""
+import asyncio
+import itertools
+import os
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.storage.db import Base
+
+
+class _SqliteStandIn:
+    """Minimal Database look-alike: database_url + get_session()."""
+
+    def __init__(self, path):
+        self.database_url = f"sqlite:///{path}"
+        self.engine = create_engine(self.database_url)
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine)
+
+    @contextmanager
+    def get_session(self):
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+@pytest.fixture
+def bench_db(tmp_path):
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if url:
+        from src.storage.db import Database
+        db = Database(url)
+        db.create_all()
+        return db
+    return _SqliteStandIn(tmp_path / "bench.db")
+
+
+class TestStorageBenchmarks:
+    def test_save_candles_bulk(self, benchmark, bench_db, candle_factory):
+        from src.storage.repository import save_candles_bulk
+
+        candles = candle_factory("BTC/USD", "15m", 300)
+        with patch("src.storage.repository.get_db", return_value=bench_db):
+            saved = benchmark(save_candles_bulk, candles)
+        assert saved == len(candles)
+
+
+class TestReplayBenchmarks:
+    def test_replay_episode(self, benchmark, tmp_path, monkeypatch):
+        from src.backtest.replay_harness.episodes import episode_1_normal
+
+        # Persisted safety state from other runs (e.g. a higher peak equity)
+        # would add the drawdown re-fetch waits to every tick.
+        for var in ("PEAK_EQUITY_STATE_PATH", "SAFETY_STATE_PATH", "KILL_SWITCH_STATE_PATH"):
+            monkeypatch.setenv(var, str(tmp_path / f"{var.lower()}.json"))
+
+        round_ids = itertools.count()
+
+        def fresh_runner():
+            return (episode_1_normal(tmp_path / f"round_{next(round_ids)}"),), {}
+
+        # Episode 1: 4h of 1m candles on BTC/ETH/SOL (241 ticks).
+        metrics = benchmark.pedantic(
+            lambda runner: asyncio.run(runner.run()),
+            setup=fresh_runner,
+            rounds=5,
+            warmup_rounds=1,
+        )
+        assert metrics.total_ticks == 241
+        assert metrics.failed_ticks == 0
@@ -0,0 +1,49 @@
+"""
+Benchmarks: indicator, SMC and Fibonacci hot paths.
+"""
+import pytest
+
+from src.config.config import StrategyConfig
+from src.strategy.fibonacci_engine import FibonacciEngine
+from src.strategy.indicators import Indicators
+from src.strategy.smc_engine import SMCEngine
+
+
+class TestIndicatorBenchmarks:
+    def test_candles_to_df(self, benchmark, candle_set):
+        df = benchmark(Indicators._candles_to_df, candle_set["4h"])
+        assert len(df) == len(candle_set["4h"])
+
+    def test_ema_200(self, benchmark, candle_set):
+        benchmark(Indicators.calculate_ema, candle_set["1d"], 200)
+
+    def test_adx(self, benchmark, candle_set):
+        benchmark(Indicators.calculate_adx, candle_set["1h"], 14)
+
+    def test_atr(self, benchmark, candle_set):
+        benchmark(Indicators.calculate_atr, candle_set["4h"], 14)
+
+    def test_rsi(self, benchmark, candle_set):
+        benchmark(Indicators.calculate_rsi, candle_set["15m"], 14)
+
+
+class TestEngineBenchmarks:
+    def test_generate_signal(self, benchmark, candle_set):
+        def run():
+            # Fresh engine per round: the indicator cache must not hide the work.
+            engine = SMCEngine(StrategyConfig())
+            return engine.generate_signal(
+                "BTC/USD",
+                regime_candles_1d=candle_set["1d"],
+                decision_candles_4h=candle_set["4h"],
+                refine_candles_1h=candle_set["1h"],
+                refine_candles_15m=candle_set["15m"],
+            )
+
+        signal = benchmark(run)
+        assert signal.symbol == "BTC/USD"
+
+    @pytest.mark.parametrize("timeframe", ["1h", "4h"])
+    def test_fibonacci_levels(self, benchmark, candle_set, timeframe):
+        engine = FibonacciEngine()
+        benchmark(engine.calculate_levels, candle_set[timeframe], timeframe)
@@ -0,0 +1,128 @@
+"""
+Tests for per-symbol input fingerprints (incremental analysis).
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from src.domain.models import Candle, SignalType
+from src.strategy.analysis_cache import AnalysisCache, config_hash, last_closed_ts, price_bucket
+
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _candles(tf: str, n: int, close: str = "100") -> list:
+    return [
+        Candle(
+            timestamp=T0 + timedelta(minutes=15 * i),
+            symbol="BTC/USD",
+            timeframe=tf,
+            open=Decimal(close),
+            high=Decimal(close),
+            low=Decimal(close),
+            close=Decimal(close),
+            volume=Decimal("1"),
+        )
+        for i in range(n)
+    ]
+
+
+def _inputs(n15: int = 10, close: str = "100") -> dict:
+    return {"1d": _candles("1d", 3), "4h": _candles("4h", 5), "1h": _candles("1h", 8), "15m": _candles("15m", n15, close)}
+
+
+def _signal(no_signal: bool = True):
+    sig = MagicMock()
+    sig.signal_type = SignalType.NO_SIGNAL if no_signal else SignalType.LONG
+    return sig
+
+
+class TestFingerprint:
+    def test_unchanged_inputs_hit(self):
+        cache = AnalysisCache(price_bucket_bps=10)
+        fp = cache.fingerprint(_inputs(), None, "cfg")
+        sig = _signal()
+        cache.store("BTC/USD", fp, sig)
+        assert cache.lookup("BTC/USD", cache.fingerprint(_inputs(), None, "cfg")) is sig
+        assert cache.stats["hits"] == 1
+
+    def test_new_bar_price_move_position_or_config_miss(self):
+        cache = AnalysisCache(price_bucket_bps=10)
+        cache.store("BTC/USD", cache.fingerprint(_inputs(), None, "cfg"), _signal())
+        assert cache.lookup("BTC/USD", cache.fingerprint(_inputs(n15=11), None, "cfg")) is None
+        assert cache.lookup("BTC/USD", cache.fingerprint(_inputs(close="101"), None, "cfg")) is None
+        assert cache.lookup("BTC/USD", cache.fingerprint(_inputs(), "long", "cfg")) is None
+        assert cache.lookup("BTC/USD", cache.fingerprint(_inputs(), None, "other")) is None
+
+    def test_actionable_signals_are_not_cached(self):
+        cache = AnalysisCache()
+        fp = cache.fingerprint(_inputs(), None, "cfg")
+        cache.store("BTC/USD", fp, _signal())
+        cache.store("BTC/USD", fp, _signal(no_signal=False))
+        assert cache.lookup("BTC/USD", fp) is None
+        assert len(cache) == 0
+
+    def test_entries_expire(self):
+        cache = AnalysisCache(max_age_seconds=-1)
+        fp = cache.fingerprint(_inputs(), None, "cfg")
+        cache.store("BTC/USD", fp, _signal())
+        assert cache.lookup("BTC/USD", fp) is None
+        assert cache.stats["expired"] == 1
+
+
+    def test_forming_bar_is_ignored_until_it_closes(self):
+        cache = AnalysisCache(price_bucket_bps=10)
+        inputs = _inputs(n15=10)
+        forming_at = inputs["15m"][-1].timestamp + timedelta(minutes=5)
+        cache.store("BTC/USD", cache.fingerprint(inputs, None, "cfg", now=forming_at), _signal())
+
+        # Still inside the last bar: same closed bars, price in bucket -> hit.
+        later = forming_at + timedelta(minutes=5)
+        assert cache.lookup("BTC/USD", cache.fingerprint(inputs, None, "cfg", now=later)) is not None
+        # The bar closes: the fingerprint moves on.
+        closed = forming_at + timedelta(minutes=15)
+        assert cache.lookup("BTC/USD", cache.fingerprint(inputs, None, "cfg", now=closed)) is None
+
+
+class TestHelpers:
+    def test_price_bucket_tolerance(self):
+        assert price_bucket(Decimal("100"), 10) == price_bucket(Decimal("100.05"), 10)
+        assert price_bucket(Decimal("100"), 10) != price_bucket(Decimal("100.5"), 10)
+        assert price_bucket(None, 10) is None
+
+    def test_config_hash_tracks_changes(self):
+        from src.config.config import StrategyConfig
+        a = StrategyConfig()
+        b = a.model_copy(update={"adx_threshold": a.adx_threshold + 1})
+        assert config_hash(a) == config_hash(StrategyConfig())
+        assert config_hash(a) != config_hash(b)
+
+    def test_last_closed_ts_skips_forming_bar(self):
+        series = _candles("15m", 3)
+        assert last_closed_ts(series, "15m", T0 + timedelta(minutes=40)) == (T0 + timedelta(minutes=15)).timestamp()
+        assert last_closed_ts(series, "15m", T0 + timedelta(minutes=45)) == (T0 + timedelta(minutes=30)).timestamp()
+        assert last_closed_ts([], "15m", T0) is None
+
+
+class TestConvictionOnHit:
+    def test_refresh_thesis_conviction_uses_decision_candles(self):
+        from src.strategy.smc_engine import SMCEngine
+
+        engine = SMCEngine.__new__(SMCEngine)
+        engine.config = MagicMock(decision_timeframes=["4h"])
+        engine._memory_manager = MagicMock()
+        engine._memory_manager.is_enabled_for_symbol.return_value = True
+
+        engine.refresh_thesis_conviction("BTC/USD", _candles("4h", 5, "200"), _candles("1h", 5))
+
+        engine._memory_manager.update_conviction_for_symbol.assert_called_once_with(
+            "BTC/USD", current_price=Decimal("200"), current_volume_avg=Decimal("1")
+        )
+
+    def test_refresh_thesis_conviction_noop_without_memory(self):
+        from src.strategy.smc_engine import SMCEngine
+
+        engine = SMCEngine.__new__(SMCEngine)
+        engine._memory_manager = None
+        engine.refresh_thesis_conviction("BTC/USD", _candles("4h", 5), [])
@@ -0,0 +1,107 @@
+"""
+Tests for the async (queue-backed) structured logging pipeline.
+"""
+import json
+import logging
+import queue
+import sys
+
+import pytest
+import structlog
+
+from src.monitoring import logger as logmod
+from src.monitoring.logger import (
+    EventRateLimiter,
+    NonBlockingQueueHandler,
+    fast_json_dumps,
+    logging_stats,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+class _Named:
+    name = "src.test"
+
+
+class TestEventRateLimiter:
+    def test_limits_per_key_and_reports_suppressed(self, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr(logmod.time, "monotonic", lambda: clock[0])
+        limiter = EventRateLimiter(max_events=2, window_seconds=60)
+        ev = lambda sym: {"event": "SIGNAL_REJECTED", "symbol": sym}
+
+        limiter(_Named, "info", ev("BTC"))
+        limiter(_Named, "info", ev("BTC"))
+        with pytest.raises(structlog.DropEvent):
+            limiter(_Named, "info", ev("BTC"))
+        # Other symbols have their own budget; errors are never limited.
+        limiter(_Named, "info", ev("ETH"))
+        for _ in range(5):
+            limiter(_Named, "error", ev("BTC"))
+
+        clock[0] = 61.0
+        assert limiter(_Named, "info", ev("BTC"))["suppressed"] == 1
+
+    def test_disabled(self):
+        limiter = EventRateLimiter(max_events=0)
+        for _ in range(10):
+            limiter(_Named, "info", {"event": "x"})
+
+
+class TestQueueHandler:
+    def test_drops_instead_of_blocking(self):
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+        handler.emit(record)
+        handler.emit(record)
+        assert handler.dropped == 1
+        queued = handler.queue.get_nowait()
+        assert queued.msg == "hello world" and queued.args is None
+
+    def test_traceback_survives_the_queue(self):
+        handler = NonBlockingQueueHandler(queue.Queue())
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = logging.LogRecord("t", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+        handler.emit(record)
+
+        queued = handler.queue.get_nowait()
+        assert queued.exc_info is None
+        rendered = logging.Formatter().format(queued)
+        assert rendered.startswith("failed\nTraceback")
+        assert "RuntimeError: boom" in rendered
+
+
+def test_fast_json_dumps_handles_non_json_types():
+    from decimal import Decimal
+    out = json.loads(fast_json_dumps({"price": Decimal("1.5"), "event": "x"}))
+    assert out == {"price": "1.5", "event": "x"}
+
+
+def test_async_setup_moves_handlers_to_writer_thread(tmp_path):
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    try:
+        setup_logging("INFO", "json", log_file=str(tmp_path / "run.log"), async_mode=True, queue_size=100)
+        assert any(isinstance(h, NonBlockingQueueHandler) for h in root.handlers)
+        assert logging_stats()["async"] is True
+
+        structlog.get_logger("src.test").debug("not emitted")
+        structlog.get_logger("src.test").info("queued_event", n=1)
+        shutdown_logging()  # flushes the listener
+
+        lines = (tmp_path / "run.log").read_text().splitlines()
+        events = [json.loads(line)["event"] for line in lines]
+        assert "queued_event" in events
+        assert "not emitted" not in events
+        assert not any(isinstance(h, NonBlockingQueueHandler) for h in root.handlers)
+    finally:
+        shutdown_logging()
+        for h in list(root.handlers):
+            if h not in saved_handlers:
+                root.removeHandler(h)
+                h.close()
+        root.setLevel(saved_level)
+        structlog.reset_defaults()
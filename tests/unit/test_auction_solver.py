@@ -0,0 +1,184 @@
+"""
+Tests for the auction winner-selection core: incremental greedy pass and exact mode.
+"""
+import random
+from decimal import Decimal
+from typing import Dict, List
+
+import pytest
+
+from src.data.symbol_utils import normalize_symbol_for_position_match
+from src.domain.models import Side
+from src.portfolio.auction_allocator import (
+    AuctionAllocator,
+    Contender,
+    ContenderKind,
+    PortfolioLimits,
+)
+
+
+def _contender(symbol: str, value: float, margin: str = "100", cluster: str = "c0",
+               direction: Side = Side.LONG, locked: bool = False) -> Contender:
+    return Contender(
+        kind=ContenderKind.NEW,
+        symbol=symbol,
+        cluster=cluster,
+        direction=direction,
+        required_margin=Decimal(margin),
+        value=value,
+        locked=locked,
+    )
+
+
+def _reference_select(allocator: AuctionAllocator, contenders: List[Contender], state: Dict) -> List[Contender]:
+    """The original rescan-the-winners greedy loop."""
+    limits = allocator.limits
+    winners, margin_used = [], Decimal("0")
+    cluster_counts, symbol_counts = {}, {}
+    long_count = short_count = 0
+    max_margin = Decimal(str(state["available_margin"])) * Decimal(str(limits.max_margin_util))
+    for c in contenders:
+        if len(winners) >= limits.max_positions:
+            break
+        if margin_used + c.required_margin > max_margin:
+            continue
+        key = normalize_symbol_for_position_match(c.symbol)
+        if symbol_counts.get(key, 0) >= limits.max_per_symbol:
+            continue
+        if cluster_counts.get(c.cluster, 0) >= limits.max_per_cluster:
+            continue
+        if limits.max_net_long is not None and c.direction == Side.LONG:
+            if sum(w.required_margin for w in winners if w.direction == Side.LONG) + c.required_margin > limits.max_net_long:
+                continue
+        if limits.max_net_short is not None and c.direction == Side.SHORT:
+            if sum(w.required_margin for w in winners if w.direction == Side.SHORT) + c.required_margin > limits.max_net_short:
+                continue
+        if c.value - allocator._direction_penalty(c.direction, long_count, short_count) < 0 and not c.locked:
+            continue
+        winners.append(c)
+        margin_used += c.required_margin
+        cluster_counts[c.cluster] = cluster_counts.get(c.cluster, 0) + 1
+        symbol_counts[key] = symbol_counts.get(key, 0) + 1
+        if c.direction == Side.LONG:
+            long_count += 1
+        else:
+            short_count += 1
+    return winners
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_greedy_matches_reference(seed):
+    rng = random.Random(seed)
+    allocator = AuctionAllocator(
+        limits=PortfolioLimits(
+            max_positions=15, max_margin_util=0.9, max_per_cluster=4, max_per_symbol=2,
+            max_net_long=Decimal("900"), max_net_short=Decimal("700"),
+            direction_concentration_penalty=30.0,
+        ),
+    )
+    contenders = [
+        _contender(
+            f"S{rng.randrange(40)}/USD",
+            rng.uniform(-5, 60),
+            margin=str(rng.randrange(20, 200)),
+            cluster=f"c{rng.randrange(5)}",
+            direction=rng.choice([Side.LONG, Side.SHORT]),
+            locked=rng.random() < 0.1,
+        )
+        for _ in range(200)
+    ]
+    contenders.sort(key=lambda c: -c.value)
+    state = {"available_margin": Decimal("2000")}
+
+    assert allocator._select_winners(contenders, state) == _reference_select(allocator, contenders, state)
+
+
+def test_exact_solver_beats_greedy_on_margin_knapsack():
+    limits = PortfolioLimits(max_positions=5, max_margin_util=1.0, max_per_cluster=5, direction_concentration_penalty=0.0)
+    contenders = [
+        _contender("BIG/USD", 50.0, margin="100"),
+        _contender("A/USD", 40.0, margin="50"),
+        _contender("B/USD", 40.0, margin="50"),
+    ]
+    state = {"available_margin": Decimal("100")}
+
+    greedy = AuctionAllocator(limits=limits)._select_winners(contenders, state)
+    assert [c.symbol for c in greedy] == ["BIG/USD"]
+
+    exact = AuctionAllocator(limits=limits, solver="exact")
+    winners = exact._select_winners_exact(contenders, state, greedy)
+    assert [c.symbol for c in winners] == ["A/USD", "B/USD"]
+
+
+def test_exact_solver_keeps_locked_and_respects_caps():
+    limits = PortfolioLimits(max_positions=2, max_margin_util=1.0, max_per_cluster=1, max_per_symbol=1,
+                             direction_concentration_penalty=0.0)
+    contenders = [
+        _contender("X/USD", 60.0, cluster="a"),
+        _contender("Y/USD", 55.0, cluster="a"),
+        _contender("Z/USD", 20.0, cluster="b"),
+        _contender("L/USD", 1.0, cluster="c", locked=True),
+    ]
+    allocator = AuctionAllocator(limits=limits, solver="exact")
+    state = {"available_margin": Decimal("1000")}
+    winners = allocator._select_winners_exact(contenders, state, allocator._select_winners(contenders, state))
+    assert [c.symbol for c in winners] == ["X/USD", "L/USD"]
+
+
+def test_exact_solver_applies_direction_penalty():
+    # Third long's penalty (2 of 2 long -> full 30) exceeds its value, so greedy drops it.
+    limits = PortfolioLimits(max_positions=5, max_margin_util=1.0, max_per_cluster=5,
+                             direction_concentration_penalty=30.0)
+    contenders = [
+        _contender("A/USD", 50.0),
+        _contender("B/USD", 45.0),
+        _contender("C/USD", 20.0),
+    ]
+    allocator = AuctionAllocator(limits=limits, solver="exact")
+    state = {"available_margin": Decimal("1000")}
+    greedy = allocator._select_winners(contenders, state)
+    assert [c.symbol for c in greedy] == ["A/USD", "B/USD"]
+
+    winners = allocator._select_winners_exact(contenders, state, greedy)
+    assert [c.symbol for c in winners] == ["A/USD", "B/USD"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_exact_solver_never_worse_than_greedy_with_penalty(seed):
+    rng = random.Random(seed)
+    limits = PortfolioLimits(max_positions=6, max_margin_util=1.0, max_per_cluster=3,
+                             direction_concentration_penalty=25.0)
+    allocator = AuctionAllocator(limits=limits, solver="exact")
+    contenders = sorted(
+        (
+            _contender(f"S{i}/USD", rng.uniform(0, 40), margin=str(rng.randrange(20, 120)),
+                       cluster=f"c{rng.randrange(3)}", direction=rng.choice([Side.LONG, Side.SHORT]))
+            for i in range(14)
+        ),
+        key=lambda c: -c.value,
+    )
+    state = {"available_margin": Decimal("400")}
+
+    def adjusted_total(winners):
+        total, longs, shorts = 0.0, 0, 0
+        for c in sorted(winners, key=contenders.index):
+            adj = c.value - allocator._direction_penalty(c.direction, longs, shorts)
+            assert adj >= 0
+            total += adj
+            longs += c.direction == Side.LONG
+            shorts += c.direction != Side.LONG
+        return total
+
+    greedy = allocator._select_winners(contenders, state)
+    exact = allocator._select_winners_exact(contenders, state, greedy)
+    assert adjusted_total(exact) >= adjusted_total(greedy) - 1e-9
+
+
+def test_exact_solver_falls_back_to_greedy_for_large_sets():
+    allocator = AuctionAllocator(limits=PortfolioLimits(), solver="exact", exact_max_contenders=3)
+    contenders = [_contender(f"S{i}/USD", 10.0 + i) for i in range(4)]
+    greedy = contenders[:1]
+    assert allocator._select_winners_exact(contenders, {"available_margin": Decimal("1000")}, greedy) is greedy
+
+    with pytest.raises(ValueError):
+        AuctionAllocator(limits=PortfolioLimits(), solver="ilp")
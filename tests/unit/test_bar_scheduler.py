@@ -0,0 +1,102 @@
+"""
+Tests for the bar-close-aligned loop scheduler.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.runtime.bar_scheduler import (
+    WAKE_ANALYSIS,
+    WAKE_MANAGEMENT,
+    BarCloseScheduler,
+    next_boundary,
+)
+
+
+T0 = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class _Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class TestNextBoundary:
+    def test_strictly_after(self):
+        assert next_boundary(T0, "15m") == T0 + timedelta(minutes=15)
+        assert next_boundary(T0 + timedelta(minutes=7), "15m") == T0 + timedelta(minutes=15)
+        assert next_boundary(T0 + timedelta(minutes=7), "4h") == datetime(2025, 1, 1, 16, tzinfo=timezone.utc)
+
+    def test_unknown_timeframes_rejected(self):
+        with pytest.raises(ValueError):
+            BarCloseScheduler(timeframes=("7m",))
+
+
+class TestPlan:
+    def test_first_wake_is_immediate_management(self):
+        clock = _Clock(T0 + timedelta(minutes=3))
+        sched = BarCloseScheduler(settle_seconds=5, clock=clock)
+        wake = sched.plan(clock.now)
+        assert wake.kind == WAKE_MANAGEMENT
+        assert wake.at == clock.now
+
+    def test_bar_close_includes_settle_and_closing_timeframes(self):
+        clock = _Clock(T0 + timedelta(minutes=50))
+        sched = BarCloseScheduler(settle_seconds=5, clock=clock)
+        sched._last_wake = clock.now
+        # Management due at :51; 1h close at 13:00:05 is far enough away.
+        assert sched.plan(clock.now).kind == WAKE_MANAGEMENT
+        sched._last_wake = T0 + timedelta(minutes=59)
+        wake = sched.plan(T0 + timedelta(minutes=59))
+        assert wake.kind == WAKE_ANALYSIS
+        assert wake.at == T0 + timedelta(hours=1, seconds=5)
+        assert wake.timeframes == frozenset({"15m", "1h"})
+
+    def test_management_inside_min_gap_is_folded(self):
+        now = T0 + timedelta(minutes=14, seconds=10)
+        sched = BarCloseScheduler(settle_seconds=5, min_gap_seconds=60, clock=_Clock(now))
+        sched._last_wake = now - timedelta(seconds=20)
+        # Management would be due at 14:50, only 15s before the 15:05 bar wake.
+        wake = sched.plan(now)
+        assert wake.kind == WAKE_ANALYSIS
+        assert wake.at == T0 + timedelta(minutes=15, seconds=5)
+
+    def test_bar_wake_never_closer_than_min_gap(self):
+        now = T0 + timedelta(minutes=14, seconds=50)
+        sched = BarCloseScheduler(settle_seconds=5, min_gap_seconds=60, clock=_Clock(now))
+        sched._last_wake = now
+        wake = sched.plan(now)
+        assert wake.kind == WAKE_ANALYSIS
+        assert wake.at == now + timedelta(seconds=60)
+
+
+class TestWait:
+    @pytest.mark.asyncio
+    async def test_ws_close_skips_settle_delay(self):
+        clock = _Clock(T0 + timedelta(minutes=15, seconds=1))
+        sched = BarCloseScheduler(settle_seconds=30, min_gap_seconds=60, clock=clock)
+        sched._last_wake = T0 + timedelta(minutes=13)
+
+        waiter = asyncio.create_task(sched.wait())
+        await asyncio.sleep(0)
+        sched.notify_bar_close("BTC/USD", "15m")
+        wake = await asyncio.wait_for(waiter, timeout=1)
+        assert wake.is_analysis and wake.ws_confirmed
+        assert sched.stats["ws_early_wakes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ws_close_before_boundary_is_ignored(self):
+        clock = _Clock(T0 + timedelta(minutes=10))
+        sched = BarCloseScheduler(settle_seconds=5, min_gap_seconds=60, clock=clock)
+        sched._last_wake = T0 + timedelta(minutes=9, seconds=30)
+
+        waiter = asyncio.create_task(sched.wait())
+        await asyncio.sleep(0)
+        sched.notify_bar_close("BTC/USD", "15m")
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        waiter.cancel()
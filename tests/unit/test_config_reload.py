@@ -0,0 +1,228 @@
+"""
+Tests for hot config reload (src/live/config_reload.py).
+"""
+import os
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.config.config import Config
+from src.execution.position_manager_v2 import PositionManagerV2
+from src.execution.position_state_machine import PositionRegistry
+from src.live.auction_runner import build_auction_allocator
+from src.live.config_reload import (
+    ConfigSnapshot,
+    ConfigWatcher,
+    apply_config_reload,
+    diff_settings,
+    requires_restart,
+)
+from src.risk.risk_manager import RiskManager
+from src.strategy.smc_engine import SMCEngine
+
+CONFIG_PATH = Path("src/config/config.yaml")
+
+SAFETY_YAML = """\
+safety:
+  invariants:
+    max_equity_drawdown_pct: 0.15
+    max_concurrent_positions: 27
+"""
+
+
+@pytest.fixture
+def files(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    safety_path = tmp_path / "safety.yaml"
+    shutil.copy(CONFIG_PATH, config_path)
+    safety_path.write_text(SAFETY_YAML)
+    return config_path, safety_path
+
+
+def _snapshot(config_path, safety_path):
+    from src.config.safety_config import load_safety_config
+
+    config = Config.from_yaml(config_path)
+    return ConfigSnapshot.build(config, load_safety_config(str(safety_path)))
+
+
+def _edit(path: Path, old: str, new: str) -> None:
+    text = path.read_text()
+    assert old in text
+    path.write_text(text.replace(old, new, 1))
+    # Guarantee a new stamp even on coarse-mtime filesystems.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_diff_settings_and_restart_rules():
+    changes = diff_settings(
+        {"risk": {"a": 1, "b": [1, 2]}, "exchange": {"x": 1}},
+        {"risk": {"a": 2, "b": [1, 2], "c": 3}, "exchange": {"x": 1}},
+    )
+    assert changes == {"risk.a": (1, 2), "risk.c": (None, 3)}
+
+    assert not requires_restart("risk.risk_per_trade_pct")
+    assert not requires_restart("safety.invariants.max_equity_drawdown_pct")
+    assert requires_restart("risk.shock_move_pct")
+    assert requires_restart("safety.cycle_guard.min_cycle_interval_seconds")
+    assert requires_restart("exchange.use_market_discovery")
+
+
+def test_poll_returns_none_until_files_change(files):
+    config_path, safety_path = files
+    watcher = ConfigWatcher(config_path, safety_path)
+    current = _snapshot(config_path, safety_path)
+
+    assert watcher.poll(current) is None
+
+    _edit(config_path, "risk_per_trade_pct: 0.03", "risk_per_trade_pct: 0.02")
+    reload = watcher.poll(current)
+
+    assert reload is not None
+    assert reload.changes == {"risk.risk_per_trade_pct": (0.03, 0.02)}
+    assert reload.sections == {"risk"}
+    assert reload.snapshot.version == current.version + 1
+    assert reload.snapshot.config_hash != current.config_hash
+    # Not an auction rollout knob, so the policy fingerprint is unchanged.
+    assert reload.snapshot.policy_hash == current.policy_hash
+    # Same on-disk version is not reloaded twice.
+    assert watcher.poll(current) is None
+
+
+def test_safety_invariant_change_is_hot(files):
+    config_path, safety_path = files
+    watcher = ConfigWatcher(config_path, safety_path)
+    current = _snapshot(config_path, safety_path)
+
+    _edit(safety_path, "max_equity_drawdown_pct: 0.15", "max_equity_drawdown_pct: 0.12")
+    reload = watcher.poll(current)
+
+    assert reload is not None
+    assert reload.sections == {"safety"}
+    assert float(reload.snapshot.invariants.max_equity_drawdown_pct) == pytest.approx(0.12)
+
+
+@pytest.mark.parametrize(
+    "old,new",
+    [
+        ("risk_per_trade_pct: 0.03", "risk_per_trade_pct: 0.5"),  # fails Field(le=0.05)
+        ("risk_per_trade_pct: 0.03", "risk_per_trade_pct: [0.03"),  # broken YAML
+        ("use_market_discovery: true", "use_market_discovery: false"),  # restart-only section
+    ],
+)
+def test_invalid_or_restart_only_changes_are_rejected(files, old, new):
+    config_path, safety_path = files
+    watcher = ConfigWatcher(config_path, safety_path)
+    current = _snapshot(config_path, safety_path)
+
+    _edit(config_path, old, new)
+    assert watcher.poll(current) is None
+
+
+def test_compatibility_check_rejects_reload(files):
+    config_path, safety_path = files
+    watcher = ConfigWatcher(
+        config_path, safety_path, compatibility_check=lambda config, invariants: ["mismatch"]
+    )
+    current = _snapshot(config_path, safety_path)
+
+    _edit(config_path, "risk_per_trade_pct: 0.03", "risk_per_trade_pct: 0.02")
+    assert watcher.poll(current) is None
+
+
+def _live_trading_stub(snapshot):
+    config = snapshot.config
+    executor_configs = []
+    return SimpleNamespace(
+        config=config,
+        runtime_params=snapshot.runtime_params,
+        config_snapshot=snapshot,
+        risk_manager=RiskManager(config.risk, params=snapshot.runtime_params.risk),
+        smc_engine=SMCEngine(config.strategy),
+        executor=SimpleNamespace(apply_config=executor_configs.append, applied=executor_configs),
+        execution_engine=None,
+        position_manager_v2=PositionManagerV2(
+            registry=PositionRegistry(), multi_tp_config=config.multi_tp, strategy_config=config.strategy
+        ),
+        auction_allocator=build_auction_allocator(config),
+        hardening=None,
+        _signal_cooldown_hours=float(config.strategy.signal_cooldown_hours),
+        _policy_snapshot=snapshot.policy_snapshot,
+        _policy_hash=snapshot.policy_hash,
+    )
+
+
+def test_apply_swaps_snapshot_and_keeps_unaffected_caches(files):
+    config_path, safety_path = files
+    watcher = ConfigWatcher(config_path, safety_path)
+    current = _snapshot(config_path, safety_path)
+    lt = _live_trading_stub(current)
+    cache_key = ("BTC/USD", pd.Timestamp("2026-01-01", tz="UTC").to_pydatetime())
+    lt.smc_engine.indicator_cache[cache_key] = {"adx": 20.0}
+
+    _edit(config_path, "risk_per_trade_pct: 0.03", "risk_per_trade_pct: 0.02")
+    updated = apply_config_reload(lt, watcher.poll(current))
+
+    assert updated == ["risk_manager"]
+    assert lt.config is lt.config_snapshot.config
+    assert lt.risk_manager.config is lt.config.risk
+    assert float(lt.risk_manager.params.risk_per_trade_pct) == pytest.approx(0.02)
+    assert lt.executor.applied == []
+    assert cache_key in lt.smc_engine.indicator_cache
+
+    # Auction knobs re-fingerprint the policy and rebuild the allocator.
+    current = lt.config_snapshot
+    allocator = lt.auction_allocator
+    _edit(config_path, "auction_swap_threshold: 14.0", "auction_swap_threshold: 16.0")
+    updated = apply_config_reload(lt, watcher.poll(current))
+
+    assert updated == ["risk_manager", "auction_allocator"]
+    assert lt.auction_allocator is not allocator
+    assert lt._policy_hash == lt.config_snapshot.policy_hash != current.policy_hash
+    assert lt._policy_snapshot["auction_swap_threshold"] == 16.0
+
+    # Indicator periods feed the cached values: changing one drops the cache.
+    current = lt.config_snapshot
+    _edit(config_path, "  adx_period: 14", "  adx_period: 21")
+    updated = apply_config_reload(lt, watcher.poll(current))
+
+    assert "smc_engine" in updated and "position_manager_v2" in updated
+    assert lt.smc_engine.config.adx_period == 21
+    assert lt.position_manager_v2._strategy_config is lt.config.strategy
+    assert lt.smc_engine.indicator_cache == {}
+
+
+def test_failed_apply_rolls_back_to_previous_snapshot(files):
+    config_path, safety_path = files
+    watcher = ConfigWatcher(config_path, safety_path)
+    current = _snapshot(config_path, safety_path)
+    lt = _live_trading_stub(current)
+    calls = []
+
+    def reject(config):
+        calls.append(config)
+        if len(calls) == 1:
+            raise ValueError("executor rejected config")
+
+    lt.executor = SimpleNamespace(apply_config=reject)
+    allocator, risk_config = lt.auction_allocator, lt.risk_manager.config
+
+    _edit(config_path, "risk_per_trade_pct: 0.03", "risk_per_trade_pct: 0.02")
+    _edit(config_path, "order_timeout_seconds: 120", "order_timeout_seconds: 90")
+    reload = watcher.poll(current)
+    assert reload.sections == {"risk", "execution"}
+
+    with pytest.raises(ValueError, match="executor rejected"):
+        apply_config_reload(lt, reload)
+
+    # Components already updated were re-applied with the previous snapshot.
+    assert lt.risk_manager.config is risk_config
+    assert float(lt.risk_manager.params.risk_per_trade_pct) == pytest.approx(0.03)
+    assert calls[-1] is current.config.execution
+    assert lt.config_snapshot is current and lt.config is current.config
+    assert lt.auction_allocator is allocator
+    assert lt.execution_engine is None
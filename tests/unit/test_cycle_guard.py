@@ -3,6 +3,7 @@ Tests for CycleGuard - timing and duplicate protection.
 
 These tests verify that the trading loop is protected against timing issues.
 """
+import asyncio
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch
@@ -230,5 +231,74 @@ class TestGlobalSingleton:
         assert guard.max_clock_skew.total_seconds() == 15
 
 
+
+class TestCycleProfiler:
+    """Stage timings recorded through CycleGuard start/end."""
+
+    def test_laps_and_nested_spans(self):
+        guard = CycleGuard(min_cycle_interval_seconds=0)
+        guard.profiler.begin()
+        guard.profiler.lap("fetch_tickers")
+        guard.start_cycle()
+        guard.profiler.lap("analysis")
+        with guard.stage("update_candles", symbol="BTC/USD"):
+            time.sleep(0.002)
+        with guard.stage("generate_signal", symbol="ETH/USD"):
+            pass
+        completed = guard.end_cycle()
+
+        assert set(completed.stage_breakdown) == {"fetch_tickers", "analysis"}
+        profile = guard.profiler.recent(1)[0]
+        assert profile.cycle_id == completed.cycle_id
+        assert "analysis/update_candles" in profile.stages
+        assert profile.slow_symbols[0][0] == "BTC/USD"
+        assert guard.profiler.finish() is None  # idempotent
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_nest_under_their_lap(self):
+        guard = CycleGuard()
+        guard.profiler.begin()
+        guard.profiler.lap("analysis")
+
+        async def coin(symbol):
+            with guard.stage("update_candles", symbol=symbol):
+                await asyncio.sleep(0)
+                with guard.stage("fetch", symbol=symbol):
+                    await asyncio.sleep(0)
+
+        await asyncio.gather(*(coin(s) for s in ("A", "B", "C")))
+        profile = guard.profiler.finish()
+        assert profile.stages["analysis/update_candles"][1] == 3
+        assert profile.stages["analysis/update_candles/fetch"][1] == 3
+
+    def test_slowest_window_keeps_longest_ticks(self):
+        guard = CycleGuard()
+        guard.profiler._slowest_size = 2
+        for delay in (0.0, 0.01, 0.0, 0.005):
+            guard.profiler.begin()
+            time.sleep(delay)
+            guard.profiler.finish()
+        slowest = guard.profiler.slowest()
+        assert len(slowest) == 2
+        assert slowest[0].duration_ms >= slowest[1].duration_ms >= 4
+
+        report = guard.get_profile_report(limit=5)
+        assert len(report["recent"]) == 4
+        assert "stats" in report
+
+    def test_sampled_cprofile_kept_for_slow_ticks(self):
+        guard = CycleGuard(profile_slow_cycle_seconds=0.0, profile_sample_every=1)
+        guard.profiler.begin()
+        sum(range(1000))
+        profile = guard.profiler.finish()
+        assert profile.profile_stats and "cumulative" in profile.profile_stats
+
+    def test_stage_outside_tick_is_noop(self):
+        guard = CycleGuard()
+        with guard.stage("anything"):
+            pass
+        assert guard.profiler.recent() == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -11,7 +11,10 @@ from datetime import datetime, timedelta, timezone
 from unittest import mock
 
 import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DBAPIError
 
+from src.storage.db import INDEX_MIGRATIONS, Base, Database, run_index_migrations
 from src.storage.maintenance import CANDLE_RETENTION_DAYS, DatabasePruner
 
 
@@ -46,7 +49,8 @@ class TestDatabasePruner:
     def pruner(self):
         p = DatabasePruner()
         p._db = mock.MagicMock()
-        return p
+        with mock.patch.object(p, "_is_partitioned", return_value=False):
+            yield p
 
     def test_prune_old_candles_iterates_all_timeframes(self, pruner):
         """Each timeframe in CANDLE_RETENTION_DAYS gets a delete query."""
@@ -96,10 +100,143 @@ class TestDatabasePruner:
             mock.patch.object(pruner, "prune_old_traces", return_value=3),
             mock.patch.object(pruner, "prune_old_candles", return_value=7),
             mock.patch.object(pruner, "log_table_stats", return_value={}),
+            mock.patch.object(pruner, "maintain_partitions", return_value=["p1"]),
+            mock.patch.object(pruner, "apply_schema_migrations", return_value={}) as migrate,
         ):
             result = pruner.run_maintenance()
 
-        assert result == {"traces_deleted": 3, "candles_deleted": 7}
+        migrate.assert_called_once()
+
+        assert result == {"partitions_created": 1, "traces_deleted": 3, "candles_deleted": 7}
+
+
+class TestPartitionedRetention:
+    """Partitioned tables: retention drops partitions instead of DELETEing rows."""
+
+    @pytest.fixture()
+    def pruner(self):
+        p = DatabasePruner()
+        p._db = mock.MagicMock()
+        with mock.patch.object(p, "_is_partitioned", return_value=True):
+            yield p
+
+    def test_traces_drop_partitions_not_rows(self, pruner):
+        with mock.patch("src.storage.maintenance.drop_expired", return_value=(["p1", "p2"], 1200)) as drop:
+            assert pruner.prune_old_traces(days_to_keep=3) == 1200
+
+        group, cutoff = drop.call_args.args[1:]
+        assert group.parent == "system_events_trace"
+        assert abs((datetime.now(timezone.utc) - cutoff) - timedelta(days=3)) < timedelta(minutes=1)
+        pruner.db.get_session.assert_not_called()
+
+    def test_candles_drop_per_timeframe(self, pruner):
+        with mock.patch("src.storage.maintenance.drop_expired", return_value=([], 4)) as drop:
+            assert pruner.prune_old_candles() == 4 * len(CANDLE_RETENTION_DAYS)
+
+        parents = [c.args[1].parent for c in drop.call_args_list]
+        assert parents == [f"candles_{tf}" for tf in CANDLE_RETENTION_DAYS]
+        pruner.db.get_session.assert_not_called()
+
+    def test_maintain_partitions_creates_for_both_tables(self, pruner):
+        with mock.patch("src.storage.maintenance.ensure_partitions", side_effect=[["e1"], ["c1", "c2"]]):
+            assert pruner.maintain_partitions() == ["e1", "c1", "c2"]
+
+    def test_driver_error_is_logged_not_raised(self, pruner):
+        err = DBAPIError("CREATE TABLE", None, Exception("lock timeout"))
+        with mock.patch("src.storage.maintenance.ensure_partitions", side_effect=err), \
+             mock.patch("src.storage.maintenance.drop_expired", side_effect=err):
+            assert pruner.maintain_partitions() == []
+            assert pruner.prune_old_traces() == 0
+
+
+class TestSchemaMigrations:
+    """Index migrations / trace-snapshot retention outside the get_db() path."""
+
+    @staticmethod
+    def _engine(relkinds, fail_on=()):
+        executed = []
+
+        def execute(stmt, params=None):
+            sql = str(stmt)
+            result = mock.MagicMock()
+            if sql.startswith("SELECT relkind"):
+                result.scalar.return_value = relkinds.get(params["t"], "r")
+                return result
+            if any(name in sql for name in fail_on):
+                raise DBAPIError(sql, None, Exception("boom"))
+            executed.append(sql)
+            return result
+
+        conn = mock.MagicMock()
+        conn.execute.side_effect = execute
+        engine = mock.MagicMock()
+        engine.connect.return_value.execution_options.return_value.__enter__.return_value = conn
+        return engine, executed
+
+    def test_partitioned_parent_index_built_without_concurrently(self):
+        engine, executed = self._engine({"system_events": "p"})
+
+        assert len(run_index_migrations(engine)) == len(INDEX_MIGRATIONS)
+        event_stmt = next(s for s in executed if "system_events" in s)
+        assert "CONCURRENTLY" not in event_stmt
+        assert all("CONCURRENTLY" in s for s in executed if "ON trades" in s)
+
+    def test_sqlalchemy_error_skips_only_that_index(self):
+        engine, executed = self._engine({}, fail_on=("idx_trade_symkey_exited",))
+
+        applied = run_index_migrations(engine)
+
+        assert len(applied) == len(INDEX_MIGRATIONS) - 1
+        assert not any("idx_trade_symkey_exited " in s for s in executed)
+
+    def test_get_db_path_runs_no_index_migrations(self):
+        db = mock.MagicMock()
+        with mock.patch("src.storage.db.run_index_migrations") as run:
+            Database._run_migrations(db)
+        run.assert_not_called()
+
+    def test_prune_latest_traces_drops_stale_symbols(self):
+        from src.storage.repository import LatestTraceModel
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine, tables=[LatestTraceModel.__table__])
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with engine.begin() as conn:
+            conn.execute(
+                LatestTraceModel.__table__.insert(),
+                [
+                    {"symbol": "BTC/USD", "timestamp": now, "details": "{}"},
+                    {"symbol": "DELISTED/USD", "timestamp": now - timedelta(days=5), "details": "{}"},
+                ],
+            )
+        pruner = DatabasePruner()
+        pruner._db = mock.MagicMock(engine=engine)
+
+        assert pruner.prune_latest_traces(now - timedelta(days=3)) == 1
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT symbol FROM latest_trace_per_symbol")).scalars().all() == ["BTC/USD"]
+
+
+class TestLiveLoopMaintenance:
+    """The live loop must never run blocking maintenance on the event loop."""
+
+    async def test_runs_in_worker_thread_and_swallows_errors(self):
+        import threading
+        from types import SimpleNamespace
+
+        from src.exceptions import OperationalError
+        from src.live.live_trading import LiveTrading
+
+        threads = []
+
+        def run_maintenance():
+            threads.append(threading.get_ident())
+            raise OperationalError("db down")
+
+        lt = SimpleNamespace(db_pruner=SimpleNamespace(run_maintenance=run_maintenance))
+        await LiveTrading._run_db_maintenance(lt)
+
+        assert threads and threads[0] != threading.get_ident()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,154 @@
+"""
+Tests for the bounded order-event dedup window shared by ManagedPosition
+and EventOrderingEnforcer.
+"""
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.domain.models import Side
+from src.execution.event_dedup import EventDedupWindow, event_key_to_int
+from src.execution.position_state_machine import (
+    ManagedPosition,
+    OrderEvent,
+    OrderEventType,
+)
+from src.execution.production_safety import EventOrderingEnforcer
+
+
+def _position() -> ManagedPosition:
+    pos = ManagedPosition(
+        symbol="BTC/USD:USD",
+        side=Side.LONG,
+        position_id="dedup-1",
+        initial_size=Decimal("10"),
+        initial_entry_price=Decimal("50000"),
+        initial_stop_price=Decimal("49000"),
+        initial_tp1_price=Decimal("52000"),
+        initial_tp2_price=None,
+        initial_final_target=None,
+    )
+    pos.entry_order_id = "entry-1"
+    return pos
+
+
+def _event(event_type, seq, fill_id=None, qty="0.01") -> OrderEvent:
+    is_fill = event_type in (OrderEventType.PARTIAL_FILL, OrderEventType.FILLED)
+    return OrderEvent(
+        order_id="entry-1",
+        client_order_id="client-1",
+        event_type=event_type,
+        event_seq=seq,
+        timestamp=datetime.now(timezone.utc),
+        fill_qty=Decimal(qty) if is_fill else None,
+        fill_price=Decimal("50000") if is_fill else None,
+        fill_id=fill_id,
+    )
+
+
+class TestEventDedupWindow:
+    def test_event_hash_maps_to_its_own_64_bit_value(self):
+        assert event_key_to_int("00000000000000ff") == 255
+        assert event_key_to_int("fill-abc") == event_key_to_int("fill-abc")
+        assert event_key_to_int("fill-abc") < 2**64
+
+    def test_ring_is_bounded(self):
+        window = EventDedupWindow(max_keys=8)
+        for i in range(100):
+            window.add("order-1", f"fill-{i}")
+        assert len(window) == 8
+        assert "fill-99" in window
+        assert "fill-0" not in window
+
+    def test_close_order_keeps_tombstone_for_fills_only(self):
+        window = EventDedupWindow()
+        window.add("order-1", "fill-a")
+        window.add("order-1", "fill-b")
+        window.close_order("order-1", keep_key="fill-b")
+
+        assert len(window) == 1
+        assert window.seen("order-1", "fill-b")
+        # Unseen fill on a closed order is still a duplicate...
+        assert window.seen("order-1", "fill-c", is_fill=True)
+        # ...but a late non-fill event is allowed through.
+        assert not window.seen("order-1", "ack-late", is_fill=False)
+
+    def test_legacy_list_state_loads(self):
+        legacy = ["00000000000000aa", "00000000000000bb"]
+        window = EventDedupWindow.from_state(legacy)
+        assert "00000000000000aa" in window
+        assert len(window) == 2
+
+    def test_json_round_trip_and_cache(self):
+        window = EventDedupWindow()
+        window.add("order-1", "fill-a")
+        window.close_order("order-2")
+        encoded = window.to_json()
+        assert window.to_json() is encoded  # unchanged -> cached
+
+        restored = EventDedupWindow.from_json(encoded)
+        assert "fill-a" in restored
+        assert restored.is_closed("order-2")
+        assert json.loads(restored.to_json()) == json.loads(encoded)
+
+
+class TestManagedPositionDedup:
+    def test_many_partial_fills_stay_bounded(self):
+        pos = _position()
+        for seq in range(1, 1001):
+            pos.apply_order_event(_event(OrderEventType.PARTIAL_FILL, seq, f"f-{seq}"))
+        assert len(pos.processed_event_hashes) <= EventDedupWindow.DEFAULT_MAX_KEYS
+        assert pos.filled_entry_qty == Decimal("10.00")
+
+    def test_terminal_fill_evicts_and_blocks_redelivery(self):
+        pos = _position()
+        partial = _event(OrderEventType.PARTIAL_FILL, 1, "f-1", qty="4")
+        final = _event(OrderEventType.FILLED, 2, "f-2", qty="6")
+        assert pos.apply_order_event(partial)
+        assert pos.apply_order_event(final)
+        assert len(pos.processed_event_hashes) == 1
+
+        # Redelivered partial (hash evicted) is still rejected via the tombstone.
+        assert pos.apply_order_event(partial) is False
+        assert pos.apply_order_event(final) is False
+        assert pos.filled_entry_qty == Decimal("10")
+
+    def test_to_dict_round_trip(self):
+        pos = _position()
+        pos.apply_order_event(_event(OrderEventType.FILLED, 1, "f-1", qty="10"))
+        restored = ManagedPosition.from_dict(pos.to_dict())
+        assert restored.processed_event_hashes.is_closed("entry-1")
+
+
+    def test_new_fill_after_cancel_is_applied(self):
+        pos = _position()
+        assert pos.apply_order_event(_event(OrderEventType.PARTIAL_FILL, 1, "f-1", qty="4"))
+        pos.apply_order_event(_event(OrderEventType.CANCELLED, 2))
+        assert not pos.processed_event_hashes.is_closed("entry-1")
+
+        late = _event(OrderEventType.PARTIAL_FILL, 3, "f-2", qty="2")
+        assert not pos._is_duplicate_event(late)
+        pos.apply_order_event(late)
+        assert pos.filled_entry_qty == Decimal("6")
+        # Exact redelivery of an already-applied fill is still a duplicate.
+        assert pos._is_duplicate_event(late)
+
+
+class TestEnforcerTerminalEviction:
+    def test_mark_order_filled_rejects_further_fills(self):
+        enforcer = EventOrderingEnforcer()
+        enforcer.mark_processed("order-1", 1, fill_id="fill-a")
+        enforcer.mark_order_filled("order-1")
+        assert enforcer.should_process_event("order-1", 2, fill_id="fill-z") is False
+        assert enforcer.should_process_event("order-2", 1, fill_id="fill-z") is True
+
+    def test_new_fill_id_after_cancel_or_cleanup_is_processed(self):
+        enforcer = EventOrderingEnforcer()
+        enforcer.mark_processed("order-1", 1, fill_id="fill-a")
+        enforcer.mark_processed("order-1", 2)  # CANCELLED: no tombstone
+        assert enforcer.should_process_event("order-1", 3, fill_id="fill-b") is True
+        assert enforcer.should_process_event("order-1", 3, fill_id="fill-a") is False
+
+        enforcer.cleanup_old_orders(active_order_ids=set())
+        assert enforcer.should_process_event("order-1", 1, fill_id="fill-c") is True
+        assert enforcer.should_process_event("order-1", 1, fill_id="fill-a") is False
@@ -4,6 +4,8 @@ No network calls.
 """
 from __future__ import annotations
 
+import time
+
 import pytest
 from decimal import Decimal
 
@@ -14,6 +16,7 @@ from src.execution.instrument_specs import (
     compute_size_contracts,
     ensure_size_step_aligned,
     _parse_instrument,
+    diff_specs,
 )
 
 
@@ -340,3 +343,87 @@ def test_ensure_size_step_aligned_rejects_when_rounded_below_min():
     out, reason = ensure_size_step_aligned(spec, Decimal("0.004"), reduce_only=False)
     assert reason == "SIZE_STEP_MISALIGNED"
     assert out == Decimal("0.004")
+
+
+# ---------- alias index / snapshot reuse / refresh diff ----------
+
+
+def _spec(raw: str, base: str, min_size: str = "0.001") -> InstrumentSpec:
+    return InstrumentSpec(
+        symbol_raw=raw,
+        symbol_ccxt=f"{base}/USD:USD",
+        base=base,
+        quote="USD",
+        min_size=Decimal(min_size),
+        size_step=Decimal("0.001"),
+    )
+
+
+def test_alias_index_resolves_format_variants(tmp_path):
+    """PF_/PI_, /USD, :USD, bare base and BTC for XBT all hit the same spec."""
+    xbt = _spec("PF_XBTUSD", "XBT")
+    eth = _spec("PF_ETHUSD", "ETH")
+    eth_inverse = _spec("PI_ETHUSD", "ETH")
+    reg = InstrumentSpecRegistry(get_instruments_fn=None, cache_path=tmp_path / "none.json")
+    reg._index([xbt, eth, eth_inverse])
+    reg._loaded_at = time.time()
+    for alias in ("PF_XBTUSD", "XBTUSD", "XBT/USD:USD", "BTC/USD", "btc/usd:usd", "PF_BTCUSD", "BTC"):
+        assert reg.get_spec(alias) is xbt, alias
+    assert reg.get_spec("ETH/USD") is eth
+    # An exact raw symbol always wins over the normalized base alias
+    assert reg.get_spec("PI_ETHUSD") is eth_inverse
+    assert reg.get_spec("NOPE/USD") is None
+    assert reg.get_spec("NOPE/USD") is None  # memoized miss
+
+
+def test_disk_snapshot_not_reparsed_when_unchanged(tmp_path, monkeypatch):
+    """Stale-TTL lookups reuse the parsed snapshot until the file changes."""
+    import json
+
+    monkeypatch.setenv("TRADING_SYSTEM_SKIP_SPEC_SANITY", "1")
+    path = tmp_path / "specs.json"
+    path.write_text(json.dumps({"loaded_at": 1, "specs": [_spec("PF_ETHUSD", "ETH").to_dict()]}))
+    reg = InstrumentSpecRegistry(get_instruments_fn=None, cache_path=path)
+    calls = []
+    original = reg._parse_disk_snapshot
+    monkeypatch.setattr(reg, "_parse_disk_snapshot", lambda: calls.append(1) or original())
+
+    for _ in range(5):
+        assert reg.get_spec("ETH/USD") is not None  # loaded_at=1 -> always past TTL
+    assert len(calls) == 1
+
+    path.write_text(json.dumps({"loaded_at": 1, "specs": [_spec("PF_SOLUSD", "SOL").to_dict()]}))
+    assert reg.get_spec("SOL/USD") is not None
+    assert len(calls) == 2
+
+
+def test_refresh_reports_added_removed_changed(tmp_path, monkeypatch):
+    """refresh() diffs the new contract list against the previous index."""
+    import asyncio
+
+    monkeypatch.setenv("TRADING_SYSTEM_SKIP_SPEC_SANITY", "1")
+    batches = [
+        [{"symbol": "PF_ETHUSD", "contractValueTradePrecision": 3},
+         {"symbol": "PF_DOGEUSD", "contractValueTradePrecision": 0}],
+        [{"symbol": "PF_ETHUSD", "contractValueTradePrecision": 2},
+         {"symbol": "PF_SOLUSD", "contractValueTradePrecision": 2}],
+    ]
+
+    async def fetch():
+        return batches.pop(0)
+
+    reg = InstrumentSpecRegistry(get_instruments_fn=fetch, cache_path=tmp_path / "specs.json")
+    asyncio.run(reg.refresh())
+    assert reg.last_diff is None  # first load: nothing to compare with
+    reg._loaded_at = 0
+    asyncio.run(reg.refresh())
+    diff = reg.last_diff
+    assert diff.added == ("PF_SOLUSD",)
+    assert diff.removed == ("PF_DOGEUSD",)
+    assert set(diff.changed["PF_ETHUSD"]) == {"min_size", "size_step"}
+    assert reg.get_spec("DOGE/USD") is None
+
+
+def test_diff_specs_empty_when_identical():
+    a = {"PF_ETHUSD": _spec("PF_ETHUSD", "ETH")}
+    assert diff_specs(a, dict(a)).empty
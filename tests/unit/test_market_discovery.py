@@ -252,3 +252,138 @@ def test_market_discovery_service_pinned_majors_default_to_tier_a():
     assert service.get_symbol_tier("ETH/USD") == "A"
     assert service.get_symbol_tier("SOL/USD") == "A"
     assert service.get_symbol_tier("BNB/USD") == "A"
+
+
+class _CountingClient(FakeKrakenClient):
+    """FakeKrakenClient recording call order and allowing ticker updates."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = []
+        self.volume_overrides = {}
+
+    async def get_spot_markets(self):
+        import asyncio
+        self.events.append("spot_markets:start")
+        await asyncio.sleep(0.01)
+        self.events.append("spot_markets:end")
+        return await super().get_spot_markets()
+
+    async def get_futures_tickers_bulk_full(self):
+        self.events.append("futures_tickers:start")
+        tickers = await super().get_futures_tickers_bulk_full()
+        for sym, vol in self.volume_overrides.items():
+            t = tickers[sym]
+            tickers[sym] = FuturesTicker(
+                symbol=t.symbol, mark_price=t.mark_price, bid=t.bid, ask=t.ask,
+                volume_24h=vol, open_interest=t.open_interest, funding_rate=t.funding_rate,
+            )
+        return tickers
+
+
+_TWO_PAIRS = dict(
+    spot_markets={
+        "BTC/USD": {"id": "a", "base": "BTC", "quote": "USD", "active": True},
+        "ETH/USD": {"id": "b", "base": "ETH", "quote": "USD", "active": True},
+    },
+)
+
+
+@pytest.mark.asyncio
+async def test_discovery_fetches_independent_inputs_concurrently(mock_config):
+    client = _CountingClient(**_TWO_PAIRS)
+    registry = MarketRegistry(client, mock_config)
+    await registry.discover_markets()
+    # Futures tickers start before the (slow) spot market list has returned.
+    assert client.events.index("futures_tickers:start") < client.events.index("spot_markets:end")
+
+
+@pytest.mark.asyncio
+async def test_refresh_refilters_only_changed_symbols(mock_config):
+    client = _CountingClient(**_TWO_PAIRS)
+    registry = MarketRegistry(client, mock_config)
+    first = await registry.discover_markets()
+    assert set(first) == {"BTC/USD", "ETH/USD"}
+
+    with patch.object(registry, "_filter_pair", wraps=registry._filter_pair) as filt:
+        await registry.discover_markets()
+        assert filt.call_count == 0
+        assert registry.last_discovery_stats["candidates_reused"] is True
+
+        client.volume_overrides["PF_ETHUSD"] = Decimal("100")
+        pairs = await registry.discover_markets()
+        assert [c.args[0] for c in filt.call_args_list] == ["ETH/USD"]
+    assert set(pairs) == {"BTC/USD", "ETH/USD"}  # ETH is pinned Tier A
+    assert pairs["ETH/USD"].futures_volume_24h == Decimal("100")
+
+
+@pytest.mark.asyncio
+async def test_refilter_memo_keys_on_threshold_bands(mock_config):
+    client = _CountingClient(
+        spot_markets={"NEWTOKEN/USD": {"id": "n", "base": "NEWTOKEN", "quote": "USD", "active": True}},
+        futures_markets={
+            "NEWTOKEN/USD": {"symbol": "PF_NEWTOKENUSD", "base": "NEWTOKEN", "quote": "USD", "active": True},
+        },
+    )
+    registry = MarketRegistry(client, mock_config)
+    assert (await registry.discover_markets())["NEWTOKEN/USD"].liquidity_tier == "A"
+
+    with patch.object(registry, "_filter_pair", wraps=registry._filter_pair) as filt:
+        # Volume moves but stays in the same band: verdict reused, figures refreshed.
+        client.volume_overrides["PF_NEWTOKENUSD"] = Decimal("90000000")
+        pairs = await registry.discover_markets()
+        assert filt.call_count == 0
+        assert pairs["NEWTOKEN/USD"].futures_volume_24h == Decimal("90000000")
+
+        # Dropping below the Tier A volume threshold is a different band.
+        client.volume_overrides["PF_NEWTOKENUSD"] = Decimal("3000000")
+        pairs = await registry.discover_markets()
+        assert filt.call_count == 1
+        assert pairs["NEWTOKEN/USD"].liquidity_tier == "B"
+
+        # Changing a tier threshold invalidates the memo.
+        registry._TIER_RULES = (("A", Decimal("1000000"), Decimal("0.0010")),) + MarketRegistry._TIER_RULES[1:]
+        pairs = await registry.discover_markets()
+        assert filt.call_count == 2
+        assert pairs["NEWTOKEN/USD"].liquidity_tier == "A"
+
+
+@pytest.mark.asyncio
+async def test_candidate_cache_survives_restart(mock_config, tmp_path):
+    cache = tmp_path / "market_metadata_cache.json"
+    await MarketRegistry(_CountingClient(**_TWO_PAIRS), mock_config, cache_path=cache).discover_markets()
+    assert cache.exists()
+
+    registry = MarketRegistry(_CountingClient(**_TWO_PAIRS), mock_config, cache_path=cache)
+    with patch.object(registry, "_build_mappings") as build:
+        pairs = await registry.discover_markets()
+    build.assert_not_called()
+    assert set(pairs) == {"BTC/USD", "ETH/USD"}
+
+
+@pytest.mark.asyncio
+async def test_universe_delta_applied_in_place():
+    from src.data.market_discovery import universe_delta
+    from src.live.coin_processor import update_market_universe
+
+    lt = MagicMock()
+    lt.config.exchange.use_market_discovery = True
+    lt.markets = {"BTC/USD": "PF_XBTUSD", "ETH/USD": "PF_ETHUSD", "OLD/USD": "PF_OLDUSD"}
+    lt._last_discovered_count = 3
+    new = {"BTC/USD": "PF_XBTUSD", "ETH/USD": "PF_ETHUSD2", "NEW/USD": "PF_NEWUSD"}
+    lt.market_discovery.discover_markets = AsyncMock(return_value=new)
+
+    delta = universe_delta(lt.markets, new)
+    assert delta.added == {"NEW/USD": "PF_NEWUSD"}
+    assert delta.removed == {"OLD/USD"}
+    assert delta.remapped == {"ETH/USD": "PF_ETHUSD2"}
+
+    markets_obj = lt.markets
+    await update_market_universe(lt)
+    assert lt.markets is markets_obj
+    assert lt.markets == new
+    lt.data_acq.update_symbols.assert_called_once()
+
+    lt.data_acq.update_symbols.reset_mock()
+    await update_market_universe(lt)  # unchanged -> nothing republished
+    lt.data_acq.update_symbols.assert_not_called()
@@ -0,0 +1,115 @@
+"""
+Tests for the memory introspection subsystem.
+"""
+import gc
+import json
+
+from src.monitoring.memory_profiler import (
+    MemoryProfiler,
+    MemoryRegistry,
+    approx_size,
+    get_memory_profiler,
+    init_memory_profiler,
+    reset_memory_profiler,
+    rss_bytes,
+)
+
+
+class _Owner:
+    def __init__(self):
+        self.cache = {f"k{i}": "x" * 100 for i in range(200)}
+
+
+class TestMemoryRegistry:
+    def test_reports_entries_and_bytes(self):
+        reg = MemoryRegistry()
+        owner = _Owner()
+        reg.register("owner.cache", owner, "cache")
+        reg.register_callable("plain.list", lambda: [1, 2, 3])
+        stats = {s.name: s for s in reg.collect()}
+        assert stats["owner.cache"].entries == 200
+        assert stats["owner.cache"].approx_bytes > 200 * 100
+        assert stats["plain.list"].entries == 3
+        # Sorted largest first
+        assert reg.collect()[0].name == "owner.cache"
+
+    def test_weak_owner_does_not_leak(self):
+        reg = MemoryRegistry()
+        owner = _Owner()
+        reg.register("owner.cache", owner, "cache")
+        del owner
+        gc.collect()
+        assert reg.collect() == []
+
+    def test_missing_attribute_skipped(self):
+        reg = MemoryRegistry()
+        reg.register("owner.missing", _Owner(), "not_there")
+        assert reg.collect() == []
+
+    def test_approx_size_empty_and_scalar(self):
+        assert approx_size({}) > 0
+        assert approx_size(5) > 0
+
+
+class TestMemoryProfiler:
+    def test_sample_updates_report_and_gauges(self):
+        from src.monitoring.metrics import get_metrics_registry
+
+        reg = MemoryRegistry()
+        owner = _Owner()
+        reg.register("owner.cache", owner, "cache")
+        profiler = MemoryProfiler(reg)
+        report = profiler.sample()
+        assert report["rss_mb"] > 0
+        assert report["tracked"][0] == {
+            "name": "owner.cache",
+            "entries": 200,
+            "approx_bytes": report["tracked"][0]["approx_bytes"],
+        }
+        assert profiler.report() is report
+        body = get_metrics_registry().render_prometheus()
+        assert 'trading_memory_tracked_entries{name="owner.cache"} 200' in body
+
+    def test_tracemalloc_diff(self):
+        profiler = MemoryProfiler(MemoryRegistry(), tracemalloc_frames=1, top_n=5)
+        profiler.start_tracing()
+        try:
+            profiler.sample()
+            hold = [bytearray(1024) for _ in range(500)]  # noqa: F841
+            growth = profiler.sample()["top_growth"]
+            assert growth and "size_diff_bytes" in growth[0]
+        finally:
+            profiler.stop()
+        assert not profiler.tracing
+
+    def test_rss_threshold_dump_with_cooldown(self, tmp_path):
+        profiler = MemoryProfiler(
+            MemoryRegistry(), rss_dump_threshold_mb=0.001, dump_dir=str(tmp_path), dump_cooldown_seconds=3600
+        )
+        profiler.sample()
+        profiler.sample()
+        dumps = list(tmp_path.glob("memory_dump_*.json"))
+        assert len(dumps) == 1
+        assert "rss_mb" in json.loads(dumps[0].read_text())
+
+
+def test_singletons_and_health_endpoint():
+    from fastapi.testclient import TestClient
+    from src.health import get_worker_health_app
+
+    reset_memory_profiler()
+    client = TestClient(get_worker_health_app(enable_debug=True))
+    assert client.get("/api/debug/memory").status_code == 503
+    try:
+        profiler = init_memory_profiler()
+        assert get_memory_profiler() is profiler
+        profiler.sample()
+        resp = client.get("/api/debug/memory")
+        assert resp.status_code == 200
+        assert "tracked" in resp.json()
+    finally:
+        reset_memory_profiler()
+
+
+def test_rss_bytes_positive():
+    assert rss_bytes() > 0
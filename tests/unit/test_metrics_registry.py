@@ -0,0 +1,157 @@
+"""
+Tests for the in-process Prometheus metrics registry.
+"""
+import pytest
+
+from src.monitoring.metrics import (
+    MetricsRegistry,
+    get_metrics_registry,
+    tick_stage_histogram,
+    timed,
+)
+
+
+class TestMetricsRegistry:
+    def test_get_or_create_shares_family(self):
+        registry = MetricsRegistry()
+        a = registry.histogram("lat_ms", "latency", ("stage",))
+        b = registry.histogram("lat_ms", "latency", ("stage",))
+        assert a is b
+        with pytest.raises(ValueError):
+            registry.counter("lat_ms", "latency", ("stage",))
+        with pytest.raises(ValueError):
+            registry.histogram("lat_ms", "latency", ("symbol",))
+
+    def test_label_validation(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("events_total", "events", ("kind",))
+        with pytest.raises(ValueError):
+            counter.labels()
+        counter.labels(kind="fill").inc()
+        counter.labels("fill").inc(2)
+        assert counter.labels(kind="fill").value == 3
+
+    def test_prometheus_exposition(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("api_ms", "api latency", ("endpoint",), buckets_ms=(10, 100))
+        hist.labels(endpoint="get_ticker").observe(5)
+        hist.labels(endpoint="get_ticker").observe(50)
+        hist.labels(endpoint="get_ticker").observe(500)
+        registry.gauge("open_positions", "open positions").set(4)
+
+        body = registry.render_prometheus()
+        assert "# TYPE api_ms histogram" in body
+        assert 'api_ms_bucket{endpoint="get_ticker",le="10"} 1' in body
+        assert 'api_ms_bucket{endpoint="get_ticker",le="100"} 2' in body
+        assert 'api_ms_bucket{endpoint="get_ticker",le="+Inf"} 3' in body
+        assert 'api_ms_count{endpoint="get_ticker"} 3' in body
+        assert "open_positions 4" in body
+
+    def test_snapshot_reports_quantiles(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("stage_ms", "stage", ("stage",))
+        for v in range(1, 101):
+            hist.labels(stage="signal").observe(v)
+        row = registry.snapshot()["stage_ms"][0]
+        assert row["labels"] == {"stage": "signal"}
+        assert row["count"] == 100
+        assert 25 <= row["p50_ms"] <= 100
+        assert row["p99_ms"] <= 100
+
+
+class TestTimedDecorator:
+    def test_sync_outcome_labels(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("call_ms", "calls", ("helper", "outcome"))
+
+        @timed(hist, helper="load")
+        def load(fail=False):
+            if fail:
+                raise RuntimeError("db down")
+            return 1
+
+        assert load() == 1
+        with pytest.raises(RuntimeError):
+            load(fail=True)
+        assert hist.labels(helper="load", outcome="ok").count == 1
+        assert hist.labels(helper="load", outcome="error").count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_without_outcome_label(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("stage_ms", "stages", ("stage",))
+
+        @timed(hist, stage="update_candles")
+        async def update():
+            return "done"
+
+        assert await update() == "done"
+        assert hist.labels(stage="update_candles").count == 1
+
+
+class TestInstrumentation:
+    def test_hot_paths_register_on_shared_registry(self):
+        import src.data.candle_manager  # noqa: F401
+        import src.data.kraken_client  # noqa: F401
+        import src.execution.execution_gateway  # noqa: F401
+        import src.storage.repository  # noqa: F401
+
+        names = {f.name for f in get_metrics_registry().families()}
+        assert {
+            "trading_kraken_api_latency_ms",
+            "trading_execution_action_latency_ms",
+            "trading_db_helper_latency_ms",
+            "trading_tick_stage_latency_ms",
+        } <= names
+        assert tick_stage_histogram().labelnames == ("stage",)
+
+    def test_worker_metrics_endpoint_serves_registry(self):
+        from fastapi.testclient import TestClient
+        from src.health import get_worker_health_app
+
+        tick_stage_histogram().labels(stage="unit_test").observe(3)
+        client = TestClient(get_worker_health_app())
+        resp = client.get("/metrics")
+        assert resp.status_code == 200
+        assert 'trading_tick_stage_latency_ms_count{stage="unit_test"}' in resp.text
+
+    def test_worker_metrics_endpoint_serves_gauges_without_db(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import src.storage.repository as repository
+        from src.health import get_worker_health_app
+        from src.monitoring.metrics import last_tick_gauge, set_snapshot_gauges
+
+        def no_db():
+            raise AssertionError("/metrics must not query the DB")
+
+        monkeypatch.setattr(repository, "get_latest_metrics_snapshot", no_db)
+        set_snapshot_gauges({"markets_count": 42, "signals_last_min": 3, "last_tick_at": "2026-01-01T00:00:00"})
+        last_tick_gauge().set(1767225600.0)
+        resp = TestClient(get_worker_health_app()).get("/metrics")
+        assert "trading_markets_count 42" in resp.text
+        assert "trading_signals_last_min 3" in resp.text
+        assert "trading_last_tick_timestamp_seconds 1767225600" in resp.text
+        assert "_iso" not in resp.text
+
+    def test_web_metrics_export_last_tick_as_unix_seconds(self, monkeypatch):
+        import src.storage.repository as repository
+        from src.health import _metrics_prometheus
+
+        monkeypatch.setattr(
+            repository, "get_latest_metrics_snapshot",
+            lambda: {"last_tick_at": "2026-01-01T00:00:00+00:00", "markets_count": 42},
+        )
+        body, _ = _metrics_prometheus()
+        assert "trading_last_tick_timestamp_seconds 1767225600.0" in body.splitlines()
+        assert '"' not in body
+
+    def test_reset_keeps_module_level_families(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("reset_ms", "reset", ("stage",))
+        hist.labels(stage="a").observe(1)
+
+        registry.reset()
+        assert hist.children() == []
+        hist.labels(stage="a").observe(2)
+        assert registry.histogram("reset_ms", "reset", ("stage",)) is hist
+        assert registry.snapshot()["reset_ms"][0]["count"] == 1
@@ -0,0 +1,116 @@
+"""
+Tests for the L2 depth cache used by the entry liquidity check.
+"""
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.data.orderbook import L2Book, OrderBookDepthCache
+from src.domain.models import Side
+from src.execution.execution_gateway import ExecutionGateway
+
+
+BIDS = [[100, 1], [99.9, 2], [99, 5]]
+ASKS = [[100.1, 1], [100.2, 3], [101, 10]]
+
+
+def _gateway(cache) -> ExecutionGateway:
+    return ExecutionGateway(
+        exchange_client=AsyncMock(),
+        registry=MagicMock(),
+        position_manager=MagicMock(),
+        persistence=MagicMock(),
+        use_safety=False,
+        orderbook_cache=cache,
+    )
+
+
+class TestL2Book:
+    def test_touch_and_spread(self):
+        book = L2Book("PF_XBTUSD", BIDS, ASKS)
+        assert book.best_bid == Decimal("100")
+        assert book.best_ask == Decimal("100.1")
+        assert book.spread_pct() == Decimal("0.1") / Decimal("100.05")
+
+    def test_depth_within_band(self):
+        book = L2Book("PF_XBTUSD", BIDS, ASKS)
+        # 20 bps of 100.1 -> up to 100.3002: first two ask levels
+        assert book.depth_within_bps("ask", Decimal("20")) == Decimal("4")
+        # 20 bps below 100 -> down to 99.8: first two bid levels
+        assert book.depth_within_bps("bid", Decimal("20")) == Decimal("3")
+        assert book.depth_within_bps("ask", Decimal("1000")) == Decimal("14")
+
+    def test_empty_side(self):
+        book = L2Book("PF_XBTUSD", [], ASKS)
+        assert book.spread_pct() is None
+        assert book.depth_within_bps("bid", Decimal("50")) == Decimal("0")
+
+
+class TestOrderBookDepthCache:
+    def test_get_fresh_is_memory_only_and_respects_age(self):
+        cache = OrderBookDepthCache(max_age_seconds=30)
+        assert cache.get_fresh("PF_XBTUSD") is None
+        cache.update("PF_XBTUSD", BIDS, ASKS)
+        assert cache.get_fresh("PF_XBTUSD") is not None
+        assert cache.get_fresh("PF_XBTUSD", max_age_seconds=-1) is None
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+        assert cache.stats["stale"] == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_watched_fetches_snapshots(self):
+        fetch = AsyncMock(return_value={"bids": BIDS, "asks": ASKS, "timestamp": 1_700_000_000_000})
+        cache = OrderBookDepthCache(fetch_snapshot=fetch)
+        cache.watch("PF_XBTUSD")
+        assert await cache.refresh_watched() == 1
+        fetch.assert_awaited_once_with("PF_XBTUSD")
+        assert cache.get_fresh("PF_XBTUSD", max_age_seconds=60).best_ask == Decimal("100.1")
+
+    @pytest.mark.asyncio
+    async def test_refresh_fails_open(self):
+        cache = OrderBookDepthCache(fetch_snapshot=AsyncMock(side_effect=RuntimeError("boom")))
+        assert await cache.refresh_symbol("PF_XBTUSD") is None
+        assert cache.stats["refresh_errors"] == 1
+
+    def test_watch_expires(self):
+        cache = OrderBookDepthCache(watch_ttl_seconds=-1)
+        cache.watch("PF_XBTUSD")
+        cache.update("PF_XBTUSD", BIDS, ASKS)
+        assert cache.watched_symbols() == []
+        assert cache.get_fresh("PF_XBTUSD") is None
+
+
+class TestGatewayEntryLiquidityWithCache:
+    @pytest.mark.asyncio
+    async def test_cached_book_used_without_network(self):
+        cache = OrderBookDepthCache()
+        cache.update("PF_XBTUSD", BIDS, ASKS)
+        gateway = _gateway(cache)
+        gateway.client.fetch_ticker = AsyncMock()
+
+        ok, reason = await gateway._check_entry_liquidity("PF_XBTUSD", Side.LONG, Decimal("1"))
+        assert ok is True and reason is None
+        gateway.client.fetch_ticker.assert_not_awaited()
+        assert "PF_XBTUSD" in cache.watched_symbols()
+
+    @pytest.mark.asyncio
+    async def test_thin_band_depth_rejects(self):
+        cache = OrderBookDepthCache()
+        cache.update("PF_XBTUSD", BIDS, ASKS)
+        gateway = _gateway(cache)
+
+        # 50 bps band on the ask side holds 4 contracts; 3 contracts needs 6.
+        ok, reason = await gateway._check_entry_liquidity("PF_XBTUSD", Side.LONG, Decimal("3"))
+        assert ok is False
+        assert "Depth ratio" in reason
+
+    @pytest.mark.asyncio
+    async def test_stale_book_falls_back_to_rest_snapshot(self):
+        fetch = AsyncMock(return_value={"bids": [[100, 50]], "asks": [[100.05, 50]]})
+        cache = OrderBookDepthCache(fetch_snapshot=fetch, max_age_seconds=30)
+        gateway = _gateway(cache)
+
+        ok, _ = await gateway._check_entry_liquidity("PF_XBTUSD", Side.SHORT, Decimal("5"))
+        assert ok is True
+        fetch.assert_awaited_once_with("PF_XBTUSD")
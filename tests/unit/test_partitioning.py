@@ -0,0 +1,191 @@
+"""
+Tests for system_events/candles partition naming, retention selection and
+conversion DDL, plus the latest_trace_per_symbol read model.
+"""
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.storage import repository
+from src.storage.db import Base
+from src.storage.partitioning import (
+    CANDLE_GROUPS,
+    EVENT_GROUPS,
+    TRACE_GROUP,
+    conversion_statements,
+    create_partition_sql,
+    ensure_partitions,
+    expired_partitions,
+    next_period,
+    parse_partition_start,
+    partition_name,
+    period_start,
+    periods,
+)
+
+
+class TestPeriods:
+    def test_day_and_month_floors(self):
+        dt = datetime(2026, 12, 31, 23, 59, tzinfo=timezone.utc)
+        assert period_start(dt, "day") == datetime(2026, 12, 31)
+        assert period_start(dt, "month") == datetime(2026, 12, 1)
+        assert next_period(datetime(2026, 12, 1), "month") == datetime(2027, 1, 1)
+        assert next_period(datetime(2026, 12, 31), "day") == datetime(2027, 1, 1)
+
+    def test_periods_cover_range(self):
+        out = periods(datetime(2026, 1, 30, 12), datetime(2026, 2, 2), "day")
+        assert out == [datetime(2026, 1, 30), datetime(2026, 1, 31), datetime(2026, 2, 1), datetime(2026, 2, 2)]
+
+    def test_names_round_trip(self):
+        day = datetime(2026, 3, 7)
+        assert partition_name(TRACE_GROUP, day) == "system_events_trace_p20260307"
+        assert parse_partition_start(TRACE_GROUP, "system_events_trace_p20260307") == day
+        month_group = CANDLE_GROUPS["15m"]
+        assert partition_name(month_group, day) == "candles_15m_p202603"
+        assert parse_partition_start(month_group, "candles_15m_p202603") == datetime(2026, 3, 1)
+        assert parse_partition_start(TRACE_GROUP, TRACE_GROUP.default) is None
+        assert parse_partition_start(TRACE_GROUP, "system_events_audit_p20260307") is None
+
+
+class TestRetentionSelection:
+    def test_only_fully_expired_partitions(self):
+        names = [partition_name(TRACE_GROUP, datetime(2026, 3, d)) for d in range(1, 8)] + [TRACE_GROUP.default]
+        cutoff = datetime(2026, 3, 4, 6, tzinfo=timezone.utc)
+        # 03-04 still holds rows newer than the cutoff
+        assert expired_partitions(TRACE_GROUP, reversed(names), cutoff) == names[:3]
+
+    def test_monthly(self):
+        group = CANDLE_GROUPS["1h"]
+        names = [partition_name(group, datetime(2026, m, 1)) for m in (1, 2, 3)]
+        assert expired_partitions(group, names, datetime(2026, 3, 1)) == names[:2]
+
+
+class TestConversionDdl:
+    def test_event_conversion_statements(self):
+        now = datetime(2026, 3, 7, 10)
+        starts = {TRACE_GROUP.parent: datetime(2026, 3, 3), EVENT_GROUPS[1].parent: datetime(2026, 2, 1)}
+        stmts = conversion_statements("system_events", EVENT_GROUPS, starts, now, ["CREATE INDEX ix ON system_events (a)"])
+        joined = "\n".join(stmts)
+        assert stmts[0] == "ALTER TABLE system_events RENAME TO system_events_legacy"
+        assert "PARTITION BY LIST (event_type)" in stmts[1]
+        assert "FOR VALUES IN ('DECISION_TRACE') PARTITION BY RANGE (timestamp)" in joined
+        assert "CREATE TABLE system_events_other PARTITION OF system_events DEFAULT" in joined
+        # daily trace partitions from the first day through 7 days ahead
+        assert create_partition_sql(TRACE_GROUP, datetime(2026, 3, 3)) in stmts
+        assert create_partition_sql(TRACE_GROUP, datetime(2026, 3, 14)) in stmts
+        assert create_partition_sql(TRACE_GROUP, datetime(2026, 3, 15)) not in stmts
+        # copy before dropping legacy; indexes after (name clash otherwise)
+        assert stmts.index("DROP TABLE system_events_legacy") > stmts.index(
+            "INSERT INTO system_events SELECT * FROM system_events_legacy"
+        )
+        assert stmts[-1] == "CREATE INDEX ix ON system_events (a)"
+
+    def test_partition_bounds(self):
+        sql = create_partition_sql(CANDLE_GROUPS["4h"], datetime(2026, 12, 1))
+        assert "candles_4h_p202612 PARTITION OF candles_4h" in sql
+        assert "FROM ('2026-12-01 00:00:00') TO ('2027-01-01 00:00:00')" in sql
+
+
+class TestEnsurePartitions:
+    """Missing partitions whose range already has rows in the default."""
+
+    @staticmethod
+    def _conn(existing, default_rows_for=()):
+        executed = []
+
+        def execute(stmt, params=None):
+            sql = str(stmt)
+            result = MagicMock()
+            if "FROM pg_inherits" in sql:
+                result.fetchall.return_value = [(n,) for n in existing]
+            elif sql.startswith("SELECT 1 FROM"):
+                result.first.return_value = (1,) if params["start"] in default_rows_for else None
+            else:
+                executed.append(sql)
+            return result
+
+        conn = MagicMock()
+        conn.execute.side_effect = execute
+        return conn, executed
+
+    def test_rows_in_default_are_moved_into_new_partition(self):
+        now = datetime(2026, 3, 7, 10)
+        existing = [TRACE_GROUP.default] + [
+            partition_name(TRACE_GROUP, datetime(2026, 3, d)) for d in range(8, 15)
+        ]
+        conn, executed = self._conn(existing, default_rows_for=(datetime(2026, 3, 7),))
+
+        assert ensure_partitions(conn, [TRACE_GROUP], now=now) == ["system_events_trace_p20260307"]
+        create = create_partition_sql(TRACE_GROUP, datetime(2026, 3, 7))
+        assert executed[0] == "ALTER TABLE system_events_trace DETACH PARTITION system_events_trace_default"
+        assert executed[1] == create
+        assert executed[2].startswith("INSERT INTO system_events_trace SELECT * FROM system_events_trace_default")
+        assert "timestamp >= '2026-03-07 00:00:00' AND timestamp < '2026-03-08 00:00:00'" in executed[2]
+        assert executed[3].startswith("DELETE FROM system_events_trace_default")
+        assert executed[-1] == "ALTER TABLE system_events_trace ATTACH PARTITION system_events_trace_default DEFAULT"
+
+    def test_empty_default_uses_plain_create(self):
+        conn, executed = self._conn([TRACE_GROUP.default])
+
+        created = ensure_partitions(conn, [TRACE_GROUP], now=datetime(2026, 3, 7))
+
+        assert len(created) == 8
+        assert executed == [create_partition_sql(TRACE_GROUP, datetime(2026, 3, d)) for d in range(7, 15)]
+
+
+class _SqliteDb:
+    database_url = "sqlite://"
+
+    def __init__(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine)
+
+    @contextmanager
+    def get_session(self):
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+
+class TestLatestTracePerSymbol:
+    @pytest.fixture
+    def db(self):
+        db = _SqliteDb()
+        with patch("src.storage.repository.get_db", return_value=db):
+            yield db
+
+    def test_trace_events_upsert_latest(self, db):
+        t0 = datetime(2026, 3, 7, 10, tzinfo=timezone.utc)
+        repository.record_event("DECISION_TRACE", "BTC/USD", {"n": 1}, timestamp=t0)
+        repository.record_event("DECISION_TRACE", "BTC/USD", {"n": 2}, timestamp=t0 + timedelta(minutes=1))
+        # Late, older trace doesn't overwrite the newer one
+        repository.record_event("DECISION_TRACE", "BTC/USD", {"n": 0}, timestamp=t0 - timedelta(minutes=5))
+        repository.record_event("DECISION_TRACE", "ETH/USD", {"n": 3}, timestamp=t0)
+        repository.record_event("SIGNAL_GENERATED", "SOL/USD", {"n": 4}, timestamp=t0)
+
+        traces = {t["symbol"]: t for t in repository.get_latest_traces()}
+        assert set(traces) == {"BTC/USD", "ETH/USD"}
+        assert traces["BTC/USD"]["details"] == {"n": 2}
+        assert traces["BTC/USD"]["timestamp"] == t0 + timedelta(minutes=1)
+
+    def test_seeded_from_events_when_empty(self, db):
+        t0 = datetime(2026, 3, 7, 10)
+        with db.get_session() as session:
+            for i, sym in enumerate(["BTC/USD", "BTC/USD", "ETH/USD"]):
+                session.add(repository.SystemEventModel(
+                    timestamp=t0 + timedelta(minutes=i), event_type="DECISION_TRACE",
+                    symbol=sym, details=f'{{"i": {i}}}',
+                ))
+
+        first = {t["symbol"]: t["details"] for t in repository.get_latest_traces()}
+        assert first == {"BTC/USD": {"i": 1}, "ETH/USD": {"i": 2}}
+        with db.get_session() as session:
+            assert session.query(repository.LatestTraceModel).count() == 2
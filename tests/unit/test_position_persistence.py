@@ -129,3 +129,31 @@ def test_save_fill_is_globally_idempotent_by_fill_id(tmp_path):
         (fill.fill_id,),
     ).fetchone()
     assert row["cnt"] == 1
+
+
+def test_save_registry_skips_when_version_unchanged(tmp_path, monkeypatch):
+    persistence = PositionPersistence(db_path=str(tmp_path / "positions.db"))
+    registry = PositionRegistry()
+    registry.register_position(
+        ManagedPosition(
+            symbol="SOL/USD",
+            side=Side.LONG,
+            position_id="pos-versioned",
+            initial_size=Decimal("1"),
+            initial_entry_price=Decimal("100"),
+            initial_stop_price=Decimal("95"),
+            initial_tp1_price=None,
+            initial_tp2_price=None,
+            initial_final_target=None,
+        )
+    )
+    saved = []
+    monkeypatch.setattr(persistence, "save_position", saved.append)
+
+    persistence.save_registry(registry)
+    persistence.save_registry(registry)
+    assert len(saved) == 1
+
+    registry.request_reversal("SOL/USD", Side.SHORT)
+    persistence.save_registry(registry)
+    assert len(saved) == 2
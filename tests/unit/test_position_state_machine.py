@@ -15,6 +15,7 @@ from decimal import Decimal
 from datetime import datetime, timezone
 import tempfile
 import os
+import threading
 
 from src.execution.position_state_machine import (
     ManagedPosition,
@@ -1007,5 +1008,186 @@ class TestReconciliation:
         assert len(orphaned) == 1
 
 
+class TestNormalizedSymbolIndex:
+    """Registry secondary index: format variants resolve without scanning."""
+
+    def setup_method(self):
+        reset_position_registry()
+
+    def _position(self, symbol: str) -> ManagedPosition:
+        return ManagedPosition(
+            symbol=symbol,
+            side=Side.LONG,
+            position_id=f"idx-{symbol}",
+            initial_size=Decimal("1"),
+            initial_entry_price=Decimal("100"),
+            initial_stop_price=Decimal("95"),
+            initial_tp1_price=Decimal("110"),
+            initial_tp2_price=None,
+            initial_final_target=None,
+        )
+
+    def test_lookup_across_formats(self):
+        registry = get_position_registry()
+        registry.register_position(self._position("PF_XBTUSD"))
+
+        for variant in ("PF_XBTUSD", "BTC/USD", "BTC/USD:USD", "XBT/USD:USD"):
+            assert registry.has_position(variant)
+            assert registry.get_position(variant).symbol == "PF_XBTUSD"
+        assert registry.get_symbols_by_normalized("BTC/USD") == ["PF_XBTUSD"]
+        assert not registry.has_position("ETH/USD")
+
+    def test_index_follows_direct_dict_mutation(self):
+        """Persistence/takeover mutate ``_positions`` directly; the index must follow."""
+        registry = get_position_registry()
+        registry._positions["ADA/USD:USD"] = self._position("ADA/USD:USD")
+        assert registry.get_position_any_state("PF_ADAUSD") is not None
+
+        registry._positions.pop("ADA/USD:USD")
+        assert registry.get_position_any_state("PF_ADAUSD") is None
+        assert registry.get_symbols_by_normalized("ADA/USD") == []
+
+        registry._positions["ADA/USD"] = self._position("ADA/USD")
+        del registry._positions["ADA/USD"]
+        assert registry.get_position_any_state("ADAUSD") is None
+
+        registry._positions["SOL/USD"] = self._position("SOL/USD")
+        registry._positions.clear()
+        assert registry.get_symbols_by_normalized("PF_SOLUSD") == []
+
+    def test_from_dict_rebuilds_index(self):
+        registry = get_position_registry()
+        registry.register_position(self._position("PF_ETHUSD"))
+        restored = PositionRegistry.from_dict(registry.to_dict())
+        assert restored.has_position("ETH/USD:USD")
+
+
+class TestRegistrySnapshots:
+    """Copy-on-write snapshots and per-symbol locking."""
+
+    def _position(self, symbol: str) -> ManagedPosition:
+        return ManagedPosition(
+            symbol=symbol,
+            side=Side.LONG,
+            position_id=f"snap-{symbol}",
+            initial_size=Decimal("1"),
+            initial_entry_price=Decimal("100"),
+            initial_stop_price=Decimal("95"),
+            initial_tp1_price=Decimal("110"),
+            initial_tp2_price=None,
+            initial_final_target=None,
+        )
+
+    def test_snapshot_is_immutable_and_versioned(self):
+        registry = PositionRegistry()
+        empty = registry.snapshot()
+        registry.register_position(self._position("PF_XBTUSD"))
+        snap = registry.snapshot()
+
+        assert snap.version > empty.version
+        assert len(empty) == 0 and len(snap) == 1
+        assert registry.snapshot() is snap  # unchanged -> same object
+        with pytest.raises(TypeError):
+            snap.positions["PF_ETHUSD"] = self._position("PF_ETHUSD")
+
+    def test_reads_do_not_take_the_lock(self):
+        registry = PositionRegistry()
+        registry.register_position(self._position("PF_XBTUSD"))
+        registry.snapshot()
+
+        acquired = registry._lock.acquire(blocking=False)
+        assert acquired
+        try:
+            # Held by "another writer": published reads must still succeed.
+            result = {}
+            t = threading.Thread(
+                target=lambda: result.update(
+                    active=len(registry.get_all_active()),
+                    found=registry.get_position("BTC/USD:USD") is not None,
+                )
+            )
+            t.start()
+            t.join(timeout=2)
+            assert result == {"active": 1, "found": True}
+        finally:
+            registry._lock.release()
+
+    def test_direct_dict_write_invalidates_snapshot(self):
+        registry = PositionRegistry()
+        before = registry.version
+        registry._positions["PF_SOLUSD"] = self._position("PF_SOLUSD")
+        assert registry.version > before
+        assert registry.get_position("SOL/USD") is not None
+
+    def test_order_event_bumps_version_under_symbol_lock(self):
+        registry = PositionRegistry()
+        pos = self._position("PF_XBTUSD")
+        pos.entry_order_id = "entry-1"
+        registry.register_position(pos)
+        before = registry.version
+
+        event = OrderEvent(
+            order_id="entry-1",
+            client_order_id="client-1",
+            event_type=OrderEventType.FILLED,
+            event_seq=1,
+            timestamp=datetime.now(timezone.utc),
+            fill_qty=Decimal("1"),
+            fill_price=Decimal("100"),
+            fill_id="fill-1",
+        )
+        assert registry.apply_order_event("PF_XBTUSD", event)
+        assert registry.version > before
+        assert registry._symbol_lock("BTC/USD:USD") is registry._symbol_lock("PF_XBTUSD")
+
+    def test_snapshot_positions_are_frozen_copies(self):
+        registry = PositionRegistry()
+        registry.register_position(self._position("PF_XBTUSD"))
+        snap = registry.snapshot()
+        live = registry.get_position("PF_XBTUSD")
+
+        live.current_stop_price = Decimal("97")
+        live.entry_fills.append("in-place list edit")
+
+        frozen = snap.find("BTC/USD:USD")
+        assert frozen is not live
+        assert frozen.current_stop_price == Decimal("95") and frozen.entry_fills == []
+        assert registry.snapshot() is snap  # no per-read scan picks it up
+
+        registry.publish_position(live)
+        assert registry.version > snap.version
+        assert registry.snapshot().find("PF_XBTUSD").current_stop_price == Decimal("97")
+        assert registry.snapshot() is registry.snapshot()
+
+    def test_publish_copies_only_changed_positions(self):
+        registry = PositionRegistry()
+        registry.register_position(self._position("PF_XBTUSD"))
+        registry.register_position(self._position("PF_ETHUSD"))
+        before = registry.snapshot()
+
+        registry.publish_position(registry.get_position("PF_XBTUSD"))
+        after = registry.snapshot()
+
+        assert after.positions["PF_ETHUSD"] is before.positions["PF_ETHUSD"]
+        assert after.positions["PF_XBTUSD"] is not before.positions["PF_XBTUSD"]
+
+    def test_registry_wide_reads_wait_for_symbol_lock(self):
+        registry = PositionRegistry()
+        registry.register_position(self._position("PF_XBTUSD"))
+        symbol_lock = registry._symbol_lock("PF_XBTUSD")
+
+        done = threading.Event()
+        symbol_lock.acquire()
+        try:
+            # An order event is mid-flight on this symbol: to_dict must not read it.
+            t = threading.Thread(target=lambda: (registry.to_dict(), done.set()))
+            t.start()
+            assert not done.wait(timeout=0.2)
+        finally:
+            symbol_lock.release()
+        t.join(timeout=2)
+        assert done.is_set()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
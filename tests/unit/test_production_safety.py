@@ -1627,5 +1627,106 @@ class TestStopOrderPolling:
         mock_client.fetch_order.assert_called_once_with("stop-exch-1", "BTC/USD:USD")
 
 
+class TestConcurrentProtectionSweep:
+    """Protection sweep: bounded concurrent per-symbol checks with a deadline."""
+
+    def _position(self, base: str) -> ManagedPosition:
+        from src.execution.position_state_machine import FillRecord
+        pos = ManagedPosition(
+            symbol=f"{base}/USD",
+            side=Side.LONG,
+            position_id=f"sweep-{base}",
+            initial_size=Decimal("10"),
+            initial_entry_price=Decimal("2.50"),
+            initial_stop_price=Decimal("2.40"),
+            initial_tp1_price=Decimal("2.70"),
+            initial_tp2_price=None,
+            initial_final_target=None,
+        )
+        pos.entry_order_id = f"entry-{base}"
+        pos.stop_order_id = f"stop-{base}"
+        pos.state = PositionState.OPEN
+        pos.entry_fills.append(FillRecord(
+            fill_id=f"fill-{base}",
+            order_id=f"entry-{base}",
+            side=Side.LONG,
+            qty=Decimal("10"),
+            price=Decimal("2.50"),
+            timestamp=datetime.now(timezone.utc),
+            is_entry=True,
+        ))
+        pos.created_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        pos.updated_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        return pos
+
+    def _setup(self, bases, fetch_order, **config_overrides):
+        registry = PositionRegistry()
+        for base in bases:
+            registry.register_position(self._position(base))
+        client = AsyncMock()
+        client.get_futures_open_orders.return_value = []
+        client.get_all_futures_positions.return_value = [
+            {"symbol": f"PF_{b}USD", "contracts": 10} for b in bases
+        ]
+        client.fetch_order.side_effect = fetch_order
+        enforcer = ProtectionEnforcer(client, SafetyConfig(**config_overrides))
+        return PositionProtectionMonitor(client, registry, enforcer), client
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently_on_shared_snapshot(self):
+        in_flight = 0
+        peak = 0
+
+        async def fetch_order(order_id, symbol):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"id": order_id, "status": "open", "side": "sell", "filled": 0}
+
+        bases = ["XRP", "ADA", "SOL", "DOT", "LINK", "AVAX"]
+        monitor, client = self._setup(bases, fetch_order, protection_check_concurrency=3)
+
+        results = await monitor.check_all_positions()
+
+        assert results == {f"{b}/USD": True for b in bases}
+        assert 1 < peak <= 3
+        client.get_futures_open_orders.assert_awaited_once()
+        client.get_all_futures_positions.assert_awaited_once()
+        stats = monitor.get_sweep_stats()
+        assert stats["check_latency_ms"]["count"] == len(bases)
+        assert stats["sweep_latency_ms"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_reports_slow_symbols_unknown_and_prioritises_them(self):
+        async def fetch_order(order_id, symbol):
+            if order_id == "stop-ADA":
+                await asyncio.sleep(5)
+            return {"id": order_id, "status": "open", "side": "sell", "filled": 0}
+
+        monitor, _ = self._setup(
+            ["XRP", "ADA"], fetch_order, protection_sweep_deadline_seconds=0.2
+        )
+
+        results = await monitor.check_all_positions()
+
+        # Slow symbol is unknown (None), never reported naked or protected.
+        assert results == {"XRP/USD": True, "ADA/USD": None}
+        assert monitor.get_sweep_stats()["timed_out_symbols"] == ["ADA/USD"]
+
+        order = []
+        original = monitor._check_position
+
+        async def recording_check(position, orders, position_map):
+            order.append(position.symbol)
+            return True
+
+        monitor._check_position = recording_check
+        await monitor.check_all_positions()
+        assert order[0] == "ADA/USD"
+        monitor._check_position = original
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
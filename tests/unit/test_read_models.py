@@ -0,0 +1,187 @@
+"""
+Tests for the worker read models (status / performance / decision projections).
+"""
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from src.domain.models import Side, Trade
+from src.health import _debug_signals_impl
+from src.monitoring.performance import performance_metrics_from_trades
+from src.monitoring.read_models import (
+    DecisionProjection,
+    PerformanceProjection,
+    ReadModel,
+    StatusProjection,
+    init_read_model,
+    load_snapshot,
+    reset_read_model,
+)
+
+NOW = datetime.now(timezone.utc)
+
+
+def _trade(trade_id, days_ago, pnl):
+    exited = NOW - timedelta(days=days_ago)
+    return Trade(
+        trade_id=trade_id,
+        symbol="PF_XBTUSD",
+        side=Side.LONG,
+        entry_price=Decimal("100"),
+        exit_price=Decimal("100"),
+        size=Decimal("1"),
+        size_notional=Decimal("100"),
+        leverage=Decimal("5"),
+        gross_pnl=Decimal(pnl),
+        fees=Decimal("0"),
+        funding=Decimal("0"),
+        net_pnl=Decimal(pnl),
+        entered_at=exited - timedelta(hours=1),
+        exited_at=exited,
+        holding_period_hours=Decimal("1"),
+        exit_reason="Take Profit",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_read_model():
+    reset_read_model()
+    yield
+    reset_read_model()
+
+
+class TestDecisionProjection:
+    def test_matches_db_digest(self):
+        events = [
+            {"timestamp": "2026-01-01T00:00:00+00:00", "symbol": "BTC/USD",
+             "details": json.dumps({"signal": "LONG", "setup_quality": 7, "reason": "a\nb", "order_placed": True})},
+            {"timestamp": "2026-01-01T00:01:00+00:00", "symbol": "ETH/USD",
+             "details": {"signal": "NONE", "reason": ["x", "y"]}},
+        ]
+        with patch("src.storage.repository.get_recent_events", return_value=events):
+            from_db = _debug_signals_impl()
+
+        proj = DecisionProjection()
+        for ev in reversed(events):  # oldest first, as the worker records them
+            details = ev["details"]
+            details = json.loads(details) if isinstance(details, str) else details
+            proj.record(ev["symbol"], details, datetime.fromisoformat(ev["timestamp"]))
+        from_proj = proj.debug_signals()
+
+        assert from_proj["recent_decisions"] == from_db["recent_decisions"]
+        assert from_proj["last_signal"]["symbol"] == from_db["last_signal"]["symbol"] == "BTC/USD"
+        assert from_proj["checked_events"] == from_db["checked_events"]
+
+    def test_symbol_filter_and_limit(self):
+        proj = DecisionProjection(per_symbol=20)
+        for i in range(30):
+            proj.record("BTC/USD", {"signal": "NONE"}, NOW + timedelta(seconds=i))
+        proj.record("ETH/USD", {"signal": "SHORT", "price": Decimal("1.5")})
+
+        btc = proj.debug_signals("BTC/USD")
+        assert btc["checked_events"] == 20
+        assert btc["last_signal"] is None
+        eth = proj.debug_signals("ETH/USD")
+        assert eth["last_signal"]["signal"] == "SHORT"
+        json.dumps(eth)  # Decimals in the trace must not leak into the response
+
+    def test_health_endpoint_prefers_projection(self):
+        rm = init_read_model()
+        rm.decisions.record("BTC/USD", {"signal": "LONG"})
+        with patch("src.storage.repository.get_recent_events") as db:
+            data = _debug_signals_impl()
+        db.assert_not_called()
+        assert data["source"] == "read_model"
+
+
+class TestStatusProjection:
+    def test_positions_enriched_with_marks(self):
+        proj = StatusProjection()
+        assert not proj.ready
+        proj.update_positions([
+            {"symbol": "PF_XBTUSD", "side": "long", "size": Decimal("2"), "entry_price": Decimal("100")},
+            {"symbol": "PF_ETHUSD", "side": "short", "size": Decimal("0"), "entry_price": Decimal("10")},
+        ])
+        proj.update_account(Decimal("1000"), Decimal("250"))
+        proj.update_marks({"PF_XBTUSD": Decimal("110")})
+
+        assert proj.ready
+        account = proj.account()
+        assert account["margin_pct"] == 25.0
+        assert len(account["positions"]) == 1
+        assert account["positions"][0]["unrealized_pnl"] == Decimal("20")
+
+        # Callers get copies
+        account["positions"][0]["unrealized_pnl"] = 0
+        assert proj.account()["positions"][0]["unrealized_pnl"] == Decimal("20")
+
+
+class TestPerformanceProjection:
+    def test_metrics_match_batch_and_window(self):
+        trades = [_trade("a", 1, "10"), _trade("b", 2, "-5"), _trade("c", 40, "100")]
+        proj = PerformanceProjection(window_days=30)
+        proj.hydrate(trades)
+        proj.record(trades[0])  # duplicate id ignored
+
+        expected = performance_metrics_from_trades(trades[:2])
+        got = proj.metrics()
+        assert got["window_days"] == 30
+        del got["window_days"]
+        assert got == expected
+
+        proj.record(_trade("d", 0, "7"))
+        assert proj.metrics()["total_trades"] == 3
+        assert [t.trade_id for t in proj.recent_trades(2)] == ["d", "a"]
+
+    def test_metrics_cached_until_change(self):
+        proj = PerformanceProjection()
+        proj.hydrate([_trade("a", 1, "10")])
+        with patch(
+            "src.monitoring.read_models.performance_metrics_from_trades",
+            wraps=performance_metrics_from_trades,
+        ) as calc:
+            proj.metrics()
+            proj.metrics()
+            assert calc.call_count == 1
+            proj.record(_trade("b", 0, "1"))
+            proj.metrics()
+            assert calc.call_count == 2
+
+
+def test_snapshot_roundtrip(tmp_path):
+    rm = ReadModel()
+    rm.status.update_account(Decimal("500"), Decimal("50"))
+    rm.status.update_positions([])
+    rm.performance.hydrate([_trade("a", 1, "3")])
+    path = tmp_path / "read_model.json"
+
+    assert rm.save(str(path))
+    assert not rm.save(str(path))  # throttled
+    snap = load_snapshot(str(path))
+    assert snap["status"]["equity"] == "500"
+    assert snap["performance"]["total_trades"] == 1
+    assert snap["decisions"] is None
+    assert load_snapshot(str(tmp_path / "missing.json")) is None
+
+
+def test_status_account_recorded_without_exchange_call():
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from src.live.exchange_sync import record_status_account
+
+    rm = ReadModel()
+    client = MagicMock()
+    lt = SimpleNamespace(_read_model=rm, client=client)
+
+    record_status_account(lt, Decimal("1234.5"), Decimal("100"))
+    rm.status.update_positions([])
+
+    account = rm.status.account()
+    assert account["equity"] == Decimal("1234.5")
+    assert rm.status.ready and rm.status.age_seconds() is not None
+    assert client.method_calls == []
+    record_status_account(SimpleNamespace(), Decimal("1"), Decimal("0"))  # no read model: no-op
@@ -0,0 +1,147 @@
+"""
+Test: RiskManager.validate_trades returns exactly what validate_trade would.
+"""
+import random
+from dataclasses import fields
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.config.config import LiquidityFilters, RiskConfig
+from src.domain.models import Position, RiskDecision, Side, Signal, SignalType
+from src.risk.risk_manager import RiskManager, TradeRequest
+
+COMPARED = [f.name for f in fields(RiskDecision) if f.name != "timestamp"]
+
+
+def _signal(rng: random.Random, i: int) -> Signal:
+    entry = Decimal(str(round(rng.uniform(0.5, 60000), 4)))
+    dist = Decimal(str(round(rng.uniform(0.001, 0.05), 5)))
+    is_long = rng.random() < 0.5
+    sign = 1 if is_long else -1
+    return Signal(
+        timestamp=datetime.now(timezone.utc),
+        symbol=f"S{i}/USD",
+        signal_type=SignalType.LONG if is_long else SignalType.SHORT,
+        setup_type="ob",
+        regime=rng.choice(["tight_smc", "wide_structure"]),
+        entry_price=entry,
+        stop_loss=entry * (1 - sign * dist),
+        take_profit=entry * (1 + sign * dist * rng.randint(1, 5)) if rng.random() < 0.8 else None,
+        reasoning="batch test",
+        higher_tf_bias="bullish",
+        adx=Decimal("20"),
+        atr=Decimal("1"),
+        ema200_slope="up",
+        atr_ratio=Decimal(str(round(rng.uniform(0.5, 2), 2))) if rng.random() < 0.7 else None,
+    )
+
+
+def _position(i: int) -> Position:
+    return Position(
+        symbol=f"PF_P{i}USD",
+        side=Side.LONG,
+        size=Decimal(i + 1),
+        size_notional=Decimal("100"),
+        entry_price=Decimal("100"),
+        current_mark_price=Decimal("10"),
+        leverage=Decimal("5"),
+        margin_used=Decimal("20"),
+        unrealized_pnl=Decimal("0"),
+        liquidation_price=Decimal("1"),
+        opened_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.parametrize("sizing_method", ["fixed", "kelly", "volatility", "kelly_volatility", "leverage_based"])
+@pytest.mark.parametrize("seed", range(3))
+def test_batch_decisions_identical_to_scalar(sizing_method, seed):
+    rng = random.Random(f"{sizing_method}:{seed}")
+    config = RiskConfig(
+        sizing_method=sizing_method,
+        fee_edge_guard_enabled=seed % 2 == 0,
+        auction_mode_enabled=seed == 1,
+    )
+    rm = RiskManager(config, liquidity_filters=LiquidityFilters() if seed else None)
+    rm.update_position_list([_position(i) for i in range(rng.randint(0, 6))])
+    if seed == 2:
+        rm.daily_pnl, rm.daily_start_equity = Decimal("-500"), Decimal("5000")
+
+    equity = Decimal(str(round(rng.uniform(50, 50000), 2)))
+    available_margin = Decimal(str(round(rng.uniform(0, 20000), 2)))
+    requests = []
+    for i in range(40):
+        signal = _signal(rng, i)
+        requests.append(
+            TradeRequest(
+                signal=signal,
+                spot_price=signal.entry_price * Decimal(str(1 + rng.uniform(-0.01, 0.01))),
+                perp_mark_price=signal.entry_price,
+                symbol_tier=rng.choice([None, "A", "B", "C"]),
+                exchange_liquidation_price=signal.entry_price * Decimal("0.9") if rng.random() < 0.2 else None,
+                notional_override=Decimal(rng.randint(5, 5000)) if rng.random() < 0.3 else None,
+            )
+        )
+
+    batch = rm.validate_trades(requests, equity, available_margin=available_margin)
+
+    assert len(batch) == len(requests)
+    for request, decision in zip(requests, batch):
+        scalar = rm.validate_trade(
+            request.signal,
+            equity,
+            request.spot_price,
+            request.perp_mark_price,
+            exchange_liquidation_price=request.exchange_liquidation_price,
+            available_margin=available_margin,
+            notional_override=request.notional_override,
+            symbol_tier=request.symbol_tier,
+        )
+        for name in COMPARED:
+            a, b = getattr(decision, name), getattr(scalar, name)
+            assert a == b and str(a) == str(b), (request.signal.symbol, name, a, b)
+
+
+def test_what_if_batch_records_no_events():
+    events = []
+    rm = RiskManager(RiskConfig(), event_recorder=lambda *args: events.append(args))
+    rng = random.Random(1)
+    requests = [
+        TradeRequest(signal=s, spot_price=s.entry_price, perp_mark_price=s.entry_price)
+        for s in (_signal(rng, i) for i in range(5))
+    ]
+
+    rm.validate_trades(requests, Decimal("10000"), record_events=False)
+    assert events == []
+
+    rm.validate_trades(requests, Decimal("10000"))
+    assert [e[0] for e in events] == ["RISK_VALIDATION"] * 5
+
+
+def test_failing_request_is_rejected_without_dropping_batch(monkeypatch):
+    rm = RiskManager(RiskConfig())
+    rng = random.Random(2)
+    requests = [
+        TradeRequest(signal=s, spot_price=s.entry_price, perp_mark_price=s.entry_price)
+        for s in (_signal(rng, i) for i in range(3))
+    ]
+    validate = rm._validate
+
+    def flaky(request, *args, **kwargs):
+        if request is requests[1]:
+            raise ValueError("bad instrument spec")
+        return validate(request, *args, **kwargs)
+
+    monkeypatch.setattr(rm, "_validate", flaky)
+    batch = rm.validate_trades(requests, Decimal("10000"), record_events=False)
+
+    assert len(batch) == 3
+    assert not batch[1].approved
+    assert batch[1].rejection_reasons == ["Risk validation error: ValueError"]
+    for i in (0, 2):
+        scalar = rm.validate_trade(
+            requests[i].signal, Decimal("10000"), requests[i].spot_price, requests[i].perp_mark_price
+        )
+        assert batch[i].approved == scalar.approved
+        assert batch[i].position_notional == scalar.position_notional
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from typing import Dict, List, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -576,3 +577,59 @@ def _quick_sleep_then_stop(lt, max_iterations: int = 2):
         return asyncio.sleep(0)
 
     return side_effect
+
+
+# ===========================================================================
+# Protection checks (self-heal verdict)
+# ===========================================================================
+
+class TestProtectionSelfHeal:
+    """Self-heal is only reported as a success when every candidate is proven protected."""
+
+    async def _run(self, sweeps):
+        from src.live.health_monitor import run_protection_checks
+
+        lt = FakeLiveTradingBase()
+        lt.config = MagicMock()
+        lt.client = AsyncMock()
+        lt.client.get_all_futures_positions.return_value = []
+
+        async def check_all_positions():
+            if len(sweeps) == 1:
+                lt.active = False
+            return sweeps.pop(0)
+
+        lt._protection_monitor = SimpleNamespace(
+            check_all_positions=check_all_positions, layer3_saves_total=0
+        )
+        real_sleep = asyncio.sleep
+
+        async def no_sleep(*args, **kwargs):
+            await real_sleep(0)
+
+        with patch("src.live.health_monitor.asyncio.sleep", new=no_sleep), \
+             patch("src.live.protection_ops.place_missing_stops_for_unprotected", new_callable=AsyncMock), \
+             patch("src.monitoring.alerting.send_alert", new_callable=AsyncMock) as mock_alert:
+            await asyncio.wait_for(run_protection_checks(lt, interval_seconds=0), timeout=5)
+        return lt, mock_alert
+
+    @pytest.mark.asyncio
+    async def test_timed_out_recheck_is_not_success(self):
+        lt, mock_alert = await self._run([{"ADA/USD": False}] * 5 + [{"ADA/USD": None}])
+
+        metrics = lt._stop_heal_metrics
+        assert metrics["stop_self_heal_attempts_total"] == 1
+        assert metrics["stop_self_heal_success_total"] == 0
+        assert metrics["stop_self_heal_failures_total"] == 1
+        assert mock_alert.await_args.args[0] == "SELF_HEAL_PARTIAL"
+
+    @pytest.mark.asyncio
+    async def test_repeated_unknowns_escalate_and_do_not_reset(self):
+        # Alternating naked / timed-out checks must keep counting up to self-heal.
+        sweeps = [{"ADA/USD": False}, {"ADA/USD": None}] * 2 + [{"ADA/USD": None}, {"ADA/USD": True}]
+        lt, mock_alert = await self._run(sweeps)
+
+        metrics = lt._stop_heal_metrics
+        assert metrics["stop_self_heal_attempts_total"] == 1
+        assert metrics["stop_self_heal_success_total"] == 1
+        assert mock_alert.await_args.args[0] == "SELF_HEAL_SUCCESS"
@@ -0,0 +1,98 @@
+"""
+Tests for the precompiled runtime params (src/config/runtime_params.py).
+"""
+from decimal import Decimal
+from types import SimpleNamespace
+
+from src.config.config import MultiTPConfig, RiskConfig, load_config
+from src.config.runtime_params import (
+    EntryBlocklist,
+    ExitParams,
+    SymbolCooldownPolicy,
+    compile_runtime_params,
+)
+from src.execution.position_manager_v2 import PositionManagerV2
+from src.execution.position_state_machine import PositionRegistry
+from src.risk.risk_manager import RiskManager
+
+CONFIG_PATH = "src/config/config.yaml"
+
+
+def test_exit_params_sort_levels_once_with_inline_defaults():
+    mtp = MultiTPConfig(
+        progressive_trail_enabled=True,
+        progressive_trail_levels=[
+            {"r_threshold": 5.0, "atr_mult": 1.4},
+            {"atr_mult": 1.1},  # sorts first (key default 0) but never reached (threshold default 999)
+            {"r_threshold": 3.0},
+        ],
+        trailing_activation_atr_min=0.25,
+    )
+    params = ExitParams.from_multi_tp(mtp)
+
+    assert params.progressive_trail_enabled is True
+    assert [(lvl.r_threshold, lvl.atr_mult) for lvl in params.progressive_trail_levels] == [
+        (Decimal("999"), Decimal("1.1")),
+        (Decimal("3.0"), Decimal("2.0")),
+        (Decimal("5.0"), Decimal("1.4")),
+    ]
+    assert params.trailing_activation_atr_min == Decimal("0.25")
+    assert ExitParams.from_multi_tp(None) == ExitParams()
+
+
+def test_symbol_cooldown_policy_canary_resolution():
+    strategy = SimpleNamespace(
+        symbol_loss_cooldown_canary_enabled=True,
+        symbol_loss_cooldown_canary_symbols=["sol/usd"],
+        symbol_loss_cooldown_canary_hours=6,
+        symbol_loss_cooldown_canary_min_pnl_pct=None,
+    )
+    policy = SymbolCooldownPolicy.from_strategy(strategy)
+
+    canary = policy.resolve("PF_SOLUSD")
+    assert canary.canary_applied is True
+    assert (canary.cooldown_hours, canary.lookback_hours, canary.min_pnl_pct) == (6, 24, -0.5)
+    assert policy.resolve("ETH/USD") is policy.base
+
+    strategy.symbol_loss_cooldown_canary_symbols = []
+    assert SymbolCooldownPolicy.from_strategy(strategy).resolve("ETH/USD").canary_applied is True
+
+
+def test_entry_blocklist_reasons():
+    blocklist = EntryBlocklist.from_execution(
+        SimpleNamespace(entry_blocklist_spot_symbols=["usdt/usd:USD"], entry_blocklist_bases=[" pepe "])
+    )
+    assert blocklist.block_reason("USDT/USD") == "blocked_spot_symbol"
+    assert blocklist.block_reason("PEPE/USD:USD") == "blocked_base"
+    assert blocklist.block_reason("BTC/USD") is None
+    assert blocklist.block_reason("") is None
+
+
+def test_risk_manager_recompiles_params_when_config_replaced():
+    rm = RiskManager(RiskConfig(risk_per_trade_pct=0.01))
+    assert rm.params.risk_per_trade_pct == Decimal("0.01")
+    assert rm.params is rm.params
+
+    rm.config = RiskConfig(risk_per_trade_pct=0.02, fee_edge_guard_enabled=True)
+    assert rm.params.risk_per_trade_pct == Decimal("0.02")
+    terms = rm._risk_terms(Decimal("1000"))
+    assert terms.base_risk_amount == Decimal("20.00")
+    assert set(terms.fee_edge_costs) == {"tight_smc", "wide_structure"}
+
+
+def test_position_manager_exit_params_follow_multi_tp_config():
+    manager = PositionManagerV2(registry=PositionRegistry(), multi_tp_config=None)
+    assert manager.exit_params.progressive_trail_enabled is False
+
+    manager._multi_tp_config = MultiTPConfig(progressive_trail_enabled=True)
+    assert manager.exit_params.progressive_trail_enabled is True
+    assert len(manager.exit_params.progressive_trail_levels) == 3
+
+
+def test_compile_runtime_params_from_shipped_config():
+    config = load_config(CONFIG_PATH)
+    params = compile_runtime_params(config)
+
+    assert params.risk == RiskManager(config.risk).params
+    assert params.exits == ExitParams.from_multi_tp(config.multi_tp)
+    assert params.auction.chop_adx_threshold == float(config.risk.auction_chop_adx_threshold)
@@ -0,0 +1,39 @@
+"""
+Tests for the -X importtime parser behind `run.py diagnose-startup`.
+"""
+import sys
+
+from src.runtime.startup_diagnostics import ImportReport, measure_imports, parse_importtime
+
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        40 |        300 |     json.decoder
+import time:        60 |        500 |   json
+import time:      1000 |       1800 | mypkg
+some unrelated warning line
+"""
+
+
+class TestParseImporttime:
+    def test_parses_rows_and_depth(self):
+        rows = parse_importtime(SAMPLE)
+        assert [r.module for r in rows] == ["_io", "json.decoder", "json", "mypkg"]
+        assert [r.depth for r in rows] == [1, 2, 1, 0]
+        assert rows[3].self_us == 1000 and rows[3].cumulative_us == 1800
+
+    def test_report_ranking(self):
+        report = ImportReport("mypkg", parse_importtime(SAMPLE), wall_seconds=0.01)
+        assert report.total_us == 1800
+        assert report.top_cumulative(1)[0].module == "mypkg"
+        assert [t.module for t in report.top_self(2)] == ["mypkg", "_io"]
+        assert report.find("json").cumulative_us == 500
+        assert report.find("missing") is None
+
+
+class TestMeasureImports:
+    def test_child_interpreter(self):
+        report = measure_imports("json", python=sys.executable)
+        assert report.find("json") is not None
+        assert report.total_us > 0
@@ -178,3 +178,31 @@ class TestAssertPhase:
         sm.fail("broken")
         with pytest.raises(AssertionError, match="FAILED"):
             sm.assert_at_least(StartupPhase.SYNCING)
+
+
+class TestTiming:
+    """Per-phase wall-clock and step durations in get_status."""
+
+    def test_phase_durations_and_time_to_ready(self):
+        sm = StartupStateMachine()
+        sm.advance_to(StartupPhase.SYNCING)
+        sm.advance_to(StartupPhase.RECONCILING)
+        status = sm.get_status()
+        assert set(status["phase_durations_seconds"]) == {"initializing", "syncing"}
+        assert status["time_to_ready_seconds"] is None
+
+        sm.advance_to(StartupPhase.READY)
+        status = sm.get_status()
+        assert set(status["phase_durations_seconds"]) == {"initializing", "syncing", "reconciling"}
+        assert status["time_to_ready_seconds"] >= sum(status["phase_durations_seconds"].values()) - 0.01
+
+    def test_step_recorded_even_when_it_raises(self):
+        sm = StartupStateMachine()
+        with sm.step("candle_hydration"):
+            pass
+        with pytest.raises(ValueError):
+            with sm.step("exchange_sync"):
+                raise ValueError("boom")
+        steps = sm.get_status()["step_durations_seconds"]
+        assert set(steps) == {"candle_hydration", "exchange_sync"}
+        assert all(v >= 0 for v in steps.values())
@@ -0,0 +1,139 @@
+"""
+trades.symbol_key + covering indexes: query plans (SQLite EXPLAIN QUERY PLAN
+over the ORM schema), the backfill job and the write path.
+"""
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from src.data.symbol_utils import symbol_key
+from src.domain.models import Side, Trade
+from src.storage import repository
+from src.storage.db import INDEX_MIGRATIONS, Base
+from src.storage.maintenance import backfill_symbol_keys
+from src.storage.repository import SystemEventModel, stopouts_query, symbol_losses_query
+
+NOW = datetime.now(timezone.utc)
+
+
+class _SqliteDb:
+    def __init__(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine)
+
+    @contextmanager
+    def get_session(self):
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+
+@pytest.fixture
+def db():
+    return _SqliteDb()
+
+
+def _plan(session, query) -> str:
+    compiled = query.statement.compile(dialect=session.bind.dialect, compile_kwargs={"render_postcompile": True})
+    params = tuple(compiled.params[k] for k in compiled.positiontup)
+    rows = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).fetchall()
+    return " | ".join(str(r[-1]) for r in rows)
+
+
+def _trade(trade_id, symbol, hours_ago, pnl, reason="stop_loss"):
+    exited = NOW - timedelta(hours=hours_ago)
+    return Trade(
+        trade_id=trade_id, symbol=symbol, side=Side.LONG,
+        entry_price=Decimal("100"), exit_price=Decimal("99"), size=Decimal("1"),
+        size_notional=Decimal("100"), leverage=Decimal("5"),
+        gross_pnl=Decimal(pnl), fees=Decimal("0"), funding=Decimal("0"), net_pnl=Decimal(pnl),
+        entered_at=exited - timedelta(hours=1), exited_at=exited,
+        holding_period_hours=Decimal("1"), exit_reason=reason,
+    )
+
+
+class TestQueryPlans:
+    def test_stopouts_search_symbol_key_index(self, db):
+        with db.get_session() as session:
+            plan = _plan(session, stopouts_query(session, "BTCUSD", NOW - timedelta(hours=24)))
+        # The case-insensitive reason prefix isn't sargable; the symbol_key
+        # equality is, and that's what bounds the scan.
+        assert "SEARCH trades USING" in plan and "idx_trade_symkey" in plan
+        assert "symbol_key=?" in plan
+
+    def test_losses_use_symbol_key_index(self, db):
+        with db.get_session() as session:
+            plan = _plan(session, symbol_losses_query(session, "BTCUSD", NOW - timedelta(hours=24)))
+        assert "idx_trade_symkey" in plan
+        assert "SEARCH" in plan
+
+    def test_events_by_type_and_symbol_use_composite_index(self, db):
+        with db.get_session() as session:
+            query = (
+                session.query(SystemEventModel)
+                .filter(SystemEventModel.event_type == "DECISION_TRACE", SystemEventModel.symbol == "BTC/USD")
+                .order_by(SystemEventModel.timestamp.desc())
+                .limit(10)
+            )
+            plan = _plan(session, query)
+        assert "idx_event_type_symbol_time" in plan
+        assert "TEMP B-TREE" not in plan  # no sort step
+
+    def test_migrations_cover_model_indexes(self):
+        names = {"idx_trade_symkey_exited", "idx_trade_symkey_reason_exited", "idx_event_type_symbol_time"}
+        assert {n for n in names if any(n in stmt for stmt in INDEX_MIGRATIONS)} == names
+
+
+class TestSymbolKeyWrites:
+    def test_save_trade_sets_symbol_key(self, db):
+        with patch("src.storage.repository.get_db", return_value=db):
+            repository.save_trade(_trade("t1", "PF_XBTUSD", 1, "-5"))
+            with db.get_session() as session:
+                stored = session.execute(text("SELECT symbol_key FROM trades")).scalar()
+        assert stored == "BTCUSD"
+
+    def test_backfill_populates_legacy_rows(self, db):
+        with patch("src.storage.repository.get_db", return_value=db):
+            for i, sym in enumerate(["PF_XBTUSD", "BTC/USD:USD", "ETH/USD"]):
+                repository.save_trade(_trade(f"t{i}", sym, 1, "-5"))
+        with db.engine.begin() as conn:
+            conn.execute(text("UPDATE trades SET symbol_key = NULL"))
+
+        assert backfill_symbol_keys(db.engine) == 3
+        assert backfill_symbol_keys(db.engine) == 0
+        with db.engine.connect() as conn:
+            keys = dict(conn.execute(text("SELECT symbol, symbol_key FROM trades")).fetchall())
+        assert keys == {s: symbol_key(s) for s in ["PF_XBTUSD", "BTC/USD:USD", "ETH/USD"]}
+
+    def test_symbol_queries_match_across_formats(self, db):
+        with patch("src.storage.repository.get_db", return_value=db):
+            repository.save_trade(_trade("a", "PF_XBTUSD", 1, "-5"))
+            repository.save_trade(_trade("b", "BTC/USD:USD", 2, "-5", reason="take_profit_1"))
+            repository.save_trade(_trade("c", "PF_ETHFIUSD", 1, "-5"))
+            with db.get_session() as session:
+                count, pnl, notional = symbol_losses_query(session, symbol_key("BTC/USD"), NOW - timedelta(hours=24)).one()
+        assert (count, float(pnl), float(notional)) == (2, -10.0, 200.0)
+
+    def test_symbol_queries_include_rows_awaiting_backfill(self, db):
+        with patch("src.storage.repository.get_db", return_value=db):
+            repository.save_trade(_trade("a", "PF_XBTUSD", 1, "-5", reason="Stop Loss"))
+            repository.save_trade(_trade("b", "BTC/USD:USD", 2, "-5", reason="Stop Loss"))
+            repository.save_trade(_trade("c", "PF_ETHUSD", 1, "-5", reason="Stop Loss"))
+        with db.engine.begin() as conn:
+            conn.execute(text("UPDATE trades SET symbol_key = NULL WHERE trade_id IN ('a', 'c')"))
+
+        since = NOW - timedelta(hours=24)
+        with db.get_session() as session:
+            count, pnl, _ = symbol_losses_query(session, "BTCUSD", since).one()
+            trade_ids = {t.trade_id for t in stopouts_query(session, "BTCUSD", since)}
+        assert (count, float(pnl)) == (2, -10.0)
+        assert trade_ids == {"a", "b"}
@@ -6,10 +6,13 @@ Locks futures_candidate_symbols() as the single source of Kraken BTC/XBT quirks.
 import pytest
 
 from src.data.symbol_utils import (
+    clear_symbol_cache,
     futures_candidate_symbols,
     normalize_symbol_for_position_match,
+    normalize_to_base,
     pf_to_unified,
     position_symbol_matches_order,
+    symbol_key,
 )
 
 
@@ -91,3 +94,19 @@ class TestPositionSymbolMatchesOrder:
 
     def test_same_symbol_matches(self) -> None:
         assert position_symbol_matches_order("PF_XBTUSD", "PF_XBTUSD") is True
+
+
+class TestSymbolKeyMemoization:
+    """symbol_key / normalize_to_base are memoized and agree with the uncached form."""
+
+    def test_symbol_key_matches_position_match(self) -> None:
+        for sym in ("PF_XBTUSD", "BTC/USD:USD", "ROSE/USD", "PI_ROSEUSD"):
+            assert symbol_key(sym) == normalize_symbol_for_position_match(sym)
+
+    def test_repeat_calls_hit_cache(self) -> None:
+        clear_symbol_cache()
+        normalize_to_base("PF_WIFUSD")
+        normalize_to_base("PF_WIFUSD")
+        info = normalize_to_base.cache_info()
+        assert info.hits >= 1
+        assert normalize_to_base("PF_WIFUSD") == "WIF"
@@ -0,0 +1,118 @@
+"""
+Tests for the concurrent, bisecting bulk spot ticker fetch.
+"""
+import asyncio
+from unittest.mock import MagicMock
+
+import ccxt
+import pytest
+
+from src.data import ticker_batch
+from src.data.kraken_client import KrakenClient
+from src.data.ticker_batch import BadSymbolCache, fetch_tickers_batched
+
+
+class FakeExchange:
+    """fetch_tickers that rejects any request containing a bad symbol (like ccxt's BadSymbol)."""
+
+    def __init__(self, bad=(), slow=(), delay=0.0):
+        self.bad = set(bad)
+        self.slow = set(slow)
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_tickers(self, symbols):
+        self.calls.append(list(symbols))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.slow.intersection(symbols):
+                await asyncio.sleep(60)
+            bad = self.bad.intersection(symbols)
+            if bad:
+                raise ccxt.BadSymbol(f"kraken does not have market symbol {sorted(bad)[0]}")
+            return {s: {"symbol": s, "last": 1.0} for s in symbols}
+        finally:
+            self.in_flight -= 1
+
+
+def _client(**kwargs) -> KrakenClient:
+    client = KrakenClient(api_key="k", api_secret="s", **kwargs)
+    client.public_limiter = MagicMock(wait_for_token=MagicMock(side_effect=lambda: asyncio.sleep(0)))
+    return client
+
+
+SYMBOLS = [f"C{i}/USD" for i in range(200)]
+
+
+@pytest.mark.asyncio
+async def test_chunks_run_concurrently_under_limit():
+    client = _client(spot_ticker_chunk_size=50, spot_ticker_concurrency=3)
+    client.exchange = FakeExchange(delay=0.01)
+
+    batch = await client.fetch_spot_tickers(SYMBOLS)
+
+    assert set(batch.tickers) == set(SYMBOLS)
+    assert not batch.errors
+    assert len(client.exchange.calls) == 4
+    assert client.exchange.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_bad_symbols_bisected_and_remembered():
+    client = _client(spot_ticker_chunk_size=50)
+    client.exchange = FakeExchange(bad={"C7/USD", "C120/USD"})
+
+    batch = await client.fetch_spot_tickers(SYMBOLS)
+    assert batch.errors == {"C7/USD": ticker_batch.BAD_SYMBOL, "C120/USD": ticker_batch.BAD_SYMBOL}
+    assert len(batch.tickers) == 198
+    # Two bad chunks bisected down to single symbols: far fewer than one request per symbol.
+    assert batch.requests < 40
+
+    client.exchange.calls.clear()
+    tickers = await client.get_spot_tickers_bulk(SYMBOLS)
+    assert len(tickers) == 198
+    assert len(client.exchange.calls) == 4  # known-bad symbols skipped, no bisection
+    assert all("C7/USD" not in call for call in client.exchange.calls)
+
+
+@pytest.mark.asyncio
+async def test_deadline_returns_partial_results():
+    client = _client(
+        spot_ticker_chunk_size=50,
+        spot_ticker_request_timeout_seconds=30.0,
+        spot_ticker_deadline_seconds=0.2,
+    )
+    client.exchange = FakeExchange(slow={"C199/USD"})
+
+    batch = await asyncio.wait_for(client.fetch_spot_tickers(SYMBOLS), timeout=2.0)
+
+    assert batch.deadline_hit
+    assert len(batch.tickers) == 150
+    assert {batch.errors[s] for s in SYMBOLS[150:]} == {ticker_batch.DEADLINE}
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_retried_once_then_reported():
+    attempts = []
+
+    async def flaky(symbols):
+        attempts.append(symbols)
+        raise ccxt.NetworkError("connection reset")
+
+    batch = await fetch_tickers_batched(
+        flaky, ["A/USD", "B/USD"], classify=KrakenClient._classify_exception, chunk_size=50,
+    )
+    assert len(attempts) == 2
+    assert batch.errors == {"A/USD": ticker_batch.ERROR, "B/USD": ticker_batch.ERROR}
+
+
+def test_bad_symbol_cache_ttl():
+    cache = BadSymbolCache(ttl_seconds=10)
+    cache.add("X/USD", now=100.0)
+    assert cache.contains("X/USD", now=105.0)
+    assert not cache.contains("X/USD", now=111.0)
+    assert len(cache) == 0
@@ -0,0 +1,139 @@
+"""
+Tests for the process-local rolling trade ledger.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.domain.models import Side, Trade
+from src.risk import symbol_cooldown
+from src.storage.trade_ledger import TradeLedger, get_trade_ledger, init_trade_ledger, reset_trade_ledger
+from src.strategy.smc_engine import get_recent_stopouts
+
+NOW = datetime.now(timezone.utc)
+
+
+def _trade(trade_id, symbol, hours_ago, pnl, reason="Take Profit", notional="1000", side=Side.LONG):
+    exited = NOW - timedelta(hours=hours_ago)
+    return Trade(
+        trade_id=trade_id,
+        symbol=symbol,
+        side=side,
+        entry_price=Decimal("100"),
+        exit_price=Decimal("100"),
+        size=Decimal("10"),
+        size_notional=Decimal(notional),
+        leverage=Decimal("5"),
+        gross_pnl=Decimal(pnl),
+        fees=Decimal("0"),
+        funding=Decimal("0"),
+        net_pnl=Decimal(pnl),
+        entered_at=exited - timedelta(minutes=30),
+        exited_at=exited,
+        holding_period_hours=Decimal("0.5"),
+        exit_reason=reason,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_ledger():
+    reset_trade_ledger()
+    yield
+    reset_trade_ledger()
+
+
+class TestWindows:
+    def test_symbol_index_spans_formats(self):
+        ledger = TradeLedger(retention_hours=48)
+        ledger.hydrate(
+            [
+                _trade("a", "PF_XBTUSD", 1, "-10"),
+                _trade("b", "BTC/USD:USD", 2, "-5"),
+                _trade("c", "PF_ETHUSD", 1, "-5"),
+                _trade("d", "PF_ETHFIUSD", 1, "-5"),
+            ],
+            since=NOW - timedelta(hours=48),
+        )
+        assert {t.trade_id for t in ledger.symbol_trades_since("BTC/USD", NOW - timedelta(hours=3))} == {"a", "b"}
+        # Exact base match: ETH does not pick up ETHFI (the old LIKE '%ETH%' did)
+        assert [t.trade_id for t in ledger.symbol_trades_since("ETH/USD", NOW - timedelta(hours=3))] == ["c"]
+        assert [t.trade_id for t in ledger.trades_since(NOW - timedelta(hours=1, minutes=30))] == ["a", "c", "d"]
+
+    def test_loss_stats_and_stopouts(self):
+        ledger = TradeLedger(retention_hours=48)
+        ledger.hydrate(
+            [
+                _trade("a", "PF_SOLUSD", 1, "-10", reason="Stop Loss"),
+                _trade("b", "PF_SOLUSD", 2, "-30", reason="stop loss (trailing)"),
+                _trade("c", "PF_SOLUSD", 3, "20"),
+                _trade("d", "PF_SOLUSD", 30, "-50", reason="Stop Loss"),
+            ],
+            since=NOW - timedelta(hours=48),
+        )
+        count, pct = ledger.loss_stats("SOL/USD", 24)
+        assert count == 2
+        assert pct == pytest.approx(-40 / 2000 * 100)
+        assert ledger.count_stopouts("PF_SOLUSD", 24) == 2
+        assert ledger.count_stopouts("SOL/USD", 48) == 3
+
+    def test_dedupe_and_retention(self):
+        ledger = TradeLedger(retention_hours=10)
+        ledger.hydrate([_trade("a", "PF_SOLUSD", 1, "1")], since=NOW - timedelta(hours=10))
+        assert ledger.record(_trade("a", "PF_SOLUSD", 1, "1")) is False
+        assert ledger.record(_trade("old", "PF_SOLUSD", 20, "1")) is True
+        assert len(ledger) == 1  # pruned straight away: outside retention
+        assert ledger.covers(NOW - timedelta(hours=5))
+        assert not ledger.covers(NOW - timedelta(hours=24))
+
+
+class TestResync:
+    def test_hydrate_then_incremental(self):
+        ledger = TradeLedger(retention_hours=24, resync_interval_seconds=900)
+        calls = []
+
+        def fetch(since):
+            calls.append(since)
+            return [_trade(f"t{len(calls)}", "PF_SOLUSD", 0.5, "1")]
+
+        assert ledger.resync_due()
+        asyncio.run(ledger.resync(fetch))
+        assert ledger.hydrated and not ledger.resync_due()
+        asyncio.run(ledger.resync(fetch))
+        assert len(ledger) == 2
+        # Incremental fetch starts near the previous sync, not at the retention edge
+        assert calls[1] > calls[0] + timedelta(hours=20)
+
+
+class TestCallers:
+    def test_unhydrated_ledger_falls_back(self, monkeypatch):
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        assert symbol_cooldown.get_symbol_loss_stats("SOL/USD", 24) == (0, 0.0)
+
+    def test_callers_use_hydrated_ledger(self, monkeypatch):
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        ledger = init_trade_ledger(retention_hours=48)
+        ledger.hydrate(
+            [_trade(str(i), "PF_DOGEUSD", i + 1, "-10", reason="Stop Loss") for i in range(3)],
+            since=NOW - timedelta(hours=48),
+        )
+        assert get_trade_ledger() is ledger
+        assert symbol_cooldown.get_symbol_loss_stats("DOGE/USD", 24)[0] == 3
+        assert get_recent_stopouts("DOGE/USD", 24) == 3
+        # Window longer than retention -> not covered -> DB path (no DB here -> 0)
+        assert get_recent_stopouts("DOGE/USD", 96) == 0
+
+    def test_save_trade_feeds_hydrated_ledger(self):
+        """Trades persisted outside the gateway hook (e.g. stop fills) reach the ledger at once."""
+        from unittest.mock import MagicMock, patch
+
+        from src.storage import repository
+
+        ledger = init_trade_ledger(retention_hours=48)
+        ledger.hydrate([], since=NOW - timedelta(hours=48))
+        with patch.object(repository, "get_db", return_value=MagicMock()):
+            repository.save_trade(_trade("stop-1", "PF_SOLUSD", 0.1, "-25", reason="Stop Loss"))
+
+        assert get_recent_stopouts("SOL/USD", 24) == 1
+        assert symbol_cooldown.get_symbol_loss_stats("SOL/USD", 24)[0] == 1
@@ -0,0 +1,61 @@
+"""
+Tests for the per-tick universe resolution stage.
+"""
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from src.execution.futures_adapter import FuturesAdapter
+from src.live.universe_resolution import resolve_universe
+
+
+class _Specs:
+    def __init__(self, known):
+        self.known = set(known)
+        self.calls = 0
+
+    def get_spec(self, symbol):
+        self.calls += 1
+        return object() if symbol in self.known else None
+
+
+FUTURES = {
+    "BTC/USD:USD": Decimal("50000"),
+    "PF_XBTUSD": Decimal("50000"),
+    "ETH/USD:USD": Decimal("3000"),
+    "PF_ETHUSD": Decimal("3000"),
+    "DELISTED/USD:USD": Decimal("1"),
+}
+SPOT = {"BTC/USD": {"last": 50000}, "ETH/USD": {"last": 3000}, "SPOTONLY/USD": {"last": 2}}
+
+
+class TestResolveUniverse:
+    def _resolve(self, symbols, specs=None):
+        adapter = FuturesAdapter(MagicMock())
+        return resolve_universe(symbols, SPOT, FUTURES, adapter, specs)
+
+    def test_records_match_adapter_mapping(self):
+        adapter = FuturesAdapter(MagicMock())
+        symbols = ["BTC/USD", "ETH/USD", "SPOTONLY/USD", "DELISTED/USD"]
+        universe = resolve_universe(symbols, SPOT, FUTURES, adapter, None)
+        for s in symbols:
+            rec = universe.get(s)
+            assert rec.futures_symbol == adapter.map_spot_to_futures(s, futures_tickers=FUTURES)
+            assert rec.has_spot == (s in SPOT)
+            assert rec.has_futures == (rec.futures_symbol in FUTURES)
+        assert universe.get("BTC/USD").base == "BTC"
+
+    def test_coverage_counts_and_spec_gate(self):
+        specs = _Specs({"BTC/USD:USD", "ETH/USD:USD", "PF_XBTUSD", "PF_ETHUSD"})
+        universe = self._resolve(["BTC/USD", "ETH/USD", "SPOTONLY/USD", "DELISTED/USD", "GONE/USD"], specs)
+        assert universe.with_spot == 3
+        assert universe.with_futures == 3
+        assert universe.with_neither == 1
+        assert universe.get("DELISTED/USD").has_spec is False
+        assert universe.get("BTC/USD").has_spec is True
+        # Spec lookups only for symbols that have a futures ticker
+        assert specs.calls == 3
+
+    def test_similar_futures_uses_base_index(self):
+        universe = self._resolve(["BTC/USD"])
+        assert set(universe.similar_futures("BTC/USD")) == {"BTC/USD:USD", "PF_XBTUSD"}
+        assert universe.similar_futures("NOPE/USD") == []